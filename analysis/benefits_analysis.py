@@ -5,40 +5,41 @@ Extracted from MarketIntelligence for focused benefits-related analytics.
 """
 
 import pandas as pd
-import re
-from typing import Dict, List
+from typing import Dict, List, Optional
 
 # Import shared constant
 import sys
 import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from analyzer import BENEFIT_DISPLAY_NAMES
+from taxonomy_matcher import TaxonomyHits
 
 
 class BenefitsAnalysis:
     """Benefits-focused analytics for job market data."""
     
-    def __init__(self, df: pd.DataFrame, taxonomy: dict):
+    def __init__(self, df: pd.DataFrame, taxonomy: dict, hits: Optional[TaxonomyHits] = None):
         """
         Initialize with data and taxonomy.
         
         Args:
             df: DataFrame with job data
             taxonomy: Loaded taxonomy dict with benefits_keywords
+            hits: Shared taxonomy hits for df (computed here when omitted)
         """
         self.df = df
         self.taxonomy = taxonomy
+        self.hits = hits if hits is not None else TaxonomyHits(df, taxonomy)
+
+    def benefit_masks(self):
+        for benefit_name in self.taxonomy.get('benefits_keywords', {}):
+            if self.hits.has('benefits', benefit_name):
+                yield benefit_name, self.hits.mask('benefits', benefit_name)
     
     def get_benefits_analysis(self) -> pd.DataFrame:
         """Analyze which benefits are most commonly offered."""
-        benefits_cats = self.taxonomy.get('benefits_keywords', {})
-
         results = []
-        for benefit_name, keywords in benefits_cats.items():
-            pattern = '|'.join([re.escape(kw) for kw in keywords])
-            mask = self.df['description'].fillna('').str.lower().str.contains(
-                pattern, regex=True, case=False
-            )
+        for benefit_name, mask in self.benefit_masks():
             count = mask.sum()
             percentage = (count / len(self.df)) * 100
 
@@ -63,21 +64,8 @@ class BenefitsAnalysis:
         if self.df.empty:
             return pd.DataFrame(columns=['Role', 'Benefit Count', 'Top Benefits'])
 
-        benefits_cats = self.taxonomy.get('benefits_keywords', {})
-
-        def count_benefits(desc: str) -> int:
-            if pd.isna(desc):
-                return 0
-            desc_lower = desc.lower()
-            count = 0
-            for keywords in benefits_cats.values():
-                pattern = '|'.join([re.escape(kw) for kw in keywords])
-                if re.search(pattern, desc_lower):
-                    count += 1
-            return count
-
-        df_copy = self.df.copy()
-        df_copy['benefit_count'] = df_copy['description'].apply(count_benefits)
+        df_copy = self.df[['role_type']].copy()
+        df_copy['benefit_count'] = self.hits.count('benefits')
 
         role_benefits = df_copy.groupby('role_type').agg(
             avg_benefits=('benefit_count', 'mean'),
@@ -89,14 +77,8 @@ class BenefitsAnalysis:
 
     def get_trending_benefits(self) -> pd.DataFrame:
         """Show fastest-growing benefits (based on frequency)."""
-        benefits_cats = self.taxonomy.get('benefits_keywords', {})
-
         results = []
-        for benefit_name, keywords in benefits_cats.items():
-            pattern = '|'.join([re.escape(kw) for kw in keywords])
-            mask = self.df['description'].fillna('').str.lower().str.contains(
-                pattern, regex=True, case=False
-            )
+        for benefit_name, mask in self.benefit_masks():
             count = mask.sum()
             percentage = (count / len(self.df)) * 100
 
@@ -6,23 +6,36 @@ Extracted from MarketIntelligence for focused location and work model analytics.
 
 import pandas as pd
 import numpy as np
-import re
-from typing import Dict, List
+from typing import Dict, List, Optional
+
+from taxonomy_matcher import TaxonomyHits
 
 
 class LocationAnalysis:
     """Location and work model analytics for job market data."""
     
-    def __init__(self, df: pd.DataFrame, taxonomy: dict):
+    def __init__(self, df: pd.DataFrame, taxonomy: dict, hits: Optional[TaxonomyHits] = None):
         """
         Initialize with data and taxonomy.
         
         Args:
             df: DataFrame with job data
             taxonomy: Loaded taxonomy dict with work_model_keywords
+            hits: Shared taxonomy hits for df (computed here when omitted)
         """
         self.df = df
         self.taxonomy = taxonomy
+        self.hits = hits if hits is not None else TaxonomyHits(df, taxonomy)
+
+    def classify_work_model(self) -> np.ndarray:
+        """Remote / Hybrid / Office per row (remote keywords win over hybrid)."""
+        conditions = [self._work_model_mask(name) for name in ('remote', 'hybrid')]
+        return np.select(conditions, ['Remote', 'Hybrid'], default='Office')
+
+    def _work_model_mask(self, name: str) -> pd.Series:
+        if not self.hits.has('work_model', name):
+            return pd.Series(False, index=self.df.index)
+        return self.hits.mask('work_model', name)
     
     def get_location_distribution(self) -> pd.DataFrame:
         """Get job distribution by location."""
@@ -32,20 +45,7 @@ class LocationAnalysis:
 
     def get_work_model_distribution(self) -> pd.DataFrame:
         """Classify jobs by work model: Remote, Hybrid, Office."""
-        work_model_kw = self.taxonomy.get('work_model_keywords', {})
-        
-        remote_pattern = '|'.join(work_model_kw.get('remote', []))
-        hybrid_pattern = '|'.join(work_model_kw.get('hybrid', []))
-
-        desc = self.df['description'].fillna('').str.lower()
-
-        conditions = [
-            desc.str.contains(remote_pattern, case=False, na=False, regex=True),
-            desc.str.contains(hybrid_pattern, case=False, na=False, regex=True)
-        ]
-        choices = ['Remote', 'Hybrid']
-        
-        self.df['work_model'] = np.select(conditions, choices, default='Office')
+        self.df['work_model'] = self.classify_work_model()
         
         result = self.df['work_model'].value_counts().reset_index()
         result.columns = ['Work Model', 'Count']
@@ -56,22 +56,8 @@ class LocationAnalysis:
         if self.df.empty:
             return pd.DataFrame(columns=['Role', 'Remote %', 'Hybrid %', 'Office %'])
 
-        work_model_kw = self.taxonomy.get('work_model_keywords', {})
-        remote_pattern = '|'.join(work_model_kw.get('remote', []))
-        hybrid_pattern = '|'.join(work_model_kw.get('hybrid', []))
-
-        def classify_work_model(desc_text: str) -> str:
-            if pd.isna(desc_text):
-                return 'Office'
-            desc_lower = desc_text.lower()
-            if re.search(remote_pattern, desc_lower):
-                return 'Remote'
-            if re.search(hybrid_pattern, desc_lower):
-                return 'Hybrid'
-            return 'Office'
-
-        df_copy = self.df.copy()
-        df_copy['work_model_temp'] = df_copy['description'].apply(classify_work_model)
+        df_copy = self.df[['role_type']].copy()
+        df_copy['work_model_temp'] = self.classify_work_model()
 
         top_roles = df_copy['role_type'].value_counts().head(8).index
         filtered = df_copy[df_copy['role_type'].isin(top_roles)]
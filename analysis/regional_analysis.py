@@ -2,17 +2,22 @@
 import pandas as pd
 import numpy as np
 
+from tools.location_normalizer import HUB_CITIES
+
 class RegionalAnalysis:
     """Calculates granular regional insights for the job market."""
     
-    def __init__(self, df: pd.DataFrame):
+    def __init__(self, df: pd.DataFrame, observations=None):
         """
         Initialize with job data.
         
         Args:
             df: DataFrame containing normalized 'region' and 'avg_salary' columns.
+            observations: Optional ObservationStore; trends compare the two most
+                recent scrapes from its history when available.
         """
         self.df = df
+        self.observations = observations
 
     def get_regional_stats(self) -> pd.DataFrame:
         """
@@ -24,8 +29,8 @@ class RegionalAnalysis:
         if self.df.empty or 'region' not in self.df.columns:
             return pd.DataFrame(columns=['Region', 'Median Salary', 'Job Count'])
             
-        # Target regions
-        hubs = ["Prague", "Brno", "Ostrava"]
+        # Target regions (region is resolved at ingest, see LocationNormalizer.resolve)
+        hubs = list(HUB_CITIES)
         
         results = []
         for region in hubs:
@@ -51,6 +56,14 @@ class RegionalAnalysis:
         Returns:
             DataFrame with columns: Region, Previous Median, Current Median, Change %.
         """
+        # History covers listings cleanup_expired has since removed; the live
+        # table is only used until two scrapes have been recorded.
+        dates = self.observations.observed_dates()[-2:] if self.observations is not None else []
+        if len(dates) == 2:
+            df = self.observations.load(columns=['region', 'avg_salary', 'observed_on'], dates=dates)
+            df['date'] = pd.to_datetime(df['observed_on']).dt.date
+            return self._compare_dates(df, dates[1], dates[0])
+
         if self.df.empty or 'scraped_at' not in self.df.columns or 'region' not in self.df.columns:
             return pd.DataFrame(columns=['Region', 'Previous Median', 'Current Median', 'Change %'])
 
@@ -62,10 +75,11 @@ class RegionalAnalysis:
         if len(dates) < 2:
             return pd.DataFrame(columns=['Region', 'Previous Median', 'Current Median', 'Change %'])
 
-        current_date = dates[0]
-        previous_date = dates[1]
+        return self._compare_dates(df, dates[0], dates[1])
 
-        hubs = ["Prague", "Brno", "Ostrava"]
+    def _compare_dates(self, df: pd.DataFrame, current_date, previous_date) -> pd.DataFrame:
+        """Median salary change per hub between two dates of a frame with a 'date' column."""
+        hubs = list(HUB_CITIES)
         results = []
 
         for region in hubs:
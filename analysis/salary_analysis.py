@@ -6,29 +6,46 @@ Extracted from MarketIntelligence for focused salary-related analytics.
 
 import pandas as pd
 import numpy as np
-import re
 import logging
 from typing import Dict, List, Optional, Any
 
+from taxonomy_matcher import TaxonomyHits
+
 logger = logging.getLogger(__name__)
 
 
 class SalaryAnalysis:
     """Salary-focused analytics for job market data."""
     
-    def __init__(self, df: pd.DataFrame, taxonomy: dict):
+    def __init__(self, df: pd.DataFrame, taxonomy: dict, observations=None, rollups=None,
+                 hits: Optional[TaxonomyHits] = None):
         """
         Initialize with data and taxonomy.
         
         Args:
             df: DataFrame with job data (must have 'avg_salary', 'role_type', etc.)
             taxonomy: Loaded taxonomy dict with skill_patterns, etc.
+            observations: Optional ObservationStore; trends read its history
+                instead of the current-state DataFrame when available.
+            rollups: Optional rollups.Rollups; role/seniority/contract medians
+                are read from it (within 1%) instead of the raw rows.
+            hits: Shared taxonomy hits for df (computed here when omitted)
         """
         self.df = df
         self.taxonomy = taxonomy
+        self.hits = hits if hits is not None else TaxonomyHits(df, taxonomy)
+        self.observations = observations
+        self.rollups = rollups if rollups is not None and rollups.available() else None
+
+    def _rollup_medians(self, dimension: str) -> pd.DataFrame:
+        result = self.rollups.quantiles(by=[dimension]).dropna(subset=[dimension])
+        return result.rename(columns={'q50': 'median_salary'})[[dimension, 'median_salary', 'count']]
     
     def get_salary_by_role(self) -> pd.DataFrame:
         """Get median salary breakdown by role type."""
+        if self.rollups is not None:
+            result = self._rollup_medians('role_type').sort_values('median_salary', ascending=False)
+            return result.reset_index(drop=True)
         valid_sal = self.df[self.df['avg_salary'] > 0]
         result = valid_sal.groupby('role_type').agg(
             median_salary=('avg_salary', 'median'),
@@ -38,17 +55,23 @@ class SalaryAnalysis:
     
     def get_salary_by_seniority(self) -> pd.DataFrame:
         """Get median salary breakdown by seniority level."""
-        valid_sal = self.df[self.df['avg_salary'] > 0]
-        result = valid_sal.groupby('seniority_level').agg(
-            median_salary=('avg_salary', 'median'),
-            count=('avg_salary', 'count')
-        ).reset_index()
+        if self.rollups is not None:
+            result = self._rollup_medians('seniority_level')
+        else:
+            valid_sal = self.df[self.df['avg_salary'] > 0]
+            result = valid_sal.groupby('seniority_level').agg(
+                median_salary=('avg_salary', 'median'),
+                count=('avg_salary', 'count')
+            ).reset_index()
         order = ['Junior', 'Mid', 'Senior', 'Lead', 'Executive']
         result['order'] = result['seniority_level'].apply(lambda x: order.index(x) if x in order else 99)
         return result.sort_values('order').drop('order', axis=1)
 
     def get_salary_by_contract_type(self) -> Dict[str, float]:
         """Get median salary for HPP vs Brigáda."""
+        if self.rollups is not None:
+            result = self._rollup_medians('contract_type')
+            return dict(zip(result['contract_type'], result['median_salary']))
         valid_sal = self.df[self.df['avg_salary'] > 0]
         result = valid_sal.groupby('contract_type')['avg_salary'].median()
         return result.to_dict()
@@ -80,6 +103,9 @@ class SalaryAnalysis:
 
     def get_salary_trend_weekly(self) -> pd.DataFrame:
         """Get weekly median salary trends (requires 7+ days of data)."""
+        if self.observations is not None and len(self.observations.observed_dates()) >= 7:
+            return self._salary_trend_from_observations()
+
         df_with_dates = self.df.copy()
         df_with_dates['scraped_date'] = pd.to_datetime(df_with_dates['scraped_at']).dt.date
         
@@ -96,14 +122,27 @@ class SalaryAnalysis:
         trend['week'] = trend['week'].astype(str)
         return trend
 
+    def _salary_trend_from_observations(self) -> pd.DataFrame:
+        """Weekly trend over the observation history, counting each listing once per week."""
+        obs = self.observations.load(columns=['hash', 'observed_on', 'avg_salary'])
+        obs = obs[obs['avg_salary'] > 0].copy()
+        obs['week'] = pd.to_datetime(obs['observed_on']).dt.to_period('W')
+        obs = obs.drop_duplicates(['week', 'hash'], keep='last')
+
+        trend = obs.groupby('week').agg(
+            median_salary=('avg_salary', 'median'),
+            count=('avg_salary', 'count')
+        ).reset_index()
+        trend['week'] = trend['week'].astype(str)
+        return trend
+
     def get_remote_salary_premium(self) -> Dict[str, Any]:
         """Calculate salary premium for remote vs office jobs."""
-        work_model_kw = self.taxonomy.get('work_model_keywords', {})
-        remote_pattern = '|'.join(work_model_kw.get('remote', []))
-
         valid_sal = self.df[self.df['avg_salary'] > 0]
-        desc = valid_sal['description'].fillna('').str.lower()
-        is_remote = desc.str.contains(remote_pattern, case=False, na=False, regex=True)
+        if self.hits.has('work_model', 'remote'):
+            is_remote = self.hits.mask('work_model', 'remote').loc[valid_sal.index]
+        else:
+            is_remote = pd.Series(False, index=valid_sal.index)
 
         remote_median = valid_sal[is_remote]['avg_salary'].median()
         office_median = valid_sal[~is_remote]['avg_salary'].median()
@@ -120,7 +159,6 @@ class SalaryAnalysis:
 
     def get_skill_premiums(self) -> pd.DataFrame:
         """Calculate salary premium for top skills using taxonomy patterns."""
-        skill_patterns = self.taxonomy.get('skill_patterns', {})
         priority_skills = ['Python', 'JavaScript', 'TypeScript', 'Java', 'Go', 'Rust',
                           'React', 'Angular', 'Vue', 'Node.js', '.NET', 'Spring',
                           'SQL', 'MongoDB', 'Redis', 'Docker', 'Kubernetes',
@@ -134,42 +172,22 @@ class SalaryAnalysis:
         premiums = []
 
         for skill_name in priority_skills:
-            if skill_name not in skill_patterns:
+            if not self.hits.has('skills', skill_name):
                 continue
 
-            pattern = skill_patterns[skill_name]
-            try:
-                mask = valid_sal['description'].fillna('').str.lower().str.contains(
-                    pattern, regex=True, case=False, na=False
-                )
-                skill_median = valid_sal[mask]['avg_salary'].median()
-                count = mask.sum()
-
-                if pd.notna(skill_median) and count >= 10:
-                    premium_pct = ((skill_median / baseline_median) - 1) * 100
-                    premiums.append({
-                        'Skill': skill_name,
-                        'Median': int(skill_median),
-                        'Premium': f"+{int(premium_pct)}%" if premium_pct >= 0 else f"{int(premium_pct)}%",
-                        'Premium_Raw': premium_pct,
-                        'Jobs': int(count)
-                    })
-            except Exception as e:
-                logger.debug(f"Regex failed for {skill_name}, using fallback: {e}")
-                mask = valid_sal['description'].fillna('').str.lower().str.contains(
-                    skill_name.lower(), regex=False
-                )
-                skill_median = valid_sal[mask]['avg_salary'].median()
-                count = mask.sum()
-                if pd.notna(skill_median) and count >= 10:
-                    premium_pct = ((skill_median / baseline_median) - 1) * 100
-                    premiums.append({
-                        'Skill': skill_name,
-                        'Median': int(skill_median),
-                        'Premium': f"+{int(premium_pct)}%" if premium_pct >= 0 else f"{int(premium_pct)}%",
-                        'Premium_Raw': premium_pct,
-                        'Jobs': int(count)
-                    })
+            mask = self.hits.mask('skills', skill_name).loc[valid_sal.index]
+            skill_median = valid_sal[mask]['avg_salary'].median()
+            count = mask.sum()
+
+            if pd.notna(skill_median) and count >= 10:
+                premium_pct = ((skill_median / baseline_median) - 1) * 100
+                premiums.append({
+                    'Skill': skill_name,
+                    'Median': int(skill_median),
+                    'Premium': f"+{int(premium_pct)}%" if premium_pct >= 0 else f"{int(premium_pct)}%",
+                    'Premium_Raw': premium_pct,
+                    'Jobs': int(count)
+                })
 
         if not premiums:
             return pd.DataFrame(columns=['Skill', 'Median', 'Premium', 'Jobs'])
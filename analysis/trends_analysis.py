@@ -10,51 +10,45 @@ import re
 import logging
 from typing import Dict, List, Optional
 
+from taxonomy_matcher import TaxonomyHits
+
 logger = logging.getLogger(__name__)
 
 
 class TrendsAnalysis:
     """Trend detection and market signal analytics."""
     
-    def __init__(self, df: pd.DataFrame, taxonomy: dict):
+    def __init__(self, df: pd.DataFrame, taxonomy: dict, hits: Optional[TaxonomyHits] = None):
         """
         Initialize with data and taxonomy.
         
         Args:
             df: DataFrame with job data
             taxonomy: Loaded taxonomy dict with skill_patterns, toxicity, etc.
+            hits: Shared taxonomy hits for df (computed here when omitted)
         """
         self.df = df
         self.taxonomy = taxonomy
+        self.hits = hits if hits is not None else TaxonomyHits(df, taxonomy)
     
     def get_emerging_tech_signals(self) -> pd.DataFrame:
         """Detect hot/emerging technologies based on mention frequency."""
-        skill_patterns = self.taxonomy.get('skill_patterns', {})
-        
         emerging_techs = ['Rust', 'Go', 'AI/ML', 'GraphQL', 'Terraform', 
                          'dbt', 'Kafka', 'Snowflake', 'Databricks']
 
         results = []
         for tech in emerging_techs:
-            if tech not in skill_patterns:
-                continue
-            
-            pattern = skill_patterns[tech]
-            try:
-                mask = self.df['description'].fillna('').str.lower().str.contains(
-                    pattern, regex=True, case=False, na=False
-                )
-                count = mask.sum()
-                if count >= 5:
-                    results.append({
-                        'Technology': tech,
-                        'Mentions': int(count),
-                        'Percentage': f"{(count / len(self.df) * 100):.1f}%"
-                    })
-            except Exception as e:
-                logger.debug(f"Pattern failed for {tech}: {e}")
+            if not self.hits.has('skills', tech):
                 continue
 
+            count = self.hits.mask('skills', tech).sum()
+            if count >= 5:
+                results.append({
+                    'Technology': tech,
+                    'Mentions': int(count),
+                    'Percentage': f"{(count / len(self.df) * 100):.1f}%"
+                })
+
         if not results:
             return pd.DataFrame(columns=['Technology', 'Mentions', 'Percentage'])
 
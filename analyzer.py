@@ -9,16 +9,30 @@ import re
 import hashlib
 import unicodedata
 import duckdb
+import pyarrow as pa
 import yaml
 from dataclasses import dataclass
-from typing import Optional
+from typing import List, Optional
 
 # New module imports
 from parsers import SalaryParser, THOUSAND_SEP_PATTERN
 from classifiers import JobClassifier
+import embedding_classifier
+from micro_batcher import MicroBatcher
+import near_duplicates
+import rollups
+from vector_index import VectorIndex
 from settings import settings
 from tools.location_normalizer import LocationNormalizer
 
+# Optional: zstd compression for the content-addressed text store
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    zstandard = None
+    ZSTD_AVAILABLE = False
+
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger('HR-Intel-Analyzer')
 
@@ -32,6 +46,12 @@ def load_taxonomy():
 
 TAXONOMY = load_taxonomy()
 
+# Labels assigned by MarketIntelligence._enrich_contract_type (HPP otherwise)
+CONTRACT_TYPE_LABELS = {'ico': 'IÄŚO', 'brigada': 'BrigĂˇda'}
+
+# Descriptions that rule remote work out (MarketIntelligence.get_remote_truth)
+REMOTE_RIGID_PATTERN = r"no remote|not remote|office only|nenĂ­ remote|pouze v kancelĂˇĹ™i"
+
 # --- PRE-COMPILED REGEX PATTERNS (Performance fix: compile once at module load) ---
 def _build_word_boundary_pattern(keywords: list) -> re.Pattern:
     """Build a compiled regex pattern with word boundaries for keyword matching."""
@@ -113,6 +133,115 @@ def get_content_hash(title: str, company: str, description: str, city: str = "",
     return hashlib.sha256(clean.encode()).hexdigest()
 
 
+def get_text_hash(text: Optional[str]) -> Optional[str]:
+    """Content address of a description/benefits text in the descriptions table.
+
+    Whitespace runs are collapsed before hashing so re-scrapes that differ only
+    in layout (innerText line breaks, indentation) share one stored copy.
+    """
+    if text is None:
+        return None
+    normalized = " ".join(str(text).split())
+    return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+
+
+_ZSTD_CODEC = None
+
+
+def _zstd_codec() -> tuple:
+    """Shared (compressor, decompressor) pair, created on first use."""
+    global _ZSTD_CODEC
+    if _ZSTD_CODEC is None:
+        _ZSTD_CODEC = (zstandard.ZstdCompressor(level=10), zstandard.ZstdDecompressor())
+    return _ZSTD_CODEC
+
+
+def _encode_text(text: str, codec: str) -> tuple:
+    """Split a text into the (body, compressed) columns of the descriptions table.
+
+    'raw' texts stay in the VARCHAR body column, where DuckDB's own string
+    compression applies and SQL can read them; 'zstd' texts go to the BLOB column.
+    """
+    if codec == "zstd":
+        return None, _zstd_codec()[0].compress(text.encode("utf-8"))
+    return text, None
+
+
+def _decode_text(body: Optional[str], compressed: Optional[bytes], codec: str) -> Optional[str]:
+    """Inverse of _encode_text."""
+    if codec == "zstd" and compressed is not None:
+        return _zstd_codec()[1].decompress(bytes(compressed)).decode("utf-8")
+    return body
+
+
+def signals_text_sql(decode_zstd: bool = False) -> str:
+    """Query behind the signals_text view: signals with their texts resolved.
+
+    decode_zstd also reads the compressed column through the zstd_text()
+    function that register_text_decoder adds to a connection.
+    """
+    def resolved(column: str, alias: str) -> str:
+        if not decode_zstd:
+            return f"COALESCE(s.{column}, {alias}.body) AS {column}"
+        # CASE rather than COALESCE: DuckDB garbles Arrow UDF results under COALESCE
+        return (f"CASE WHEN s.{column} IS NOT NULL THEN s.{column} "
+                f"WHEN {alias}.body IS NOT NULL THEN {alias}.body "
+                f"ELSE zstd_text({alias}.compressed) END AS {column}")
+
+    return f"""
+        SELECT s.* REPLACE (
+            {resolved("description", "d")},
+            {resolved("benefits", "b")}
+        )
+        FROM signals s
+        LEFT JOIN descriptions d ON d.text_hash = s.description_hash
+        LEFT JOIN descriptions b ON b.text_hash = s.benefits_hash
+    """
+
+
+def _zstd_text(blobs: pa.Array) -> pa.Array:
+    """Vectorized zstd_text() for DuckDB: BLOB -> VARCHAR."""
+    decompress = _zstd_codec()[1].decompress
+    return pa.array(
+        [None if blob is None else decompress(blob).decode("utf-8") for blob in blobs.to_pylist()],
+        pa.string()
+    )
+
+
+def register_text_decoder(con: duckdb.DuckDBPyConnection, force: bool = False) -> bool:
+    """Make zstd-compressed texts readable through signals_text on this connection.
+
+    The persistent view only sees the 'raw' body column. When the store holds
+    zstd texts (or force is set, for a writer using that codec), the decoder is
+    registered as a function and signals_text is shadowed by a temp view that
+    also decodes the compressed column, so SQL consumers get every text.
+
+    Returns:
+        True when the decoding view is in place.
+    """
+    try:
+        if not force:
+            force = con.execute(
+                "SELECT COUNT(*) FROM (SELECT 1 FROM descriptions"
+                " WHERE body IS NULL AND compressed IS NOT NULL LIMIT 1)"
+            ).fetchone()[0] > 0
+        if not force:
+            return False
+        if not ZSTD_AVAILABLE:
+            logger.warning("zstd-compressed texts found but zstandard is not installed - "
+                           "SQL readers will see them as NULL")
+            return False
+        registered = con.execute(
+            "SELECT COUNT(*) FROM duckdb_functions() WHERE function_name = 'zstd_text'"
+        ).fetchone()[0]
+        if not registered:
+            con.create_function("zstd_text", _zstd_text, ["BLOB"], "VARCHAR", type="arrow")
+        con.execute(f"CREATE OR REPLACE TEMP VIEW signals_text AS {signals_text_sql(decode_zstd=True)}")
+        return True
+    except duckdb.Error:
+        return False  # No text store yet (database not migrated)
+
+
 class SemanticEngine:
     """Simulates AI logic using high-fidelity keyword weighting (NER Lite)."""
 
@@ -160,10 +289,23 @@ class IntelligenceCore:
     def __init__(self, read_only=False):
         settings.ensure_dirs()  # Create data/config/public dirs if needed
         self.con = duckdb.connect(DB_PATH, read_only=read_only)
+        self.read_only = read_only
         self.normalizer = LocationNormalizer()
+        self.text_codec = settings.get_text_codec()
+        if self.text_codec == "zstd" and not ZSTD_AVAILABLE:
+            logger.warning("zstandard not installed - storing descriptions uncompressed")
+            self.text_codec = "raw"
         self._init_db()
+        register_text_decoder(self.con, force=self.text_codec == "zstd")
         self._df_cache = None  # Lazy loading cache
         self._cache_timestamp = None
+        self._stale_rollup_weeks = set()  # Weeks whose rows changed since the last refresh_rollups
+        self._vector_index = None  # Loaded on first use (see vector_index)
+        # Signals waiting for the embedding fallback, inserted when their batch flushes
+        self.role_batcher = MicroBatcher(self._flush_role_batch, settings.get_role_batch_size(),
+                                         settings.get_role_batch_latency(), name="Embedding role batches")
+        if not read_only:
+            self._load_classification_cache()
 
     def _init_db(self):
         # Only create table if not read_only
@@ -188,11 +330,29 @@ class IntelligenceCore:
                     role_type TEXT DEFAULT 'Unknown',
                     seniority_level TEXT DEFAULT 'Unknown',
                     ghost_score INTEGER DEFAULT 0,
-                    region TEXT DEFAULT 'Unknown'
+                    region TEXT DEFAULT 'Unknown',
+                    description_hash TEXT,
+                    benefits_hash TEXT,
+                    cluster_id TEXT,
+                    resolved_city TEXT
                 )
             """
             )
-            
+
+            # Content-addressed text store: one row per distinct description/benefits
+            # text, referenced from signals by hash (see get_text_hash)
+            self.con.execute(
+                """
+                CREATE TABLE IF NOT EXISTS descriptions (
+                    text_hash TEXT PRIMARY KEY,
+                    codec TEXT,
+                    body TEXT,
+                    compressed BLOB,
+                    raw_length INTEGER
+                )
+            """
+            )
+
             # v1.0 Migration: Add new HR Intelligence columns to existing table
             try:
                 self.con.execute("ALTER TABLE signals ADD COLUMN role_type TEXT DEFAULT 'Unknown'")
@@ -216,6 +376,45 @@ class IntelligenceCore:
             except Exception:
                 pass  # Column already exists
 
+            # v1.6 Content-addressed description storage
+            for column in ("description_hash", "benefits_hash"):
+                try:
+                    self.con.execute(f"ALTER TABLE signals ADD COLUMN {column} TEXT")
+                except Exception:
+                    pass  # Column already exists
+            self._migrate_inline_texts()
+
+            # v1.7 Near-duplicate clusters (MinHash + LSH, see near_duplicates.py)
+            try:
+                self.con.execute("ALTER TABLE signals ADD COLUMN cluster_id TEXT")
+            except Exception:
+                pass  # Column already exists
+            self.con.execute(
+                "CREATE TABLE IF NOT EXISTS minhash_signatures (hash TEXT PRIMARY KEY, cluster_id TEXT, signature BLOB)"
+            )
+            self.con.execute("CREATE TABLE IF NOT EXISTS lsh_buckets (band_key BIGINT, hash TEXT)")
+
+            # v1.9 Persisted role/seniority classifications (see classifiers.ClassificationCache)
+            self.con.execute(
+                """
+                CREATE TABLE IF NOT EXISTS classification_cache (
+                    kind TEXT, title_key TEXT, description_fp TEXT, value TEXT,
+                    version TEXT, used_at TIMESTAMP,
+                    PRIMARY KEY (kind, title_key, description_fp)
+                )
+            """
+            )
+
+            # v1.10 Resolved locations (see resolve_locations)
+            try:
+                self.con.execute("ALTER TABLE signals ADD COLUMN resolved_city TEXT")
+            except Exception:
+                pass  # Column already exists
+
+            # Texts resolved back onto signals for SQL consumers. The stored view
+            # reads the 'raw' codec; register_text_decoder adds zstd per connection.
+            self.con.execute(f"CREATE OR REPLACE VIEW signals_text AS {signals_text_sql()}")
+
             # Create indexes for frequently queried columns
             # These dramatically improve performance for analytics queries
             indexes = [
@@ -228,8 +427,12 @@ class IntelligenceCore:
                 "CREATE INDEX IF NOT EXISTS idx_city ON signals(city)",
                 "CREATE INDEX IF NOT EXISTS idx_region ON signals(region)",
                 "CREATE INDEX IF NOT EXISTS idx_role_type ON signals(role_type)",
-                "CREATE INDEX IF NOT EXISTS idx_seniority_level ON signals(seniority_level)"
+                "CREATE INDEX IF NOT EXISTS idx_seniority_level ON signals(seniority_level)",
+                "CREATE INDEX IF NOT EXISTS idx_lsh_band_key ON lsh_buckets(band_key)"
             ]
+
+            # v1.8 Report rollups (see rollups.py)
+            rollups.ensure_tables(self.con)
             
             for idx_sql in indexes:
                 try:
@@ -247,21 +450,181 @@ class IntelligenceCore:
     def df(self):
         """Lazy-loaded DataFrame with caching to avoid repeated DB queries."""
         # Cache is valid for 60 seconds
-        if self._df_cache is None or (self._cache_timestamp and 
+        if self._df_cache is None or (self._cache_timestamp and
                                       (datetime.now() - self._cache_timestamp).seconds > 60):
-            self._df_cache = self.con.execute("SELECT * FROM signals").df()
-            self._cache_timestamp = datetime.now()
+            self.load_as_df()
         return self._df_cache
-    
-    def load_as_df(self):
-        """Force reload from database, bypassing cache."""
-        self._df_cache = self.con.execute("SELECT * FROM signals").df()
+
+    def load_as_df(self, include_text: bool = True):
+        """Force reload from database, bypassing cache.
+
+        Args:
+            include_text: Join description/benefits from the text store. When
+                False only the narrow signals columns are read and the result
+                is returned without touching the cache.
+        """
+        if not include_text:
+            return self.con.execute("SELECT * FROM signals").df()
+        self._df_cache = self._resolve_texts(self.con.execute(f"SELECT * FROM {self._text_source()}").df())
         self._cache_timestamp = datetime.now()
         return self._df_cache
 
+    def _text_source(self) -> str:
+        """signals_text when the DB has been migrated, plain signals otherwise."""
+        exists = self.con.execute(
+            "SELECT COUNT(*) FROM duckdb_views() WHERE view_name = 'signals_text'"
+        ).fetchone()[0]
+        return "signals_text" if exists else "signals"
+
+    def _store_text(self, text: Optional[str]) -> Optional[str]:
+        """Write a text into the descriptions table (once per content) and return its hash."""
+        text_hash = get_text_hash(text)
+        if text_hash is None:
+            return None
+        body, compressed = _encode_text(text, self.text_codec)
+        self.con.execute(
+            "INSERT OR IGNORE INTO descriptions VALUES (?, ?, ?, ?, ?)",
+            [text_hash, self.text_codec, body, compressed, len(text)]
+        )
+        return text_hash
+
+    def get_texts(self, text_hashes: list) -> dict:
+        """Fetch and decode texts from the descriptions table.
+
+        Returns:
+            Mapping of text_hash to decoded text for the hashes that exist.
+        """
+        wanted = [h for h in set(text_hashes) if isinstance(h, str)]
+        if not wanted:
+            return {}
+        rows = self.con.execute(
+            "SELECT text_hash, codec, body, compressed FROM descriptions WHERE text_hash IN (SELECT unnest(?))",
+            [wanted]
+        ).fetchall()
+        return {h: _decode_text(body, compressed, codec) for h, codec, body, compressed in rows}
+
+    def _resolve_texts(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Fill texts the signals_text view could not decode (zstd without zstandard)."""
+        for column in ("description", "benefits"):
+            hash_column = f"{column}_hash"
+            if hash_column not in df.columns or df.empty:
+                continue
+            missing = df[column].isna() & df[hash_column].notna()
+            if missing.any():
+                texts = self.get_texts(df.loc[missing, hash_column].tolist())
+                df.loc[missing, column] = df.loc[missing, hash_column].map(texts)
+        return df
+
+    def _migrate_inline_texts(self) -> None:
+        """Move description/benefits still stored inline on signals into the text store."""
+        pending = self.con.execute(
+            """
+            SELECT hash, description, benefits FROM signals
+            WHERE (description IS NOT NULL AND description_hash IS NULL)
+               OR (benefits IS NOT NULL AND benefits_hash IS NULL)
+        """
+        ).df()
+        if pending.empty:
+            return
+
+        logger.info(f"Moving {len(pending)} inline descriptions into the content-addressed store...")
+        store = {}
+        refs = {"description": [], "benefits": []}
+        for column in ("description", "benefits"):
+            for text in pending[column]:
+                text_hash = get_text_hash(text)
+                refs[column].append(text_hash)
+                if text_hash is not None and text_hash not in store:
+                    store[text_hash] = (self.text_codec, *_encode_text(text, self.text_codec), len(text))
+
+        texts_df = pd.DataFrame(
+            [(h, *entry) for h, entry in store.items()],
+            columns=["text_hash", "codec", "body", "compressed", "raw_length"]
+        )
+        refs_df = pd.DataFrame({
+            "hash": pending["hash"],
+            "description_hash": refs["description"],
+            "benefits_hash": refs["benefits"],
+        })
+        self.con.register("_texts_df", texts_df)
+        self.con.register("_refs_df", refs_df)
+        try:
+            self.con.execute("INSERT OR IGNORE INTO descriptions SELECT * FROM _texts_df")
+            self.con.execute(
+                """
+                UPDATE signals SET
+                    description_hash = r.description_hash,
+                    benefits_hash = r.benefits_hash,
+                    description = NULL,
+                    benefits = NULL
+                FROM _refs_df r
+                WHERE signals.hash = r.hash
+            """
+            )
+        finally:
+            self.con.unregister("_texts_df")
+            self.con.unregister("_refs_df")
+
+    def _prune_orphan_texts(self) -> int:
+        """Delete stored texts no longer referenced by any signal. Returns rows removed."""
+        removed = self.con.execute(
+            """
+            DELETE FROM descriptions WHERE text_hash NOT IN (
+                SELECT description_hash FROM signals WHERE description_hash IS NOT NULL
+                UNION
+                SELECT benefits_hash FROM signals WHERE benefits_hash IS NOT NULL
+            )
+            RETURNING 1
+        """
+        ).fetchall()
+        return len(removed)
+
+    def _load_classification_cache(self) -> None:
+        """Warm JobClassifier.cache with the persisted entries of the current classifier version.
+
+        Entries of the other mode's current version are kept (a run without
+        the model must not wipe the embedding results); outdated ones are dropped.
+        """
+        cache = JobClassifier.cache
+        version = JobClassifier.current_version()
+        try:
+            self.con.execute("DELETE FROM classification_cache WHERE NOT list_contains(?, version)",
+                             [JobClassifier.known_versions()])
+            rows = self.con.execute("""
+                SELECT kind, title_key, description_fp, value FROM (
+                    SELECT * FROM classification_cache WHERE version = ? ORDER BY used_at DESC LIMIT ?
+                ) ORDER BY used_at
+            """, [version, cache.maxsize]).fetchall()
+        except duckdb.Error as e:
+            logger.debug(f"Classification cache not loaded: {e}")
+            return
+        cache.load(rows)
+
+    def save_classification_cache(self) -> dict:
+        """Persist entries used in this run, trim the table to the cache size and log the hit rate."""
+        cache = JobClassifier.cache
+        stats = cache.stats()
+        rows = cache.drain_touched()
+        if rows and cache.version:
+            frame = pd.DataFrame(rows, columns=["kind", "title_key", "description_fp", "value"])
+            frame["version"] = cache.version
+            frame["used_at"] = datetime.now()
+            self.con.execute("INSERT OR REPLACE INTO classification_cache BY NAME SELECT * FROM frame")
+            self.con.execute("""
+                DELETE FROM classification_cache WHERE rowid IN (
+                    SELECT rowid FROM classification_cache ORDER BY used_at DESC OFFSET ?
+                )
+            """, [cache.maxsize])
+        logger.info(f"Classification cache: {stats['hits']} hits / {stats['hits'] + stats['misses']} lookups "
+                    f"({stats['hit_rate']:.1%}), {stats['size']} entries")
+        return stats
+
     def close(self):
         """Explicitly close the DuckDB connection."""
         if hasattr(self, 'con') and self.con:
+            if not self.read_only:
+                self.flush_pending_signals()
+                self.save_classification_cache()
             self.con.close()
 
     def is_known(self, url: str) -> bool:
@@ -318,8 +681,37 @@ class IntelligenceCore:
 
         return min(score, 100)
 
-    def add_signal(self, signal: JobSignal):
-        """Adds a new signal with semantic enrichment and HR classification."""
+    def add_signals(self, signals: List[JobSignal]):
+        """Adds a scraped page of signals, batching the embedding fallback.
+
+        Signals with a cached or keyword role are inserted now. The ones
+        keywords cannot place wait in role_batcher and go to the embedding
+        classifier together with other pages' misses, then are inserted; call
+        flush_pending_signals() before reading what was ingested.
+        """
+        roles = JobClassifier.keyword_pass([(s.title, s.description) for s in signals])
+        for signal, role in zip(signals, roles):
+            if role is not None:
+                self.add_signal(signal, role=role)
+        self.role_batcher.add([s for s, role in zip(signals, roles) if role is None])
+
+    def _flush_role_batch(self, signals: List[JobSignal]):
+        roles = JobClassifier.embedding_pass([(s.title, s.description) for s in signals])
+        for signal, role in zip(signals, roles):
+            self.add_signal(signal, role=role)
+
+    def flush_pending_signals(self) -> dict:
+        """Classify and insert signals still waiting for an embedding batch; log batch stats."""
+        self.role_batcher.flush()
+        return self.role_batcher.log_stats()
+
+    def add_signal(self, signal: JobSignal, role: Optional[str] = None):
+        """Adds a new signal with semantic enrichment and HR classification.
+
+        Args:
+            signal: Scraped job.
+            role: Role already classified by add_signals; classified here if None.
+        """
         # Calculate semantic metrics
         tox = SemanticEngine.analyze_toxicity(signal.description)
         tech = SemanticEngine.analyze_tech_lag(signal.description)
@@ -327,7 +719,8 @@ class IntelligenceCore:
         h = get_content_hash(signal.title, signal.company, signal.description, signal.location, signal.link)
 
         # v1.0 HR Intelligence: Role and Seniority classification
-        role = JobClassifier.classify_role(signal.title, signal.description)
+        if role is None:
+            role = JobClassifier.classify_role(signal.title, signal.description)
         seniority = JobClassifier.detect_seniority(signal.title, signal.description)
 
         # Robust Salary Parsing
@@ -344,12 +737,28 @@ class IntelligenceCore:
         now = datetime.now()
         try:
             # v1.1 Regional Analysis: Normalize location
-            region, city = self.normalizer.normalize(signal.location)
+            _, city = self.normalizer.normalize(signal.location)
+            # Region and display city with the description fallback, so readers never re-derive them
+            region, resolved_city = self.normalizer.resolve(signal.location, signal.description)
             
-            self.con.execute(
+            # Texts live in the descriptions table; signals only keeps the references
+            description_hash = self._store_text(signal.description)
+            benefits_hash = self._store_text(signal.benefits)
+
+            # v1.7 Near-duplicates: join the cluster of a re-posted ad, else start one
+            signature = near_duplicates.minhash_signature(signal.description)
+            cluster_id = self._find_cluster(signature) or h
+
+            inserted = self.con.execute(
                 """
-                INSERT OR IGNORE INTO signals 
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                INSERT OR IGNORE INTO signals (
+                    hash, title, company, salary_raw, avg_salary, description, benefits,
+                    link, source, city, scraped_at, toxicity_score, tech_status,
+                    last_seen_at, role_type, seniority_level, ghost_score, region,
+                    description_hash, benefits_hash, cluster_id, resolved_city
+                )
+                VALUES (?, ?, ?, ?, ?, NULL, NULL, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                RETURNING hash
             """,
                 [
                     h,
@@ -357,8 +766,6 @@ class IntelligenceCore:
                     signal.company,
                     signal.salary,
                     avg_sal,
-                    signal.description,
-                    signal.benefits,
                     signal.link,
                     signal.source,
                     city,
@@ -370,11 +777,188 @@ class IntelligenceCore:
                     seniority,
                     ghost_score,
                     region,
+                    description_hash,
+                    benefits_hash,
+                    cluster_id,
+                    resolved_city,
                 ],
-            )
+            ).fetchall()
+            if inserted:
+                self._stale_rollup_weeks.add(now.date() - timedelta(days=now.weekday()))
+            if inserted and signature is not None:
+                self._index_signature(h, cluster_id, signature)
         except Exception as e:
             logger.error(f"DB Error: {e}")
 
+    def _find_cluster(self, signature) -> Optional[str]:
+        """Cluster id of the most similar indexed signal, via LSH bucket lookups."""
+        if signature is None:
+            return None
+        keys = near_duplicates.band_keys(signature)[0].tolist()
+        candidates = self.con.execute(
+            "SELECT DISTINCT hash FROM lsh_buckets WHERE band_key IN (SELECT unnest(?))",
+            [keys]
+        ).fetchall()
+        if not candidates:
+            return None
+        rows = self.con.execute(
+            "SELECT cluster_id, signature FROM minhash_signatures WHERE hash IN (SELECT unnest(?))",
+            [[c[0] for c in candidates]]
+        ).fetchall()
+        return near_duplicates.best_match(signature, rows)
+
+    def _index_signature(self, h: str, cluster_id: str, signature) -> None:
+        """Store a signal's MinHash signature and its LSH bucket keys."""
+        self.con.execute(
+            "INSERT OR IGNORE INTO minhash_signatures VALUES (?, ?, ?)",
+            [h, cluster_id, near_duplicates.signature_to_bytes(signature)]
+        )
+        self.con.execute(
+            "INSERT INTO lsh_buckets SELECT unnest(?), ?",
+            [near_duplicates.band_keys(signature)[0].tolist(), h]
+        )
+
+    def rebuild_near_duplicates(self) -> int:
+        """Recompute MinHash signatures, LSH buckets and cluster ids for all signals.
+
+        Used to backfill databases created before v1.7 and after changes to
+        near_duplicates parameters. Signals are processed oldest-first so the
+        original posting becomes the cluster id.
+
+        Returns:
+            Number of signals that share a cluster with at least one other signal.
+        """
+        frame = self._resolve_texts(self.con.execute(
+            f"SELECT hash, description, description_hash FROM {self._text_source()} ORDER BY scraped_at, hash"
+        ).df())
+        logger.info(f"Building near-duplicate index for {len(frame)} signals...")
+
+        hashes, signatures = [], []
+        for h, text in zip(frame["hash"], frame["description"]):
+            signature = near_duplicates.minhash_signature(text if isinstance(text, str) else None)
+            if signature is not None:
+                hashes.append(h)
+                signatures.append(signature)
+
+        clusters = pd.DataFrame({"hash": frame["hash"], "cluster_id": frame["hash"]})
+        self.con.execute("DELETE FROM lsh_buckets")
+        self.con.execute("DELETE FROM minhash_signatures")
+        if signatures:
+            stacked = np.vstack(signatures)
+            representatives = near_duplicates.cluster_signatures(stacked)
+            cluster_of = dict(zip(hashes, np.asarray(hashes, dtype=object)[representatives]))
+            clusters["cluster_id"] = clusters["hash"].map(cluster_of).fillna(clusters["hash"])
+
+            signatures_df = pd.DataFrame({
+                "hash": hashes,
+                "cluster_id": [cluster_of[h] for h in hashes],
+                "signature": [near_duplicates.signature_to_bytes(sig) for sig in signatures],
+            })
+            keys = near_duplicates.band_keys(stacked)
+            buckets_df = pd.DataFrame({
+                "band_key": keys.ravel(),
+                "hash": np.repeat(np.asarray(hashes, dtype=object), near_duplicates.BANDS),
+            })
+            self.con.register("_signatures_df", signatures_df)
+            self.con.register("_buckets_df", buckets_df)
+            try:
+                self.con.execute("INSERT INTO minhash_signatures SELECT * FROM _signatures_df")
+                self.con.execute("INSERT INTO lsh_buckets SELECT * FROM _buckets_df")
+            finally:
+                self.con.unregister("_signatures_df")
+                self.con.unregister("_buckets_df")
+
+        self.con.register("_clusters_df", clusters)
+        try:
+            self.con.execute(
+                "UPDATE signals SET cluster_id = c.cluster_id FROM _clusters_df c WHERE signals.hash = c.hash"
+            )
+        finally:
+            self.con.unregister("_clusters_df")
+
+        duplicated = int(clusters["cluster_id"].duplicated(keep=False).sum())
+        logger.info(
+            f"Near-duplicate index ready: {clusters['cluster_id'].nunique()} unique jobs "
+            f"across {len(clusters)} signals ({duplicated} in shared clusters)."
+        )
+        return duplicated
+
+    def ensure_near_duplicate_index(self) -> None:
+        """Backfill the near-duplicate index if any signal has no cluster yet."""
+        missing = self.con.execute("SELECT COUNT(*) FROM signals WHERE cluster_id IS NULL").fetchone()[0]
+        if missing:
+            self.rebuild_near_duplicates()
+
+    def resolve_locations(self, only_missing: bool = True) -> int:
+        """Store region and resolved_city from LocationNormalizer.resolve_many.
+
+        Signals stored before v1.10 have no resolved_city; their region also
+        lacked the description fallback. Weeks whose regions change are
+        marked for the next refresh_rollups.
+
+        Args:
+            only_missing: Only signals without a resolved_city. False
+                re-resolves every signal (after reanalysis).
+
+        Returns:
+            Number of signals updated.
+        """
+        where = "WHERE resolved_city IS NULL" if only_missing else ""
+        rows = self._resolve_texts(self.con.execute(
+            f"""SELECT hash, city, region, resolved_city, description, description_hash, scraped_at
+                FROM {self._text_source()} {where}"""
+        ).df())
+        if rows.empty:
+            return 0
+
+        # city holds normalize()'s output; rows stored without a location stay Unknown
+        locations = rows["city"].where(rows["region"] != "Unknown")
+        resolved = self.normalizer.resolve_many(locations, rows["description"])
+        region_changed = rows["region"].ne(resolved["region"])
+        changed = region_changed | rows["resolved_city"].ne(resolved["city"])
+        if not changed.any():
+            return 0
+
+        updates = pd.DataFrame({
+            "hash": rows.loc[changed, "hash"],
+            "region": resolved.loc[changed, "region"],
+            "resolved_city": resolved.loc[changed, "city"],
+        })
+        self.con.register("_locations_df", updates)
+        try:
+            self.con.execute(
+                """
+                UPDATE signals SET region = u.region, resolved_city = u.resolved_city
+                FROM _locations_df u
+                WHERE signals.hash = u.hash
+            """
+            )
+        finally:
+            self.con.unregister("_locations_df")
+        for scraped_at in rows.loc[region_changed, "scraped_at"].dropna():
+            self._stale_rollup_weeks.add(scraped_at.date() - timedelta(days=scraped_at.weekday()))
+        logger.info(f"Resolved locations for {len(updates)} signals.")
+        return len(updates)
+
+    def refresh_rollups(self, full: bool = False) -> int:
+        """Re-aggregate report rollups for the weeks touched since the last refresh.
+
+        Args:
+            full: Rebuild every week (after reanalysis changed classifications).
+                Also done automatically when the rollups are still empty.
+
+        Returns:
+            Number of rollup groups written.
+        """
+        has_rollups = self.con.execute("SELECT COUNT(*) FROM rollup_counts").fetchone()[0] > 0
+        full = full or not has_rollups
+        weeks = None if full else self._stale_rollup_weeks
+        written = rollups.refresh(self.con, rollups.contract_type_sql(TAXONOMY, CONTRACT_TYPE_LABELS), weeks)
+        scope = "all weeks" if full else f"{len(self._stale_rollup_weeks)} week(s)"
+        logger.info(f"Rollups refreshed for {scope}: {written} groups.")
+        self._stale_rollup_weeks = set()
+        return written
+
     def get_summary(self):
         if self.df.empty:
             return "NO DATA"
@@ -396,32 +980,134 @@ class IntelligenceCore:
         from datetime import datetime, timedelta
         cutoff = datetime.now() - timedelta(minutes=threshold_minutes)
         
-        self.con.execute(
-            "DELETE FROM signals WHERE last_seen_at < ?",
+        expired = self.con.execute(
+            "DELETE FROM signals WHERE last_seen_at < ? RETURNING hash, CAST(date_trunc('week', scraped_at) AS DATE)",
             [cutoff]
-        )
+        ).fetchall()
+        self._stale_rollup_weeks.update(week for _, week in expired if week is not None)
         
         after = self.con.execute("SELECT count(*) FROM signals").fetchone()[0]
         removed = before - after
+        orphaned = self._prune_orphan_texts()
+        self.con.execute("DELETE FROM lsh_buckets WHERE hash NOT IN (SELECT hash FROM signals)")
+        self.con.execute("DELETE FROM minhash_signatures WHERE hash NOT IN (SELECT hash FROM signals)")
         logger.info(f"Cleanup: Removed {removed} expired listings. {after} active signals remaining.")
+        if orphaned:
+            logger.info(f"Cleanup: Pruned {orphaned} descriptions no longer referenced by any signal.")
+        if expired and os.path.exists(self._vector_index_path()):
+            if self.vector_index.remove(h for h, _ in expired):
+                self.vector_index.save(self._vector_index_path())
+
+    # --- Similar postings (vector index) ---
+
+    def _vector_index_path(self) -> str:
+        """Index file next to the DB (or JOBSCZINSIGHT_VECTOR_INDEX_PATH)."""
+        env_path = settings.get_vector_index_path()
+        return str(env_path) if env_path else os.path.splitext(DB_PATH)[0] + ".vectors.npz"
+
+    @property
+    def vector_index(self) -> VectorIndex:
+        """Similar-postings index over signal embeddings, loaded on first use."""
+        if self._vector_index is None:
+            self._vector_index = VectorIndex.load(self._vector_index_path(), embedding_classifier.store_name())
+        return self._vector_index
+
+    def update_vector_index(self, batch_size: int = 2048) -> int:
+        """Embed active signals missing from the vector index and add them.
+
+        Signals no longer in the table are dropped too (cleanup_expired already
+        does this as it deletes). Texts embedded before, e.g. by the role
+        fallback, come from the embedding store instead of the model.
+
+        Returns:
+            Number of signals added.
+        """
+        if not embedding_classifier.EmbeddingClassifier.is_available():
+            logger.info("Vector index not updated: embeddings unavailable")
+            return 0
+        index = self.vector_index
+        active = [h for (h,) in self.con.execute("SELECT hash FROM signals").fetchall()]
+        active_set = set(active)
+        removed = index.remove([h for h in index.hashes if h not in active_set])
+        missing = [h for h in active if h not in index]
+        added = 0
+        for start in range(0, len(missing), batch_size):
+            rows = self._resolve_texts(self.con.execute(
+                f"SELECT hash, title, description, description_hash FROM {self._text_source()} "
+                "WHERE hash IN (SELECT unnest(?))",
+                [missing[start:start + batch_size]]
+            ).df())
+            texts = [embedding_classifier.role_text(title, description if isinstance(description, str) else "")
+                     for title, description in zip(rows["title"], rows["description"])]
+            vectors = embedding_classifier.encode(texts, show_progress_bar=len(missing) >= 1000)
+            if vectors is None:
+                logger.warning("Vector index update stopped: embedding model unavailable")
+                break
+            index.add(rows["hash"].tolist(), vectors)
+            added += len(rows)
+        if added or removed:
+            index.save(self._vector_index_path())
+        logger.info(f"Vector index: {added} added, {removed} removed, {len(index)} signals indexed.")
+        return added
+
+    def find_similar(self, signal_hash: str, k: int = 10, nprobe: int = 16) -> pd.DataFrame:
+        """Postings most similar to an indexed signal (itself excluded), best first.
+
+        Args:
+            signal_hash: Hash of a signal in the vector index.
+            k: Number of results.
+            nprobe: IVF lists scanned; raise for better recall at some speed cost.
+
+        Returns:
+            DataFrame with hash, similarity, title, company, city, source, link,
+            role_type (empty if the signal is not indexed).
+        """
+        vector = self.vector_index.vector(signal_hash)
+        if vector is None:
+            return self._similar_frame([])
+        hits = self.vector_index.search(vector, k + 1, nprobe)[0]
+        return self._similar_frame([hit for hit in hits if hit[0] != signal_hash][:k])
+
+    def find_similar_text(self, text: str, k: int = 10, nprobe: int = 16) -> pd.DataFrame:
+        """Postings most similar to free text (e.g. a title + description), best first."""
+        vectors = embedding_classifier.encode([text])
+        if vectors is None:
+            return self._similar_frame([])
+        return self._similar_frame(self.vector_index.search(vectors, k, nprobe)[0])
+
+    def _similar_frame(self, hits: list) -> pd.DataFrame:
+        frame = pd.DataFrame(hits, columns=["hash", "similarity"])
+        details = self.con.execute(
+            "SELECT hash, title, company, city, source, link, role_type FROM signals WHERE hash IN (SELECT unnest(?))",
+            [frame["hash"].tolist()]
+        ).df()
+        return frame.merge(details, on="hash", how="inner")
 
     def reanalyze_all(self):
         """Re-runs semantic analysis and HR classification on all existing records."""
         logger.info("Re-analyzing all stored signals with v1.0 HR Intelligence...")
-        rows = self.con.execute("SELECT hash, title, description, salary_raw, source FROM signals").fetchall()
-        for h, title, desc, salary_str, source in rows:
+        rows = self._resolve_texts(self.con.execute(
+            f"SELECT hash, title, description, description_hash, salary_raw, source FROM {self._text_source()}"
+        ).df())
+        rows = rows[["hash", "title", "description", "salary_raw", "source"]].astype(object)
+        rows = list(rows.where(rows.notna(), None).itertuples(index=False, name=None))
+        # One batch, so keyword misses share a single embedding pass
+        roles = JobClassifier.classify_roles([(title or "", desc or "") for _, title, desc, _, _ in rows])
+        # Re-parse salaries to apply recent parser fixes (e.g. k-notation)
+        _, _, avg_salaries = SalaryParser.parse_many([r[3] for r in rows], [r[4] for r in rows])
+        for (h, title, desc, salary_str, source), role, avg_sal in zip(rows, roles, avg_salaries):
             tox = SemanticEngine.analyze_toxicity(desc)
             tech = SemanticEngine.analyze_tech_lag(desc)
-            role = JobClassifier.classify_role(title or "", desc or "")
             seniority = JobClassifier.detect_seniority(title or "", desc or "")
             
-            # Re-parse salary to apply recent parser fixes (e.g. k-notation)
-            min_sal, max_sal, avg_sal = SalaryParser.parse(salary_str, source)
-            
             self.con.execute(
                 "UPDATE signals SET toxicity_score = ?, tech_status = ?, role_type = ?, seniority_level = ?, avg_salary = ? WHERE hash = ?",
                 [tox, tech, role, seniority, avg_sal, h]
             )
+        self.ensure_near_duplicate_index()
+        self.resolve_locations(only_missing=False)
+        self.refresh_rollups(full=True)
+        self.save_classification_cache()
         # Invalidate cache after updates
         self.load_as_df()
         logger.info(f"v1.0 Migration complete: {len(rows)} signals updated with role/seniority/salary.")
@@ -431,10 +1117,34 @@ class IntelligenceCore:
         try:
             logger.info("Compacting database (VACUUM)...")
             self.con.execute("VACUUM")
+            self.con.execute("CHECKPOINT")
+            # DuckDB's VACUUM does not shrink the file; rewrite it when most of
+            # it is free blocks (e.g. after moving texts into the descriptions table)
+            size = self.con.execute("SELECT total_blocks, free_blocks FROM pragma_database_size()").fetchone()
+            if size and size[0] and size[1] / size[0] > 0.25:
+                self._rewrite_database_file()
             logger.info("Database compaction complete.")
         except Exception as e:
             logger.warning(f"Warning: VACUUM failed: {e}")
 
+    def _rewrite_database_file(self) -> None:
+        """Copy all tables/views into a fresh file and swap it in place of DB_PATH."""
+        compact_path = f"{DB_PATH}.compact"
+        if os.path.exists(compact_path):
+            os.remove(compact_path)
+        current = self.con.execute("SELECT current_database()").fetchone()[0]
+        self.con.execute(f"ATTACH '{compact_path}' AS compact_target")
+        self.con.execute(f"COPY FROM DATABASE {current} TO compact_target")
+        self.con.execute("DETACH compact_target")
+        self.con.close()
+        os.replace(compact_path, DB_PATH)
+        self.con = duckdb.connect(DB_PATH)
+        # Temp views and cached frames belonged to the old connection
+        register_text_decoder(self.con, force=self.text_codec == "zstd")
+        self._df_cache = None
+        self._cache_timestamp = None
+        logger.info(f"Rewrote database file: {os.path.getsize(DB_PATH) / (1024 * 1024):.1f} MB")
+
     def get_database_stats(self) -> dict:
         """Get comprehensive database statistics for monitoring."""
         try:
@@ -490,17 +1200,40 @@ class MarketIntelligence:
         from analysis.location_analysis import LocationAnalysis
         from analysis.trends_analysis import TrendsAnalysis
         from analysis.regional_analysis import RegionalAnalysis
+        from observations import ObservationStore
+        from taxonomy_matcher import TaxonomyHits
+        import snapshot
         
-        self.core = IntelligenceCore(read_only=True)
-        self.df = self.core.df
+        # Prefer the published snapshot; the DB is only opened when it is missing or stale
+        self.df = snapshot.load_df(db_path=DB_PATH)
+        self.core = None
+        if self.df is None:
+            self.core = IntelligenceCore(read_only=True)
+            self.df = self.core.df
+        self.observations = ObservationStore()
+        # Pre-aggregated counts/quantiles; the snapshot ships them when the DB is not open
+        self._rollup_con = None if self.core else snapshot.connect(db_path=DB_PATH, include_signals=False)
+        self.rollups = rollups.Rollups(self.core.con if self.core else self._rollup_con)
+        # One pass of the taxonomy matcher over all descriptions, shared by every module
+        self.hits = TaxonomyHits(self.df, TAXONOMY)
         self._enrich_contract_type()
+        self._ensure_resolved_city()
+        self.unique_df = self._unique_jobs()
         
         # Compose analysis modules (delegation pattern)
-        self._salary = SalaryAnalysis(self.df, TAXONOMY)
-        self._benefits = BenefitsAnalysis(self.df, TAXONOMY)
-        self._location = LocationAnalysis(self.df, TAXONOMY)
-        self._trends = TrendsAnalysis(self.df, TAXONOMY)
-        self._regional = RegionalAnalysis(self.df)
+        self._salary = SalaryAnalysis(self.df, TAXONOMY, self.observations, self.rollups, hits=self.hits)
+        self._benefits = BenefitsAnalysis(self.df, TAXONOMY, hits=self.hits)
+        self._location = LocationAnalysis(self.df, TAXONOMY, hits=self.hits)
+        self._trends = TrendsAnalysis(self.df, TAXONOMY, hits=self.hits)
+        self._regional = RegionalAnalysis(self.df, self.observations)
+
+    def close(self) -> None:
+        """Close the database handle behind the rollups (the core's or the snapshot's)."""
+        if self.core:
+            self.core.close()
+        if self._rollup_con is not None:
+            self._rollup_con.close()
+            self._rollup_con = None
 
     def _enrich_contract_type(self) -> None:
         """Enrich DataFrame with contract_type column."""
@@ -508,17 +1241,32 @@ class MarketIntelligence:
             self.df['contract_type'] = 'Unknown'
             return
 
-        desc = self.df["description"].str.lower()
-        ico_pat = "|".join(TAXONOMY['contract_keywords']['ico'])
-        brig_pat = "|".join(TAXONOMY['contract_keywords']['brigada'])
-
-        conds = [
-            desc.str.contains(ico_pat, na=False),
-            desc.str.contains(brig_pat, na=False)
-        ]
-        choices = ['IÄŚO', 'BrigĂˇda']
+        conds = [self.hits.mask('contract', 'ico'), self.hits.mask('contract', 'brigada')]
+        choices = [CONTRACT_TYPE_LABELS['ico'], CONTRACT_TYPE_LABELS['brigada']]
         self.df['contract_type'] = np.select(conds, choices, default='HPP')
 
+    def _ensure_resolved_city(self) -> None:
+        """Resolve cities in memory when reading a database not yet backfilled (read-only)."""
+        if 'resolved_city' in self.df.columns and self.df['resolved_city'].notna().all():
+            return
+        missing = self.df['resolved_city'].isna() if 'resolved_city' in self.df.columns else pd.Series(True, self.df.index)
+        rows = self.df[missing]
+        locations = rows['city'].where(rows['region'] != 'Unknown') if 'region' in rows.columns else rows['city']
+        resolved = LocationNormalizer().resolve_many(locations, rows.get('description'))
+        self.df.loc[missing, 'resolved_city'] = resolved['city']
+
+    def _unique_jobs(self) -> pd.DataFrame:
+        """One row per near-duplicate cluster, so re-posts of the same ad count once."""
+        if 'cluster_id' not in self.df.columns:
+            self.df['cluster_id'] = self.df['hash'] if 'hash' in self.df.columns else self.df.index.astype(str)
+        elif 'hash' in self.df.columns:
+            self.df['cluster_id'] = self.df['cluster_id'].fillna(self.df['hash'])
+        return self.df[~self.df['cluster_id'].duplicated(keep='first')]
+
+    def get_unique_job_count(self) -> int:
+        """Number of distinct jobs after collapsing re-posts across sources."""
+        return len(self.unique_df)
+
     def load_ispv_benchmarks(self):
         """Loads official ISPV salary benchmarks from JSON"""
         try:
@@ -580,13 +1328,10 @@ class MarketIntelligence:
 
     def get_remote_truth(self):
         """Calculates jobs that are likely remote, with negative context handling."""
-        remote_pattern = "|".join(TAXONOMY.get("remote_keywords", []))
         # Negative signals: "no remote", "office only", etc.
-        rigid_pattern = r"no remote|not remote|office only|nenĂ­ remote|pouze v kancelĂˇĹ™i"
-        
         desc = self.df["description"].fillna("").str.lower()
-        is_remote_candidate = desc.str.contains(remote_pattern, case=False, na=False, regex=True)
-        is_rigid = desc.str.contains(rigid_pattern, case=False, na=False, regex=True)
+        is_remote_candidate = self.hits.mask('remote', 'remote')
+        is_rigid = desc.str.contains(REMOTE_RIGID_PATTERN, case=False, na=False, regex=True)
         
         true_remote_count = (is_remote_candidate & ~is_rigid).sum()
         return {"True Remote": int(true_remote_count)}
@@ -613,8 +1358,8 @@ class MarketIntelligence:
     # --- v1.0 HR INTELLIGENCE METHODS ---
     
     def get_role_distribution(self) -> pd.DataFrame:
-        """Get job distribution by role type."""
-        return self.df['role_type'].value_counts().reset_index()
+        """Get job distribution by role type (re-posted ads counted once)."""
+        return self.unique_df['role_type'].value_counts().reset_index()
     
     def get_seniority_distribution(self) -> pd.DataFrame:
         """Get job distribution by seniority level."""
@@ -672,25 +1417,7 @@ class MarketIntelligence:
 
     def get_work_model_by_role(self) -> pd.DataFrame:
         """Show work model distribution for top roles."""
-        work_model_kw = TAXONOMY.get('work_model_keywords', {})
-
-        remote_pattern = '|'.join(work_model_kw.get('remote', []))
-        hybrid_pattern = '|'.join(work_model_kw.get('hybrid', []))
-
-        desc = self.df['description'].fillna('').str.lower()
-
-        # Classify each job
-        def classify_work_model(desc_text):
-            if not isinstance(desc_text, str):
-                return 'Office'
-            desc_lower = desc_text.lower()
-            if re.search(remote_pattern, desc_lower):
-                return 'Remote'
-            elif re.search(hybrid_pattern, desc_lower):
-                return 'Hybrid'
-            return 'Office'
-
-        self.df['work_model_temp'] = self.df['description'].apply(classify_work_model)
+        self.df['work_model_temp'] = self._location.classify_work_model()
 
         # Get top 5 roles
         top_roles = self.df['role_type'].value_counts().head(5).index
@@ -719,37 +1446,18 @@ class MarketIntelligence:
         """
         Detect hot/emerging technologies based on mention frequency using accurate patterns.
         """
-        # Use skill_patterns from taxonomy for accurate detection
-        skill_patterns = TAXONOMY.get('skill_patterns', {})
-
         results = []
-        for tech_name, pattern in skill_patterns.items():
-            try:
-                mask = self.df['description'].fillna('').str.lower().str.contains(pattern, regex=True, case=False, na=False)
-                count = mask.sum()
-                percentage = (count / len(self.df)) * 100
-
-                if count >= 10:  # Minimum threshold for significance (lowered from 50)
-                    results.append({
-                        'Technology': tech_name,
-                        'Jobs': int(count),
-                        'Market Share': f"{percentage:.1f}%",
-                        'Share_Raw': percentage
-                    })
-            except Exception as e:
-                # Fallback to simple matching if regex fails
-                import logging
-                logging.debug(f"Regex failed for {tech_name}: {e}")
-                mask = self.df['description'].fillna('').str.lower().str.contains(tech_name.lower(), regex=False)
-                count = mask.sum()
-                percentage = (count / len(self.df)) * 100
-                if count >= 10:
-                    results.append({
-                        'Technology': tech_name,
-                        'Jobs': int(count),
-                        'Market Share': f"{percentage:.1f}%",
-                        'Share_Raw': percentage
-                    })
+        for tech_name in TAXONOMY.get('skill_patterns', {}):
+            count = self.hits.mask('skills', tech_name).sum()
+            percentage = (count / len(self.df)) * 100
+
+            if count >= 10:  # Minimum threshold for significance (lowered from 50)
+                results.append({
+                    'Technology': tech_name,
+                    'Jobs': int(count),
+                    'Market Share': f"{percentage:.1f}%",
+                    'Share_Raw': percentage
+                })
 
         if not results:
             return pd.DataFrame(columns=['Technology', 'Jobs', 'Market Share'])
@@ -784,12 +1492,8 @@ class MarketIntelligence:
         Show fastest-growing benefits (based on frequency).
         For single-day data, this shows current hot benefits.
         """
-        benefits_cats = TAXONOMY.get('benefits_keywords', {})
-
         results = []
-        for benefit_name, keywords in benefits_cats.items():
-            pattern = '|'.join([re.escape(kw) for kw in keywords])
-            mask = self.df['description'].fillna('').str.lower().str.contains(pattern, regex=True, case=False)
+        for benefit_name, mask in self._benefits.benefit_masks():
             count = mask.sum()
             percentage = (count / len(self.df)) * 100
 
@@ -846,13 +1550,8 @@ class MarketIntelligence:
         valid_sal = self.df[self.df['avg_salary'] > 0]
 
         # Classify by contract type
-        ico_pattern = '|'.join(TAXONOMY['contract_keywords']['ico'])
-        brigada_pattern = '|'.join(TAXONOMY['contract_keywords']['brigada'])
-
-        desc = valid_sal['description'].fillna('').str.lower()
-
-        is_ico = desc.str.contains(ico_pattern, case=False, na=False, regex=True)
-        is_brigada = desc.str.contains(brigada_pattern, case=False, na=False, regex=True)
+        is_ico = self.hits.mask('contract', 'ico').loc[valid_sal.index]
+        is_brigada = self.hits.mask('contract', 'brigada').loc[valid_sal.index]
 
         # HPP is everything that's NOT IÄŚO or BrigĂˇda
         is_hpp = ~(is_ico | is_brigada)
@@ -955,11 +1654,7 @@ class MarketIntelligence:
         Semantic analysis of "Hybrid" - rigid vs flexible.
         Detects phrases like "2 days fixed", "mandatory office", "flexible arrangement".
         """
-        work_model_kw = TAXONOMY.get('work_model_keywords', {})
-        hybrid_pattern = '|'.join(work_model_kw.get('hybrid', []))
-
-        desc = self.df['description'].fillna('').str.lower()
-        is_hybrid = desc.str.contains(hybrid_pattern, case=False, na=False, regex=True)
+        is_hybrid = self.hits.mask('work_model', 'hybrid')
 
         hybrid_jobs = self.df[is_hybrid].copy()
 
@@ -1,8 +1,7 @@
 import streamlit as st
-import pandas as pd
 import altair as alt
 import subprocess
-import analyzer
+import dashboard_data
 
 # --- SWISS DESIGN CONFIG ---
 st.set_page_config(page_title="Market Pulse // 2026", layout="wide")
@@ -62,17 +61,21 @@ st.markdown("""
     """, unsafe_allow_html=True)
 
 # --- ENGINE ---
-@st.cache_resource(ttl=600)
-def load_intel():
-    return analyzer.MarketIntelligence()
+# Each widget reads one small pre-aggregated query (dashboard_data), cached per
+# data version: reruns are cache hits, a new scrape or snapshot misses them.
+@st.cache_data(max_entries=32, show_spinner=False)
+def query(name, version):
+    with dashboard_data.connect() as con:
+        return getattr(dashboard_data, name)(con)
 
-intel = load_intel()
-df = intel.df
+version = dashboard_data.data_version()
+kpis = query("kpis", version)
+total = kpis["signals"]
 
 # --- TOP SECTION ---
 st.markdown('<div class="header">Market<br><span>Pulse.</span></div>', unsafe_allow_html=True)
 
-if df.empty:
+if total == 0:
     st.warning("SYSTEM OFFLINE // NO DATA DETECTED")
     if st.button("EXECUTE SCRAPE"):
         try:
@@ -94,11 +97,11 @@ if df.empty:
 # --- KPI STRIP ---
 cols = st.columns(5)
 metrics = [
-    ("Signals", len(df)),
-    ("Median CZK", f"{int(df[df['avg_salary']>0]['avg_salary'].median()/1000)}k" if not df[df['avg_salary']>0].empty else "N/A"),
-    ("English %", f"{int(intel.get_language_barrier()['English Friendly'] / len(df) * 100)}%"),
-    ("Remote %", f"{int(intel.get_remote_truth()['True Remote'] / len(df) * 100)}%"),
-    ("Stability", f"{int(intel.get_contract_split()['HPP'] / len(df) * 100)}%")
+    ("Signals", total),
+    ("Median CZK", f"{int(kpis['median_salary']/1000)}k" if kpis['median_salary'] is not None else "N/A"),
+    ("English %", f"{int(kpis['english_friendly'] / total * 100)}%"),
+    ("Remote %", f"{int(kpis['true_remote'] / total * 100)}%"),
+    ("Stability", f"{int(kpis['hpp'] / total * 100)}%")
 ]
 
 for i, (label, val) in enumerate(metrics):
@@ -112,7 +115,8 @@ c1, c2 = st.columns([1, 1])
 
 with c1:
     st.markdown("### // GEOGRAPHIC VOLUME")
-    geo_data = df['city'].value_counts().reset_index().head(10)
+    # Stored at ingest: Czech hub names, "CZ" listings resolved from the description
+    geo_data = query("city_volume", version)
     # Highlight the top city with Blue, others Gray
     geo_data['color'] = ['#0055FF' if i == 0 else '#E0E0E0' for i in range(len(geo_data))]
     
@@ -124,7 +128,7 @@ with c1:
     st.altair_chart(chart, use_container_width=True)
 
     st.markdown("### // HUB BENCHMARKING")
-    reg_stats = intel.get_regional_stats()
+    reg_stats, reg_trends = query("regional", version)
     reg_chart = alt.Chart(reg_stats).mark_bar(color='#0055FF').encode(
         x=alt.X('Median Salary:Q', title="Median Salary (CZK)"),
         y=alt.Y('Region:N', sort='-x', title=None),
@@ -132,24 +136,17 @@ with c1:
     ).properties(height=200)
     st.altair_chart(reg_chart, use_container_width=True)
     
-    reg_trends = intel.get_regional_trends()
     if not reg_trends.empty:
         st.markdown("**Regional Salary Movement**")
         st.dataframe(reg_trends, hide_index=True, use_container_width=True)
 
     st.markdown("### // BENEFIT SATURATION")
-    benefits = ['multisport', 'sick day', 'flexibil', 'home office', 'akademie', 'stravenk']
-    # Vectorized approach: O(n*m) instead of O(n²)
-    ben_stats = []
-    for benefit in benefits:
-        count = df['description'].fillna('').str.lower().str.contains(benefit, regex=False).sum()
-        ben_stats.append({"Benefit": benefit, "Signal": count})
-    ben_stats = pd.DataFrame(ben_stats).sort_values('Signal', ascending=False)
+    ben_stats = query("benefit_saturation", version)
     st.dataframe(ben_stats, hide_index=True, use_container_width=True)
 
 with c2:
     st.markdown("### // CONTRACT REALITY")
-    contracts = pd.DataFrame(list(intel.get_contract_split().items()), columns=['Type', 'Count'])
+    contracts = query("contract_split", version)
     # Distinct Palette: Blue, Dark Gray, Light Gray
     pie = alt.Chart(contracts).mark_arc(innerRadius=60).encode(
         theta=alt.Theta(field="Count", type="quantitative"),
@@ -159,8 +156,7 @@ with c2:
     st.altair_chart(pie, use_container_width=True)
 
     st.markdown("### // MARKET VIBE")
-    vibe = intel.get_market_vibe().reset_index()
-    vibe.columns = ['Metric', 'Intensity']
+    vibe = query("market_vibe", version)
     vibe_chart = alt.Chart(vibe).mark_bar(color='#0055FF').encode(
         x=alt.X('Intensity:Q', title=None),
         y=alt.Y('Metric:N', sort='-x', title=None),
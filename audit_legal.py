@@ -1,9 +1,37 @@
-import duckdb
+"""
+Labour-law audit of job descriptions (LEGAL_AUDIT_REPORT.md).
+
+All discrimination and Švarcsystém patterns are compiled once into a single
+TaxonomyMatcher, so each description is lowercased and scanned once instead
+of once per pattern. Findings are stored per signal hash
+(settings.get_legal_findings_path()); the hash covers title and description,
+so a later run audits only signals it has not seen, in parallel chunks, and
+rebuilds the report from the stored findings. Editing the patterns changes
+rules_version() and re-audits everything.
+
+    python audit_legal.py [--full]
+"""
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from functools import lru_cache
+from pathlib import Path
+from typing import List, Optional, Sequence, Tuple
+import argparse
+import hashlib
+import json
 import os
+import re
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
 from settings import settings
+import snapshot
+from taxonomy_matcher import TaxonomyMatcher
 
-DB_PATH = str(settings.get_db_path())
 OUTPUT_FILE = "LEGAL_AUDIT_REPORT.md"
+CHUNK_SIZE = 2_000  # Descriptions per worker task
+FINDINGS_SCHEMA = pa.schema([("hash", pa.string()), ("issues", pa.list_(pa.string()))])
 
 # --- LEGAL DEFINITIONS (Based on Zakonik_Prace_Raw_Fetch.txt) ---
 # § 1a, § 16: Prohibition of Discrimination
@@ -39,87 +67,135 @@ SVARCSYSTEM_INDICATORS = {
     ]
 }
 
+_WHITESPACE = re.compile(r"\s+")
+
+
+def rules_version() -> str:
+    """Fingerprint of the audit patterns; stored findings of another version are discarded."""
+    rules = json.dumps([DISCRIMINATION_PATTERNS, SVARCSYSTEM_INDICATORS], ensure_ascii=False, sort_keys=True)
+    return hashlib.blake2b(rules.encode("utf-8"), digest_size=8).hexdigest()
+
+
+class LegalAuditor:
+    """Every audit pattern compiled into one scanner.
+
+    The patterns are \\b-anchored words joined by \\s+; matched against text
+    with whitespace runs collapsed to one space they become plain literals,
+    which TaxonomyMatcher finds together in a single pass.
+    """
+
+    def __init__(self, discrimination: dict = DISCRIMINATION_PATTERNS, svarcsystem: dict = SVARCSYSTEM_INDICATORS):
+        groups = {f"discrimination:{category}": {p: p.replace(r"\s+", " ") for p in patterns}
+                  for category, patterns in discrimination.items()}
+        groups.update({f"svarcsystem:{kind}": {p: p.replace(r"\s+", " ") for p in patterns}
+                       for kind, patterns in svarcsystem.items()})
+        self.matcher = TaxonomyMatcher(groups)
+        label = self.matcher.label_id
+        # (category, [(pattern, label id, reported term)]) in pattern order
+        self._discrimination = [
+            (category, [(p, label(f"discrimination:{category}", p), p.replace(r"\b", "").strip()) for p in patterns])
+            for category, patterns in discrimination.items()
+        ]
+        self._contract = [label("svarcsystem:Contract Type", p) for p in svarcsystem["Contract Type"]]
+        self._dependent = [(p, label("svarcsystem:Dependent Features", p)) for p in svarcsystem["Dependent Features"]]
+
+    def _hits(self, text: str) -> frozenset:
+        return self.matcher.match(_WHITESPACE.sub(" ", text))
+
+    def _discrimination_issues(self, hits: frozenset, text: str) -> List[str]:
+        found = []
+        for category, patterns in self._discrimination:
+            for pattern, label, term in patterns:
+                if label in hits:
+                    # Context check: ignore "vhodné pro důchodce" (legal) vs "hledáme důchodce" (gray area)
+                    if "důchodce" in pattern and "vhodné" in text.lower():
+                        continue
+                    found.append(f"{category}: '{term}'")
+                    break  # One hit per category is enough
+        return found
+
+    def _svarcsystem_issues(self, hits: frozenset) -> List[str]:
+        # Contractor keywords combined with employee characteristics (dependent work)
+        if not any(label in hits for label in self._contract):
+            return []
+        dependent_features = [pattern for pattern, label in self._dependent if label in hits]
+        if dependent_features:
+            return [f"Potential Švarcsystém (§ 2, § 3): IČO combined with {', '.join(dependent_features)}"]
+        return []
+
+    def discrimination(self, text: str) -> List[str]:
+        return self._discrimination_issues(self._hits(text), text)
+
+    def svarcsystem(self, text: str) -> List[str]:
+        return self._svarcsystem_issues(self._hits(text))
+
+    def audit(self, text: str) -> List[str]:
+        """Discrimination and Švarcsystém findings for one text, from one scan."""
+        hits = self._hits(text)
+        if not hits:
+            return []
+        return self._discrimination_issues(hits, text) + self._svarcsystem_issues(hits)
+
+
+@lru_cache(maxsize=1)
+def get_auditor() -> LegalAuditor:
+    return LegalAuditor()
+
+
 def analyze_discrimination(text):
-    text = text.lower()
-    found = []
-    for category, patterns in DISCRIMINATION_PATTERNS.items():
-        for pat in patterns:
-            if re.search(pat, text):
-                # Context check: ignore "vhodné pro důchodce" (legal) vs "hledáme důchodce" (gray area)
-                if "důchodce" in pat and "vhodné" in text:
-                    continue
-                found.append(f"{category}: '{pat.replace(r'\\b', '').strip()}'")
-                break # One hit per category is enough
-    return found
+    return get_auditor().discrimination(text)
+
 
 def analyze_svarcsystem(text):
-    text = text.lower()
-    
-    # 1. Check for Contractor keywords
-    is_contractor = False
-    contract_kw = []
-    for pat in SVARCSYSTEM_INDICATORS["Contract Type"]:
-        if re.search(pat, text):
-            is_contractor = True
-            contract_kw.append(pat.replace(r'\\b', ''))
-    
-    if not is_contractor:
-        return []
-    
-    # 2. If Contractor, check for Employee characteristics (Dependent Work)
-    dependent_features = []
-    for pat in SVARCSYSTEM_INDICATORS["Dependent Features"]:
-        if re.search(pat, text):
-            dependent_features.append(pat.replace(r'\\b', ''))
-            
-    if dependent_features:
-        return [f"Potential Švarcsystém (§ 2, § 3): IČO combined with {', '.join(dependent_features)}"]
-    
-    return []
-
-def run_audit():
-    if not os.path.exists(DB_PATH):
-        print("Database not found.")
-        return
+    return get_auditor().svarcsystem(text)
 
-    con = duckdb.connect(DB_PATH, read_only=True)
-    df = con.execute("SELECT title, company, description, link, source FROM signals").df()
-    con.close()
-    
-    print(f"Auditing {len(df)} job descriptions against Labour Law (262/2006 Sb.)...")
-    
-    violations = []
-    
-    for _, row in df.iterrows():
-        title = row['title']
-        desc = row['description'] or ""
-        text = f"{title} {desc}"
-        
-        # Check Discrimination
-        discrim_issues = analyze_discrimination(text)
-        
-        # Check Švarcsystém
-        svarc_issues = analyze_svarcsystem(text)
-        
-        issues = discrim_issues + svarc_issues
-        
-        if issues:
-            violations.append({
-                "Company": row['company'],
-                "Title": title,
-                "Link": row['link'],
-                "Issues": issues
-            })
-    
-    # Generate Report
-    with open(OUTPUT_FILE, "w", encoding="utf-8") as f:
+
+def _audit_chunk(rows: Sequence[tuple]) -> List[Tuple[str, List[str]]]:
+    """(hash, issues) for (hash, title, description) rows; runs in worker processes."""
+    auditor = get_auditor()
+    return [(h, auditor.audit(f"{title} {description or ''}")) for h, title, description in rows]
+
+
+def audit_rows(rows: Sequence[tuple], workers: Optional[int] = None,
+               chunk_size: int = CHUNK_SIZE) -> List[Tuple[str, List[str]]]:
+    """Audit (hash, title, description) rows, in parallel chunks when there are several."""
+    workers = workers or settings.get_audit_workers()
+    chunks = [rows[i:i + chunk_size] for i in range(0, len(rows), chunk_size)]
+    if workers <= 1 or len(chunks) <= 1:
+        return [finding for chunk in chunks for finding in _audit_chunk(chunk)]
+    get_auditor()  # Compiled here once; forked workers inherit it
+    with ProcessPoolExecutor(max_workers=min(workers, len(chunks))) as pool:
+        return [finding for result in pool.map(_audit_chunk, chunks) for finding in result]
+
+
+def load_findings(path: Optional[Path] = None) -> pa.Table:
+    """Stored findings of the current rules version (empty if missing or outdated)."""
+    path = Path(path or settings.get_legal_findings_path())
+    if path.exists():
+        metadata = pq.read_schema(path).metadata or {}
+        if metadata.get(b"rules_version", b"").decode() == rules_version():
+            return pq.read_table(path).cast(FINDINGS_SCHEMA)
+    return FINDINGS_SCHEMA.empty_table()
+
+
+def save_findings(table: pa.Table, path: Optional[Path] = None) -> Path:
+    path = Path(path or settings.get_legal_findings_path())
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    pq.write_table(table.replace_schema_metadata({"rules_version": rules_version()}), tmp, compression="zstd")
+    os.replace(tmp, path)
+    return path
+
+
+def write_report(violations: list, scanned: int, output: str = OUTPUT_FILE) -> None:
+    with open(output, "w", encoding="utf-8") as f:
         f.write("# ⚖️ LABOUR LAW COMPLIANCE AUDIT\n")
         f.write(f"**Date:** {datetime.now().strftime('%Y-%m-%d')}\n")
-        f.write(f"**Scanned:** {len(df)} job listings\n")
+        f.write(f"**Scanned:** {scanned} job listings\n")
         f.write(f"**Legal Grounding:** Zákoník práce (262/2006 Sb.) - § 1a, § 2, § 3, § 16\n\n")
         
         f.write("## 🚨 Executive Summary\n")
-        f.write(f"- **Total Flagged Listings:** {len(violations)} ({len(violations)/len(df)*100:.1f}%)\n")
+        f.write(f"- **Total Flagged Listings:** {len(violations)} ({len(violations)/max(scanned, 1)*100:.1f}%)\n")
         
         # Stats by type
         discrim_count = sum(1 for v in violations if any("Bias" in i for i in v['Issues']))
@@ -141,7 +217,62 @@ def run_audit():
                 f.write(f"- ⚠️ {issue}\n")
             f.write("\n---\n")
 
-    print(f"Audit complete. Report saved to {OUTPUT_FILE}")
+
+def run_audit(full: bool = False, output: str = OUTPUT_FILE, workers: Optional[int] = None):
+    """Audit new signals, store their findings and regenerate the report.
+
+    Args:
+        full: Ignore stored findings and re-audit every signal.
+        output: Report path.
+        workers: Processes for the new signals (default settings.get_audit_workers()).
+    """
+    if not settings.get_db_path().exists():
+        print("Database not found.")
+        return
+
+    con = snapshot.connect(materialize=False)
+    try:
+        stored = FINDINGS_SCHEMA.empty_table() if full else load_findings()
+        con.register("stored", stored)
+        # Findings of signals no longer in the data are dropped
+        kept = con.execute("SELECT hash, issues FROM stored SEMI JOIN signals_text USING (hash)").fetch_arrow_table()
+        rows = con.execute(
+            "SELECT hash, title, description FROM signals_text ANTI JOIN stored USING (hash)"
+        ).fetchall()
+        scanned = con.execute("SELECT COUNT(*) FROM signals_text").fetchone()[0]
+
+        print(f"Auditing {len(rows)} new of {scanned} job descriptions against Labour Law (262/2006 Sb.)...")
+        audited = audit_rows(rows, workers)
+        new = pa.Table.from_pylist([{"hash": h, "issues": issues} for h, issues in audited], schema=FINDINGS_SCHEMA)
+        findings = pa.concat_tables([kept.cast(FINDINGS_SCHEMA), new])
+        # Rows without a readable description are re-audited once their text is available
+        missing_text = {h for h, _, description in rows if description is None}
+        persisted = findings.filter(pa.array([h not in missing_text for h in findings["hash"].to_pylist()]))
+        save_findings(persisted)
+
+        con.register("findings", findings)
+        violations = [
+            {"Company": company, "Title": title, "Link": link, "Issues": issues}
+            for title, company, link, issues in con.execute("""
+                SELECT s.title, s.company, s.link, f.issues
+                FROM signals_text s JOIN findings f USING (hash)
+                WHERE len(f.issues) > 0
+                ORDER BY s.scraped_at, s.hash
+            """).fetchall()
+        ]
+    finally:
+        con.close()
+
+    write_report(violations, scanned, output)
+    print(f"Audit complete ({len(persisted)} findings stored). Report saved to {output}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Labour-law audit of job descriptions")
+    parser.add_argument("--full", action="store_true", help="re-audit every signal, ignoring stored findings")
+    args = parser.parse_args()
+    run_audit(full=args.full)
+
 
 if __name__ == "__main__":
-    run_audit()
+    main()
@@ -1,4 +1,13 @@
-﻿import re
+﻿import hashlib
+import json
+import logging
+import re
+from collections import OrderedDict
+from typing import Iterable, List, Optional, Tuple
+
+from settings import settings
+
+logger = logging.getLogger('HR-Intel-Classifier')
 
 # --- ROLE TAXONOMY ---
 ROLE_TAXONOMY = {
@@ -81,6 +90,112 @@ SENIORITY_PATTERNS = {
                   'ředitel', 'c-level', 'executive']
 }
 
+# --- COMPILED KEYWORD MATCHING ---
+# Keywords that REQUIRE word boundaries to avoid false positives (e.g., 'controller' in 'controllers')
+BOUNDARY_KEYWORDS = frozenset([
+    'hr', 'it', 'pr', 'ui', 'ux', 'grafik', 'qa', 'sales',
+    'controller', 'lead', 'manager', 'director', 'vp', 'ceo', 'cto',
+    'pokojská', 'školka', 'banker', 'bankéř', 'účetní'
+])
+# Boundary keywords that do not count when the text contains one of these phrases
+# ('grafik směn'/'grafik rozvrhu' is a Shift Scheduler, not a designer)
+KEYWORD_EXCLUSIONS = {'grafik': ('grafik směn', 'grafik rozvrhu')}
+
+# Specific roles first
+ROLE_PRIORITY = ['Developer', 'Analyst', 'QA', 'PM', 'Designer', 'Legal', 'Healthcare', 'Finance', 'HR', 'General Engineering', 'Manufacturing', 'Construction', 'Retail', 'Hospitality', 'Logistics', 'Marketing', 'Education', 'Social Services', 'Technical Specialists', 'Electromechanics', 'Support', 'Operations', 'Service', 'Management']
+
+# Above this length a text is scanned keyword by keyword (str.find exits early in C);
+# short texts like titles are faster through one compiled alternation.
+_SHORT_TEXT = 200
+
+
+def _boundary_pattern(keyword: str) -> str:
+    return r'\b' + re.escape(keyword) + r'(?:\b|[-_])'
+
+
+def _any_of(keywords) -> re.Pattern:
+    """Compiled equivalent of any(kw in text for kw in keywords)."""
+    return re.compile('|'.join(re.escape(kw) for kw in keywords))
+
+
+class KeywordMatcher:
+    """A role's keyword list compiled once; matches() equals any(smart_match(text, kw))."""
+
+    def __init__(self, keywords):
+        plain = [kw for kw in keywords if kw not in BOUNDARY_KEYWORDS]
+        bounded = [kw for kw in keywords if kw in BOUNDARY_KEYWORDS and kw not in KEYWORD_EXCLUSIONS]
+        self.substrings = tuple(plain)
+        self.bounded = re.compile('|'.join(_boundary_pattern(kw) for kw in bounded)) if bounded else None
+        self.short = re.compile('|'.join([re.escape(kw) for kw in plain] + [_boundary_pattern(kw) for kw in bounded])) \
+            if plain or bounded else None
+        self.guarded = tuple((re.compile(_boundary_pattern(kw)), KEYWORD_EXCLUSIONS[kw])
+                             for kw in keywords if kw in BOUNDARY_KEYWORDS and kw in KEYWORD_EXCLUSIONS)
+
+    def matches(self, text: str) -> bool:
+        if len(text) <= _SHORT_TEXT:
+            if self.short is not None and self.short.search(text):
+                return True
+        elif any(kw in text for kw in self.substrings) or (self.bounded is not None and self.bounded.search(text)):
+            return True
+        for pattern, exclusions in self.guarded:
+            if pattern.search(text) and not any(phrase in text for phrase in exclusions):
+                return True
+        return False
+
+
+ROLE_MATCHERS = [(role, KeywordMatcher(ROLE_TAXONOMY.get(role, []))) for role in ROLE_PRIORITY]
+
+# Title overrides, checked in order before the matching loop
+TITLE_OVERRIDES = [
+    # Hospitality (Brands & Specific roles)
+    (_any_of(['mcdonald', 'burger king', 'fast food', 'restaurace', 'restaurant', 'kuchař', 'číšník', 'barman', 'boulevard', 'kfc', 'bageterie']), 'Hospitality'),
+    # Education / Research
+    (_any_of(['phd', 'ph.d.', 'postdoc', 'akademický', 'docent', 'didaktik', 'pedagog', 'učitel', 'lektor']), 'Education'),
+    # Legal
+    (_any_of(['právník', 'advokát', 'legal', 'compliance', 'notář']), 'Legal'),
+    # Healthcare
+    (_any_of(['chirurg', 'lékař', 'sestra', 'doktor', 'radiolog', 'terapeut', 'zubní', 'farmaceut', 'optometrista', 'adiktolog']), 'Healthcare'),
+    # Sales
+    (_any_of(['business development', 'channel development', 'sales engineer', 'account executive', 'obchodník', 'obchodní zástupce', 'telesales']), 'Sales'),
+    # Service (Physical Security/Safety)
+    (_any_of(['policista', 'hasič', 'ostraha', 'strážný', 'security', 'vrátný', 'plavčík', 'záchranář']), 'Service'),
+]
+
+# Refinement layer keyword sets (titles: compiled alternations, full text: tuples)
+CORE_IT_PROTECTION = ('software', 'firmware', 'embedded', 'sw ', 'development', 'vývoj',
+                      'programátor', 'data', 'cloud', 'devops', 'python', 'java', 'sql', 'api')
+IT_PROTECTION = CORE_IT_PROTECTION + ('web ', 'frontend', 'backend', 'fullstack', 'mobile', 'ios', 'android')
+TECH_PROTECTION = IT_PROTECTION + ('technik', 'inženýr', 'engineer', 'sap', 'automatizace')
+HVAC_MEP_KEYWORDS = ('hvac', 'vzduchotechnik', 'klimatizace', 'topení', 'vytápění', 'chlazení',
+                     'silnoproud', 'slaboproud', 'tze', 'technické zařízení budov', 'mep')
+NON_IT_QUALITY = ('manufacturing', 'production', 'výrob', 'stroj', 'mechanical', 'construction', 'stavb', 'food', 'potravin', 'control', 'iso')
+HEALTHCARE_SERVICE_CONTEXT = ('průkaz', 'potravinář', 'uklid', 'úklid', 'zahradník', 'ostraha', 'security')
+TECH_LEAD_CONTEXT = ('software', 'python', 'java', 'react', 'node', 'aws', 'cloud', 'developer', 'engineer')
+
+_IT_PROTECTION_TITLE = _any_of(IT_PROTECTION)
+_ENG_INDICATORS_TITLE = _any_of(['industrial', 'process', 'manufacturing', 'production', 'výrob', 'stroj', 'mechanical', 'electrical', 'elektro', 'hvac', 'plc', 'scada', 'automatizace'])
+_AUTOMATION_TITLE = _any_of(['automation', 'plc', 'automatizace'])
+_PROCESS_TITLE = _any_of(['process', 'industrial', 'výrob', 'procesní'])
+_ADMINISTRATOR_TITLE = _any_of(['administrator', 'administrátor'])
+_NON_IT_TITLE = _any_of([
+    'industrial', 'process', 'quality', 'sales', 'quotation', 'structural', 'civil',
+    'mechanical', 'electrical', 'výrob', 'technolog', 'statik', 'projektant',
+    'commissioning', 'service', 'maintenance', 'údržba', 'servis', 'hardware', 'hw ',
+    'elektro', 'geodet', 'geolog', 'biomedic', 'sestra', 'zdravotní', 'laborant',
+    'horizontkář', 'analog', 'asistent', 'cad', 'inžernýr', 'strojní', 'strojírenský',
+    'konstruktér', 'konstrukční', 'validation', 'reliability'
+])
+_MECHANICAL_TITLE = _any_of(['mechanical', 'strojní', 'strojírenský', 'konstruktér', 'konstrukční'])
+_ELECTRICAL_TITLE = _any_of(['electrical', 'elektro', 'silnoproud', 'slaboproud'])
+_STRUCTURAL_TITLE = _any_of(['structural', 'civil', 'statik', 'projektant', 'stavební'])
+_QUALITY_ENG_TITLE = _any_of(['quality', 'validation', 'reliability'])
+_CLINICAL_TITLE = _any_of(['lékař', 'sestra', 'biomedic', 'farmaceut', 'chirurg', 'optometr', 'adiktolog'])
+_SOCIAL_TITLE = _any_of(['sociální', 'pečovatel', 'chůva', 'mentor'])
+_CLEANING_TITLE = _any_of(['úklid', 'čištění', 'vrátný', 'ostraha'])
+_CONSTRUCTION_ASSISTANT_TITLE = _any_of(['staveb', 'projekt', 'geodet'])
+_SITE_MANAGEMENT_TITLE = _any_of(['store', 'prodejn', 'směn', 'shift', 'restaurace', 'restaurant', 'hotel', 'sklad', 'warehouse'])
+_IT_AUDIT_TITLE = _any_of(['audit', 'licence', 'specialista'])
+
 try:
     from embedding_classifier import EmbeddingClassifier, EMBEDDINGS_AVAILABLE
     _USE_EMBEDDINGS = EMBEDDINGS_AVAILABLE
@@ -89,6 +204,93 @@ except ImportError:
     EmbeddingClassifier = None
 
 
+def classifier_version(mode: str) -> str:
+    """Hash of everything a cached classification depends on.
+
+    Covers ROLE_TAXONOMY, SENIORITY_PATTERNS, this module's rules and, in
+    ML_EMBEDDINGS mode, the embedding model, backend, exemplars and threshold. Cached
+    entries from another version are discarded.
+    """
+    digest = hashlib.blake2b(digest_size=8)
+    digest.update(json.dumps([ROLE_TAXONOMY, SENIORITY_PATTERNS, mode], sort_keys=True).encode('utf-8'))
+    with open(__file__, 'rb') as f:
+        digest.update(f.read())
+    if mode == "ML_EMBEDDINGS":
+        import embedding_classifier
+        digest.update(json.dumps([
+            getattr(embedding_classifier, 'MODEL_NAME', None), embedding_classifier.BACKEND,
+            embedding_classifier.SIMILARITY_THRESHOLD,
+            embedding_classifier.ROLE_EXEMPLARS, embedding_classifier.SENIORITY_EXEMPLARS
+        ], sort_keys=True).encode('utf-8'))
+    return digest.hexdigest()
+
+
+class ClassificationCache:
+    """Bounded LRU of classifier outputs.
+
+    Keys are (kind, normalized title, description fingerprint), so the same
+    title re-posted with the same text is classified once. Entries are only
+    valid for one classifier_version; IntelligenceCore persists them in the
+    classification_cache table between runs.
+    """
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self.version: Optional[str] = None
+        self._entries: OrderedDict = OrderedDict()
+        self._touched = set()  # Keys read or written since the last persist
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(kind: str, title: str, description: str) -> Tuple[str, str, str]:
+        title_key = ' '.join((title or '').lower().split())
+        fingerprint = hashlib.blake2b((description or '').encode('utf-8'), digest_size=8).hexdigest()
+        return kind, title_key, fingerprint
+
+    def reset(self, version: str) -> None:
+        """Drop all entries and start over for a new classifier version."""
+        self.version = version
+        self._entries.clear()
+        self._touched.clear()
+
+    def get(self, key) -> Optional[str]:
+        value = self._entries.get(key)
+        if value is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self._touched.add(key)
+        self.hits += 1
+        return value
+
+    def put(self, key, value: str) -> None:
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        self._touched.add(key)
+        while len(self._entries) > self.maxsize:
+            evicted, _ = self._entries.popitem(last=False)
+            self._touched.discard(evicted)
+
+    def load(self, rows: Iterable[Tuple[str, str, str, str]]) -> None:
+        """Add persisted (kind, title_key, description_fp, value) rows, least recent first."""
+        for kind, title_key, fingerprint, value in rows:
+            self._entries[(kind, title_key, fingerprint)] = value
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def drain_touched(self) -> List[Tuple[str, str, str, str]]:
+        """Rows used since the last call, for persisting."""
+        rows = [key + (self._entries[key],) for key in self._touched if key in self._entries]
+        self._touched.clear()
+        return rows
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {'hits': self.hits, 'misses': self.misses, 'size': len(self._entries),
+                'hit_rate': self.hits / lookups if lookups else 0.0}
+
+
 class JobClassifier:
     """
     Hybrid job classifier using ML embeddings with keyword fallback.
@@ -97,6 +299,10 @@ class JobClassifier:
     # Class-level flag to force keyword mode (useful for debugging/testing)
     USE_EMBEDDINGS = _USE_EMBEDDINGS
 
+    # Shared memo of classify_role/detect_seniority results (see ClassificationCache)
+    cache = ClassificationCache(settings.get_classification_cache_size())
+    _versions = {}  # mode -> classifier_version(mode)
+
     @staticmethod
     def get_classification_mode() -> str:
         """Return current classification mode for debugging."""
@@ -104,20 +310,131 @@ class JobClassifier:
             return "ML_EMBEDDINGS"
         return "KEYWORD_MATCHING"
 
+    @staticmethod
+    def configured_mode() -> str:
+        """Mode the classifier is configured for.
+
+        Unlike get_classification_mode this does not change when the lazily
+        loaded model turns out to be unavailable, so the cache version stays
+        the same for the whole run.
+        """
+        if JobClassifier.USE_EMBEDDINGS and EmbeddingClassifier:
+            return "ML_EMBEDDINGS"
+        return "KEYWORD_MATCHING"
+
+    @staticmethod
+    def version_for(mode: str) -> str:
+        version = JobClassifier._versions.get(mode)
+        if version is None:
+            version = JobClassifier._versions[mode] = classifier_version(mode)
+        return version
+
+    @staticmethod
+    def known_versions() -> List[str]:
+        """Current classifier_version of every mode this install can run in."""
+        modes = ["KEYWORD_MATCHING"] + (["ML_EMBEDDINGS"] if EmbeddingClassifier else [])
+        return [JobClassifier.version_for(mode) for mode in modes]
+
+    @staticmethod
+    def current_version() -> str:
+        """classifier_version for the configured mode, keeping the cache in step with it."""
+        version = JobClassifier.version_for(JobClassifier.configured_mode())
+        if JobClassifier.cache.version != version:
+            JobClassifier.cache.reset(version)
+        return version
+
+    @staticmethod
+    def _cached(kind: str, classify, title: str, description: str) -> str:
+        """Memoized classify; a None result (no final answer) is returned as "Other", uncached."""
+        JobClassifier.current_version()
+        key = ClassificationCache.key(kind, title, description)
+        result = JobClassifier.cache.get(key)
+        if result is None:
+            result = classify(title, description)
+            if result is None:
+                return "Other"
+            JobClassifier.cache.put(key, result)
+        return result
+
     @staticmethod
     def classify_role(title: str, description: str = "") -> str:
-        """Classify job into role category using hybrid approach."""
+        """Classify job into role category using hybrid approach (memoized)."""
+        return JobClassifier._cached('role', JobClassifier._classify_role, title, description)
+
+    @staticmethod
+    def classify_roles(jobs: List[Tuple[str, str]]) -> List[str]:
+        """Batch classify_role for a page of (title, description) pairs (memoized).
+
+        Keywords run per job; the jobs they leave as "Other" go to the
+        embedding classifier in one batch (one encode, one matrix multiply)
+        instead of one model call each.
+        """
+        results = JobClassifier.keyword_pass(jobs)
+        fallback = [i for i, result in enumerate(results) if result is None]
+        for i, role in zip(fallback, JobClassifier.embedding_pass([jobs[i] for i in fallback])):
+            results[i] = role
+        return results
+
+    @staticmethod
+    def keyword_pass(jobs: List[Tuple[str, str]]) -> List[Optional[str]]:
+        """First stage of classify_roles: cached or keyword roles only.
+
+        Returns None for jobs keywords leave as "Other" while the embedding
+        fallback is enabled; finish those with embedding_pass (possibly later,
+        batched with other pages' misses). Final results are cached.
+        """
+        JobClassifier.current_version()
+        fallback_enabled = bool(JobClassifier.USE_EMBEDDINGS and EmbeddingClassifier)
+        results = []
+        for title, description in jobs:
+            key = ClassificationCache.key('role', title, description)
+            result = JobClassifier.cache.get(key)
+            if result is None:
+                result = JobClassifier._classify_role_keywords(title, description)
+                if result == "Other" and fallback_enabled:
+                    result = None
+                else:
+                    JobClassifier.cache.put(key, result)
+            results.append(result)
+        return results
+
+    @staticmethod
+    def embedding_pass(jobs: List[Tuple[str, str]]) -> List[str]:
+        """Second stage of classify_roles for jobs keyword_pass left undecided.
+
+        One embedding batch for all of them; "Other" where the embedding is
+        unavailable or not confident. Only answers the embedding actually gave
+        are cached, so jobs are reclassified once the model works again.
+        """
+        results = ["Other"] * len(jobs)
+        answered = [False] * len(jobs)
+        if jobs and JobClassifier.USE_EMBEDDINGS and EmbeddingClassifier:
+            try:
+                for i, ml_result in enumerate(EmbeddingClassifier.classify_roles_batch(jobs)):
+                    if ml_result is not None:
+                        results[i], answered[i] = ml_result, True
+            except Exception as e:
+                logger.warning(f"Embedding role fallback failed for {len(jobs)} jobs: {e}")
+
+        JobClassifier.current_version()
+        for (title, description), result, final in zip(jobs, results, answered):
+            if final:
+                JobClassifier.cache.put(ClassificationCache.key('role', title, description), result)
+        return results
+
+    @staticmethod
+    def _classify_role(title: str, description: str = "") -> Optional[str]:
+        """Keyword role, else the embedding's; None if the embedding fallback gave no answer."""
         keyword_result = JobClassifier._classify_role_keywords(title, description)
         if keyword_result != "Other":
             return keyword_result
 
         if JobClassifier.USE_EMBEDDINGS and EmbeddingClassifier:
             try:
-                ml_result = EmbeddingClassifier.classify_role(title, description)
-                if ml_result is not None and ml_result != "Other":
-                    return ml_result
-            except Exception:
-                pass
+                return EmbeddingClassifier.classify_role(title, description)
+            except Exception as e:
+                logger.warning(f"Embedding role fallback failed for {title!r}: {e}")
+                return None
 
         return "Other"
 
@@ -127,57 +444,21 @@ class JobClassifier:
         text = f"{title} {description}".lower()
         title_lower = title.lower()
 
-        def smart_match(text: str, keyword: str) -> bool:
-            # Keywords that REQUIRE word boundaries to avoid false positives (e.g., 'controller' in 'controllers')
-            boundary_keywords = [
-                'hr', 'it', 'pr', 'ui', 'ux', 'grafik', 'qa', 'sales', 
-                'controller', 'lead', 'manager', 'director', 'vp', 'ceo', 'cto',
-                'pokojská', 'školka', 'banker', 'bankéř', 'účetní'
-            ]
-            if keyword in boundary_keywords:
-                # Special exclusion for 'grafik směn'/'grafik rozvrhu' (Shift Scheduler)
-                if keyword == 'grafik' and ('grafik směn' in text or 'grafik rozvrhu' in text):
-                    return False
-                pattern = r'\b' + re.escape(keyword) + r'(?:\b|[-_])'
-                return bool(re.search(pattern, text))
-            else:
-                return keyword in text
-
         # 1. TOP-LEVEL OVERRIDES (The "Fast Path")
-        # Hospitality (Brands & Specific roles)
-        if any(kw in title_lower for kw in ['mcdonald', 'burger king', 'fast food', 'restaurace', 'restaurant', 'kuchař', 'číšník', 'barman', 'boulevard', 'kfc', 'bageterie']):
-             return 'Hospitality'
-        # Education / Research
-        if any(kw in title_lower for kw in ['phd', 'ph.d.', 'postdoc', 'akademický', 'docent', 'didaktik', 'pedagog', 'učitel', 'lektor']):
-             return 'Education'
-        # Legal
-        if any(kw in title_lower for kw in ['právník', 'advokát', 'legal', 'compliance', 'notář']):
-             return 'Legal'
-        # Healthcare
-        if any(kw in title_lower for kw in ['chirurg', 'lékař', 'sestra', 'doktor', 'radiolog', 'terapeut', 'zubní', 'farmaceut', 'optometrista', 'adiktolog']):
-             return 'Healthcare'
-        # Sales
-        if any(kw in title_lower for kw in ['business development', 'channel development', 'sales engineer', 'account executive', 'obchodník', 'obchodní zástupce', 'telesales']):
-             return 'Sales'
-        # Service (Physical Security/Safety)
-        if any(kw in title_lower for kw in ['policista', 'hasič', 'ostraha', 'strážný', 'security', 'vrátný', 'plavčík', 'záchranář']):
-             return 'Service'
+        for pattern, role in TITLE_OVERRIDES:
+            if pattern.search(title_lower):
+                return role
 
         # 2. MATCHING LOOP
         matched_role = None
-        # Priority: Specific roles first
-        priority_order = ['Developer', 'Analyst', 'QA', 'PM', 'Designer', 'Legal', 'Healthcare', 'Finance', 'HR', 'General Engineering', 'Manufacturing', 'Construction', 'Retail', 'Hospitality', 'Logistics', 'Marketing', 'Education', 'Social Services', 'Technical Specialists', 'Electromechanics', 'Support', 'Operations', 'Service', 'Management']
-        
-        for role in priority_order:
-            keywords = ROLE_TAXONOMY.get(role, [])
-            if any(smart_match(title_lower, kw) for kw in keywords):
+        for role, matcher in ROLE_MATCHERS:
+            if matcher.matches(title_lower):
                 matched_role = role
                 break
 
         if not matched_role:
-            for role in priority_order:
-                keywords = ROLE_TAXONOMY.get(role, [])
-                if any(smart_match(text, kw) for kw in keywords):
+            for role, matcher in ROLE_MATCHERS:
+                if matcher.matches(text):
                     matched_role = role
                     break
 
@@ -187,26 +468,20 @@ class JobClassifier:
 
         # A. Tech Integrity
         if matched_role in ['Developer', 'Analyst', 'QA', 'PM', 'Designer']:
-             it_protection = ['software', 'firmware', 'embedded', 'sw ', 'development', 'vývoj', 
-                                'programátor', 'data', 'cloud', 'devops', 'python', 'java', 'sql', 'api',
-                                'web ', 'frontend', 'backend', 'fullstack', 'mobile', 'ios', 'android']
-             
              # If it's labeled as IT but has strong Engineering/Manufacturing indicators and lacks IT indicators
-             eng_indicators = ['industrial', 'process', 'manufacturing', 'production', 'výrob', 'stroj', 'mechanical', 'electrical', 'elektro', 'hvac', 'plc', 'scada', 'automatizace']
-             if any(kw in title_lower for kw in eng_indicators) and not any(kw in title_lower for kw in it_protection):
-                  if 'automation' in title_lower or 'plc' in title_lower or 'automatizace' in title_lower:
+             if _ENG_INDICATORS_TITLE.search(title_lower) and not _IT_PROTECTION_TITLE.search(title_lower):
+                  if _AUTOMATION_TITLE.search(title_lower):
                        return 'General Engineering'
-                  if any(kw in title_lower for kw in ['process', 'industrial', 'výrob', 'procesní']):
+                  if _PROCESS_TITLE.search(title_lower):
                        return 'Manufacturing'
                   return 'General Engineering'
 
-             tech_protection = it_protection + ['technik', 'inženýr', 'engineer', 'sap', 'automatizace']
-             if any(kw in text for kw in tech_protection):
+             if any(kw in text for kw in TECH_PROTECTION):
                   return matched_role
              
              if matched_role == 'Developer' and ('developersk' in text or 'nemovitost' in text):
                   return 'Construction'
-             if any(kw in title_lower for kw in ['administrator', 'administrátor']) and 'it' in title_lower:
+             if _ADMINISTRATOR_TITLE.search(title_lower) and 'it' in title_lower:
                   return 'Developer'
              # Allow fall-through to specific cleanup blocks
              pass
@@ -214,41 +489,27 @@ class JobClassifier:
         # 1. Developer Clean-up (Enhanced: route non-IT engineering to correct categories)
         if matched_role == 'Developer':
             # HVAC/MEP engineering keywords - route to General Engineering
-            hvac_mep_keywords = [
-                'hvac', 'vzduchotechnik', 'klimatizace', 'topení', 'vytápění', 'chlazení',
-                'silnoproud', 'slaboproud', 'tze', 'technické zařízení budov', 'mep'
-            ]
-            if any(kw in title_lower or kw in text for kw in hvac_mep_keywords):
+            if any(kw in title_lower or kw in text for kw in HVAC_MEP_KEYWORDS):
                 return 'General Engineering'
             
             # General non-IT engineering keywords
-            non_it_keywords = [
-                'industrial', 'process', 'quality', 'sales', 'quotation', 'structural', 'civil',
-                'mechanical', 'electrical', 'výrob', 'technolog', 'statik', 'projektant',
-                'commissioning', 'service', 'maintenance', 'údržba', 'servis', 'hardware', 'hw ',
-                'elektro', 'geodet', 'geolog', 'biomedic', 'sestra', 'zdravotní', 'laborant',
-                'horizontkář', 'analog', 'asistent', 'cad', 'inžernýr', 'strojní', 'strojírenský',
-                'konstruktér', 'konstrukční', 'validation', 'reliability'
-            ]
-            if any(kw in title_lower for kw in non_it_keywords):
+            if _NON_IT_TITLE.search(title_lower):
                 # Preserve QA/Sales routing
                 if 'quality' in title_lower and 'software' not in text: return 'QA'
                 if 'sales' in title_lower: return 'Sales'
                 
                 # Only reclassify if NOT clearly IT
-                it_protection = ['software', 'firmware', 'embedded', 'sw ', 'development', 'vývoj', 
-                                'programátor', 'data', 'cloud', 'devops', 'python', 'java', 'sql', 'api']
-                if not any(kw in text for kw in it_protection):
+                if not any(kw in text for kw in CORE_IT_PROTECTION):
                     # Route to General Engineering for engineering-specific roles
-                    if any(kw in title_lower for kw in ['mechanical', 'strojní', 'strojírenský', 'konstruktér', 'konstrukční']):
+                    if _MECHANICAL_TITLE.search(title_lower):
                         return 'General Engineering'
-                    if any(kw in title_lower for kw in ['electrical', 'elektro', 'silnoproud', 'slaboproud']):
+                    if _ELECTRICAL_TITLE.search(title_lower):
                         return 'General Engineering'
-                    if any(kw in title_lower for kw in ['industrial', 'process', 'výrob', 'procesní']):
+                    if _PROCESS_TITLE.search(title_lower):
                         return 'Manufacturing'
-                    if any(kw in title_lower for kw in ['structural', 'civil', 'statik', 'projektant', 'stavební']):
+                    if _STRUCTURAL_TITLE.search(title_lower):
                         return 'Construction'
-                    if any(kw in title_lower for kw in ['quality', 'validation', 'reliability']) and 'engineer' in title_lower:
+                    if _QUALITY_ENG_TITLE.search(title_lower) and 'engineer' in title_lower:
                         return 'General Engineering'
                     if 'laborant' in title_lower: return 'Technical Specialists'
                     if 'biomedic' in title_lower or 'sestra' in title_lower: return 'Healthcare'
@@ -259,32 +520,31 @@ class JobClassifier:
 
         if matched_role == 'QA':
             # Route non-IT quality roles to Manufacturing/General Engineering
-            non_it_quality = ['manufacturing', 'production', 'výrob', 'stroj', 'mechanical', 'construction', 'stavb', 'food', 'potravin', 'control', 'iso']
-            if any(kw in text for kw in non_it_quality) and 'software' not in text and 'automation' not in text:
+            if any(kw in text for kw in NON_IT_QUALITY) and 'software' not in text and 'automation' not in text:
                 if 'engineer' in title_lower or 'inženýr' in title_lower:
                     return 'General Engineering'
                 return 'Manufacturing'
 
         # 2. Healthcare Clean-up
         if matched_role == 'Healthcare':
-             if any(kw in text for kw in ['průkaz', 'potravinář', 'uklid', 'úklid', 'zahradník', 'ostraha', 'security']):
-                  if not any(kw in title_lower for kw in ['lékař', 'sestra', 'biomedic', 'farmaceut', 'chirurg', 'optometr', 'adiktolog']):
+             if any(kw in text for kw in HEALTHCARE_SERVICE_CONTEXT):
+                  if not _CLINICAL_TITLE.search(title_lower):
                        return 'Service'
 
         # 3. Operations Clean-up
         if matched_role == 'Operations':
              if 'knihovník' in title_lower: return 'Education'
              if 'radiolog' in title_lower or 'zubní' in title_lower: return 'Healthcare'
-             if any(kw in title_lower for kw in ['sociální', 'pečovatel', 'chůva', 'mentor']): return 'Social Services'
-             if any(kw in title_lower for kw in ['úklid', 'čištění', 'vrátný', 'ostraha']): return 'Service'
-             if any(kw in title_lower for kw in ['staveb', 'projekt', 'geodet']) and 'asistent' in title_lower: return 'Construction'
+             if _SOCIAL_TITLE.search(title_lower): return 'Social Services'
+             if _CLEANING_TITLE.search(title_lower): return 'Service'
+             if _CONSTRUCTION_ASSISTANT_TITLE.search(title_lower) and 'asistent' in title_lower: return 'Construction'
 
         if matched_role == 'Management':
             # Tech Lead / Team Lead / IT Manager in IT context -> Developer
-            if ('tech lead' in title_lower or 'team lead' in title_lower or 'it manager' in title_lower) and any(kw in text for kw in ['software', 'python', 'java', 'react', 'node', 'aws', 'cloud', 'developer', 'engineer']):
+            if ('tech lead' in title_lower or 'team lead' in title_lower or 'it manager' in title_lower) and any(kw in text for kw in TECH_LEAD_CONTEXT):
                  return 'Developer'
 
-            if any(kw in title_lower for kw in ['store', 'prodejn', 'směn', 'shift', 'restaurace', 'restaurant', 'hotel', 'sklad', 'warehouse']):
+            if _SITE_MANAGEMENT_TITLE.search(title_lower):
                  # Check full text for warehouse context (e.g. Shift Leader in Amazon Warehouse)
                  if 'sklad' in text or 'warehouse' in text: return 'Logistics'
                  if 'store' in title_lower or 'prodejn' in title_lower: return 'Retail'
@@ -295,7 +555,7 @@ class JobClassifier:
         # 5. Marketing Clean-up
         if matched_role == 'Marketing':
              if 'payable' in text or 'receivable' in text or 'faktura' in text: return 'Finance'
-             if 'it' in title_lower and any(kw in title_lower for kw in ['audit', 'licence', 'specialista']): return 'Developer'
+             if 'it' in title_lower and _IT_AUDIT_TITLE.search(title_lower): return 'Developer'
 
         # 6. Finance Clean-up
         if matched_role == 'Finance':
@@ -305,7 +565,11 @@ class JobClassifier:
 
     @staticmethod
     def detect_seniority(title: str, description: str = "") -> str:
-        """Detect seniority level."""
+        """Detect seniority level (memoized)."""
+        return JobClassifier._cached('seniority', JobClassifier._detect_seniority, title, description)
+
+    @staticmethod
+    def _detect_seniority(title: str, description: str = "") -> str:
         title_lower = title.lower()
         desc_lower = description.lower() if description else ""
         priority_order = ['Executive', 'Lead', 'Senior', 'Junior', 'Mid']
@@ -0,0 +1,173 @@
+"""
+Pre-aggregated queries behind the Streamlit dashboard (app.py).
+
+The dashboard used to cache a whole MarketIntelligence (every column of every
+signal, plus a taxonomy pass over all descriptions) and then recompute its
+KPIs on each rerun with row-wise pandas. Each widget now runs one small query
+here over a read-only connection (snapshot.connect: views over the fresh
+Parquet snapshot, else the database itself) and gets back a few rows; app.py
+caches each result with st.cache_data keyed by data_version().
+
+The SQL mirrors the MarketIntelligence methods it replaces (same keywords,
+same counts); zstd-compressed descriptions are decoded by the signals_text
+view snapshot.connect sets up on the database connection.
+"""
+from pathlib import Path
+from typing import Optional
+import logging
+import re
+
+import duckdb
+import pandas as pd
+
+import analyzer
+import snapshot
+from analysis.regional_analysis import RegionalAnalysis
+from observations import ObservationStore
+from rollups import Rollups, contract_type_sql
+from settings import settings
+from tools.location_normalizer import LocationNormalizer
+
+logger = logging.getLogger('HR-Intel-Dashboard')
+
+BENEFITS = ['multisport', 'sick day', 'flexibil', 'home office', 'akademie', 'stravenk']
+
+# MarketIntelligence.get_language_barrier: >= 3 distinct English stop words
+ENGLISH_MIN_STOPS = 3
+# Python's \w (letters, digits, underscore); RE2's \w and \b are ASCII only
+WORD_CHARS = r"[\p{L}\p{N}_]*"
+
+
+def _stop_word_pattern(stops: list) -> str:
+    """RE2 pattern extracting the whole words around each stop word hit.
+
+    One pass instead of tokenizing every description: a stop word is found
+    between ASCII word boundaries, then widened to the surrounding Unicode
+    word, which only equals the stop word when Python's word tokenizer would
+    have found it too ("žand" is not "and").
+    """
+    return WORD_CHARS + r"\b(?:" + "|".join(re.escape(w) for w in stops) + r")\b" + WORD_CHARS
+
+
+def _stamp(path: Path) -> str:
+    try:
+        stat = path.stat()
+    except OSError:
+        return f"{path}:missing"
+    return f"{path}:{stat.st_mtime_ns}:{stat.st_size}"
+
+
+def data_version(db_path: Optional[Path] = None) -> str:
+    """Cheap version of the data the dashboard reads (file stamps, not contents).
+
+    Covers the fresh snapshot and its rollups (else the database and its WAL)
+    and the observation history, so any scrape or re-analysis changes it.
+    Called on every rerun, so it only stats files.
+    """
+    db_path = Path(db_path or analyzer.DB_PATH)
+    if snapshot.is_fresh(db_path=db_path):
+        files = snapshot.published_files()
+    else:
+        files = [db_path, db_path.with_name(db_path.name + ".wal")]
+    files += sorted(settings.get_observations_dir().glob("week=*/*.parquet"))
+    return "|".join(_stamp(Path(f)) for f in files)
+
+
+def connect(db_path: Optional[Path] = None) -> duckdb.DuckDBPyConnection:
+    """Read-only connection exposing signals_text (and the rollups)."""
+    return snapshot.connect(db_path=db_path or analyzer.DB_PATH, materialize=False)
+
+
+def kpis(con: duckdb.DuckDBPyConnection) -> dict:
+    """Headline counts: signals, median salary, English-friendly, true remote and HPP jobs."""
+    taxonomy = analyzer.TAXONOMY
+    remote = "|".join(taxonomy.get('remote_keywords', []))
+    true_remote = ("regexp_matches(text, $remote) AND NOT regexp_matches(text, $rigid, 'i')"
+                   if remote else "FALSE")
+    stops = sorted(set(taxonomy.get('nlp', {}).get('english_stops', [])))
+    params = {"words": _stop_word_pattern(stops), "stops": stops, "min_stops": ENGLISH_MIN_STOPS}
+    if remote:
+        params.update(remote=remote, rigid=analyzer.REMOTE_RIGID_PATTERN)
+    signals, median, english, remote_jobs = con.execute(f"""
+        SELECT
+            COUNT(*),
+            MEDIAN(avg_salary) FILTER (WHERE avg_salary > 0),
+            COUNT(*) FILTER (WHERE len(list_intersect(
+                list_distinct(regexp_extract_all(text, $words)), $stops::VARCHAR[])) >= $min_stops),
+            COUNT(*) FILTER (WHERE {true_remote})
+        FROM (SELECT avg_salary, lower(coalesce(description, '')) AS text FROM signals_text)
+    """, params).fetchone()
+    return {
+        "signals": int(signals),
+        "median_salary": float(median) if median is not None else None,
+        "english_friendly": int(english or 0),
+        "true_remote": int(remote_jobs or 0),
+        "hpp": _contract_counts(con).get("HPP", 0),
+    }
+
+
+def city_volume(con: duckdb.DuckDBPyConnection, limit: int = 10) -> pd.DataFrame:
+    """Signals per resolved city (LocationNormalizer.resolve), largest first."""
+    columns = {row[0] for row in con.execute("DESCRIBE signals_text").fetchall()}
+    resolved = "resolved_city" in columns
+    counts = con.execute("""
+        SELECT resolved_city AS city, COUNT(*) AS count FROM signals_text
+        WHERE resolved_city IS NOT NULL GROUP BY 1
+    """).df() if resolved else pd.DataFrame(columns=["city", "count"])
+
+    # Rows not backfilled yet are resolved in memory, as MarketIntelligence does
+    missing = con.execute(f"""
+        SELECT city, region, description FROM signals_text
+        {"WHERE resolved_city IS NULL" if resolved else ""}
+    """).df()
+    if len(missing):
+        cities = LocationNormalizer().resolve_many(missing['city'].where(missing['region'] != 'Unknown'),
+                                                   missing['description'])['city']
+        extra = cities.value_counts().rename_axis("city").reset_index(name="count")
+        counts = pd.concat([counts, extra]).groupby("city", as_index=False)["count"].sum()
+    counts["count"] = counts["count"].astype(int)
+    return counts.sort_values(["count", "city"], ascending=[False, True]).head(limit).reset_index(drop=True)
+
+
+def regional(con: duckdb.DuckDBPyConnection) -> tuple:
+    """(hub stats, hub salary trends) as in MarketIntelligence.get_regional_stats/_trends."""
+    frame = con.execute("SELECT region, avg_salary, scraped_at FROM signals_text").df()
+    analysis = RegionalAnalysis(frame, ObservationStore())
+    return analysis.get_regional_stats(), analysis.get_regional_trends()
+
+
+def benefit_saturation(con: duckdb.DuckDBPyConnection) -> pd.DataFrame:
+    """Descriptions mentioning each dashboard benefit keyword, in one scan."""
+    counts = ", ".join(f"COUNT(*) FILTER (WHERE contains(text, ${i + 1}))" for i in range(len(BENEFITS)))
+    row = con.execute(f"SELECT {counts} FROM (SELECT lower(description) AS text FROM signals_text)",
+                      BENEFITS).fetchone()
+    stats = pd.DataFrame({"Benefit": BENEFITS, "Signal": [int(c) for c in row]})
+    return stats.sort_values('Signal', ascending=False, kind='stable')
+
+
+def _contract_counts(con: duckdb.DuckDBPyConnection) -> dict:
+    """Jobs per contract type, from the rollups when they have been built."""
+    rollups = Rollups(con)
+    if rollups.available():
+        counts = rollups.counts(by=["contract_type"])
+        return {t: int(n) for t, n in zip(counts["contract_type"], counts["jobs"])}
+    contract = contract_type_sql(analyzer.TAXONOMY, analyzer.CONTRACT_TYPE_LABELS)
+    return {t: int(n) for t, n in con.execute(f"SELECT ({contract}), COUNT(*) FROM signals_text GROUP BY 1").fetchall()}
+
+
+def contract_split(con: duckdb.DuckDBPyConnection) -> pd.DataFrame:
+    """Jobs per contract type (HPP, IČO, Brigáda), as in MarketIntelligence.get_contract_split."""
+    counts = _contract_counts(con)
+    types = ["HPP", analyzer.CONTRACT_TYPE_LABELS['ico'], analyzer.CONTRACT_TYPE_LABELS['brigada']]
+    return pd.DataFrame({"Type": types, "Count": [counts.get(t, 0) for t in types]})
+
+
+def market_vibe(con: duckdb.DuckDBPyConnection) -> pd.DataFrame:
+    """Signals per tech_status, largest first."""
+    return con.execute("""
+        SELECT tech_status AS Metric, COUNT(*) AS Intensity
+        FROM signals_text
+        WHERE tech_status IS NOT NULL
+        GROUP BY 1
+        ORDER BY Intensity DESC, Metric
+    """).df()
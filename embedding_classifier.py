@@ -11,7 +11,7 @@ ARCHITECTURE OVERVIEW:
    Czech and English text (paraphrase-multilingual-MiniLM-L12-v2).
    
 2. Each role category has "exemplar phrases" that define what that role means.
-   These are converted to embeddings once at module load time.
+   These are converted to embeddings once, together with the model load.
    
 3. When classifying a job, we:
    a) Combine title + description into a single text
@@ -28,6 +28,21 @@ DEBUGGING STRATEGY:
   2. Are there competing high-scoring roles? (ambiguous job)
   3. Is the text mostly non-job content? (noise in description)
 
+LAZY LOADING:
+------------
+Importing this module does not import sentence-transformers or load the
+model. ensure_loaded() prepares the exemplar embeddings on the first
+embedding call (i.e. the first job keywords could not classify); preload()
+does that and loads the model in a background thread so a scrape can overlap
+it with page fetching.
+
+EMBEDDING STORE:
+---------------
+All encoding goes through encode(), which looks texts up in the on-disk
+EmbeddingStore first (see embedding_store.py). Each distinct text, exemplars
+included, is embedded once ever; the model is only loaded when some text has
+not been embedded before, so a re-run over unchanged data never loads it.
+
 FALLBACK BEHAVIOR:
 -----------------
 If sentence-transformers is not installed or model fails to load:
@@ -35,16 +50,38 @@ If sentence-transformers is not installed or model fails to load:
 - All calls gracefully fall back to keyword-based classification
 - No exceptions or crashes - the app continues working
 
+CPU BACKEND:
+-----------
+BACKEND says how the model runs:
+- "torch": full-precision PyTorch SentenceTransformer (the only one in use)
+- "onnx-int8": the model exported once to ONNX with int8 dynamic
+  quantization (under data/models/), run by onnxruntime with
+  settings.get_embedding_threads() threads. Needs onnxruntime + optimum
+  (pip install "sentence-transformers[onnx]"); falls back to "torch" if the
+  export or session fails. Vectors differ slightly from fp32, so each backend
+  has its own embedding store.
+  Not selectable yet: it becomes a setting once
+  tools/benchmarks/bench_embedding_backends.py has shown >= 99% role
+  agreement with fp32 on current_classifications.txt, with docs/sec numbers.
+
 PERFORMANCE NOTES:
 -----------------
-- Model load: ~2-3 seconds, 420MB RAM
+- Model load: ~2-3 seconds, 420MB RAM (paid on first use, not at import)
 - Classification: ~50ms per job (GPU: ~5ms)
 - Batch classification available for bulk processing
 """
 
+import importlib.util
 import logging
+import platform
+import threading
 from typing import Dict, List, Tuple, Optional
 
+import numpy as np
+
+from embedding_store import get_store
+from settings import settings
+
 logger = logging.getLogger('HR-Intel-Embeddings')
 
 # ============================================================================
@@ -61,42 +98,46 @@ DEBUG_EMBEDDINGS = False
 #   - CALIBRATION (2026-01-07): Raised to 0.40 to prioritize precision over recall.
 SIMILARITY_THRESHOLD = 0.40
 
+# Seniority needs a higher score since keywords are more reliable for it;
+# below this the embedding abstains and keyword matching decides.
+SENIORITY_THRESHOLD = 0.45
+
 # ============================================================================
 # MODEL INITIALIZATION
 # ============================================================================
 
-# Attempt to load the embedding model
-# This is wrapped in try/except for graceful degradation
-EMBEDDINGS_AVAILABLE = False
+# Model selection rationale:
+# - paraphrase-multilingual-MiniLM-L12-v2: Best balance of size/quality for multilingual
+# - Supports 50+ languages including Czech
+# - 384 dimensions (smaller than alternatives)
+# - ~420MB download, ~120MB RAM after loading
+MODEL_NAME = 'paraphrase-multilingual-MiniLM-L12-v2'
+
+# Only check that sentence-transformers is installed; importing it (torch) and
+# loading the model is deferred to the first encode() miss. EMBEDDINGS_AVAILABLE
+# turns False if that load fails.
+EMBEDDINGS_AVAILABLE = importlib.util.find_spec('sentence_transformers') is not None
 _model = None
 _role_embeddings = None
 _seniority_embeddings = None
-
-try:
-    from sentence_transformers import SentenceTransformer
-    import numpy as np
-    
-    # Model selection rationale:
-    # - paraphrase-multilingual-MiniLM-L12-v2: Best balance of size/quality for multilingual
-    # - Supports 50+ languages including Czech
-    # - 384 dimensions (smaller than alternatives)
-    # - ~420MB download, ~120MB RAM after loading
-    MODEL_NAME = 'paraphrase-multilingual-MiniLM-L12-v2'
-    
-    logger.info(f"Loading embedding model: {MODEL_NAME}")
-    _model = SentenceTransformer(MODEL_NAME)
-    logger.info("Embedding model loaded successfully")
-    
-    EMBEDDINGS_AVAILABLE = True
-    
-except ImportError:
+_role_matrix = None  # (labels, normalized exemplar matrix), see stack_exemplars()
+_seniority_matrix = None
+_loaded = False
+_load_lock = threading.Lock()  # exemplar embeddings (ensure_loaded)
+_model_lock = threading.Lock()  # model load (_load_model)
+_preload_thread = None
+
+# Backend the model runs on ("torch" or "onnx-int8"); reset to "torch" if the
+# ONNX backend cannot be loaded. onnx-int8 is not configurable until its
+# agreement report is in (see CPU BACKEND above)
+BACKEND = "torch"
+
+if not EMBEDDINGS_AVAILABLE:
     logger.warning(
         "sentence-transformers not installed. "
         "Role classification will use keyword fallback. "
         "Install with: pip install sentence-transformers"
     )
-except Exception as e:
-    logger.warning(f"Failed to load embedding model: {e}. Using keyword fallback.")
 
 
 # ============================================================================
@@ -308,14 +349,114 @@ SENIORITY_EXEMPLARS = {
 
 
 # ============================================================================
-# PRE-COMPUTE EMBEDDINGS AT MODULE LOAD
+# LAZY MODEL LOADING
 # ============================================================================
 
+def _load_model() -> bool:
+    """Import sentence-transformers and load MODEL_NAME, once. A failure is not retried."""
+    global EMBEDDINGS_AVAILABLE, BACKEND, _model
+    if _model is not None:
+        return True
+    
+    with _model_lock:
+        if _model is None and EMBEDDINGS_AVAILABLE:
+            if BACKEND == "onnx-int8":
+                try:
+                    _model = _load_onnx_int8_model()
+                except Exception as e:
+                    BACKEND = "torch"
+                    logger.warning(f"ONNX int8 backend unavailable ({e}); using PyTorch backend")
+            
+            if _model is None:
+                try:
+                    from sentence_transformers import SentenceTransformer
+                    
+                    logger.info(f"Loading embedding model: {MODEL_NAME}")
+                    _model = SentenceTransformer(MODEL_NAME)
+                    logger.info("Embedding model loaded successfully")
+                
+                except Exception as e:
+                    EMBEDDINGS_AVAILABLE = False
+                    logger.warning(f"Failed to load embedding model: {e}. Using keyword fallback.")
+    return _model is not None
+
+
+def _quantization_target() -> str:
+    """Instruction set the int8 weights are quantized for (portable choice per CPU family)."""
+    return "arm64" if platform.machine().lower() in ("arm64", "aarch64") else "avx2"
+
+
+def _load_onnx_int8_model():
+    """
+    Load MODEL_NAME as an int8-quantized ONNX model, exporting it on first use.
+    
+    The fp32 ONNX export and its dynamically quantized copy are saved under
+    settings.get_models_dir(), so later runs load the quantized file directly.
+    """
+    import onnxruntime
+    from sentence_transformers import SentenceTransformer, export_dynamic_quantized_onnx_model
+    
+    target = _quantization_target()
+    export_dir = settings.get_models_dir() / f"{MODEL_NAME}-onnx"
+    file_name = f"onnx/model_qint8_{target}.onnx"
+    if not (export_dir / file_name).exists():
+        logger.info(f"Exporting {MODEL_NAME} to ONNX with int8 dynamic quantization ({target})...")
+        fp32_model = SentenceTransformer(MODEL_NAME, backend="onnx", model_kwargs={"provider": "CPUExecutionProvider"})
+        fp32_model.save(str(export_dir))
+        export_dynamic_quantized_onnx_model(fp32_model, target, str(export_dir), file_suffix=f"qint8_{target}")
+    
+    session_options = onnxruntime.SessionOptions()
+    threads = settings.get_embedding_threads()
+    if threads > 0:
+        session_options.intra_op_num_threads = threads
+    logger.info(f"Loading embedding model: {file_name} ({threads or 'default'} threads)")
+    model = SentenceTransformer(str(export_dir), backend="onnx", model_kwargs={
+        "file_name": file_name,
+        "provider": "CPUExecutionProvider",
+        "session_options": session_options,
+    })
+    logger.info("Embedding model loaded successfully (ONNX int8)")
+    return model
+
+
+def store_name() -> str:
+    """Embedding store for the active backend (quantized vectors are not mixed with fp32 ones).
+
+    A non-default backend falls back to torch when it cannot be loaded, so the
+    model is loaded first to settle which backend the vectors come from.
+    """
+    if BACKEND != "torch":
+        _load_model()
+    return MODEL_NAME if BACKEND == "torch" else f"{MODEL_NAME}-{BACKEND}"
+
+
+def encode(texts: List[str], show_progress_bar: bool = False) -> Optional[np.ndarray]:
+    """
+    Embed texts, reusing vectors already in the embedding store.
+    
+    Only texts never embedded before are run through the model (loading it
+    on first need) and are then stored.
+    
+    Returns:
+        float32 array of shape (len(texts), 384), or None if the model is needed
+        but unavailable
+    """
+    if not EMBEDDINGS_AVAILABLE:
+        return None
+    
+    def run_model(missing: List[str]) -> Optional[np.ndarray]:
+        if not _load_model():
+            return None
+        return _model.encode(missing, convert_to_numpy=True, show_progress_bar=show_progress_bar)
+    
+    return get_store(store_name()).get_many(texts, run_model)
+
+
 def _compute_role_embeddings() -> Optional[Dict[str, np.ndarray]]:
     """
     Convert all role exemplar texts to embedding vectors.
     
-    Called once at module load. If this fails, we fall back to keywords.
+    Called once by ensure_loaded(). If this fails, we fall back to keywords.
     
     Returns:
         Dict mapping role name -> embedding vector (384 dims)
@@ -324,12 +465,11 @@ def _compute_role_embeddings() -> Optional[Dict[str, np.ndarray]]:
         return None
     
     try:
-        embeddings = {}
-        for role, exemplar_text in ROLE_EXEMPLARS.items():
-            # Clean up the text (remove extra whitespace)
-            clean_text = ' '.join(exemplar_text.split())
-            # Encode to vector
-            embeddings[role] = _model.encode(clean_text, convert_to_numpy=True)
+        # Clean up the texts (remove extra whitespace) and encode in one batch
+        vectors = encode([' '.join(text.split()) for text in ROLE_EXEMPLARS.values()])
+        if vectors is None:
+            return None
+        embeddings = dict(zip(ROLE_EXEMPLARS, vectors))
         
         logger.info(f"Pre-computed embeddings for {len(embeddings)} roles")
         return embeddings
@@ -347,10 +487,10 @@ def _compute_seniority_embeddings() -> Optional[Dict[str, np.ndarray]]:
         return None
     
     try:
-        embeddings = {}
-        for level, exemplar_text in SENIORITY_EXEMPLARS.items():
-            clean_text = ' '.join(exemplar_text.split())
-            embeddings[level] = _model.encode(clean_text, convert_to_numpy=True)
+        vectors = encode([' '.join(text.split()) for text in SENIORITY_EXEMPLARS.values()])
+        if vectors is None:
+            return None
+        embeddings = dict(zip(SENIORITY_EXEMPLARS, vectors))
         
         logger.info(f"Pre-computed embeddings for {len(embeddings)} seniority levels")
         return embeddings
@@ -360,21 +500,76 @@ def _compute_seniority_embeddings() -> Optional[Dict[str, np.ndarray]]:
         return None
 
 
-# Initialize embeddings at module load
-if EMBEDDINGS_AVAILABLE:
-    _role_embeddings = _compute_role_embeddings()
-    _seniority_embeddings = _compute_seniority_embeddings()
+def ensure_loaded() -> bool:
+    """
+    Prepare the exemplar embeddings if that has not happened yet.
+    
+    They come from the embedding store when cached, so this only loads the
+    model if an exemplar (or the model) changed. Thread-safe; concurrent
+    callers (e.g. a preload thread and the first fallback) wait for a single
+    load. A failed load is not retried.
+    
+    Returns:
+        True if embedding classification can be used
+    """
+    global EMBEDDINGS_AVAILABLE, _role_embeddings, _seniority_embeddings, _loaded
+    global _role_matrix, _seniority_matrix
+    if _loaded:
+        return EMBEDDINGS_AVAILABLE
+    
+    with _load_lock:
+        if not _loaded and EMBEDDINGS_AVAILABLE:
+            _role_embeddings = _compute_role_embeddings()
+            _seniority_embeddings = _compute_seniority_embeddings()
+            
+            # If embedding computation failed, disable embeddings
+            if _role_embeddings is None:
+                EMBEDDINGS_AVAILABLE = False
+                logger.warning("Embedding computation failed, falling back to keywords")
+            else:
+                _role_matrix = stack_exemplars(_role_embeddings)
+                if _seniority_embeddings is not None:
+                    _seniority_matrix = stack_exemplars(_seniority_embeddings)
+        
+        _loaded = True
+    return EMBEDDINGS_AVAILABLE
+
+
+def _preload() -> None:
+    if ensure_loaded():
+        _load_model()
+
+
+def preload() -> Optional[threading.Thread]:
+    """
+    Prepare exemplars and load the model in a daemon thread so the load
+    overlaps other work.
     
-    # If embedding computation failed, disable embeddings
-    if _role_embeddings is None:
-        EMBEDDINGS_AVAILABLE = False
-        logger.warning("Embedding computation failed, falling back to keywords")
+    Returns:
+        The loader thread, or None if there is nothing to load
+    """
+    global _preload_thread
+    if _model is not None or not EMBEDDINGS_AVAILABLE:
+        return None
+    if _preload_thread is None:
+        _preload_thread = threading.Thread(target=_preload, name='embedding-preload', daemon=True)
+        _preload_thread.start()
+    return _preload_thread
 
 
 # ============================================================================
 # SIMILARITY FUNCTIONS
 # ============================================================================
 
+def role_text(title: str, description: str = "") -> str:
+    """
+    Text embedded for role classification (also the vector-index text).
+    
+    The title appears twice to give it more weight in the embedding.
+    """
+    return f"{title} {title} {(description or '')[:500]}"
+
+
 def cosine_similarity(vec1: np.ndarray, vec2: np.ndarray) -> float:
     """
     Compute cosine similarity between two vectors.
@@ -402,6 +597,67 @@ def cosine_similarity(vec1: np.ndarray, vec2: np.ndarray) -> float:
     return float(np.dot(vec1, vec2) / (norm1 * norm2))
 
 
+def _normalize_rows(vectors: np.ndarray) -> np.ndarray:
+    """L2-normalize each row; all-zero rows stay zero (similarity 0 to everything)."""
+    vectors = np.asarray(vectors, dtype=np.float32)
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    return np.divide(vectors, norms, out=np.zeros_like(vectors), where=norms > 0)
+
+
+def stack_exemplars(embeddings_dict: Dict[str, np.ndarray]) -> Tuple[List[str], np.ndarray]:
+    """
+    Stack category embeddings into one pre-normalized matrix.
+    
+    Returns:
+        (labels, matrix) where matrix[i] is the unit vector of labels[i]
+    """
+    labels = list(embeddings_dict)
+    return labels, _normalize_rows(np.stack([embeddings_dict[label] for label in labels]))
+
+
+def similarity_matrix(embeddings: np.ndarray, exemplar_matrix: np.ndarray) -> np.ndarray:
+    """
+    Cosine similarity of every embedding to every category in one matrix multiply.
+    
+    Args:
+        embeddings: (N, dims) job embeddings
+        exemplar_matrix: (categories, dims) matrix from stack_exemplars()
+        
+    Returns:
+        (N, categories) similarity scores, the same values cosine_similarity gives
+    """
+    return _normalize_rows(embeddings) @ exemplar_matrix.T
+
+
+def best_matches(
+    scores: np.ndarray,
+    labels: List[str],
+    threshold: float,
+    below: Optional[str]
+) -> List[Optional[str]]:
+    """
+    Highest-scoring label per row, or `below` where that score is under threshold.
+    
+    Ties go to the first label, as with max() over the similarity dict.
+    """
+    if not len(scores):
+        return []
+    best = scores.argmax(axis=1)
+    confident = scores[np.arange(len(scores)), best] >= threshold
+    return np.where(confident, np.array(labels, dtype=object)[best], below).tolist()
+
+
+_stacked_cache: Dict[int, Tuple[Dict[str, np.ndarray], List[str], np.ndarray]] = {}
+
+
+def _stacked(embeddings_dict: Dict[str, np.ndarray]) -> Tuple[List[str], np.ndarray]:
+    """stack_exemplars() result for a category dict, computed once per dict."""
+    entry = _stacked_cache.get(id(embeddings_dict))
+    if entry is None or entry[0] is not embeddings_dict:
+        entry = _stacked_cache[id(embeddings_dict)] = (embeddings_dict, *stack_exemplars(embeddings_dict))
+    return entry[1], entry[2]
+
+
 def get_all_similarities(
     text: str,
     embeddings_dict: Dict[str, np.ndarray]
@@ -419,19 +675,19 @@ def get_all_similarities(
     Returns:
         Dict mapping category name -> similarity score
     """
-    if not EMBEDDINGS_AVAILABLE or _model is None:
+    if not ensure_loaded():
         return {}
     
     try:
-        # Encode the input text
-        text_embedding = _model.encode(text, convert_to_numpy=True)
+        # Encode the input text (or reuse its stored embedding)
+        encoded = encode([text])
+        if encoded is None:
+            return {}
         
         # Compute similarity to each category
-        similarities = {}
-        for category, category_embedding in embeddings_dict.items():
-            similarities[category] = cosine_similarity(text_embedding, category_embedding)
-        
-        return similarities
+        labels, matrix = _stacked(embeddings_dict)
+        scores = similarity_matrix(encoded, matrix)[0]
+        return dict(zip(labels, scores.tolist()))
     
     except Exception as e:
         logger.error(f"Error computing similarities: {e}")
@@ -477,12 +733,12 @@ class EmbeddingClassifier:
         Returns:
             Role category (e.g., "Developer") or None if embeddings unavailable
         """
-        if not EMBEDDINGS_AVAILABLE or _role_embeddings is None:
+        if not ensure_loaded() or _role_embeddings is None:
             return None  # Caller should fall back to keyword matching
         
         # Combine text with title emphasis
         # Title appears twice to give it more weight in the embedding
-        combined_text = f"{title} {title} {description[:500]}"
+        combined_text = role_text(title, description)
         
         similarities = get_all_similarities(combined_text, _role_embeddings)
         
@@ -523,7 +779,7 @@ class EmbeddingClassifier:
         Returns:
             Seniority level (e.g., "Senior") or None if unavailable
         """
-        if not EMBEDDINGS_AVAILABLE or _seniority_embeddings is None:
+        if not ensure_loaded() or _seniority_embeddings is None:
             return None
         
         combined_text = f"{title} {description[:300]}"
@@ -543,8 +799,8 @@ class EmbeddingClassifier:
         best_level = max(similarities, key=similarities.get)
         best_score = similarities[best_level]
         
-        # Higher threshold for seniority (0.45) since it's less reliable
-        if best_score < 0.45:
+        # Higher threshold for seniority since it's less reliable
+        if best_score < SENIORITY_THRESHOLD:
             return None  # Let keyword matching decide
         
         return best_level
@@ -560,79 +816,129 @@ class EmbeddingClassifier:
             scores = EmbeddingClassifier.get_role_debug_scores("Python Developer", "Django backend")
             # Returns: {'Developer': 0.72, 'Analyst': 0.31, 'Management': 0.15, ...}
         """
-        if not EMBEDDINGS_AVAILABLE or _role_embeddings is None:
+        if not ensure_loaded() or _role_embeddings is None:
             return {}
         
-        combined_text = f"{title} {title} {description[:500]}"
+        combined_text = role_text(title, description)
         return get_all_similarities(combined_text, _role_embeddings)
     
     @staticmethod
     def get_seniority_debug_scores(title: str, description: str = "") -> Dict[str, float]:
         """Get all seniority similarity scores for debugging."""
-        if not EMBEDDINGS_AVAILABLE or _seniority_embeddings is None:
+        if not ensure_loaded() or _seniority_embeddings is None:
             return {}
         
         combined_text = f"{title} {description[:300]}"
         return get_all_similarities(combined_text, _seniority_embeddings)
     
+    @staticmethod
+    def classify_roles_batch(jobs: List[Tuple[str, str]]) -> List[Optional[str]]:
+        """
+        Batch form of classify_role for a page of (title, description) pairs.
+        
+        One encode call and one matrix multiply for the whole batch.
+        Returns a list of None if embeddings are unavailable.
+        """
+        return classify_roles_batch(jobs)
+    
+    @staticmethod
+    def classify_seniority_batch(jobs: List[Tuple[str, str]]) -> List[Optional[str]]:
+        """Batch form of classify_seniority (None where the embedding abstains)."""
+        return classify_seniority_batch(jobs)
+    
     @staticmethod
     def is_available() -> bool:
-        """Check if embedding classification is available."""
-        return EMBEDDINGS_AVAILABLE and _role_embeddings is not None
+        """
+        Check if embedding classification is available.
+        
+        Does not load the model: True while sentence-transformers is installed
+        and no load attempt has failed.
+        """
+        return EMBEDDINGS_AVAILABLE and (not _loaded or _role_embeddings is not None)
+    
+    @staticmethod
+    def is_loaded() -> bool:
+        """Check if the model and exemplar embeddings are in memory."""
+        return _loaded and _role_embeddings is not None
 
 
 # ============================================================================
 # BATCH PROCESSING (for re-analyzing existing data)
 # ============================================================================
 
+# Show the encode progress bar only for bulk work (reanalysis), not scrape pages
+PROGRESS_BAR_MIN_JOBS = 1000
+
+
 def classify_roles_batch(
     jobs: List[Tuple[str, str]]
-) -> List[str]:
+) -> List[Optional[str]]:
     """
     Classify multiple jobs efficiently using batch encoding.
     
     This is ~3x faster than individual calls for large datasets
-    because the model can parallelize the encoding.
+    because the model can parallelize the encoding. Scoring is one
+    matrix multiply against the stacked role exemplars, with argmax and
+    threshold applied to the whole batch.
     
     Args:
         jobs: List of (title, description) tuples
         
     Returns:
-        List of role classifications
+        List of role classifications ("Other" below SIMILARITY_THRESHOLD),
+        or a list of None if embeddings are unavailable
     """
-    if not EMBEDDINGS_AVAILABLE or _role_embeddings is None:
+    if not jobs:
+        return []
+    if not ensure_loaded() or _role_matrix is None:
         return [None] * len(jobs)
     
     try:
-        # Prepare texts
-        texts = [f"{title} {title} {desc[:500]}" for title, desc in jobs]
-        
-        # Batch encode
-        embeddings = _model.encode(texts, convert_to_numpy=True, show_progress_bar=True)
-        
-        # Classify each
-        results = []
-        for text_embedding in embeddings:
-            similarities = {
-                role: cosine_similarity(text_embedding, role_emb)
-                for role, role_emb in _role_embeddings.items()
-            }
-            
-            best_role = max(similarities, key=similarities.get)
-            best_score = similarities[best_role]
-            
-            if best_score < SIMILARITY_THRESHOLD:
-                results.append("Other")
-            else:
-                results.append(best_role)
+        # Prepare texts (title twice for emphasis, as in classify_role)
+        texts = [role_text(title, desc) for title, desc in jobs]
+        
+        # Batch encode (texts already in the embedding store are not re-encoded)
+        embeddings = encode(texts, show_progress_bar=len(jobs) >= PROGRESS_BAR_MIN_JOBS)
+        if embeddings is None:
+            return [None] * len(jobs)
         
-        return results
+        labels, matrix = _role_matrix
+        return best_matches(similarity_matrix(embeddings, matrix), labels, SIMILARITY_THRESHOLD, "Other")
     
     except Exception as e:
         logger.error(f"Batch classification failed: {e}")
         return [None] * len(jobs)
 
 
+def classify_seniority_batch(
+    jobs: List[Tuple[str, str]]
+) -> List[Optional[str]]:
+    """
+    Classify seniority for multiple jobs with one encode and one matrix multiply.
+    
+    Returns:
+        List of seniority levels, None where the best score is below
+        SENIORITY_THRESHOLD or embeddings are unavailable
+    """
+    if not jobs:
+        return []
+    if not ensure_loaded() or _seniority_matrix is None:
+        return [None] * len(jobs)
+    
+    try:
+        texts = [f"{title} {desc[:300]}" for title, desc in jobs]
+        embeddings = encode(texts, show_progress_bar=len(jobs) >= PROGRESS_BAR_MIN_JOBS)
+        if embeddings is None:
+            return [None] * len(jobs)
+        
+        labels, matrix = _seniority_matrix
+        return best_matches(similarity_matrix(embeddings, matrix), labels, SENIORITY_THRESHOLD, None)
+    
+    except Exception as e:
+        logger.error(f"Batch seniority classification failed: {e}")
+        return [None] * len(jobs)
+
+
 # ============================================================================
 # QUICK TEST (run this file directly to test)
 # ============================================================================
@@ -642,7 +948,7 @@ if __name__ == "__main__":
     print("EMBEDDING CLASSIFIER TEST")
     print("=" * 60)
     
-    if not EMBEDDINGS_AVAILABLE:
+    if not ensure_loaded():
         print("❌ Embeddings not available. Install with:")
         print("   pip install sentence-transformers")
         exit(1)
@@ -0,0 +1,162 @@
+"""
+Content-addressed on-disk cache of sentence embeddings.
+
+Every text the embedding classifier encodes (job texts and role/seniority
+exemplars) is stored once, keyed by a hash of the text, in one file per model
+next to the intelligence DB:
+
+    data/embeddings/paraphrase-multilingual-MiniLM-L12-v2.emb
+
+The file is a small header (magic + dimension) followed by fixed-size
+records of a 16-byte blake2b key and a float16 vector. It is read through a
+NumPy memmap and only ever appended to, one write per batch, so a re-run over
+unchanged texts reads vectors from the page cache instead of running the
+model. The key -> row index is rebuilt from the key column on open; rows
+appended by another process are picked up on the next miss.
+"""
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence
+import hashlib
+import logging
+import re
+import threading
+
+import numpy as np
+
+from settings import settings
+
+logger = logging.getLogger('HR-Intel-EmbeddingStore')
+
+MAGIC = b'JCEMB1\0\0'
+HEADER_SIZE = 64
+
+
+def text_key(text: str) -> bytes:
+    """16-byte content hash a vector is stored under."""
+    return hashlib.blake2b(text.encode('utf-8'), digest_size=16).digest()
+
+
+class EmbeddingStore:
+    """Append-only float16 vector store for one embedding model."""
+
+    def __init__(self, model_name: str, root: Optional[Path] = None):
+        self.model_name = model_name
+        self.root = Path(root) if root else settings.get_embeddings_dir()
+        self.path = self.root / f"{re.sub(r'[^A-Za-z0-9_.-]+', '_', model_name)}.emb"
+        self.dim: Optional[int] = None
+        self.writable = True
+        self._index: Dict[bytes, int] = {}
+        self._records = None
+        self._rows = 0
+        self._size = 0
+        self._lock = threading.Lock()
+        self._refresh()
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def _dtype(self) -> np.dtype:
+        return np.dtype([('key', 'V16'), ('vector', '<f2', (self.dim,))])
+
+    def _refresh(self) -> None:
+        """(Re)map the file if it grew since it was last mapped."""
+        try:
+            size = self.path.stat().st_size
+        except FileNotFoundError:
+            return
+        if size == self._size or size < HEADER_SIZE:
+            return
+        if self.dim is None:
+            with open(self.path, 'rb') as f:
+                header = f.read(HEADER_SIZE)
+            if header[:len(MAGIC)] != MAGIC:
+                logger.warning(f"{self.path} is not an embedding store; not using it")
+                self.writable = False
+                self._size = size
+                return
+            self.dim = int(np.frombuffer(header, dtype='<u4', count=1, offset=len(MAGIC))[0])
+        record_size = self._dtype().itemsize
+        rows = (size - HEADER_SIZE) // record_size
+        # A torn trailing record (interrupted append) is ignored, not read
+        self._records = np.memmap(self.path, dtype=self._dtype(), mode='r', offset=HEADER_SIZE, shape=(rows,)) if rows else None
+        if rows > self._rows:
+            raw = self._records['key'][self._rows:rows].tobytes()
+            self._index.update((raw[i:i + 16], self._rows + i // 16) for i in range(0, len(raw), 16))
+        self._rows = rows
+        self._size = HEADER_SIZE + rows * record_size
+
+    def _append(self, keys: List[bytes], vectors: np.ndarray) -> None:
+        records = np.empty(len(keys), dtype=self._dtype())
+        records['key'] = keys
+        records['vector'] = vectors
+        try:
+            self.root.mkdir(parents=True, exist_ok=True)
+            new_file = not self.path.exists()
+            with open(self.path, 'ab') as f:
+                if new_file:
+                    f.write(MAGIC + np.uint32(self.dim).tobytes() + b'\0' * (HEADER_SIZE - len(MAGIC) - 4))
+                elif f.tell() != self._size:
+                    # Index rows other writers added, and drop a torn tail
+                    self._refresh()
+                    f.truncate(self._size)
+                f.write(records.tobytes())
+        except OSError as e:
+            logger.warning(f"Embedding store not writable ({e}); vectors will not be persisted")
+            self.writable = False
+            return
+        self._refresh()
+
+    def get_many(self, texts: Sequence[str], encode: Callable[[List[str]], Optional[np.ndarray]]) -> Optional[np.ndarray]:
+        """Vectors for texts, encoding (and storing) only those not stored yet.
+
+        Args:
+            texts: Texts to embed; duplicates are encoded once.
+            encode: Called with the missing texts, returns their vectors as a
+                2-D array (or None if encoding is unavailable).
+
+        Returns:
+            float32 array of shape (len(texts), dim), or None if some texts
+            were missing and encode returned None.
+        """
+        if not texts:
+            return np.empty((0, self.dim or 0), dtype=np.float32)
+        keys = [text_key(t) for t in texts]
+        with self._lock:
+            if any(k not in self._index for k in keys):
+                self._refresh()
+            missing = list(dict.fromkeys(k for k in keys if k not in self._index))
+            fresh: Dict[bytes, np.ndarray] = {}
+            if missing:
+                by_key = dict(zip(keys, texts))
+                vectors = encode([by_key[k] for k in missing])
+                if vectors is None:
+                    return None
+                vectors = np.asarray(vectors, dtype=np.float32)
+                if self.dim is None:
+                    self.dim = int(vectors.shape[1])
+                elif vectors.shape[1] != self.dim:
+                    raise ValueError(f"{self.model_name} returned {vectors.shape[1]}-d vectors, store holds {self.dim}-d")
+                if self.writable:
+                    self._append(missing, vectors)
+                if not self.writable:
+                    fresh = dict(zip(missing, vectors.astype(np.float16).astype(np.float32)))
+            rows = np.fromiter((self._index.get(k, -1) for k in keys), dtype=np.int64, count=len(keys))
+            stored = rows >= 0
+            out = np.empty((len(keys), self.dim), dtype=np.float32)
+            if stored.any():
+                out[stored] = self._records['vector'][rows[stored]]
+            for i in np.flatnonzero(~stored):
+                out[i] = fresh[keys[i]]
+            return out
+
+
+_stores: Dict[str, EmbeddingStore] = {}
+
+
+def get_store(model_name: str) -> EmbeddingStore:
+    """Process-wide store for model_name under settings.get_embeddings_dir()."""
+    root = settings.get_embeddings_dir()
+    store = _stores.get(model_name)
+    if store is None or store.root != root:
+        store = _stores[model_name] = EmbeddingStore(model_name, root)
+    return store
@@ -13,11 +13,64 @@ from typing import Dict, List, Optional
 logger = logging.getLogger(__name__)
 
 
-def get_market_stats(df) -> Dict:
-    """Extract key market statistics from the DataFrame for LLM analysis."""
+def _rollup_stats(summary) -> Dict:
+    """Counts and salary figures of get_market_stats, read from the report rollups."""
+    def distribution(dimension, limit=None):
+        counts = summary.counts(by=[dimension]).dropna(subset=[dimension])
+        counts = counts.sort_values('jobs', ascending=False)
+        if limit:
+            counts = counts.head(limit)
+        return {k: int(v) for k, v in zip(counts[dimension], counts['jobs'])}
+
+    totals = summary.counts()
+    total_jobs = int(totals['jobs'].iloc[0])
+    salaried = int(totals['salaried'].iloc[0])
+    salary_stats = {}
+    if salaried:
+        overall = summary.quantiles()
+        by_role = summary.quantiles(by=['role_type']).dropna(subset=['role_type'])
+        by_role = by_role.sort_values('q50', ascending=False).head(8)
+        salary_stats = {
+            'median': int(overall['q50'].iloc[0]),
+            'count_with_salary': salaried,
+            'percentage_with_salary': round(salaried / total_jobs * 100, 1),
+            'by_role': {k: int(v) for k, v in zip(by_role['role_type'], by_role['q50'])}
+        }
+    return {
+        'total_jobs': total_jobs,
+        'role_distribution': distribution('role_type', 10),
+        'seniority_distribution': distribution('seniority_level'),
+        'salary_stats': salary_stats,
+        'source_distribution': distribution('source'),
+        'contract_distribution': distribution('contract_type'),
+    }
+
+
+def get_market_stats(df, summary=None) -> Dict:
+    """Extract key market statistics from the DataFrame for LLM analysis.
+
+    Args:
+        df: Market DataFrame (MarketIntelligence.df).
+        summary: Optional rollups.Rollups; counts and salary medians are read
+            from it instead of being recomputed from df.
+    """
     if df.empty:
         return {}
     
+    if summary is not None and summary.available():
+        stats = _rollup_stats(summary)
+        tech_status = df['tech_status'].value_counts().to_dict() if 'tech_status' in df.columns else {}
+        city_dist = df['city'].value_counts().head(5).to_dict() if 'city' in df.columns else {}
+        from analysis.regional_analysis import RegionalAnalysis
+        regional_analyzer = RegionalAnalysis(df)
+        stats.update({
+            'tech_status': tech_status,
+            'top_cities': city_dist,
+            'regional_stats': regional_analyzer.get_regional_stats().to_dict(orient='records'),
+            'regional_trends': regional_analyzer.get_regional_trends().to_dict(orient='records'),
+        })
+        return stats
+    
     # Basic counts
     total_jobs = len(df)
     
@@ -286,11 +339,12 @@ Vytvoř JSON objekt s touto strukturou:
         return {}
 
 
-def get_llm_insights(df) -> Dict:
+def get_llm_insights(df, summary=None) -> Dict:
     """
     Main entry point for LLM market analysis.
     
     Checks for API key, generates insights, handles failures gracefully.
+    summary (rollups.Rollups) is passed through to get_market_stats.
     
     Returns:
         Dict with insights or empty dict if unavailable
@@ -309,7 +363,7 @@ def get_llm_insights(df) -> Dict:
     logger.info("Generating LLM market insights...")
     
     # Get stats
-    stats = get_market_stats(df)
+    stats = get_market_stats(df, summary)
     if not stats:
         logger.warning("No market stats available for LLM analysis.")
         return {'summary': '', 'key_insights': [], 'trend_alert': None, 'enabled': False}
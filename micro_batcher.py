@@ -0,0 +1,109 @@
+"""
+Size/latency-bounded micro-batching for the ingest path.
+
+Scrapers hand IntelligenceCore one page of signals at a time, and only the
+few jobs keywords cannot place need the embedding model. Sending each page's
+misses to the model separately means many tiny batches, so
+IntelligenceCore.add_signals parks those signals in a MicroBatcher. The
+batcher flushes them together once max_size are pending, or once the oldest
+has waited max_latency seconds. The flush callback classifies the batch and
+inserts it.
+
+The batcher has no timer thread (the DuckDB connection must stay on the
+caller's thread). Latency is checked on every add() and poll(), and callers
+drain it with flush() before anything reads what was ingested.
+"""
+from typing import Callable, Dict, Generic, List, Sequence, TypeVar
+import logging
+import time
+
+logger = logging.getLogger('HR-Intel-Batcher')
+
+T = TypeVar('T')
+
+
+class MicroBatcher(Generic[T]):
+    """Accumulates items and flushes them in batches by size or age."""
+
+    def __init__(self, flush: Callable[[List[T]], None], max_size: int, max_latency: float,
+                 name: str = "batch", clock: Callable[[], float] = time.monotonic):
+        """
+        Args:
+            flush: Called with each batch (in arrival order).
+            max_size: Flush as soon as this many items are pending.
+            max_latency: Flush once the oldest pending item is this many seconds old.
+            name: Label for the stats log line.
+            clock: Monotonic time source (injectable for tests).
+        """
+        self._flush = flush
+        self.max_size = max(1, int(max_size))
+        self.max_latency = float(max_latency)
+        self.name = name
+        self._clock = clock
+        self._pending: List[T] = []
+        self._oldest = None
+        self.batches = 0
+        self.items = 0
+        self.largest_batch = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+        self.flush_seconds = 0.0
+        self.reasons: Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def add(self, items: Sequence[T]) -> None:
+        """Queue items, flushing (possibly several times) if a threshold is hit."""
+        for item in items:
+            if not self._pending:
+                self._oldest = self._clock()
+            self._pending.append(item)
+            if len(self._pending) >= self.max_size:
+                self.flush("size")
+        self.poll()
+
+    def poll(self) -> None:
+        """Flush if the oldest pending item has waited max_latency."""
+        if self._pending and self._clock() - self._oldest >= self.max_latency:
+            self.flush("latency")
+
+    def flush(self, reason: str = "drain") -> None:
+        """Hand all pending items to the flush callback now."""
+        if not self._pending:
+            return
+        batch, self._pending = self._pending, []
+        wait = self._clock() - self._oldest
+        start = self._clock()
+        self._flush(batch)
+        self.flush_seconds += self._clock() - start
+        self.batches += 1
+        self.items += len(batch)
+        self.largest_batch = max(self.largest_batch, len(batch))
+        self.total_wait += wait
+        self.max_wait = max(self.max_wait, wait)
+        self.reasons[reason] = self.reasons.get(reason, 0) + 1
+
+    def stats(self) -> dict:
+        """Batch sizes, queue waits and flush triggers since creation."""
+        return {
+            "batches": self.batches,
+            "items": self.items,
+            "mean_batch": self.items / self.batches if self.batches else 0.0,
+            "largest_batch": self.largest_batch,
+            "mean_wait_s": self.total_wait / self.batches if self.batches else 0.0,
+            "max_wait_s": self.max_wait,
+            "flush_s": self.flush_seconds,
+            "reasons": dict(self.reasons),
+        }
+
+    def log_stats(self) -> dict:
+        stats = self.stats()
+        if stats["batches"]:
+            logger.info(
+                f"{self.name}: {stats['items']} items in {stats['batches']} batches "
+                f"(mean {stats['mean_batch']:.1f}, max {stats['largest_batch']}/{self.max_size}); "
+                f"queue wait mean {stats['mean_wait_s']:.2f}s, max {stats['max_wait_s']:.2f}s "
+                f"(limit {self.max_latency:.1f}s); flush time {stats['flush_s']:.2f}s; triggers {stats['reasons']}"
+            )
+        return stats
@@ -0,0 +1,155 @@
+"""
+Near-duplicate detection for job descriptions (MinHash + LSH).
+
+get_content_hash only catches exact duplicates. The same ad re-posted on another
+portal, by an agency, or with a tweaked title gets a new hash but keeps an almost
+identical description. MinHash signatures over word shingles estimate the
+Jaccard similarity of two descriptions; splitting each signature into bands
+(locality-sensitive hashing) turns "which stored signals look like this one?"
+into a few indexed bucket lookups instead of a comparison with every signal.
+"""
+from typing import List, Optional
+import re
+import zlib
+
+import numpy as np
+
+# --- MINHASH / LSH PARAMETERS ---
+NUM_PERM = 64
+BANDS = 16
+ROWS_PER_BAND = NUM_PERM // BANDS  # Candidate threshold ~ (1/BANDS)^(1/ROWS) = 0.5
+SHINGLE_SIZE = 3                   # Word 3-grams
+MIN_SHINGLES = 10                  # Shorter texts are too generic to cluster
+SIMILARITY_THRESHOLD = 0.7         # Estimated Jaccard needed to join a cluster (~5% of words edited)
+
+_PRIME = np.uint64(4294967291)  # Largest prime < 2**32 keeps signature values in uint32
+_rng = np.random.RandomState(20260107)  # Fixed: stored signatures depend on it
+_PERM_A = _rng.randint(1, 2**31 - 1, NUM_PERM).astype(np.uint64)
+_PERM_B = _rng.randint(0, 2**31 - 1, NUM_PERM).astype(np.uint64)
+_TOKEN_PATTERN = re.compile(r"\w+")
+
+
+def shingles(text: Optional[str]) -> set:
+    """Lowercased word n-grams of a description."""
+    if not text:
+        return set()
+    tokens = _TOKEN_PATTERN.findall(str(text).lower())
+    if len(tokens) < SHINGLE_SIZE:
+        return set()
+    return {" ".join(tokens[i:i + SHINGLE_SIZE]) for i in range(len(tokens) - SHINGLE_SIZE + 1)}
+
+
+def minhash_signature(text: Optional[str]) -> Optional[np.ndarray]:
+    """MinHash signature (NUM_PERM uint32 values) of a description.
+
+    Returns:
+        None when the text has fewer than MIN_SHINGLES shingles.
+    """
+    grams = shingles(text)
+    if len(grams) < MIN_SHINGLES:
+        return None
+    values = np.fromiter((zlib.crc32(g.encode("utf-8")) for g in grams), dtype=np.uint64, count=len(grams))
+    # (a * x + b) mod p stays below 2**63 for a < 2**31 and x < 2**32
+    permuted = (_PERM_A[:, None] * values[None, :] + _PERM_B[:, None]) % _PRIME
+    return permuted.min(axis=1).astype(np.uint32)
+
+
+def _mix64(x: np.ndarray) -> np.ndarray:
+    """splitmix64 finalizer (wrapping uint64 arithmetic)."""
+    x = x ^ (x >> np.uint64(30))
+    x = x * np.uint64(0xBF58476D1CE4E5B9)
+    x = x ^ (x >> np.uint64(27))
+    x = x * np.uint64(0x94D049BB133111EB)
+    return x ^ (x >> np.uint64(31))
+
+
+def band_keys(signatures: np.ndarray) -> np.ndarray:
+    """LSH bucket key per band.
+
+    Args:
+        signatures: One signature (NUM_PERM,) or a stack (n, NUM_PERM).
+
+    Returns:
+        int64 array of shape (n, BANDS); keys also encode the band index, so a
+        single indexed column holds all bands.
+    """
+    sig = np.atleast_2d(signatures).astype(np.uint64).reshape(-1, BANDS, ROWS_PER_BAND)
+    keys = np.broadcast_to(np.arange(BANDS, dtype=np.uint64), sig.shape[:2]).copy()
+    for row in range(ROWS_PER_BAND):
+        keys = _mix64(keys ^ sig[:, :, row])
+    return keys.view(np.int64)
+
+
+def estimate_similarity(a: np.ndarray, b: np.ndarray) -> float:
+    """Estimated Jaccard similarity of two signatures."""
+    return float(np.mean(a == b))
+
+
+def signature_to_bytes(signature: np.ndarray) -> bytes:
+    return signature.astype("<u4").tobytes()
+
+
+def signature_from_bytes(blob: bytes) -> np.ndarray:
+    return np.frombuffer(bytes(blob), dtype="<u4")
+
+
+def best_match(signature: np.ndarray, candidates: List[tuple],
+               threshold: float = SIMILARITY_THRESHOLD) -> Optional[str]:
+    """Cluster id of the most similar candidate above threshold.
+
+    Args:
+        signature: Signature of the incoming description.
+        candidates: (cluster_id, signature_bytes) pairs from the LSH buckets.
+    """
+    best_cluster, best_score = None, threshold
+    for cluster_id, blob in candidates:
+        score = estimate_similarity(signature, signature_from_bytes(blob))
+        if score >= best_score:
+            best_cluster, best_score = cluster_id, score
+    return best_cluster
+
+
+def cluster_signatures(signatures: np.ndarray, threshold: float = SIMILARITY_THRESHOLD) -> np.ndarray:
+    """Bulk clustering for backfills: index of each row's cluster representative.
+
+    Rows sharing a bucket are linked (union-find) when their estimated
+    similarity reaches the threshold. Each member is compared with the first
+    and the previous member of its bucket only, so oversized buckets (the same
+    ad re-posted hundreds of times) cost O(k) instead of O(k^2). The
+    representative is the lowest row index in a cluster, so ordering rows
+    oldest-first keeps the original posting as the cluster id.
+    """
+    n = len(signatures)
+    parent = np.arange(n)
+
+    def find(i):
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    def union(i, j):
+        ri, rj = find(i), find(j)
+        if ri != rj:
+            parent[max(ri, rj)] = min(ri, rj)
+
+    if n == 0:
+        return parent
+    keys = band_keys(signatures)
+    for band in range(BANDS):
+        order = np.argsort(keys[:, band], kind="stable")
+        sorted_keys = keys[order, band]
+        boundaries = np.flatnonzero(np.diff(sorted_keys)) + 1
+        starts = np.concatenate(([0], boundaries))
+        ends = np.concatenate((boundaries, [n]))
+        shared = ends - starts > 1
+        for start, end in zip(starts[shared], ends[shared]):
+            bucket = np.sort(order[start:end])
+            first = bucket[0]
+            for prev, cur in zip(bucket[:-1], bucket[1:]):
+                for other in {first, prev}:
+                    if find(other) == find(cur):
+                        continue
+                    if estimate_similarity(signatures[other], signatures[cur]) >= threshold:
+                        union(other, cur)
+    return np.array([find(i) for i in range(n)])
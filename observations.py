@@ -0,0 +1,144 @@
+"""
+Append-only observation history for trend analytics.
+
+`signals` holds the current state of the market and cleanup_expired deletes
+listings that disappear, so trends computed from it only see the survivors.
+Every scrape therefore also records one compact row per (signal hash, scrape
+date) with the fields that change over time. Rows are written as Parquet files
+partitioned by ISO week:
+
+    data/observations/week=2026-10-12/observed_2026-10-19.parquet
+
+Re-running a scrape on the same day rewrites that day's file, so the history
+never holds duplicate (hash, date) rows. Readers go through DuckDB's
+read_parquet with hive partitioning, so filters on week prune whole
+directories and filters on observed_on use the Parquet row-group statistics.
+"""
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import List, Optional, Sequence
+import logging
+import os
+
+import duckdb
+import pandas as pd
+
+from settings import settings
+
+logger = logging.getLogger('HR-Intel-Observations')
+
+# Mutable fields plus the dimensions trend queries group by
+OBSERVATION_COLUMNS = [
+    "hash", "observed_on", "source", "region", "city", "company",
+    "role_type", "seniority_level", "avg_salary", "ghost_score", "cluster_id",
+]
+
+
+def week_start(day: date) -> date:
+    """Monday of the ISO week containing day (partition key)."""
+    return day - timedelta(days=day.weekday())
+
+
+class ObservationStore:
+    """Weekly-partitioned Parquet history of signal observations."""
+
+    def __init__(self, root: Optional[Path] = None):
+        self.root = Path(root) if root else settings.get_observations_dir()
+
+    def _file_for(self, observed_on: date) -> Path:
+        return self.root / f"week={week_start(observed_on).isoformat()}" / f"observed_{observed_on.isoformat()}.parquet"
+
+    def _glob(self) -> str:
+        return str(self.root / "week=*" / "*.parquet")
+
+    def available(self) -> bool:
+        return any(self.root.glob("week=*/*.parquet"))
+
+    def observed_dates(self) -> List[date]:
+        """Scrape dates with recorded observations, oldest first (from file names only)."""
+        dates = []
+        for path in self.root.glob("week=*/observed_*.parquet"):
+            try:
+                dates.append(date.fromisoformat(path.stem.replace("observed_", "")))
+            except ValueError:
+                continue
+        return sorted(dates)
+
+    def record(self, con: duckdb.DuckDBPyConnection, observed_on: Optional[date] = None,
+               seen_since: Optional[datetime] = None) -> int:
+        """Snapshot the signals seen by a scrape into that day's partition file.
+
+        Args:
+            con: Connection to the intelligence DB (signals table).
+            observed_on: Scrape date; defaults to today.
+            seen_since: Scrape start; signals with last_seen_at from here on are
+                recorded. Defaults to midnight of observed_on.
+
+        Returns:
+            Number of observations written.
+        """
+        observed_on = observed_on or datetime.now().date()
+        seen_since = seen_since or datetime.combine(observed_on, datetime.min.time())
+        target = self._file_for(observed_on)
+        target.parent.mkdir(parents=True, exist_ok=True)
+
+        existing = {row[0] for row in con.execute("DESCRIBE signals").fetchall()}
+        select = ", ".join(
+            "CAST(? AS DATE) AS observed_on" if col == "observed_on"
+            else (col if col in existing else f"NULL AS {col}")
+            for col in OBSERVATION_COLUMNS
+        )
+        where = "last_seen_at >= ?"
+        count = con.execute(f"SELECT COUNT(*) FROM signals WHERE {where}", [seen_since]).fetchone()[0]
+        if not count:
+            return 0
+
+        tmp = target.with_suffix(".parquet.tmp")
+        con.execute(
+            f"COPY (SELECT {select} FROM signals WHERE {where} ORDER BY region, role_type) "
+            f"TO '{tmp.as_posix()}' (FORMAT PARQUET, COMPRESSION ZSTD)",
+            [observed_on, seen_since]
+        )
+        os.replace(tmp, target)
+        logger.info(f"Recorded {count} observations for {observed_on} -> {target}")
+        return count
+
+    def load(self, columns: Optional[Sequence[str]] = None, since: Optional[date] = None,
+             until: Optional[date] = None, dates: Optional[Sequence[date]] = None) -> pd.DataFrame:
+        """Read observations with partition and row-group pruning.
+
+        Args:
+            columns: Subset of OBSERVATION_COLUMNS (default: all).
+            since: First observation date to include.
+            until: Last observation date to include.
+            dates: Explicit observation dates to include.
+
+        Returns:
+            DataFrame of matching observations (empty with the requested
+            columns when there is no history yet).
+        """
+        columns = list(columns or OBSERVATION_COLUMNS)
+        if not self.available():
+            return pd.DataFrame(columns=columns)
+
+        conditions, params = [], []
+        if since:
+            conditions += ["week >= CAST(? AS DATE)", "observed_on >= CAST(? AS DATE)"]
+            params += [week_start(since), since]
+        if until:
+            conditions += ["week <= CAST(? AS DATE)", "observed_on <= CAST(? AS DATE)"]
+            params += [week_start(until), until]
+        if dates:
+            dates = list(dates)
+            conditions += ["week IN (SELECT unnest(CAST(? AS DATE[])))", "observed_on IN (SELECT unnest(CAST(? AS DATE[])))"]
+            params += [sorted({week_start(d) for d in dates}), dates]
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+
+        con = duckdb.connect()
+        try:
+            return con.execute(
+                f"SELECT {', '.join(columns)} FROM read_parquet('{self._glob()}', hive_partitioning = true) {where}",
+                params
+            ).df()
+        finally:
+            con.close()
@@ -1,8 +1,10 @@
 ﻿import re
 import logging
 from pathlib import Path
-from typing import Tuple, Optional, Dict
+from typing import Iterable, Tuple, Optional, Dict, Union
 
+import numpy as np
+import pandas as pd
 import yaml
 
 logger = logging.getLogger('HR-Intel-Parsers')
@@ -39,6 +41,27 @@ SALARY_NUM_PATTERN = re.compile(r"(\d+(?:\.\d+)?)")
 THOUSAND_SEP_PATTERN = re.compile(r"(\d)\.(\d{3})")
 # Range pattern: handles both integers and decimals (after comma-to-dot conversion)
 RANGE_PATTERN = re.compile(r"(\d+(?:\.\d+)?)\s*(?:-|–|—|až)\s*(\d+(?:\.\d+)?)")
+DECIMAL_COMMA_PATTERN = re.compile(r',(\d{1,2})($|[^0-9])')
+K_NOTATION_PATTERN = re.compile(r'(\d+(?:\.\d+)?)k(?!č)')
+# "45-80000" (k applied to the end of a range only)
+K_RANGE_PATTERN = re.compile(r'(\d+(?:\.\d+)?)([-–])(\d{4,6})')
+ZERO_SALARY_PATTERN = re.compile(r'(^|[^0-9])0(czk|kč)')
+NO_BONUS_PATTERN = re.compile(r'bez\s*bonus|no\s*bonus|without\s*bonus|není\s*bonus')
+EXTRA_SALARY_PATTERN = re.compile(r'13\.?\s*plat|14\.?\s*plat|třináct|čtrnáct')
+
+# Unit conversion thresholds (validated against CZ market 2026)
+# - HOURLY_THRESHOLD: Max reasonable hourly rate before assuming it's monthly
+#   Executive consultants can reach 2000-3500 CZK/hour
+# - DAILY_THRESHOLD: Max reasonable daily rate before assuming it's monthly
+#   Senior contractors can reach 15000-25000 CZK/day
+HOURLY_THRESHOLD = 3500  # CZK/hour - covers executive consultants
+DAILY_THRESHOLD = 25000  # CZK/day - covers senior contractors
+MONTHLY_HOURS = 160
+WORKING_DAYS = 22
+
+
+def _expand_k(match: re.Match) -> str:
+    return str(int(float(match.group(1)) * 1000))
 
 # Bonus detection patterns (Czech and English)
 BONUS_PATTERNS = [
@@ -71,22 +94,79 @@ class SalaryParser:
         """
         if not s or not isinstance(s, str):
             return None, None, None
-            
-        original_input = s
-        s = s.lower().replace(" ", "").replace(" ", "")
-        
+        return SalaryParser._parse_normalized(SalaryParser.normalize(s), source == 'StartupJobs', s)
+
+    @staticmethod
+    def normalize(s: str) -> str:
+        """
+        Lowercase, drop spaces, turn decimal commas into dots, remove
+        thousand separators and expand 'k' notation (80k -> 80000).
+        """
+        s = s.lower().replace(" ", "").replace("\u00a0", "")
         # Handle decimal commas (3,3 -> 3.3) before thousand separator removal
-        s = re.sub(r',(\d{1,2})($|[^0-9])', r'.\1\g<2>', s)
-        
+        s = DECIMAL_COMMA_PATTERN.sub(r'.\1\g<2>', s)
         # Remove thousand separators (dots)
-        s = re.sub(r'(\d)\.(\d{3})', r'\1\2', s)
-        
+        s = THOUSAND_SEP_PATTERN.sub(r'\1\2', s)
         # Handle 'k' notation (e.g., 80k -> 80000)
-        s = re.sub(r'(\d+(?:\.\d+)?)k(?!č)', lambda m: str(int(float(m.group(1)) * 1000)), s)
-        
+        return K_NOTATION_PATTERN.sub(_expand_k, s)
+
+    @staticmethod
+    def _normalize_series(salaries: pd.Series) -> pd.Series:
+        """normalize() as pandas string operations over a Series of strings."""
+        return (
+            salaries.str.lower()
+            .str.replace(" ", "", regex=False)
+            .str.replace("\u00a0", "", regex=False)
+            .str.replace(DECIMAL_COMMA_PATTERN, r'.\1\g<2>', regex=True)
+            .str.replace(THOUSAND_SEP_PATTERN, r'\1\2', regex=True)
+            .str.replace(K_NOTATION_PATTERN, _expand_k, regex=True)
+        )
+
+    @staticmethod
+    def parse_many(salaries: Iterable, sources: Union[Iterable, str, None] = None
+                   ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Parse many salary strings at once; same results as parse() per element.
+
+        Identical (salary, StartupJobs-or-not) pairs are parsed once, and the
+        string normalization runs as vectorized pandas string operations over
+        the distinct strings.
+
+        Args:
+            salaries: Raw salary strings (None/NaN/non-strings allowed).
+            sources: Source per salary, or one source for all (None = no source).
+
+        Returns:
+            (min_salary, max_salary, avg_salary) object arrays aligned with
+            salaries, holding exactly what parse() returns for each element.
+        """
+        salaries = pd.Series(list(salaries), dtype=object)
+        n = len(salaries)
+        if sources is None or isinstance(sources, str):
+            startup = np.full(n, sources == 'StartupJobs')
+        else:
+            startup = (pd.Series(list(sources), dtype=object) == 'StartupJobs').to_numpy()
+        valid = salaries.map(lambda s: isinstance(s, str) and s != "").to_numpy(dtype=bool)
+
+        result = np.full((n, 3), None, dtype=object)
+        if valid.any():
+            codes, uniques = pd.factorize(salaries[valid].to_numpy())
+            keys, inverse = np.unique(codes * 2 + startup[valid], return_inverse=True)
+            raw = pd.Series(uniques[keys // 2], dtype=object)
+            normalized = SalaryParser._normalize_series(raw)
+            parsed = np.empty((len(keys), 3), dtype=object)
+            for i, (s, is_startup, original) in enumerate(zip(normalized, keys % 2 == 1, raw)):
+                parsed[i] = SalaryParser._parse_normalized(s, bool(is_startup), original)
+            result[valid] = parsed[inverse.ravel()]
+        return result[:, 0], result[:, 1], result[:, 2]
+
+    @staticmethod
+    def _parse_normalized(s: str, startup_jobs: bool, original_input: str
+                          ) -> Tuple[Optional[int], Optional[int], Optional[float]]:
+        """parse() on an already normalize()d string."""
         # Pre-process ranges to ensure both numbers are expanded if 'k' was applied to the end
         # e.g. 45-80000 -> 45000-80000
-        range_match = re.search(r'(\d+(?:\.\d+)?)([-–])(\d{4,6})', s)
+        range_match = K_RANGE_PATTERN.search(s)
         if range_match:
             first_val = float(range_match.group(1))
             second_val = float(range_match.group(3))
@@ -106,16 +186,6 @@ class SalaryParser:
             is_range = True
         
         # --- UNIT CONVERSION ---
-        # Threshold constants (validated against CZ market 2026)
-        # - HOURLY_THRESHOLD: Max reasonable hourly rate before assuming it's monthly
-        #   Executive consultants can reach 2000-3500 CZK/hour
-        # - DAILY_THRESHOLD: Max reasonable daily rate before assuming it's monthly
-        #   Senior contractors can reach 15000-25000 CZK/day
-        HOURLY_THRESHOLD = 3500  # CZK/hour - covers executive consultants
-        DAILY_THRESHOLD = 25000  # CZK/day - covers senior contractors
-        MONTHLY_HOURS = 160
-        WORKING_DAYS = 22
-        
         # Daily rates
         if '/den' in s or '/day' in s or 'denně' in s or 'per day' in s or 'daily' in s:
             if not is_range: nums = [float(n) for n in SALARY_NUM_PATTERN.findall(s)]
@@ -131,7 +201,7 @@ class SalaryParser:
                 nums_raw = nums  # Use already detected range numbers
             
             # StartupJobs shorthand handling - applies to BOTH ranges and single values
-            if source == 'StartupJobs' and "eur" not in s and "€" not in s:
+            if startup_jobs and "eur" not in s and "€" not in s:
                 nums = []
                 for n in nums_raw:
                     if n < 300: nums.append(n * 1000)        # 60-80 -> 60k-80k
@@ -155,7 +225,7 @@ class SalaryParser:
             nums = [n * rates.get('CHF', 26.0) for n in nums]
         
         # Special Case: Unpaid / Negotiable
-        if 'unpaid' in s or re.search(r'(^|[^0-9])0(czk|kč)', s):
+        if 'unpaid' in s or ZERO_SALARY_PATTERN.search(s):
             return 0, 0, 0
         if 'dohodou' in s or 'negotiable' in s or 'tbd' in s:
             return -1, -1, -1
@@ -209,12 +279,12 @@ class SalaryParser:
         s_lower = s.lower()
         
         # Check for negative context (no bonus)
-        no_bonus_pattern = re.search(r'bez\s*bonus|no\s*bonus|without\s*bonus|není\s*bonus', s_lower)
+        no_bonus_pattern = NO_BONUS_PATTERN.search(s_lower)
         
         # Detect bonus mentions (only if not negated)
         if not no_bonus_pattern:
             result['has_bonus'] = bool(BONUS_MENTION_PATTERN.search(s_lower))
-            result['has_13th_salary'] = bool(re.search(r'13\.?\s*plat|14\.?\s*plat|třináct|čtrnáct', s_lower))
+            result['has_13th_salary'] = bool(EXTRA_SALARY_PATTERN.search(s_lower))
         
         # Try to extract specific bonus amount
         for pattern in BONUS_COMPILED:
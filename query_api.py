@@ -0,0 +1,509 @@
+"""
+Local JSON query API over the intelligence data.
+
+Internal tools query this service instead of opening intelligence.db (or
+copying it) themselves:
+
+    python query_api.py [--host 127.0.0.1] [--port 8765]
+
+GET endpoints, all returning JSON:
+
+    /health             data version and pool state
+    /metrics            requests, cache hits, errors and latency per endpoint
+    /kpis               dashboard headline counts (dashboard_data.kpis)
+    /regional           hub salary stats and trends
+    /salary             jobs and salary quantiles per group, from the rollups:
+                        ?by=role_type,region  &q=0.25,0.5,0.75
+                        &<dimension>=value[,value...]  (rollups.DIMENSIONS)
+    /signals            matching signals as a streamed JSON array:
+                        ?columns=title,company  &limit=N  &since=YYYY-MM-DD
+                        &<column>=value[,value...]  (SIGNAL_FILTERS)
+    /skill-premiums, /ghost-jobs, /salary-by-role, /salary-by-seniority,
+    /salary-by-city, /benefits, /benefits-by-role, /locations
+                        the MarketIntelligence method behind each path
+                        (INTEL_ENDPOINTS); ?limit=N keeps the first rows
+
+SQL endpoints run on read-only DuckDB cursors from a pool over one
+connection per data version (views over a fresh snapshot, else the database
+itself; see dashboard_data.connect). MarketIntelligence endpoints share one
+instance per data version. Responses are cached per (endpoint, parameters,
+data version), so a scrape invalidates them without an explicit flush;
+/signals is streamed and never cached.
+"""
+from collections import OrderedDict, deque
+from contextlib import contextmanager
+from datetime import date, datetime
+from decimal import Decimal
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, Iterator, List, NamedTuple, Optional, Union
+from urllib.parse import parse_qs, urlparse
+import argparse
+import json
+import logging
+import queue
+import threading
+import time
+
+import duckdb
+import numpy as np
+import pandas as pd
+
+import analyzer
+import dashboard_data
+import rollups
+from settings import settings
+
+logger = logging.getLogger('HR-Intel-API')
+
+CACHE_ENTRIES = 256
+STREAM_BATCH = 2_000  # Rows fetched and written per chunk of /signals
+LATENCY_SAMPLES = 1_000  # Recent requests per endpoint kept for percentiles
+
+# /signals: columns returned by default, and columns that can be filtered on
+SIGNAL_COLUMNS = ["hash", "title", "company", "avg_salary", "role_type", "seniority_level", "region",
+                  "resolved_city", "source", "link", "scraped_at", "last_seen_at"]
+SIGNAL_FILTERS = ["role_type", "seniority_level", "region", "resolved_city", "source", "company", "tech_status"]
+
+# Path -> MarketIntelligence method
+INTEL_ENDPOINTS = {
+    "/skill-premiums": "get_skill_premiums",
+    "/ghost-jobs": "get_ghost_jobs",
+    "/salary-by-role": "get_salary_by_role",
+    "/salary-by-seniority": "get_salary_by_seniority",
+    "/salary-by-city": "get_salary_by_city",
+    "/benefits": "get_benefits_analysis",
+    "/benefits-by-role": "get_benefits_by_role",
+    "/locations": "get_location_distribution",
+}
+
+
+class QueryError(ValueError):
+    """Invalid request parameters (answered with HTTP 400)."""
+
+
+class Response(NamedTuple):
+    status: int
+    body: Union[bytes, Iterator[bytes]]  # An iterator is streamed
+    cached: bool = False
+
+
+def _json_default(obj):
+    if isinstance(obj, (datetime, date, pd.Timestamp)):
+        return obj.isoformat()
+    if isinstance(obj, np.integer):
+        return int(obj)
+    if isinstance(obj, (np.floating, Decimal)):
+        value = float(obj)
+        return None if np.isnan(value) else value
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    raise TypeError(f"{type(obj).__name__} is not JSON serializable")
+
+
+def to_json(result) -> bytes:
+    """JSON body for an endpoint result (DataFrames as lists of records)."""
+    if isinstance(result, pd.DataFrame):
+        body = result.to_json(orient="records", date_format="iso", force_ascii=False)
+    elif isinstance(result, pd.Series):
+        body = result.to_json(date_format="iso", force_ascii=False)
+    else:
+        body = json.dumps(result, default=_json_default, ensure_ascii=False)
+    return body.encode("utf-8")
+
+
+class ConnectionPool:
+    """Read-only DuckDB cursors over one connection per data version.
+
+    At most `size` cursors are handed out at once; idle ones are reused. When
+    the data version changes the connection is reopened; the old one stays
+    open until its checked-out cursors come back (closing a DuckDB connection
+    breaks the cursors still reading from it), then closes with them.
+    """
+
+    def __init__(self, size: int, connect: Callable = dashboard_data.connect):
+        self.size = size
+        self._connect = connect
+        self._slots = threading.BoundedSemaphore(size)
+        self._lock = threading.Lock()
+        self._version: Optional[str] = None
+        self._con = None
+        self._idle: "queue.LifoQueue" = queue.LifoQueue()
+        self._checked_out: Dict[duckdb.DuckDBPyConnection, int] = {}  # Connection -> cursors in use
+
+    @contextmanager
+    def cursor(self, version: str):
+        self._slots.acquire()
+        try:
+            with self._lock:
+                if version != self._version:
+                    self._reopen(version)
+                con = self._con
+                try:
+                    cursor = self._idle.get_nowait()
+                except queue.Empty:
+                    cursor = con.cursor()
+                    # Temp views are per cursor: give it the zstd-decoding signals_text too
+                    analyzer.register_text_decoder(cursor)
+                self._checked_out[con] = self._checked_out.get(con, 0) + 1
+            try:
+                yield cursor
+            finally:
+                with self._lock:
+                    self._checked_out[con] -= 1
+                    if con is self._con:
+                        self._idle.put(cursor)
+                    else:
+                        cursor.close()
+                        self._close_if_unused(con)
+        finally:
+            self._slots.release()
+
+    def _reopen(self, version: str) -> None:
+        self._retire()
+        self._con = self._connect()
+        self._version = version
+        logger.info(f"Opened read-only connection for data version {version[:80]}")
+
+    def state(self) -> dict:
+        return {"size": self.size, "idle": self._idle.qsize()}
+
+    def close(self) -> None:
+        with self._lock:
+            self._retire()
+            self._con, self._version = None, None
+
+    def _retire(self) -> None:
+        """Close the idle cursors and, once none is checked out, the current connection."""
+        while not self._idle.empty():
+            self._idle.get_nowait().close()
+        if self._con is not None:
+            self._checked_out.setdefault(self._con, 0)
+            self._close_if_unused(self._con)
+
+    def _close_if_unused(self, con) -> None:
+        if self._checked_out.get(con) == 0:
+            del self._checked_out[con]
+            con.close()
+
+
+class ResponseCache:
+    """LRU cache of encoded responses."""
+
+    def __init__(self, max_entries: int = CACHE_ENTRIES):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[tuple, bytes]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: tuple) -> Optional[bytes]:
+        with self._lock:
+            body = self._entries.get(key)
+            if body is not None:
+                self._entries.move_to_end(key)
+            return body
+
+    def put(self, key: tuple, body: bytes) -> None:
+        with self._lock:
+            self._entries[key] = body
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class LatencyMetrics:
+    """Request counts and latency percentiles per endpoint."""
+
+    def __init__(self, samples: int = LATENCY_SAMPLES):
+        self._samples: Dict[str, deque] = {}
+        self._counts: Dict[str, Dict[str, int]] = {}
+        self._maxlen = samples
+        self._lock = threading.Lock()
+
+    def record(self, endpoint: str, seconds: float, cached: bool = False, error: bool = False) -> None:
+        with self._lock:
+            self._samples.setdefault(endpoint, deque(maxlen=self._maxlen)).append(seconds)
+            counts = self._counts.setdefault(endpoint, {"requests": 0, "cache_hits": 0, "errors": 0})
+            counts["requests"] += 1
+            counts["cache_hits"] += int(cached)
+            counts["errors"] += int(error)
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            report = {}
+            for endpoint, samples in sorted(self._samples.items()):
+                ms = np.array(samples) * 1000
+                report[endpoint] = dict(self._counts[endpoint],
+                                        p50_ms=round(float(np.percentile(ms, 50)), 3),
+                                        p95_ms=round(float(np.percentile(ms, 95)), 3),
+                                        max_ms=round(float(ms.max()), 3))
+            return report
+
+
+def _values(params: dict, name: str) -> List[str]:
+    """Comma-separated and repeated values of a query parameter."""
+    return [v for raw in params.get(name, []) for v in raw.split(",") if v]
+
+
+def _limit(params: dict) -> Optional[int]:
+    values = _values(params, "limit")
+    if not values:
+        return None
+    try:
+        limit = int(values[-1])
+    except ValueError:
+        raise QueryError("limit must be an integer")
+    if limit < 0:
+        raise QueryError("limit must not be negative")
+    return limit
+
+
+class QueryService:
+    """Endpoint logic, independent of the HTTP layer."""
+
+    def __init__(self, pool_size: Optional[int] = None, version: Callable[[], str] = dashboard_data.data_version):
+        self.pool = ConnectionPool(pool_size or settings.get_api_pool_size())
+        self.cache = ResponseCache()
+        self.metrics = LatencyMetrics()
+        self._version = version
+        self._intel = (None, None)  # (data version, MarketIntelligence)
+        self._intel_lock = threading.Lock()
+        self.endpoints: Dict[str, Callable] = {
+            "/kpis": self._kpis,
+            "/regional": self._regional,
+            "/salary": self._salary,
+        }
+        for path, method in INTEL_ENDPOINTS.items():
+            self.endpoints[path] = self._intel_endpoint(method)
+
+    # --- Dispatch ---
+
+    def handle(self, path: str, params: dict) -> Response:
+        """Response to a GET of path with parse_qs-style params.
+
+        Raises:
+            QueryError: Invalid parameters.
+            LookupError: The data behind the endpoint is not available yet.
+        """
+        if path == "/health":
+            return Response(200, to_json({"status": "ok", "data_version": self._version(),
+                                          "pool": self.pool.state(), "cached_responses": len(self.cache)}))
+        if path == "/metrics":
+            return Response(200, to_json(self.metrics.snapshot()))
+        if path == "/signals":
+            return Response(200, self._signals(params, self._version()))
+        if path not in self.endpoints:
+            return Response(404, to_json({"error": f"unknown endpoint {path}", "endpoints": self.paths()}))
+
+        version = self._version()
+        key = (path, tuple(sorted((k, tuple(v)) for k, v in params.items())), version)
+        body = self.cache.get(key)
+        if body is not None:
+            return Response(200, body, cached=True)
+        body = to_json(self.endpoints[path](params, version))
+        self.cache.put(key, body)
+        return Response(200, body)
+
+    def paths(self) -> List[str]:
+        return sorted(["/health", "/metrics", "/signals"] + list(self.endpoints))
+
+    def close(self) -> None:
+        """Close the pooled connections and the loaded MarketIntelligence."""
+        self.pool.close()
+        with self._intel_lock:
+            intel = self._intel[1]
+            if intel is not None:
+                intel.close()
+            self._intel = (None, None)
+
+    # --- SQL endpoints ---
+
+    def _kpis(self, params: dict, version: str) -> dict:
+        with self.pool.cursor(version) as cur:
+            return dashboard_data.kpis(cur)
+
+    def _regional(self, params: dict, version: str) -> dict:
+        with self.pool.cursor(version) as cur:
+            stats, trends = dashboard_data.regional(cur)
+        return {"stats": json.loads(to_json(stats)), "trends": json.loads(to_json(trends))}
+
+    def _salary(self, params: dict, version: str) -> pd.DataFrame:
+        by = list(dict.fromkeys(_values(params, "by")))
+        unknown = [d for d in by if d not in rollups.DIMENSIONS]
+        if unknown:
+            raise QueryError(f"cannot group by {unknown}; choose from {rollups.DIMENSIONS}")
+        try:
+            qs = [float(q) for q in _values(params, "q")] or [0.25, 0.5, 0.75]
+        except ValueError:
+            raise QueryError("q must be numbers in [0, 1]")
+        if any(not 0 <= q <= 1 for q in qs):
+            raise QueryError("q must be numbers in [0, 1]")
+        filters = {d: _values(params, d) for d in rollups.DIMENSIONS if _values(params, d)}
+
+        with self.pool.cursor(version) as cur:
+            store = rollups.Rollups(cur)
+            if not store.available():
+                raise LookupError("rollups have not been built yet (run the scraper)")
+            counts = store.counts(by=by, filters=filters).drop(columns=["salary_sum"])
+            quantiles = store.quantiles(by=by, qs=qs, filters=filters).drop(columns=["count"])
+        result = counts.merge(quantiles, on=by, how="left") if by else pd.concat([counts, quantiles], axis=1)
+        result = result.sort_values("jobs", ascending=False) if by else result
+        limit = _limit(params)
+        return result.head(limit) if limit is not None else result
+
+    def _signals(self, params: dict, version: str) -> Iterator[bytes]:
+        """Matching signals as a JSON array, fetched and written STREAM_BATCH rows at a time."""
+        columns = _values(params, "columns") or SIGNAL_COLUMNS
+        conditions, args = [], []
+        for column in SIGNAL_FILTERS:
+            values = _values(params, column)
+            if values:
+                conditions.append(f"{column} IN (SELECT unnest(CAST(? AS TEXT[])))")
+                args.append(values)
+        since = _values(params, "since")
+        if since:
+            try:
+                args.append(date.fromisoformat(since[-1]))
+            except ValueError:
+                raise QueryError("since must be a date (YYYY-MM-DD)")
+            conditions.append("scraped_at >= ?")
+        limit = _limit(params)
+
+        def rows() -> Iterator[bytes]:
+            with self.pool.cursor(version) as cur:
+                available = {row[0] for row in cur.execute("DESCRIBE signals_text").fetchall()}
+                unknown = [c for c in columns if c not in available]
+                if unknown:
+                    raise QueryError(f"unknown columns {unknown}")
+                where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+                limit_sql = f"LIMIT {limit}" if limit is not None else ""
+                cur.execute(f"SELECT {', '.join(columns)} FROM signals_text {where} ORDER BY scraped_at, hash "
+                            f"{limit_sql}", args)
+                yield b"["
+                first = True
+                while True:
+                    batch = cur.fetchmany(STREAM_BATCH)
+                    if not batch:
+                        break
+                    records = ",".join(json.dumps(dict(zip(columns, row)), default=_json_default,
+                                                  ensure_ascii=False) for row in batch)
+                    yield (records if first else "," + records).encode("utf-8")
+                    first = False
+                yield b"]"
+
+        stream = rows()
+        # Run up to the first chunk so parameter errors surface before the headers are sent
+        first_chunk = next(stream)
+        return _chain(first_chunk, stream)
+
+    # --- MarketIntelligence endpoints ---
+
+    def _market_intelligence(self, version: str):
+        """MarketIntelligence for `version`; the caller holds _intel_lock."""
+        built_for, intel = self._intel
+        if built_for != version:
+            if intel is not None:
+                intel.close()
+            start = time.perf_counter()
+            intel = analyzer.MarketIntelligence()
+            self._intel = (version, intel)
+            logger.info(f"Loaded MarketIntelligence in {time.perf_counter() - start:.1f}s")
+        return intel
+
+    def _intel_endpoint(self, method: str) -> Callable:
+        def endpoint(params: dict, version: str):
+            # Analysis modules share the DataFrame, and a new data version closes
+            # the previous instance: one call at a time
+            with self._intel_lock:
+                result = getattr(self._market_intelligence(version), method)()
+            limit = _limit(params)
+            if limit is not None and isinstance(result, (pd.DataFrame, pd.Series)):
+                result = result.head(limit)
+            return result
+        endpoint.__doc__ = f"MarketIntelligence.{method}"
+        return endpoint
+
+
+def _chain(first: bytes, rest: Iterator[bytes]) -> Iterator[bytes]:
+    yield first
+    yield from rest
+
+
+def make_handler(service: QueryService):
+    """Request handler class bound to a QueryService."""
+
+    class Handler(BaseHTTPRequestHandler):
+        server_version = "JobsCzInsightAPI/1.0"
+
+        def do_GET(self):
+            url = urlparse(self.path)
+            endpoint = url.path.rstrip("/") or "/"
+            start = time.perf_counter()
+            cached, error = False, False
+            try:
+                status, body, cached = service.handle(endpoint, parse_qs(url.query))
+            except QueryError as e:
+                status, body, error = 400, to_json({"error": str(e)}), True
+            except LookupError as e:
+                status, body, error = 503, to_json({"error": str(e)}), True
+            except Exception as e:
+                logger.exception(f"{endpoint} failed")
+                status, body, error = 500, to_json({"error": f"{type(e).__name__}: {e}"}), True
+
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json; charset=utf-8")
+            if isinstance(body, bytes):
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+            else:
+                # Streamed: no Content-Length, the body ends when the connection closes
+                self.send_header("Connection", "close")
+                self.end_headers()
+                try:
+                    for chunk in body:
+                        self.wfile.write(chunk)
+                except (BrokenPipeError, ConnectionResetError):
+                    body.close()
+                except Exception:
+                    logger.exception(f"{endpoint} failed while streaming")
+                    error = True
+            if endpoint not in ("/metrics", "/health"):
+                service.metrics.record(endpoint, time.perf_counter() - start, cached=cached, error=error)
+
+        def log_message(self, format, *args):
+            logger.debug(format % args)
+
+    return Handler
+
+
+def serve(host: Optional[str] = None, port: Optional[int] = None) -> ThreadingHTTPServer:
+    """HTTP server for a new QueryService (call serve_forever() on it)."""
+    service = QueryService()
+    server = ThreadingHTTPServer((host or settings.API_HOST, settings.get_api_port() if port is None else port),
+                                 make_handler(service))
+    server.service = service
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local JSON query API over the intelligence data")
+    parser.add_argument("--host", default=settings.API_HOST)
+    parser.add_argument("--port", type=int, default=settings.get_api_port())
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] [%(name)s] %(message)s")
+
+    server = serve(args.host, args.port)
+    logger.info(f"Serving {', '.join(server.service.paths())} on http://{args.host}:{server.server_port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        server.service.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -14,6 +14,7 @@ from report.chart_builder import (
     format_currency_cz,
     DEFAULT_LAYOUT
 )
+from report.build_graph import ReportBuild, Section, hash_paths
 
 __all__ = [
     'create_donut_chart',
@@ -23,5 +24,8 @@ __all__ = [
     'create_tech_stack_chart',
     'format_number_cz',
     'format_currency_cz',
-    'DEFAULT_LAYOUT'
+    'DEFAULT_LAYOUT',
+    'ReportBuild',
+    'Section',
+    'hash_paths'
 ]
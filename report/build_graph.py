@@ -0,0 +1,165 @@
+"""
+Build Graph Module
+
+Incremental build of the executive dashboard: the report is split into
+named sections, each producing the template variables it owns (KPI values,
+a figure's JSON, ...). A section's output is cached on disk under a key made
+of:
+
+- the input data version (content hash of the data files it reads)
+- the source of its build function and of the shared helpers it uses
+- the content of the modules / config files it depends on
+
+A rebuild only runs the sections whose key changed; the template render
+itself is cheap and always runs, so a template-only change costs one render.
+"""
+
+import hashlib
+import inspect
+import json
+import logging
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger('HR-Intel-Report')
+
+# Bump to invalidate every cached section (e.g. when the cache format changes)
+CACHE_FORMAT = 1
+_CHUNK = 1 << 20
+
+
+@dataclass
+class Section:
+    """One cacheable part of the report.
+
+    Attributes:
+        name: Section name (also the cache file name).
+        build: Called with the shared inputs; returns a dict of template variables.
+        code: Helpers (functions/classes) the build uses, hashed with it.
+        files: Modules, packages or config files whose content the output depends on.
+        uses_data: False if the output does not depend on the data version.
+    """
+    name: str
+    build: Callable[[Any], Dict[str, Any]]
+    code: Tuple[Any, ...] = ()
+    files: Tuple[str, ...] = ()
+    uses_data: bool = True
+
+
+@dataclass
+class SectionResult:
+    name: str
+    cached: bool
+    seconds: float
+    values: Dict[str, Any] = field(default_factory=dict)
+
+
+def _hash_file(digest, path: Path) -> None:
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(_CHUNK), b''):
+            digest.update(chunk)
+
+
+def hash_paths(paths: Iterable, root: Optional[Path] = None) -> str:
+    """Content hash of files (directories: every file below them, sorted); missing paths count as absent."""
+    digest = hashlib.blake2b(digest_size=16)
+    for path in paths:
+        path = Path(root) / path if root and not Path(path).is_absolute() else Path(path)
+        files = sorted(p for p in path.rglob('*') if p.is_file() and '__pycache__' not in p.parts) \
+            if path.is_dir() else [path]
+        for file in files:
+            digest.update(str(file.relative_to(root) if root and file.is_relative_to(root) else file).encode())
+            if file.exists():
+                _hash_file(digest, file)
+            else:
+                digest.update(b'\0missing')
+    return digest.hexdigest()
+
+
+def _json_default(obj):
+    if isinstance(obj, np.integer):
+        return int(obj)
+    if isinstance(obj, np.floating):
+        return float(obj)
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    raise TypeError(f"{type(obj).__name__} is not JSON serializable")
+
+
+class ReportBuild:
+    """Runs report sections, reusing cached outputs whose key is unchanged."""
+
+    def __init__(self, cache_dir: Path, data_version: str, root: Path):
+        """
+        Args:
+            cache_dir: Where section outputs are cached (one JSON file per section).
+            data_version: Content hash of the input data (see hash_paths).
+            root: Repo root that Section.files are relative to.
+        """
+        self.cache_dir = Path(cache_dir)
+        self.data_version = data_version
+        self.root = Path(root)
+        self.results: List[SectionResult] = []
+
+    def section_key(self, section: Section) -> str:
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(f"{CACHE_FORMAT}:{section.name}".encode())
+        if section.uses_data:
+            digest.update(self.data_version.encode())
+        for obj in (section.build, *section.code):
+            digest.update(inspect.getsource(obj).encode())
+        digest.update(hash_paths(section.files, self.root).encode())
+        return digest.hexdigest()
+
+    def _cached(self, section: Section, key: str) -> Optional[Dict[str, Any]]:
+        path = self.cache_dir / f"{section.name}.json"
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        return entry.get('values') if entry.get('key') == key else None
+
+    def _store(self, section: Section, key: str, values: Dict[str, Any]) -> None:
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        path = self.cache_dir / f"{section.name}.json"
+        tmp = path.with_suffix('.json.tmp')
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump({'key': key, 'values': values}, f, default=_json_default, ensure_ascii=False)
+        tmp.replace(path)
+
+    def run(self, sections: List[Section], inputs: Any) -> Dict[str, Any]:
+        """Build (or load) every section and return their merged template variables.
+
+        Args:
+            sections: Sections in build order.
+            inputs: Shared inputs handed to each build; only stale sections touch
+                it, so lazily loaded inputs are never loaded on a fully cached run.
+        """
+        variables: Dict[str, Any] = {}
+        for section in sections:
+            start = time.perf_counter()
+            key = self.section_key(section)
+            values = self._cached(section, key)
+            cached = values is not None
+            if not cached:
+                values = section.build(inputs)
+                self._store(section, key, values)
+                # Cached and fresh runs must render identically
+                values = json.loads(json.dumps(values, default=_json_default))
+            self.results.append(SectionResult(section.name, cached, time.perf_counter() - start, values))
+            variables.update(values)
+        return variables
+
+    def timings(self) -> str:
+        """Per-section build time table."""
+        lines = [f"{'section':<18}{'status':<10}{'seconds':>8}"]
+        for result in self.results:
+            lines.append(f"{result.name:<18}{'cached' if result.cached else 'built':<10}{result.seconds:8.2f}")
+        built = sum(not r.cached for r in self.results)
+        lines.append(f"{built}/{len(self.results)} sections rebuilt in {sum(r.seconds for r in self.results):.2f}s")
+        return "\n".join(lines)
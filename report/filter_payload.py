@@ -0,0 +1,238 @@
+"""
+Filter Payload Module
+
+Pre-aggregated data behind the dashboard's client-side filters. Instead of
+one record per job, the page gets a cube of (role_type, seniority_level,
+city, contract_type) cells and answers every filter by summing cells, so
+the payload is bounded by the number of cells rather than jobs:
+
+- each cell holds its job count and a sparse salary histogram over fixed
+  bins (1 000 CZK wide up to 300 000, then 10% wider each), from which
+  medians and box-plot quartiles are interpolated (within one bin of the
+  exact order statistics, i.e. the dashboard's rounding to thousands)
+- top companies, which are not a cube dimension, are precomputed for every
+  filter combination the page offers (role x city x seniority, each
+  optionally "all")
+- cities outside the filter list and the largest MAX_CITIES fold into
+  "Other", which the treemap already leaves out
+- rows are deduplicated first on the fields the dashboard reads (role,
+  company, city, seniority, salary, contract)
+
+Codes and counts are little-endian typed arrays (base64). The asset is
+written as plain JSON and as a gzip copy that the page fetches on first
+filter use and decompresses itself (DecompressionStream), since static
+hosting serves .gz files without Content-Encoding. query_filter_payload
+answers a filter the way the page does (used by tests and benchmarks).
+"""
+
+import base64
+import gzip
+import hashlib
+import json
+from itertools import combinations
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+PAYLOAD_FORMAT = 2
+CUBE_DIMENSIONS = ['role_type', 'seniority_level', 'city', 'contract_type']
+# Dimensions the page filters on, in the order of the top-companies key
+FILTER_DIMENSIONS = ['role_type', 'city', 'seniority_level']
+SALARY_COLUMN = 'avg_salary'
+ASSET_NAME = 'filters.json'
+MAX_CITIES = 50
+TOP_COMPANIES = 10
+COMPANY_NAME_LENGTH = 25
+INVALID_COMPANIES = {'', 'Unknown Employer', 'Unknown', 'N/A', 'null', 'undefined'}
+BOX_SALARY_CAP = 150000
+
+
+def salary_edges() -> np.ndarray:
+    """Histogram bin edges: bin i holds salaries in (edges[i], edges[i + 1]]."""
+    linear = np.arange(0, 300_001, 1000, dtype=np.float64)
+    geometric = 300_000 * 1.1 ** np.arange(1, 32)  # up to ~5.2M
+    return np.round(np.concatenate([linear, geometric]))
+
+
+def _typed_array(values: np.ndarray) -> Dict[str, str]:
+    return {'dtype': values.dtype.name, 'data': base64.b64encode(values.tobytes()).decode('ascii')}
+
+
+def _decode_array(array: Dict[str, str]) -> np.ndarray:
+    return np.frombuffer(base64.b64decode(array['data']), dtype=np.dtype(array['dtype']).newbyteorder('<'))
+
+
+def _uint_dtype(max_value: int) -> str:
+    return '<u1' if max_value < 1 << 8 else '<u2' if max_value < 1 << 16 else '<u4'
+
+
+def _codes(values: np.ndarray) -> Dict[str, str]:
+    return _typed_array(values.astype(_uint_dtype(int(values.max()) if len(values) else 0)))
+
+
+def _top_companies(frame: pd.DataFrame, dictionary: Dict[str, List[str]]) -> dict:
+    """Top companies per filter combination, keyed "role,city,seniority" codes (-1 = all)."""
+    companies = frame['company'].str.slice(0, COMPANY_NAME_LENGTH)
+    valid = ~frame['company'].str.strip().isin(INVALID_COMPANIES)
+    names, company_codes = np.unique(companies[valid], return_inverse=True)
+    keyed = frame.loc[valid, FILTER_DIMENSIONS].copy()
+    keyed['company'] = company_codes
+    for column in FILTER_DIMENSIONS:
+        keyed[column] = keyed[column].map({v: i for i, v in enumerate(dictionary[column])})
+
+    groups = {}
+    for size in range(len(FILTER_DIMENSIONS) + 1):
+        for dims in combinations(FILTER_DIMENSIONS, size):
+            counts = keyed.groupby(list(dims) + ['company'], sort=False).size().reset_index(name='n')
+            # Ties broken by name so the table is stable between builds
+            counts = counts.sort_values(['n', 'company'], ascending=[False, True], kind='stable')
+            top = counts.groupby(list(dims), sort=False).head(TOP_COMPANIES) if dims else counts.head(TOP_COMPANIES)
+            for row in top.itertuples(index=False):
+                key = ','.join(str(getattr(row, d)) if d in dims else '-1' for d in FILTER_DIMENSIONS)
+                groups.setdefault(key, []).extend([int(row.company), int(row.n)])
+    return {'names': names.tolist(), 'groups': groups}
+
+
+def encode_filter_payload(df: pd.DataFrame, cities: Sequence[str] = ()) -> dict:
+    """Filter cube of df for the dashboard.
+
+    Args:
+        df: One row per job with role_type, seniority_level, avg_salary,
+            company, contract_type and city.
+        cities: City filter options; always kept as their own cube value.
+
+    Returns:
+        JSON-serializable payload (query it with query_filter_payload).
+    """
+    frame = df[CUBE_DIMENSIONS + ['company']].fillna('').astype(str)
+    frame[SALARY_COLUMN] = pd.to_numeric(df[SALARY_COLUMN], errors='coerce')
+    frame = frame.drop_duplicates()
+    kept = set(cities) | set(frame['city'].value_counts().head(MAX_CITIES).index)
+    frame['city'] = frame['city'].where(frame['city'].isin(kept) | (frame['city'] == ''), 'Other')
+
+    dictionary = {column: sorted(frame[column].unique()) for column in CUBE_DIMENSIONS}
+    codes = pd.DataFrame({
+        column: pd.Categorical(frame[column], categories=dictionary[column]).codes
+        for column in CUBE_DIMENSIONS
+    }, index=frame.index)
+    cells = codes.groupby(CUBE_DIMENSIONS, sort=True)
+    cell_codes = cells.ngroup().to_numpy()
+    cell_sizes = cells.size()
+    cell_keys = cell_sizes.index.to_frame(index=False)
+    cell_counts = cell_sizes.to_numpy()
+
+    edges = salary_edges()
+    salary = frame[SALARY_COLUMN].to_numpy()
+    paid = salary > 0
+    bins = np.clip(np.searchsorted(edges, salary[paid], side='left') - 1, 0, len(edges) - 2)
+    histogram = pd.Series(1, index=pd.MultiIndex.from_arrays([cell_codes[paid], bins])).groupby(level=[0, 1]).sum()
+    hist_cells, hist_bins = histogram.index.get_level_values(0), histogram.index.get_level_values(1)
+
+    return {
+        'format': PAYLOAD_FORMAT,
+        'rows': len(frame),
+        'dims': dictionary,
+        'cells': {
+            **{column: _codes(cell_keys[column].to_numpy()) for column in CUBE_DIMENSIONS},
+            'count': _codes(cell_counts),
+        },
+        'salary_edges': edges.tolist(),
+        # Sparse (cell, bin, count) triplets, sorted by cell
+        'histograms': {
+            'cell': _codes(np.asarray(hist_cells)),
+            'bin': _codes(np.asarray(hist_bins)),
+            'count': _codes(histogram.to_numpy()),
+        },
+        'top_companies': _top_companies(frame, dictionary),
+    }
+
+
+# --- Reading the cube (mirrors the dashboard's JavaScript) ---
+
+def histogram_quantile(histogram: np.ndarray, edges: np.ndarray, q: float) -> Optional[float]:
+    """q-quantile of a binned distribution, interpolated linearly inside the bin."""
+    total = histogram.sum()
+    if total == 0:
+        return None
+    rank = q * total
+    cumulative = 0.0
+    for i in np.flatnonzero(histogram):
+        count = histogram[i]
+        if cumulative + count >= rank:
+            return float(edges[i] + (edges[i + 1] - edges[i]) * max(rank - cumulative, 0) / count)
+        cumulative += count
+    return float(edges[np.flatnonzero(histogram)[-1] + 1])
+
+
+def query_filter_payload(payload: dict, role_type: str = '', city: str = '', seniority_level: str = '') -> dict:
+    """Dashboard figures for one filter selection ('' = all), computed from the cube.
+
+    Returns:
+        jobs, salary_count, median_salary, hpp_median_salary, role_counts,
+        seniority_counts, city_counts, top_companies and per-role box
+        statistics (q1, median, q3 of salaries up to BOX_SALARY_CAP).
+    """
+    dims = payload['dims']
+    cells = {name: _decode_array(array) for name, array in payload['cells'].items()}
+    edges = np.asarray(payload['salary_edges'])
+    selected = np.ones(len(cells['count']), dtype=bool)
+    wanted = {'role_type': role_type, 'city': city, 'seniority_level': seniority_level}
+    for column, value in wanted.items():
+        if value:
+            code = dims[column].index(value) if value in dims[column] else -1
+            selected &= cells[column] == code
+
+    hist_cells = _decode_array(payload['histograms']['cell'])
+    histograms = np.zeros((len(selected), len(edges) - 1))
+    histograms[hist_cells, _decode_array(payload['histograms']['bin'])] = _decode_array(payload['histograms']['count'])
+    hpp = cells['contract_type'] == (dims['contract_type'].index('HPP') if 'HPP' in dims['contract_type'] else -1)
+    salaries = histograms[selected].sum(axis=0)
+
+    def counts_by(column):
+        totals = np.bincount(cells[column][selected], weights=cells['count'][selected], minlength=len(dims[column]))
+        return {value: int(n) for value, n in zip(dims[column], totals) if n}
+
+    box = {}
+    capped = edges[1:] <= BOX_SALARY_CAP
+    for code, role in enumerate(dims['role_type']):
+        role_hist = histograms[selected & (cells['role_type'] == code)].sum(axis=0) * capped
+        if role and role != 'Other' and role_hist.sum():
+            box[role] = tuple(histogram_quantile(role_hist, edges, q) for q in (0.25, 0.5, 0.75))
+
+    key = ','.join(str(dims[c].index(wanted[c]) if wanted[c] in dims[c] else -2) if wanted[c] else '-1'
+                   for c in FILTER_DIMENSIONS)
+    flat = payload['top_companies']['groups'].get(key, [])
+    names = payload['top_companies']['names']
+    return {
+        'jobs': int(cells['count'][selected].sum()),
+        'salary_count': int(salaries.sum()),
+        'median_salary': histogram_quantile(salaries, edges, 0.5),
+        'hpp_median_salary': histogram_quantile(histograms[selected & hpp].sum(axis=0), edges, 0.5),
+        'role_counts': counts_by('role_type'),
+        'seniority_counts': counts_by('seniority_level'),
+        'city_counts': counts_by('city'),
+        'top_companies': [(names[flat[i]], flat[i + 1]) for i in range(0, len(flat), 2)],
+        'box': box,
+    }
+
+
+def publish_filter_payload(payload: dict, public_dir: Path) -> Dict[str, str]:
+    """Write the payload under public_dir/data as JSON plus a gzip copy.
+
+    The gzip copy has a fixed mtime, so unchanged data gives identical bytes.
+
+    Returns:
+        Template variables: filter_data_url (relative to the page) and
+        filter_data_version (content hash, for cache busting).
+    """
+    body = json.dumps(payload, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+    target = Path(public_dir) / 'data'
+    target.mkdir(parents=True, exist_ok=True)
+    (target / ASSET_NAME).write_bytes(body)
+    (target / f"{ASSET_NAME}.gz").write_bytes(gzip.compress(body, compresslevel=9, mtime=0))
+    return {
+        'filter_data_url': f"data/{ASSET_NAME}",
+        'filter_data_version': hashlib.blake2b(body, digest_size=8).hexdigest(),
+    }
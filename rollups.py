@@ -0,0 +1,199 @@
+"""
+Materialized rollups of the signals table for report generators.
+
+Reports mostly need counts and salary quantiles broken down by role,
+seniority, region, source and contract type. Instead of re-aggregating raw
+rows in every script, two small tables keyed by (week, *DIMENSIONS) hold:
+
+- rollup_counts: jobs, salaried jobs, salary sum and latest scrape per group;
+- rollup_salary_sketch: a log-bucket histogram of avg_salary per group.
+
+The sketch buckets salaries on a logarithmic grid with RELATIVE_ACCURACY, so
+any quantile read from merged buckets is within 1% of the exact value, and
+merging groups or weeks is a plain SUM over bucket counts. Only weeks touched
+by a scrape (new rows in the current week, expired rows in old weeks) are
+re-aggregated, so refresh cost follows the run size, not the table size.
+"""
+from typing import Dict, Iterable, List, Optional, Sequence
+import logging
+import math
+
+import duckdb
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger('HR-Intel-Rollups')
+
+DIMENSIONS = ["role_type", "seniority_level", "region", "source", "contract_type"]
+TABLES = ["rollup_counts", "rollup_salary_sketch"]
+
+RELATIVE_ACCURACY = 0.01
+GAMMA = (1 + RELATIVE_ACCURACY) / (1 - RELATIVE_ACCURACY)
+_LOG_GAMMA = math.log(GAMMA)
+
+_KEY_COLUMNS = "week DATE, " + ", ".join(f"{d} TEXT" for d in DIMENSIONS)
+
+
+def ensure_tables(con: duckdb.DuckDBPyConnection) -> None:
+    con.execute(f"""
+        CREATE TABLE IF NOT EXISTS rollup_counts (
+            {_KEY_COLUMNS}, jobs INTEGER, salaried INTEGER, salary_sum DOUBLE,
+            last_scraped_at TIMESTAMP
+        )
+    """)
+    con.execute(f"""
+        CREATE TABLE IF NOT EXISTS rollup_salary_sketch (
+            {_KEY_COLUMNS}, bucket INTEGER, n INTEGER
+        )
+    """)
+
+
+def bucket_value(bucket) -> np.ndarray:
+    """Representative salary of a sketch bucket (within RELATIVE_ACCURACY of any value in it)."""
+    return 2 * np.power(GAMMA, np.asarray(bucket, dtype=float)) / (GAMMA + 1)
+
+
+def contract_type_sql(taxonomy: dict, labels: Dict[str, str]) -> str:
+    """SQL CASE mirroring MarketIntelligence._enrich_contract_type.
+
+    Rows without a description (or with zstd texts on a connection without
+    analyzer.register_text_decoder) count as HPP.
+    """
+    keywords = taxonomy.get('contract_keywords', {})
+    cases = []
+    for key in ("ico", "brigada"):
+        pattern = "|".join(keywords.get(key, [])).replace("'", "''")
+        if pattern:
+            cases.append(f"WHEN regexp_matches(lower(description), '{pattern}') THEN '{labels[key]}'")
+    if not cases:
+        return "'HPP'"
+    return f"CASE WHEN description IS NULL THEN 'HPP' {' '.join(cases)} ELSE 'HPP' END"
+
+
+def refresh(con: duckdb.DuckDBPyConnection, contract_sql: str, weeks: Optional[Iterable] = None) -> int:
+    """Re-aggregate the given weeks (all weeks when None) from signals_text.
+
+    Args:
+        con: Connection to the intelligence DB.
+        contract_sql: Expression deriving contract_type (see contract_type_sql).
+        weeks: Week start dates to rebuild.
+
+    Returns:
+        Number of rollup_counts rows written.
+    """
+    ensure_tables(con)
+    week_expr = "CAST(date_trunc('week', scraped_at) AS DATE)"
+    params: list = []
+    if weeks is None:
+        con.execute("DELETE FROM rollup_counts")
+        con.execute("DELETE FROM rollup_salary_sketch")
+        scope = ""
+    else:
+        weeks = sorted(set(weeks))
+        if not weeks:
+            return 0
+        for table in TABLES:
+            con.execute(f"DELETE FROM {table} WHERE week IN (SELECT unnest(CAST(? AS DATE[])))", [weeks])
+        scope = f"WHERE {week_expr} IN (SELECT unnest(CAST(? AS DATE[])))"
+        params = [weeks]
+
+    dims = ", ".join(DIMENSIONS)
+    con.execute(f"""
+        CREATE OR REPLACE TEMP TABLE _rollup_rows AS
+        SELECT {week_expr} AS week, role_type, seniority_level, region, source,
+               {contract_sql} AS contract_type, avg_salary, scraped_at
+        FROM signals_text {scope}
+    """, params)
+    written = con.execute(f"""
+        INSERT INTO rollup_counts
+        SELECT week, {dims}, COUNT(*),
+               COUNT(*) FILTER (WHERE avg_salary > 0),
+               COALESCE(SUM(avg_salary) FILTER (WHERE avg_salary > 0), 0),
+               MAX(scraped_at)
+        FROM _rollup_rows GROUP BY ALL
+        RETURNING 1
+    """).fetchall()
+    con.execute(f"""
+        INSERT INTO rollup_salary_sketch
+        SELECT week, {dims}, CAST(CEIL(LN(avg_salary) / {_LOG_GAMMA!r}) AS INTEGER) AS bucket, COUNT(*)
+        FROM _rollup_rows WHERE avg_salary > 0 GROUP BY ALL
+    """)
+    con.execute("DROP TABLE _rollup_rows")
+    return len(written)
+
+
+class Rollups:
+    """Read side: counts and approximate salary quantiles from the rollup tables."""
+
+    def __init__(self, con: duckdb.DuckDBPyConnection):
+        self.con = con
+
+    def available(self) -> bool:
+        try:
+            return self.con.execute("SELECT COUNT(*) FROM rollup_counts").fetchone()[0] > 0
+        except duckdb.Error:
+            return False
+
+    @staticmethod
+    def _where(filters: Optional[dict]) -> tuple:
+        if not filters:
+            return "", []
+        conditions, params = [], []
+        for column, value in filters.items():
+            if isinstance(value, (list, tuple, set)):
+                conditions.append(f"{column} IN (SELECT unnest(CAST(? AS TEXT[])))")
+                params.append(list(value))
+            else:
+                conditions.append(f"{column} = ?")
+                params.append(value)
+        return "WHERE " + " AND ".join(conditions), params
+
+    def counts(self, by: Sequence[str] = (), filters: Optional[dict] = None) -> pd.DataFrame:
+        """jobs, salaried, salary_sum and last_scraped_at per group (one row overall when by is empty)."""
+        where, params = self._where(filters)
+        keys = ", ".join(by)
+        select = f"{keys}, " if keys else ""
+        group = f"GROUP BY {keys}" if keys else ""
+        return self.con.execute(f"""
+            SELECT {select}CAST(SUM(jobs) AS BIGINT) AS jobs, CAST(SUM(salaried) AS BIGINT) AS salaried,
+                   SUM(salary_sum) AS salary_sum, MAX(last_scraped_at) AS last_scraped_at
+            FROM rollup_counts {where} {group}
+        """, params).df()
+
+    def quantiles(self, by: Sequence[str] = (), qs: Sequence[float] = (0.5,),
+                  filters: Optional[dict] = None, min_salary: float = 0) -> pd.DataFrame:
+        """Approximate salary quantiles per group.
+
+        Args:
+            by: Dimensions to group by.
+            qs: Quantiles in [0, 1]; output columns are named q25, q50, ...
+            filters: {dimension: value or list of values}.
+            min_salary: Ignore salaries at or below this value.
+
+        Returns:
+            DataFrame with the group keys, `count` (salaried jobs) and one column per quantile.
+        """
+        where, params = self._where(filters)
+        keys = list(by)
+        sketch = self.con.execute(f"""
+            SELECT {''.join(k + ', ' for k in keys)}bucket, CAST(SUM(n) AS BIGINT) AS n
+            FROM rollup_salary_sketch {where}
+            GROUP BY ALL ORDER BY ALL
+        """, params).df()
+        if min_salary:
+            sketch = sketch[bucket_value(sketch["bucket"]) > min_salary]
+
+        columns = keys + ["count"] + [f"q{round(q * 100)}" for q in qs]
+        rows: List[list] = []
+        groups = sketch.groupby(keys, dropna=False, sort=False) if keys else [((), sketch)]
+        for key, group in groups:
+            counts = group["n"].to_numpy()
+            total = int(counts.sum())
+            if not total:
+                continue
+            cumulative = np.cumsum(counts)
+            values = bucket_value(group["bucket"].to_numpy())
+            estimates = [float(values[np.searchsorted(cumulative, q * (total - 1), side="right")]) for q in qs]
+            key = key if isinstance(key, tuple) else (key,)
+            rows.append(list(key) + [total] + estimates)
+        return pd.DataFrame(rows, columns=columns)
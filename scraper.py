@@ -3,6 +3,7 @@ import re
 import logging
 import yaml
 import os
+from datetime import datetime
 from typing import List, Optional, Dict
 
 from playwright.async_api import async_playwright, TimeoutError as PlaywrightTimeout, Error as PlaywrightError
@@ -11,7 +12,10 @@ from tqdm.asyncio import tqdm
 
 # New module imports
 import analyzer
+import embedding_classifier
 from analyzer import JobSignal, IntelligenceCore
+from observations import ObservationStore
+import snapshot
 import scraper_utils
 from scraper_utils import (
     validate_job_data,
@@ -25,6 +29,7 @@ from scraper_utils import (
     Heartbeat
 )
 from settings import settings
+from tools.gazetteer import Gazetteer
 
 # --- CONFIGURATION ---
 CONFIG_PATH = str(settings.SELECTORS_PATH)
@@ -230,6 +235,10 @@ class BaseScraper:
                 el = await card.query_selector(sel)
                 if el:
                     txt = (await el.inner_text()).strip()
+                    # Canonical municipality (or district) when the gazetteer knows it
+                    place = Gazetteer.default().lookup(txt)
+                    if place and place.city:
+                        return place.city
                     # Clean up common patterns
                     txt = txt.replace(',', '').split('-')[0].split('(')[0].strip()
                     if txt and len(txt) > 1 and len(txt) < 50:  # Reasonable city name length
@@ -240,15 +249,11 @@ class BaseScraper:
                 logger.debug(f"{self.site_name}: City extraction error for selector '{sel}': {e}")
                 continue
         
-        # Fallback to text-based city detection using config with word boundaries
+        # Fallback to the first statutory city named in the card text (whole tokens only)
         try:
-            card_text = (await card.inner_text()).lower()
-            fallback_cities = CONFIG.get('common', {}).get('fallback_cities', [])
-            for city in fallback_cities:
-                # Use word boundaries to avoid false positives (e.g., "Praha" in "Praha Solutions")
-                pattern = r'\b' + re.escape(city.lower()) + r'\b'
-                if re.search(pattern, card_text):
-                    return city.title()
+            place = Gazetteer.default().find(await card.inner_text())
+            if place and place.city:
+                return place.city
         except Exception:
             pass
         
@@ -383,7 +388,7 @@ class PagedScraper(BaseScraper):
 
                     if batch:
                         await asyncio.gather(*(self.engine.scrape_detail(context, s) for s in batch))
-                        for s in batch: CORE.add_signal(s)
+                        CORE.add_signals(batch)
                     
                     pbar.update(1)
                     consecutive_failures = 0  # Reset on success
@@ -510,7 +515,7 @@ class StartupJobsScraper(BaseScraper):
                     if new_batch:
                         logger.info(f"StartupJobs: Processing incremental batch of {len(new_batch)} jobs...")
                         await asyncio.gather(*(self.engine.scrape_detail(context, s) for s in new_batch))
-                        for s in new_batch: CORE.add_signal(s)
+                        CORE.add_signals(new_batch)
                         total_saved += len(new_batch)
                         self.extraction_stats['success'] = self.extraction_stats.get('success', 0) + len(new_batch)
                         pbar.update(len(new_batch))
@@ -582,7 +587,7 @@ class StartupJobsScraper(BaseScraper):
             if final_batch:
                 logger.info(f"StartupJobs: Processing final batch of {len(final_batch)} jobs...")
                 await asyncio.gather(*(self.engine.scrape_detail(context, s) for s in final_batch))
-                for s in final_batch: CORE.add_signal(s)
+                CORE.add_signals(final_batch)
                 self.extraction_stats['success'] = self.extraction_stats.get('success', 0) + len(final_batch)
                 pbar.update(len(final_batch))
             
@@ -708,8 +713,7 @@ class WttjScraper(BaseScraper):
                 
                 if batch:
                     await asyncio.gather(*(self.engine.scrape_detail(context, s) for s in batch))
-                    for s in batch:
-                        CORE.add_signal(s)
+                    CORE.add_signals(batch)
                 
                 logger.debug(f"WTTJ page {page_num}: collected {len(batch)} jobs (total: {total_collected})")
             
@@ -826,8 +830,7 @@ class LinkedinScraper(BaseScraper):
             if batch:
                 logger.info(f"Fetching details for {len(batch)} LinkedIn jobs")
                 await asyncio.gather(*(self.engine.scrape_detail(context, s) for s in batch))
-                for s in batch:
-                    CORE.add_signal(s)
+                CORE.add_signals(batch)
             
             CIRCUIT_BREAKER.record_success(self.site_name)
             
@@ -842,7 +845,12 @@ async def main():
     logger.info("=== OMNISCRAPE v18.0: Enhanced Security & Reliability ===")
     
     global CORE, CIRCUIT_BREAKER
+    run_started = datetime.now()
     CORE = IntelligenceCore()
+    CORE.ensure_near_duplicate_index()  # One-off backfill for pre-v1.7 databases
+    CORE.resolve_locations()  # One-off backfill for pre-v1.10 databases
+    if settings.get_preload_embeddings():
+        embedding_classifier.preload()  # Load the model while the first pages download
     CIRCUIT_BREAKER = CircuitBreaker(failure_threshold=5, timeout_seconds=300)
     
     # Setup graceful shutdown
@@ -891,10 +899,24 @@ async def main():
             await browser.close()
             await shutdown_handler.cleanup()
 
+    # Insert signals still waiting for an embedding batch, then keep this run's
+    # role/seniority classifications for the next one (both log their stats)
+    CORE.flush_pending_signals()
+    CORE.save_classification_cache()
+
+    # Append this run to the observation history before expired rows are deleted
+    ObservationStore().record(CORE.con, observed_on=run_started.date(), seen_since=run_started)
+
     # Enhanced cleanup strategy for GitHub weekly runs
     # Remove jobs not seen in last 14 days (2 scrape cycles for safety)
     CORE.cleanup_expired(threshold_minutes=14 * 24 * 60)  # 14 days
 
+    # Re-aggregate report rollups for the weeks this run touched
+    CORE.refresh_rollups()
+
+    # Embed this run's new postings into the similar-postings index
+    CORE.update_vector_index()
+
     # Compact database to reclaim space from deleted records
     CORE.vacuum_database()
 
@@ -906,6 +928,9 @@ async def main():
     logger.info(f"Jobs by source: {stats['by_source']}")
     logger.info(f"Oldest job: {stats['oldest_job']}")
     logger.info(f"Newest job: {stats['newest_job']}")
+
+    # Read-only snapshot for the report/dashboard steps that follow
+    snapshot.publish_from_core(CORE)
     logger.info("=== SCRAPING COMPLETE ===")
 
 if __name__ == "__main__":
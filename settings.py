@@ -20,18 +20,40 @@ class Settings:
     # --- Database ---
     DB_PATH: Path = DATA_DIR / "intelligence.db"
     DB_BACKUP_PATH: Path = DATA_DIR / "intelligence.db.backup"
+    SNAPSHOT_PATH: Path = DATA_DIR / "signals_snapshot.parquet"
+    LEGAL_FINDINGS_PATH: Path = DATA_DIR / "legal_findings.parquet"
     
     # --- Cache ---
     LLM_CACHE_PATH: Path = DATA_DIR / "llm_cache.json"
+    REPORT_CACHE_DIR: Path = DATA_DIR / "report_cache"
+    CLASSIFICATION_CACHE_SIZE: int = 50_000
+    PRELOAD_EMBEDDINGS: bool = True
+    EMBEDDING_THREADS: int = 0  # onnxruntime intra-op threads; 0 = runtime default
+    ROLE_BATCH_SIZE: int = 64
+    ROLE_BATCH_LATENCY_S: float = 10.0
+    
+    # --- History ---
+    OBSERVATIONS_DIR: Path = DATA_DIR / "observations"
+    EMBEDDINGS_DIR: Path = DATA_DIR / "embeddings"
+    MODELS_DIR: Path = DATA_DIR / "models"
     
     # --- Config Files ---
     TAXONOMY_PATH: Path = CONFIG_DIR / "taxonomy.yaml"
     SELECTORS_PATH: Path = CONFIG_DIR / "selectors.yaml"
     CURRENCY_RATES_PATH: Path = CONFIG_DIR / "currency_rates.yaml"
+    GAZETTEER_PATH: Path = CONFIG_DIR / "gazetteer.yaml"
     
     # --- Output ---
     REPORT_HTML_PATH: Path = PUBLIC_DIR / "report.html"
     DASHBOARD_HTML_PATH: Path = PUBLIC_DIR / "executive_dashboard.html"
+
+    # --- Query API ---
+    API_HOST: str = "127.0.0.1"
+    API_PORT: int = 8765
+    API_POOL_SIZE: int = 4  # Concurrent read-only DuckDB cursors
+
+    # --- Legal Audit ---
+    AUDIT_WORKERS: int = 0  # Processes auditing new descriptions; 0 = one per CPU
     
     # --- Environment Overrides ---
     @classmethod
@@ -40,12 +62,111 @@ class Settings:
         env_path = os.environ.get("JOBSCZINSIGHT_DB_PATH")
         return Path(env_path) if env_path else cls.DB_PATH
     
+    @classmethod
+    def get_snapshot_path(cls) -> Path:
+        """Get read-only snapshot path, allowing override via environment variable."""
+        env_path = os.environ.get("JOBSCZINSIGHT_SNAPSHOT_PATH")
+        return Path(env_path) if env_path else cls.SNAPSHOT_PATH
+    
+    @classmethod
+    def get_legal_findings_path(cls) -> Path:
+        """Get stored legal audit findings path, allowing override via environment variable."""
+        env_path = os.environ.get("JOBSCZINSIGHT_LEGAL_FINDINGS_PATH")
+        return Path(env_path) if env_path else cls.LEGAL_FINDINGS_PATH
+    
     @classmethod
     def get_cache_path(cls) -> Path:
         """Get cache path, allowing override via environment variable."""
         env_path = os.environ.get("JOBSCZINSIGHT_CACHE_PATH")
         return Path(env_path) if env_path else cls.LLM_CACHE_PATH
     
+    @classmethod
+    def get_observations_dir(cls) -> Path:
+        """Get observation history dir, allowing override via environment variable."""
+        env_path = os.environ.get("JOBSCZINSIGHT_OBSERVATIONS_DIR")
+        return Path(env_path) if env_path else cls.OBSERVATIONS_DIR
+    
+    @classmethod
+    def get_embeddings_dir(cls) -> Path:
+        """Get embedding store dir, allowing override via environment variable."""
+        env_path = os.environ.get("JOBSCZINSIGHT_EMBEDDINGS_DIR")
+        return Path(env_path) if env_path else cls.EMBEDDINGS_DIR
+
+    @classmethod
+    def get_models_dir(cls) -> Path:
+        """Get exported (ONNX) model dir, allowing override via environment variable."""
+        env_path = os.environ.get("JOBSCZINSIGHT_MODELS_DIR")
+        return Path(env_path) if env_path else cls.MODELS_DIR
+
+    @classmethod
+    def get_report_cache_dir(cls) -> Path:
+        """Get cached report sections dir, allowing override via environment variable."""
+        env_path = os.environ.get("JOBSCZINSIGHT_REPORT_CACHE_DIR")
+        return Path(env_path) if env_path else cls.REPORT_CACHE_DIR
+
+    @classmethod
+    def get_embedding_threads(cls) -> int:
+        """onnxruntime intra-op thread count for the onnx-int8 backend (0 = runtime default)."""
+        return int(os.environ.get("JOBSCZINSIGHT_EMBEDDING_THREADS", cls.EMBEDDING_THREADS))
+
+    @classmethod
+    def get_vector_index_path(cls) -> Optional[Path]:
+        """Similar-postings index file override; None keeps it next to the DB."""
+        env_path = os.environ.get("JOBSCZINSIGHT_VECTOR_INDEX_PATH")
+        return Path(env_path) if env_path else None
+
+    @classmethod
+    def get_classification_cache_size(cls) -> int:
+        """Max entries in the role/seniority classification cache (memory and DB table)."""
+        return int(os.environ.get("JOBSCZINSIGHT_CLASSIFICATION_CACHE_SIZE", cls.CLASSIFICATION_CACHE_SIZE))
+
+    @classmethod
+    def get_preload_embeddings(cls) -> bool:
+        """Whether the scraper loads the embedding model in the background at start.
+
+        Otherwise it is loaded on the first job keywords cannot classify.
+        """
+        env_value = os.environ.get("JOBSCZINSIGHT_PRELOAD_EMBEDDINGS")
+        if env_value is None:
+            return cls.PRELOAD_EMBEDDINGS
+        return env_value.lower() in ("1", "true", "yes")
+
+    @classmethod
+    def get_role_batch_size(cls) -> int:
+        """Signals per embedding fallback batch in the ingest path."""
+        return int(os.environ.get("JOBSCZINSIGHT_ROLE_BATCH_SIZE", cls.ROLE_BATCH_SIZE))
+
+    @classmethod
+    def get_role_batch_latency(cls) -> float:
+        """Max seconds a signal waits for its embedding batch before a partial flush."""
+        return float(os.environ.get("JOBSCZINSIGHT_ROLE_BATCH_LATENCY_S", cls.ROLE_BATCH_LATENCY_S))
+
+    @classmethod
+    def get_api_port(cls) -> int:
+        """Port of the local query API (query_api.py)."""
+        return int(os.environ.get("JOBSCZINSIGHT_API_PORT", cls.API_PORT))
+
+    @classmethod
+    def get_api_pool_size(cls) -> int:
+        """Read-only DuckDB cursors the query API runs queries on concurrently."""
+        return int(os.environ.get("JOBSCZINSIGHT_API_POOL_SIZE", cls.API_POOL_SIZE))
+
+    @classmethod
+    def get_audit_workers(cls) -> int:
+        """Processes audit_legal.py audits new descriptions with (0 = one per CPU)."""
+        workers = int(os.environ.get("JOBSCZINSIGHT_AUDIT_WORKERS", cls.AUDIT_WORKERS))
+        return workers if workers > 0 else (os.cpu_count() or 1)
+
+    @classmethod
+    def get_text_codec(cls) -> str:
+        """Codec for the content-addressed description store ('raw' or 'zstd').
+
+        'raw' keeps texts readable from plain SQL through the signals_text view;
+        'zstd' shrinks the DB further; connections opened through IntelligenceCore
+        or snapshot.connect decode it in signals_text, plain duckdb.connect does not.
+        """
+        return os.environ.get("JOBSCZINSIGHT_TEXT_CODEC", "raw").lower()
+
     @classmethod
     def ensure_dirs(cls) -> None:
         """Ensure all required directories exist."""
@@ -0,0 +1,157 @@
+"""
+Read-optimized Parquet snapshot of the signals table.
+
+The scraper publishes one snapshot after each run. Report, dashboard and
+audit scripts then read that file instead of each opening intelligence.db and
+re-scanning it:
+
+- texts are resolved from the description store, so consumers see plain
+  description/benefits columns;
+- rows are sorted by the low-cardinality columns and those columns are
+  dictionary-encoded, so they compress to a few runs per row group;
+- DataFrame consumers read it through a memory-mapped Arrow table and SQL
+  consumers get an in-memory DuckDB copy, so neither holds a lock on the
+  database.
+
+The report rollups (rollups.py) are published alongside as
+<snapshot stem>.<table>.parquet. A snapshot older than the database (e.g.
+after FORCE_REANALYZE) is ignored and readers fall back to the database.
+"""
+from pathlib import Path
+from typing import Optional
+import logging
+import os
+
+import duckdb
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+import rollups
+from settings import settings
+
+logger = logging.getLogger('HR-Intel-Snapshot')
+
+# Low-cardinality columns: sort keys and dictionary-encoded in the file
+DICTIONARY_COLUMNS = ["role_type", "seniority_level", "source", "region"]
+SORT_COLUMNS = DICTIONARY_COLUMNS + ["scraped_at"]
+
+
+def is_fresh(path: Optional[Path] = None, db_path: Optional[Path] = None) -> bool:
+    """Whether a snapshot exists and was written after the last database change."""
+    path = Path(path or settings.get_snapshot_path())
+    db_path = Path(db_path or settings.get_db_path())
+    if not path.exists():
+        return False
+    if not db_path.exists():
+        return True
+    return path.stat().st_mtime >= db_path.stat().st_mtime
+
+
+def _write(table: pa.Table, path: Optional[Path]) -> Path:
+    path = Path(path or settings.get_snapshot_path())
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    pq.write_table(
+        table, tmp,
+        compression="zstd",
+        use_dictionary=[c for c in DICTIONARY_COLUMNS if c in table.column_names],
+        row_group_size=64 * 1024,
+    )
+    os.replace(tmp, path)
+    logger.info(f"Published snapshot with {table.num_rows} signals -> {path}")
+    return path
+
+
+def publish(df: pd.DataFrame, path: Optional[Path] = None) -> Path:
+    """Write df (signals with resolved texts) as the current snapshot.
+
+    Args:
+        df: Output of IntelligenceCore.load_as_df().
+        path: Target file (default: settings.get_snapshot_path()).
+
+    Returns:
+        Path of the published snapshot.
+    """
+    sort_by = [c for c in SORT_COLUMNS if c in df.columns]
+    ordered = df.sort_values(sort_by, kind="stable", na_position="last") if sort_by else df
+    return _write(pa.Table.from_pandas(ordered, preserve_index=False), path)
+
+
+def _rollup_path(path: Path, table: str) -> Path:
+    return path.with_name(f"{path.stem}.{table}.parquet")
+
+
+def published_files(path: Optional[Path] = None) -> list:
+    """The snapshot file and its rollup files."""
+    path = Path(path or settings.get_snapshot_path())
+    return [path] + [_rollup_path(path, table) for table in rollups.TABLES]
+
+
+def _publish_rollups(core, path: Optional[Path]) -> None:
+    path = Path(path or settings.get_snapshot_path())
+    for table in rollups.TABLES:
+        target = _rollup_path(path, table)
+        tmp = target.with_suffix(".parquet.tmp")
+        core.con.execute(f"COPY {table} TO '{tmp.as_posix()}' (FORMAT PARQUET, COMPRESSION ZSTD)")
+        os.replace(tmp, target)
+
+
+def publish_from_core(core, path: Optional[Path] = None) -> Path:
+    """Publish the snapshot straight from an open IntelligenceCore.
+
+    The core's signals_text view resolves every text (zstd ones through
+    analyzer.register_text_decoder), so DuckDB sorts the rows and hands them
+    over as Arrow without a round trip through pandas.
+    """
+    _publish_rollups(core, path)
+
+    columns = {row[0] for row in core.con.execute("DESCRIBE signals_text").fetchall()}
+    order_by = ", ".join(c for c in SORT_COLUMNS if c in columns)
+    table = core.con.execute(f"SELECT * FROM signals_text ORDER BY {order_by}").fetch_arrow_table()
+    return _write(table, path)
+
+
+def read_table(path: Optional[Path] = None, columns: Optional[list] = None) -> pa.Table:
+    """Memory-mapped Arrow table of the snapshot."""
+    path = Path(path or settings.get_snapshot_path())
+    return pq.read_table(path, columns=columns, memory_map=True)
+
+
+def load_df(path: Optional[Path] = None, db_path: Optional[Path] = None) -> Optional[pd.DataFrame]:
+    """Snapshot as a DataFrame, or None when it is missing or stale."""
+    if not is_fresh(path, db_path):
+        return None
+    return read_table(path).to_pandas()
+
+
+def connect(path: Optional[Path] = None, db_path: Optional[Path] = None,
+            include_signals: bool = True, materialize: bool = True) -> duckdb.DuckDBPyConnection:
+    """Read-only SQL access for report scripts.
+
+    Returns an in-memory DuckDB connection holding the snapshot as `signals`
+    (with `signals_text` as an alias view) and the rollup tables when a fresh
+    snapshot exists, otherwise a read-only connection to the database itself
+    (with zstd-compressed texts decoded in its signals_text view).
+    include_signals=False loads only the rollups; materialize=False exposes
+    the snapshot as views over the Parquet files instead of copying it, for
+    callers that run a few column-pruned aggregates.
+    """
+    if not is_fresh(path, db_path):
+        from analyzer import register_text_decoder  # analyzer imports this module
+        con = duckdb.connect(str(db_path or settings.get_db_path()), read_only=True)
+        register_text_decoder(con)
+        return con
+    path = Path(path or settings.get_snapshot_path())
+    con = duckdb.connect()
+    # Materialized once: scripts like visualizer run dozens of regex scans over
+    # description, and re-decoding the Parquet pages for each is slower than the DB
+    kind = "TABLE" if materialize else "VIEW"
+    if include_signals:
+        con.execute(f"CREATE {kind} signals AS SELECT * FROM read_parquet('{path.as_posix()}')")
+        con.execute("CREATE VIEW signals_text AS SELECT * FROM signals")
+    for table in rollups.TABLES:
+        rollup_path = _rollup_path(path, table)
+        if rollup_path.exists():
+            con.execute(f"CREATE {kind} {table} AS SELECT * FROM read_parquet('{rollup_path.as_posix()}')")
+    return con
@@ -0,0 +1,243 @@
+"""
+Single-pass multi-pattern matching for taxonomy keywords.
+
+Benefit, skill, work-model, contract, remote, toxicity and tech-stack keywords
+used to be matched with one regex (and one full scan of every description) per
+category. TaxonomyMatcher compiles all of them once:
+
+- Every alternative that is a plain literal (optionally wrapped in \\b) goes
+  into a prefix trie, compiled to a single regex used as a lookahead. One
+  finditer over the lowercased text reports, at each position, the longest
+  literal starting there; the shorter literals that are prefixes of it are
+  derived from a precomputed table, and \\b anchors are checked by hand.
+- The few alternatives that need real regex features (\\s, .*, \\d, ...) form
+  a small per-label regex tail.
+
+match() returns the ids of all labels hit in a text (a sparse vector);
+TaxonomyHits turns a DataFrame's descriptions into a boolean hit matrix once
+and serves masks per label to the analysis modules.
+"""
+from typing import Dict, FrozenSet, Iterable, List, Optional, Tuple
+import logging
+import re
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger('HR-Intel-Matcher')
+
+_ALTERNATIVE = re.compile(r"(?:\\.|[^\\|])+")
+_LITERAL_CHAR = re.compile(r"\\[^A-Za-z0-9]|[^\\.^$*+?{}\[\]()|]")
+_ESCAPE = re.compile(r"\\(.)")
+
+
+def _is_word(ch: str) -> bool:
+    return ch.isalnum() or ch == "_"
+
+
+def _boundary(text: str, pos: int) -> bool:
+    """re's \\b at pos."""
+    before = pos > 0 and _is_word(text[pos - 1])
+    after = pos < len(text) and _is_word(text[pos])
+    return before != after
+
+
+def _parse_literal(alternative: str) -> Optional[Tuple[str, bool, bool]]:
+    """(literal, \\b before, \\b after) when the alternative is a plain literal."""
+    left = alternative.startswith(r"\b")
+    right = alternative.endswith(r"\b") and len(alternative) > 2 and not alternative.endswith(r"\\b")
+    core = alternative[2 if left else 0: len(alternative) - (2 if right else 0)]
+    if not core or _LITERAL_CHAR.sub("", core):
+        return None
+    return _ESCAPE.sub(r"\1", core), left, right
+
+
+def _split_alternatives(pattern: str) -> Optional[List[str]]:
+    """Top-level alternatives of a pattern, or None if it has groups or classes."""
+    if re.search(r"(?<!\\)[(\[]", pattern):
+        return None
+    return _ALTERNATIVE.findall(pattern)
+
+
+def _trie_regex(words: Iterable[str]) -> str:
+    """Regex matching any of words, preferring the longest at a position."""
+    trie: dict = {}
+    for word in words:
+        node = trie
+        for ch in word:
+            node = node.setdefault(ch, {})
+        node[""] = True
+
+    def build(node: dict) -> str:
+        terminal = "" in node
+        branches = [re.escape(ch) + build(child) for ch, child in sorted(node.items()) if ch]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        if terminal:
+            return "(?:" + body + ")?"
+        return body
+
+    return build(trie)
+
+
+def taxonomy_patterns(taxonomy: dict) -> Dict[str, Dict[str, str]]:
+    """Label patterns per group, with the same semantics the analysis modules used."""
+    def word_bounded(keywords):
+        return "|".join(r"\b" + re.escape(k.lower()) + r"\b" for k in keywords)
+
+    groups = {
+        "benefits": {name: "|".join(re.escape(k) for k in keywords)
+                     for name, keywords in taxonomy.get("benefits_keywords", {}).items()},
+        "skills": dict(taxonomy.get("skill_patterns", {})),
+        "work_model": {name: "|".join(keywords)
+                       for name, keywords in taxonomy.get("work_model_keywords", {}).items()},
+        "contract": {name: "|".join(keywords)
+                     for name, keywords in taxonomy.get("contract_keywords", {}).items()},
+        "remote": {"remote": "|".join(taxonomy.get("remote_keywords", []))},
+        "toxicity": {name: word_bounded(keywords)
+                     for name, keywords in taxonomy.get("toxicity", {}).items()},
+        "tech_stack": {name: word_bounded(keywords)
+                       for name, keywords in taxonomy.get("tech_stack", {}).items()},
+    }
+    return {group: {name: p for name, p in labels.items() if p} for group, labels in groups.items()}
+
+
+class TaxonomyMatcher:
+    """All taxonomy keyword groups compiled into one scanner."""
+
+    def __init__(self, groups: Dict[str, Dict[str, str]]):
+        """
+        Args:
+            groups: {group: {label name: regex pattern}}, matched against
+                lowercased text like the original str.contains(case=False) scans.
+        """
+        self.labels: List[Tuple[str, str]] = []
+        self._index: Dict[Tuple[str, str], int] = {}
+        literal_rules: Dict[str, List[Tuple[int, bool, bool]]] = {}
+        tails: Dict[int, List[str]] = {}
+
+        for group, patterns in groups.items():
+            for name, pattern in patterns.items():
+                label = len(self.labels)
+                self.labels.append((group, name))
+                self._index[(group, name)] = label
+                alternatives = _split_alternatives(pattern.lower())
+                if alternatives is None:
+                    tails.setdefault(label, []).append(pattern.lower())
+                    continue
+                for alternative in alternatives:
+                    parsed = _parse_literal(alternative)
+                    if parsed is None:
+                        tails.setdefault(label, []).append(alternative)
+                        continue
+                    literal, left, right = parsed
+                    literal_rules.setdefault(literal, []).append((label, left, right))
+
+        self._tails = []
+        for label, alternatives in tails.items():
+            try:
+                pattern = re.compile("|".join(alternatives))
+            except re.error as e:
+                # Same fallback the per-pattern scans used: the label name as a substring
+                logger.warning(f"Invalid taxonomy pattern for {self.labels[label]}: {e}")
+                pattern = re.compile(re.escape(self.labels[label][1].lower()))
+            self._tails.append((label, pattern))
+        literals = sorted(literal_rules)
+        self._scanner = re.compile("(?=(" + _trie_regex(literals) + "))") if literals else None
+        # For the longest literal found at a position: the labels of every literal
+        # that is a prefix of it, split into unconditional hits and \b-anchored rules
+        self._rules_at: Dict[str, Tuple[FrozenSet[int], List[Tuple[int, int, bool, bool]]]] = {}
+        for literal in literals:
+            plain, anchored = set(), []
+            for end in range(1, len(literal) + 1):
+                for label, left, right in literal_rules.get(literal[:end], ()):
+                    if left or right:
+                        anchored.append((label, end, left, right))
+                    else:
+                        plain.add(label)
+            self._rules_at[literal] = (frozenset(plain), anchored)
+
+    def label_id(self, group: str, name: str) -> int:
+        return self._index[(group, name)]
+
+    def group_ids(self, group: str) -> List[int]:
+        return [i for i, (g, _) in enumerate(self.labels) if g == group]
+
+    def match(self, text: Optional[str]) -> FrozenSet[int]:
+        """Ids of all labels whose pattern occurs in text."""
+        if not text or not isinstance(text, str):
+            return frozenset()
+        text = text.lower()
+        hits = set()
+        if self._scanner is not None:
+            rules_at = self._rules_at
+            for m in self._scanner.finditer(text):
+                plain, anchored = rules_at[m.group(1)]
+                hits.update(plain)
+                start = m.start()
+                for label, length, left, right in anchored:
+                    if label in hits:
+                        continue
+                    if left and not _boundary(text, start):
+                        continue
+                    if right and not _boundary(text, start + length):
+                        continue
+                    hits.add(label)
+        for label, pattern in self._tails:
+            if label not in hits and pattern.search(text):
+                hits.add(label)
+        return frozenset(hits)
+
+    def match_many(self, texts: Iterable[Optional[str]]) -> np.ndarray:
+        """Boolean hit matrix of shape (len(texts), len(labels))."""
+        texts = list(texts)
+        matrix = np.zeros((len(texts), len(self.labels)), dtype=bool)
+        for row, text in enumerate(texts):
+            hits = self.match(text)
+            if hits:
+                matrix[row, list(hits)] = True
+        return matrix
+
+
+_MATCHERS: Dict[int, Tuple[dict, TaxonomyMatcher]] = {}
+
+
+def get_matcher(taxonomy: dict) -> TaxonomyMatcher:
+    """Matcher for a loaded taxonomy, compiled once per taxonomy object."""
+    cached = _MATCHERS.get(id(taxonomy))
+    if cached is None or cached[0] is not taxonomy:
+        cached = (taxonomy, TaxonomyMatcher(taxonomy_patterns(taxonomy)))
+        _MATCHERS[id(taxonomy)] = cached
+    return cached[1]
+
+
+class TaxonomyHits:
+    """Lazily computed taxonomy hits for a DataFrame's descriptions.
+
+    One instance is shared by the analysis modules of a MarketIntelligence,
+    so all of them together scan each description once.
+    """
+
+    def __init__(self, df: pd.DataFrame, taxonomy: dict, column: str = "description"):
+        self.matcher = get_matcher(taxonomy)
+        self.index = df.index
+        self._texts = df[column] if column in df.columns else pd.Series(None, index=df.index, dtype=object)
+        self._matrix: Optional[np.ndarray] = None
+
+    @property
+    def matrix(self) -> np.ndarray:
+        if self._matrix is None:
+            self._matrix = self.matcher.match_many(self._texts.tolist())
+        return self._matrix
+
+    def mask(self, group: str, name: str) -> pd.Series:
+        """Boolean Series (aligned with the DataFrame) of rows hitting a label."""
+        return pd.Series(self.matrix[:, self.matcher.label_id(group, name)], index=self.index)
+
+    def count(self, group: str) -> pd.Series:
+        """Number of distinct labels of a group hit per row."""
+        return pd.Series(self.matrix[:, self.matcher.group_ids(group)].sum(axis=1), index=self.index)
+
+    def has(self, group: str, name: str) -> bool:
+        return (group, name) in self.matcher._index
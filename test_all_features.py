@@ -76,6 +76,7 @@ from analyzer import MarketIntelligence
 intel = MarketIntelligence()
 print(f'   ✅ Loaded {len(intel.df)} jobs from database')
 tech_counts = intel.df['tech_status'].value_counts()
+intel.close()
 print(f'   Modern: {tech_counts.get("Modern", 0)}, Dinosaur: {tech_counts.get("Dinosaur", 0)}, Stable: {tech_counts.get("Stable", 0)}')
 
 print('\n' + '=' * 60)
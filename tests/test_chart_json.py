@@ -0,0 +1,60 @@
+"""
+Tests for the dashboard's chart serialization (generate_report.clean_json).
+"""
+
+import pytest
+import sys
+import os
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import json
+from types import SimpleNamespace
+
+import numpy as np
+import pandas as pd
+import plotly.express as px
+
+from generate_report import box_statistics, build_salary_box_plot, clean_json
+
+
+class TestChartJson:
+
+    def test_arrays_become_compact_rounded_lists(self):
+        frame = pd.DataFrame({'name': ['a', 'b', 'c'], 'n': [1.234567, 2.0, np.nan]})
+        fig = px.pie(frame, values='n', names='name', hole=0.6)
+        text = clean_json(fig)
+
+        assert 'bdata' not in text
+        assert len(text) < len(fig.to_json())
+        figure = json.loads(text)
+        assert figure['data'][0]['values'] == [1.23, 2.0, None]
+        assert figure['data'][0]['hole'] == 0.6
+        assert figure['layout'] == json.loads(json.dumps(fig.to_dict()['layout']))
+
+    def test_box_statistics_match_plotly_definitions(self):
+        values = pd.Series(np.random.default_rng(1).normal(50000, 15000, 1001))
+        stats = box_statistics(values)
+        assert stats['q1'] == pytest.approx(values.quantile(0.25))
+        assert stats['median'] == pytest.approx(values.median())
+        assert stats['q3'] == pytest.approx(values.quantile(0.75))
+        iqr = stats['q3'] - stats['q1']
+        inside = values[(values >= stats['q1'] - 1.5 * iqr) & (values <= stats['q3'] + 1.5 * iqr)]
+        assert (stats['lowerfence'], stats['upperfence']) == (inside.min(), inside.max())
+
+    def test_salary_box_plot_ships_quartiles_not_salaries(self):
+        rng = np.random.default_rng(2)
+        roles = rng.choice(['Developer', 'Sales', 'Other', 'Logistics'], 5000)
+        salaries = pd.DataFrame({'role_type': roles, 'avg_salary': rng.uniform(20000, 200000, 5000)})
+        inputs = SimpleNamespace(valid_salaries=salaries, role_counts=salaries['role_type'].value_counts())
+
+        figure = json.loads(build_salary_box_plot(inputs)['salary_box_plot_json'])
+        traces = figure['data']
+        assert [t['name'] for t in traces] == (
+            salaries[(salaries['role_type'] != 'Other') & (salaries['avg_salary'] <= 150000)]
+            .groupby('role_type')['avg_salary'].median().sort_values().index.tolist()
+        )
+        assert all('y' not in t and len(t['q1']) == 1 for t in traces)
+        assert all(t['lowerfence'][0] <= t['q1'][0] <= t['median'][0] <= t['q3'][0] <= t['upperfence'][0] <= 150000
+                   for t in traces)
@@ -0,0 +1,159 @@
+"""
+Tests for the memoizing role/seniority classification cache.
+"""
+
+import pytest
+import sys
+import os
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import classifiers
+from classifiers import ClassificationCache, JobClassifier
+
+
+@pytest.fixture
+def fresh_cache(monkeypatch):
+    cache = ClassificationCache(maxsize=100)
+    monkeypatch.setattr(JobClassifier, "cache", cache)
+    monkeypatch.setattr(JobClassifier, "_versions", {})
+    return cache
+
+
+class TestClassificationCache:
+
+    def test_lru_eviction_and_stats(self):
+        cache = ClassificationCache(maxsize=2)
+        a, b, c = (ClassificationCache.key("role", t, "") for t in ("a", "b", "c"))
+        cache.put(a, "Developer")
+        cache.put(b, "QA")
+        assert cache.get(a) == "Developer"  # a is now most recent
+        cache.put(c, "HR")
+        assert cache.get(b) is None
+        assert cache.get(c) == "HR"
+        assert cache.stats() == {"hits": 2, "misses": 1, "size": 2, "hit_rate": 2 / 3}
+
+    def test_classify_role_memoized_by_normalized_title(self, fresh_cache, monkeypatch):
+        calls = []
+        original = JobClassifier._classify_role
+
+        def counting(title, description=""):
+            calls.append(title)
+            return original(title, description)
+
+        monkeypatch.setattr(JobClassifier, "_classify_role", staticmethod(counting))
+        assert JobClassifier.classify_role("Skladník", "Práce ve skladu") == "Logistics"
+        assert JobClassifier.classify_role("  SKLADNÍK ", "Práce ve skladu") == "Logistics"
+        JobClassifier.classify_role("Skladník", "Jiný popis")
+        assert len(calls) == 2
+        assert fresh_cache.hits == 1
+
+    def test_version_change_resets_cache(self, fresh_cache, monkeypatch):
+        JobClassifier.detect_seniority("Senior Developer", "")
+        assert fresh_cache.stats()["size"] == 1
+        monkeypatch.setitem(classifiers.SENIORITY_PATTERNS, "Junior",
+                            classifiers.SENIORITY_PATTERNS["Junior"] + ["nováček"])
+        monkeypatch.setattr(JobClassifier, "_versions", {})
+        JobClassifier.detect_seniority("Senior Developer", "")
+        assert fresh_cache.stats()["size"] == 1
+        assert fresh_cache.hits == 0
+
+
+class FailingEmbeddings:
+    """Stands in for EmbeddingClassifier when the model cannot be loaded or encode fails."""
+    available = True
+
+    @staticmethod
+    def is_available():
+        return FailingEmbeddings.available
+
+    @staticmethod
+    def classify_role(title, description=""):
+        FailingEmbeddings.available = False
+        return None
+
+    @staticmethod
+    def classify_roles_batch(jobs):
+        raise RuntimeError("encode failed")
+
+
+@pytest.fixture
+def failing_embeddings(monkeypatch):
+    FailingEmbeddings.available = True
+    monkeypatch.setattr(classifiers, "EmbeddingClassifier", FailingEmbeddings)
+    monkeypatch.setattr(JobClassifier, "USE_EMBEDDINGS", True)
+    return FailingEmbeddings
+
+
+class TestEmbeddingFailures:
+
+    def test_version_does_not_change_when_the_model_fails_to_load(self, fresh_cache, failing_embeddings):
+        version = JobClassifier.current_version()
+        JobClassifier.detect_seniority("Senior Developer", "")
+        # The lazy load fails on the first fallback: the mode changes, the cache version does not
+        assert JobClassifier.classify_role("Xyzzy", "") == "Other"
+        assert JobClassifier.get_classification_mode() == "KEYWORD_MATCHING"
+        assert JobClassifier.current_version() == version
+        # Entries cached before the failed load survive
+        assert fresh_cache.get(ClassificationCache.key("seniority", "Senior Developer", "")) is not None
+
+    def test_fallbacks_without_an_embedding_answer_are_not_cached(self, fresh_cache, failing_embeddings, caplog):
+        assert JobClassifier.classify_roles([("Xyzzy", ""), ("Skladník", "")]) == ["Other", "Logistics"]
+        assert "encode failed" in caplog.text
+        assert JobClassifier.cache.get(ClassificationCache.key("role", "Xyzzy", "")) is None
+        assert JobClassifier.classify_role("Plugh", "") == "Other"
+        assert JobClassifier.cache.get(ClassificationCache.key("role", "Plugh", "")) is None
+
+
+class TestPersistedCache:
+
+    @pytest.fixture
+    def temp_db(self, tmp_path):
+        db_path = str(tmp_path / "test_classification_cache.db")
+        import analyzer
+        original_path = analyzer.DB_PATH
+        analyzer.DB_PATH = db_path
+        yield db_path
+        analyzer.DB_PATH = original_path
+
+    def test_entries_survive_restart_and_stale_versions_are_dropped(self, temp_db, fresh_cache, monkeypatch):
+        from analyzer import IntelligenceCore
+        core = IntelligenceCore(read_only=False)
+        JobClassifier.classify_role("Účetní", "Fakturace")
+        core.close()
+
+        monkeypatch.setattr(JobClassifier, "cache", ClassificationCache(maxsize=100))
+        core = IntelligenceCore(read_only=False)
+        JobClassifier.classify_role("účetní", "Fakturace")
+        assert JobClassifier.cache.hits == 1
+        core.con.execute("UPDATE classification_cache SET version = 'old'")
+        core.con.close()
+
+        monkeypatch.setattr(JobClassifier, "cache", ClassificationCache(maxsize=100))
+        core = IntelligenceCore(read_only=False)
+        assert JobClassifier.cache.stats()["size"] == 0
+        assert core.con.execute("SELECT COUNT(*) FROM classification_cache").fetchone()[0] == 0
+        core.close()
+
+    def test_other_modes_entries_are_kept(self, temp_db, fresh_cache, monkeypatch):
+        from analyzer import IntelligenceCore
+        monkeypatch.setattr(JobClassifier, "USE_EMBEDDINGS", False)
+        core = IntelligenceCore(read_only=False)
+        JobClassifier.classify_role("Účetní", "Fakturace")
+        core.close()
+
+        # A run configured for embeddings neither loads nor deletes the keyword-mode rows
+        monkeypatch.setattr(JobClassifier, "USE_EMBEDDINGS", True)
+        monkeypatch.setattr(classifiers, "EmbeddingClassifier", FailingEmbeddings)
+        monkeypatch.setattr(JobClassifier, "cache", ClassificationCache(maxsize=100))
+        core = IntelligenceCore(read_only=False)
+        assert JobClassifier.cache.stats()["size"] == 0
+        assert core.con.execute("SELECT COUNT(*) FROM classification_cache").fetchone()[0] == 1
+        core.con.close()
+
+        monkeypatch.setattr(JobClassifier, "USE_EMBEDDINGS", False)
+        monkeypatch.setattr(JobClassifier, "cache", ClassificationCache(maxsize=100))
+        core = IntelligenceCore(read_only=False)
+        assert JobClassifier.cache.stats()["size"] == 1
+        core.close()
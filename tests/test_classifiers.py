@@ -1,3 +1,8 @@
+import json
+import os
+import subprocess
+import sys
+
 import pytest
 from classifiers import JobClassifier
 
@@ -21,3 +26,34 @@ def test_role_classification(title, description, expected_role):
 ])
 def test_seniority_detection(title, description, expected_seniority):
     assert JobClassifier.detect_seniority(title, description) == expected_seniority
+
+
+def _exported_titles():
+    path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "current_classifications.txt")
+    with open(path, encoding="utf-8") as f:
+        return [line.strip() for line in f if line.strip() and not line.startswith("---")]
+
+
+def test_keyword_engine_matches_recorded_baseline():
+    """Every title in current_classifications.txt keeps its recorded role (tools/debug/dump_role_baseline.py)."""
+    with open(os.path.join(os.path.dirname(__file__), "fixtures", "role_baseline.json"), encoding="utf-8") as f:
+        baseline = json.load(f)
+    titles = _exported_titles()
+    assert len(titles) == baseline["titles"]
+
+    mismatches = []
+    for title, codes in zip(titles, baseline["expected"]):
+        for description, code in zip(baseline["descriptions"], codes.split()):
+            role = JobClassifier._classify_role_keywords(title, description)
+            if role != baseline["roles"][int(code)]:
+                mismatches.append((title, description[:40], role, baseline["roles"][int(code)]))
+    assert not mismatches, mismatches[:10]
+
+
+def test_embedding_model_not_loaded_at_import():
+    """Importing the classifier must not pull in sentence-transformers or load the model."""
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    code = ("import sys, classifiers, embedding_classifier; "
+            "print('sentence_transformers' in sys.modules, embedding_classifier._model is None)")
+    out = subprocess.run([sys.executable, "-c", code], cwd=root, capture_output=True, text=True, check=True)
+    assert out.stdout.split() == ["False", "True"]
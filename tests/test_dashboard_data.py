@@ -0,0 +1,110 @@
+"""
+Tests for the dashboard queries (dashboard_data), checked against the
+MarketIntelligence methods they replace.
+"""
+
+import pytest
+import sys
+import os
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import dashboard_data
+import snapshot
+
+SIGNALS = [
+    ("Python Developer", "Praha 4", 90000,
+     "We are looking for a developer to join the team. Home office and multisport."),
+    ("Java Developer", "Brno", 80000,
+     "Join our team: the role is office only, no remote. Sick day, stravenky."),
+    ("Účetní", "CZ", 0, "Hledáme účetní do kanceláře v Ostrava. Faktura, IČO spolupráce."),
+    ("Analytik", "Plzeň", 60000, "Žand thečko isový: český text bez anglických slov, hybrid práce."),
+    ("Skladník", "Olomouc", 40000, "Brigáda DPP pro studenty. The flexibilní směny and bonus for all."),
+]
+
+
+class TestDashboardData:
+
+    @pytest.fixture
+    def temp_db(self, tmp_path, monkeypatch):
+        db_path = str(tmp_path / "test_dashboard.db")
+        monkeypatch.setenv("JOBSCZINSIGHT_SNAPSHOT_PATH", str(tmp_path / "snap.parquet"))
+        monkeypatch.setenv("JOBSCZINSIGHT_OBSERVATIONS_DIR", str(tmp_path / "observations"))
+        import analyzer
+        original_path = analyzer.DB_PATH
+        analyzer.DB_PATH = db_path
+        yield db_path
+        analyzer.DB_PATH = original_path
+
+    @pytest.fixture
+    def populated(self, temp_db):
+        from analyzer import IntelligenceCore, JobSignal
+        core = IntelligenceCore(read_only=False)
+        for i, (title, location, salary, description) in enumerate(SIGNALS):
+            core.add_signal(JobSignal(title=title, company=f"Co {i}", link=f"https://jobs.cz/{i}",
+                                      source="Jobs.cz", description=description, location=location,
+                                      salary=f"{salary} Kč" if salary else None))
+        core.con.execute("CHECKPOINT")
+        core.close()
+        return temp_db
+
+    @pytest.mark.parametrize("use_snapshot", [False, True])
+    def test_queries_match_market_intelligence(self, populated, use_snapshot):
+        from analyzer import IntelligenceCore, MarketIntelligence
+        if use_snapshot:
+            # As after a scrape: contract counts then come from the rollups
+            core = IntelligenceCore(read_only=False)
+            core.refresh_rollups()
+            snapshot.publish_from_core(core)
+            core.close()
+        intel = MarketIntelligence()
+        df = intel.df
+
+        with dashboard_data.connect() as con:
+            kpis = dashboard_data.kpis(con)
+            cities = dashboard_data.city_volume(con)
+            stats, trends = dashboard_data.regional(con)
+            benefits = dashboard_data.benefit_saturation(con)
+            contracts = dashboard_data.contract_split(con)
+            vibe = dashboard_data.market_vibe(con)
+
+        valid = df[df['avg_salary'] > 0]['avg_salary']
+        assert kpis == {
+            "signals": len(df),
+            "median_salary": float(valid.median()),
+            "english_friendly": int(intel.get_language_barrier()['English Friendly']),
+            "true_remote": intel.get_remote_truth()['True Remote'],
+            "hpp": intel.get_contract_split()['HPP'],
+        }
+        # Stop words glued to Czech letters ("Žand", "thečko") do not count
+        assert kpis["english_friendly"] == 3
+        assert dict(zip(cities['city'], cities['count'])) == df['resolved_city'].value_counts().to_dict()
+        assert stats.equals(intel.get_regional_stats())
+        assert trends.equals(intel.get_regional_trends())
+        assert dict(zip(contracts['Type'], contracts['Count'])) == intel.get_contract_split()
+        assert dict(zip(vibe['Metric'], vibe['Intensity'])) == intel.get_market_vibe().to_dict()
+        expected = {b: int(df['description'].str.lower().str.contains(b, regex=False).sum())
+                    for b in dashboard_data.BENEFITS}
+        assert dict(zip(benefits['Benefit'], benefits['Signal'])) == expected
+        intel.close()
+
+    def test_market_intelligence_close_releases_the_database(self, populated):
+        from analyzer import IntelligenceCore, MarketIntelligence
+        intel = MarketIntelligence()  # No snapshot: reads through a read-only core
+        intel.close()
+        # A read-only handle still open in this process would block the writer
+        core = IntelligenceCore(read_only=False)
+        core.close()
+
+    def test_data_version_follows_snapshot_and_database(self, populated):
+        from analyzer import IntelligenceCore
+        before = dashboard_data.data_version()
+        assert before == dashboard_data.data_version()
+
+        core = IntelligenceCore(read_only=True)
+        snapshot.publish_from_core(core)
+        core.close()
+        published = dashboard_data.data_version()
+        assert published != before
+        assert "snap.parquet" in published
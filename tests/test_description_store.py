@@ -0,0 +1,188 @@
+"""
+Tests for the content-addressed description store.
+
+Descriptions and benefits are stored once per distinct (whitespace-normalized)
+text in the descriptions table and referenced from signals by hash.
+"""
+
+import pytest
+import sys
+import os
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import duckdb
+
+
+class TestDescriptionStore:
+    """Tests for IntelligenceCore text storage."""
+
+    @pytest.fixture
+    def temp_db(self, tmp_path):
+        """Create a temporary database path for testing."""
+        db_path = str(tmp_path / "test_descriptions.db")
+        import analyzer
+        original_path = analyzer.DB_PATH
+        analyzer.DB_PATH = db_path
+        yield db_path
+        analyzer.DB_PATH = original_path
+
+    @pytest.fixture
+    def core(self, temp_db):
+        from analyzer import IntelligenceCore
+        core = IntelligenceCore(read_only=False)
+        yield core
+        core.close()
+
+    @staticmethod
+    def _signal(link, description="Python a Django, práce z domova.", company="TestCo"):
+        from analyzer import JobSignal
+        return JobSignal(
+            title="Python Developer",
+            company=company,
+            link=link,
+            source="TestSource",
+            description=description,
+            benefits="Sick days, MultiSport",
+            location="Praha"
+        )
+
+    def test_text_hash_ignores_whitespace_layout(self):
+        from analyzer import get_text_hash
+        assert get_text_hash("Python\n  Django ") == get_text_hash("Python Django")
+        assert get_text_hash("Python Django") != get_text_hash("Python Flask")
+        assert get_text_hash(None) is None
+
+    def test_signal_references_text_instead_of_storing_it(self, core):
+        core.add_signal(self._signal("https://example.com/1"))
+        row = core.con.execute(
+            "SELECT description, benefits, description_hash, benefits_hash FROM signals"
+        ).fetchone()
+        assert row[0] is None and row[1] is None
+        assert row[2] is not None and row[3] is not None
+
+    def test_identical_descriptions_stored_once(self, core):
+        for i in range(3):
+            core.add_signal(self._signal(f"https://example.com/{i}", company=f"Agency {i}"))
+        assert core.con.execute("SELECT COUNT(*) FROM signals").fetchone()[0] == 3
+        # One description + one benefits text
+        assert core.con.execute("SELECT COUNT(*) FROM descriptions").fetchone()[0] == 2
+
+    def test_df_and_view_resolve_texts(self, core):
+        signal = self._signal("https://example.com/1")
+        core.add_signal(signal)
+        df = core.load_as_df()
+        assert df.iloc[0]["description"] == signal.description
+        assert df.iloc[0]["benefits"] == signal.benefits
+        view_row = core.con.execute("SELECT description FROM signals_text").fetchone()
+        assert view_row[0] == signal.description
+
+    def test_load_without_text_skips_join(self, core):
+        core.add_signal(self._signal("https://example.com/1"))
+        df = core.load_as_df(include_text=False)
+        assert df.iloc[0]["description"] is None
+        assert df.iloc[0]["description_hash"] is not None
+
+    def test_cleanup_prunes_orphan_texts(self, core):
+        from datetime import datetime, timedelta
+        core.add_signal(self._signal("https://example.com/old", description="Old listing text"))
+        core.add_signal(self._signal("https://example.com/new", description="Fresh listing text"))
+        core.con.execute(
+            "UPDATE signals SET last_seen_at = ? WHERE link = ?",
+            [datetime.now() - timedelta(hours=2), "https://example.com/old"]
+        )
+        core.cleanup_expired(threshold_minutes=60)
+        texts = core.get_texts(
+            [h for (h,) in core.con.execute("SELECT text_hash FROM descriptions").fetchall()]
+        )
+        assert "Fresh listing text" in texts.values()
+        assert "Old listing text" not in texts.values()
+
+    def test_legacy_inline_texts_are_migrated(self, temp_db):
+        """Rows written by the pre-store schema are moved into descriptions on open."""
+        con = duckdb.connect(temp_db)
+        con.execute("""
+            CREATE TABLE signals (
+                hash TEXT PRIMARY KEY, title TEXT, company TEXT, salary_raw TEXT,
+                avg_salary DOUBLE, description TEXT, benefits TEXT, link TEXT,
+                source TEXT, city TEXT, scraped_at TIMESTAMP, toxicity_score INTEGER,
+                tech_status TEXT, last_seen_at TIMESTAMP
+            )
+        """)
+        con.execute(
+            "INSERT INTO signals (hash, title, description, benefits) VALUES "
+            "('a', 'Dev', 'Shared text', ''), ('b', 'Dev', 'Shared  text', NULL)"
+        )
+        con.close()
+
+        from analyzer import IntelligenceCore
+        core = IntelligenceCore(read_only=False)
+        try:
+            inline = core.con.execute(
+                "SELECT COUNT(*) FROM signals WHERE description IS NOT NULL OR benefits IS NOT NULL"
+            ).fetchone()[0]
+            assert inline == 0
+            df = core.load_as_df().set_index("hash")
+            assert df.loc["a", "description"] == "Shared text"
+            assert df.loc["a", "benefits"] == ""
+            assert df.loc["b", "description_hash"] == df.loc["a", "description_hash"]
+        finally:
+            core.close()
+
+    @pytest.mark.skipif(
+        not __import__("analyzer").ZSTD_AVAILABLE, reason="zstandard not installed"
+    )
+    def test_zstd_codec_round_trip(self, temp_db, monkeypatch):
+        monkeypatch.setenv("JOBSCZINSIGHT_TEXT_CODEC", "zstd")
+        from analyzer import IntelligenceCore
+        core = IntelligenceCore(read_only=False)
+        try:
+            signal = self._signal("https://example.com/z")
+            core.add_signal(signal)
+            assert core.con.execute("SELECT DISTINCT codec FROM descriptions").fetchall() == [("zstd",)]
+            assert core.load_as_df().iloc[0]["description"] == signal.description
+        finally:
+            core.close()
+
+    @pytest.mark.skipif(
+        not __import__("analyzer").ZSTD_AVAILABLE, reason="zstandard not installed"
+    )
+    def test_zstd_texts_stay_readable_after_file_rewrite(self, temp_db, monkeypatch):
+        monkeypatch.setenv("JOBSCZINSIGHT_TEXT_CODEC", "zstd")
+        from analyzer import IntelligenceCore
+        signal = self._signal("https://example.com/z")
+        core = IntelligenceCore(read_only=False)
+        try:
+            core.add_signal(signal)
+            core.load_as_df()
+            core._rewrite_database_file()  # What vacuum_database does past 25% free blocks
+            assert core._df_cache is None
+            assert core.con.execute("SELECT description, benefits FROM signals_text").fetchall() == [
+                (signal.description, signal.benefits)
+            ]
+        finally:
+            core.close()
+
+    @pytest.mark.skipif(
+        not __import__("analyzer").ZSTD_AVAILABLE, reason="zstandard not installed"
+    )
+    def test_zstd_texts_are_readable_from_sql(self, temp_db, tmp_path, monkeypatch):
+        monkeypatch.setenv("JOBSCZINSIGHT_TEXT_CODEC", "zstd")
+        from analyzer import IntelligenceCore
+        import snapshot
+        signal = self._signal("https://example.com/z")
+        core = IntelligenceCore(read_only=False)
+        try:
+            core.add_signal(signal)
+            query = "SELECT description, benefits FROM signals_text"
+            assert core.con.execute(query).fetchall() == [(signal.description, signal.benefits)]
+        finally:
+            core.close()
+
+        # Report scripts fall back to the database when there is no snapshot
+        con = snapshot.connect(path=tmp_path / "missing.parquet", db_path=temp_db)
+        try:
+            assert con.execute(query).fetchall() == [(signal.description, signal.benefits)]
+        finally:
+            con.close()
@@ -0,0 +1,72 @@
+"""
+Tests for matrix-form embedding scoring and the batch role API.
+"""
+
+import pytest
+import sys
+import os
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+import classifiers
+from classifiers import ClassificationCache, JobClassifier
+from embedding_classifier import best_matches, cosine_similarity, similarity_matrix, stack_exemplars
+
+
+class TestMatrixScoring:
+
+    def test_matches_scalar_cosine_argmax_and_threshold(self):
+        rng = np.random.default_rng(3)
+        categories = {name: rng.standard_normal(16).astype(np.float32) for name in ("A", "B", "C")}
+        jobs = np.vstack([
+            categories["B"] * 3 + rng.standard_normal(16) * 0.1,  # clearly B
+            rng.standard_normal(16),                              # weak match
+            np.zeros(16),                                         # no signal at all
+        ]).astype(np.float32)
+
+        labels, matrix = stack_exemplars(categories)
+        scores = similarity_matrix(jobs, matrix)
+        for i, job in enumerate(jobs):
+            for j, label in enumerate(labels):
+                assert scores[i, j] == pytest.approx(cosine_similarity(job, categories[label]), abs=1e-6)
+
+        assert best_matches(scores, labels, 0.4, "Other") == ["B", "Other", "Other"]
+        assert best_matches(scores, labels, -1.0, None)[2] == "A"  # tie at 0 -> first label, like max()
+        assert best_matches(scores[:0], labels, 0.4, "Other") == []
+
+
+class FakeEmbeddingClassifier:
+    """Labels every job 'Logistics' and records each batch it is given."""
+
+    def __init__(self):
+        self.batches = []
+
+    def is_available(self):
+        return True
+
+    def classify_roles_batch(self, jobs):
+        self.batches.append(list(jobs))
+        return ["Logistics"] * len(jobs)
+
+
+class TestBatchRoles:
+
+    def test_classify_roles_batches_keyword_misses(self, monkeypatch):
+        fake = FakeEmbeddingClassifier()
+        monkeypatch.setattr(classifiers, "EmbeddingClassifier", fake)
+        monkeypatch.setattr(JobClassifier, "USE_EMBEDDINGS", True)
+        monkeypatch.setattr(JobClassifier, "cache", ClassificationCache(maxsize=100))
+        jobs = [("Python Developer", "Django"), ("Zzz", "nic"), ("Účetní", "faktury"), ("Qqq", "")]
+
+        roles = JobClassifier.classify_roles(jobs)
+        assert roles[0] == "Developer" and roles[2] == "Finance"
+        assert roles[1] == roles[3] == "Logistics"
+        assert fake.batches == [[jobs[1], jobs[3]]]
+
+        # Memoized: a second page with the same jobs needs no embedding call
+        assert JobClassifier.classify_roles(jobs) == roles
+        assert len(fake.batches) == 1
+        assert JobClassifier.classify_role("Zzz", "nic") == "Logistics"
@@ -0,0 +1,120 @@
+"""
+Tests for the on-disk embedding store and its use by the embedding classifier.
+"""
+
+import pytest
+import sys
+import os
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+import embedding_classifier
+import embedding_store
+from embedding_store import EmbeddingStore
+
+
+class FakeModel:
+    """Deterministic 8-d 'embeddings' that count how many texts were encoded."""
+
+    def __init__(self):
+        self.encoded = []
+
+    def encode(self, texts, convert_to_numpy=True, show_progress_bar=False):
+        self.encoded.extend(texts)
+        return np.array([[len(t), t.count('e'), t.count('a'), 1, 0, 0, 0, 0] for t in texts], dtype=np.float32)
+
+
+class TestEmbeddingStore:
+
+    def test_texts_are_encoded_once_and_survive_reopen(self, tmp_path):
+        model = FakeModel()
+        store = EmbeddingStore("fake-model", tmp_path)
+        first = store.get_many(["alpha", "beta", "alpha"], model.encode)
+        assert model.encoded == ["alpha", "beta"]
+        assert first.dtype == np.float32 and first.shape == (3, 8)
+        np.testing.assert_array_equal(first[0], first[2])
+
+        reopened = EmbeddingStore("fake-model", tmp_path)
+        again = reopened.get_many(["beta", "gamma"], model.encode)
+        assert model.encoded == ["alpha", "beta", "gamma"]
+        np.testing.assert_array_equal(again[0], first[1])
+        assert len(reopened) == 3
+
+    def test_rows_appended_by_another_writer_are_picked_up(self, tmp_path):
+        model = FakeModel()
+        reader = EmbeddingStore("fake-model", tmp_path)
+        reader.get_many(["one"], model.encode)
+        EmbeddingStore("fake-model", tmp_path).get_many(["two"], model.encode)
+        reader.get_many(["two"], model.encode)
+        assert model.encoded == ["one", "two"]
+
+    def test_torn_tail_is_ignored_and_overwritten(self, tmp_path):
+        model = FakeModel()
+        store = EmbeddingStore("fake-model", tmp_path)
+        store.get_many(["kept"], model.encode)
+        with open(store.path, "ab") as f:
+            f.write(b"\x01" * 7)  # interrupted append
+        store = EmbeddingStore("fake-model", tmp_path)
+        assert len(store) == 1
+        store.get_many(["next"], model.encode)
+        assert len(EmbeddingStore("fake-model", tmp_path)) == 2
+
+    def test_missing_vectors_without_encoder(self, tmp_path):
+        store = EmbeddingStore("fake-model", tmp_path)
+        assert store.get_many(["anything"], lambda texts: None) is None
+        assert len(store) == 0
+
+
+class TestClassifierUsesStore:
+
+    @pytest.fixture
+    def fake_embeddings(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("JOBSCZINSIGHT_EMBEDDINGS_DIR", str(tmp_path))
+        monkeypatch.setattr(embedding_store, "_stores", {})
+        model = FakeModel()
+        monkeypatch.setattr(embedding_classifier, "EMBEDDINGS_AVAILABLE", True)
+        monkeypatch.setattr(embedding_classifier, "_model", model)
+        monkeypatch.setattr(embedding_classifier, "_loaded", False)
+        monkeypatch.setattr(embedding_classifier, "_role_embeddings", None)
+        monkeypatch.setattr(embedding_classifier, "_seniority_embeddings", None)
+        return model
+
+    def test_rerun_needs_no_model(self, fake_embeddings, monkeypatch):
+        jobs = [("Barista", "káva a obsluha"), ("Referent", "agenda úřadu")]
+        first = embedding_classifier.classify_roles_batch(jobs)
+        exemplars = len(embedding_classifier.ROLE_EXEMPLARS) + len(embedding_classifier.SENIORITY_EXEMPLARS)
+        assert len(fake_embeddings.encoded) == exemplars + len(jobs)
+
+        # Fresh process: nothing in memory and a model that cannot be loaded
+        monkeypatch.setattr(embedding_store, "_stores", {})
+        monkeypatch.setattr(embedding_classifier, "_model", None)
+        monkeypatch.setattr(embedding_classifier, "_loaded", False)
+        monkeypatch.setattr(embedding_classifier, "_role_embeddings", None)
+        monkeypatch.setattr(embedding_classifier, "_load_model", lambda: False)
+        assert embedding_classifier.classify_roles_batch(jobs) == first
+        assert embedding_classifier.EmbeddingClassifier.get_role_debug_scores(*jobs[0])
+
+    def test_onnx_backend_falls_back_to_torch(self, fake_embeddings, monkeypatch):
+        import types
+
+        def no_onnxruntime():
+            raise ImportError("No module named 'onnxruntime'")
+
+        torch_model = FakeModel()
+        fake_st = types.SimpleNamespace(SentenceTransformer=lambda name: torch_model)
+        monkeypatch.setitem(sys.modules, "sentence_transformers", fake_st)
+        monkeypatch.setattr(embedding_classifier, "_model", None)
+        monkeypatch.setattr(embedding_classifier, "BACKEND", "onnx-int8")
+        monkeypatch.setattr(embedding_classifier, "_load_onnx_int8_model", no_onnxruntime)
+
+        assert embedding_classifier.classify_roles_batch([("Barista", "káva")]) != [None]
+        assert embedding_classifier.BACKEND == "torch"
+        assert embedding_classifier.store_name() == embedding_classifier.MODEL_NAME
+        assert torch_model.encoded
+        # Not even the first batch of fp32 vectors lands in the int8 store
+        int8_store = embedding_store.get_store(f"{embedding_classifier.MODEL_NAME}-onnx-int8")
+        assert len(int8_store) == 0
+        assert len(embedding_store.get_store(embedding_classifier.MODEL_NAME)) == len(torch_model.encoded)
@@ -0,0 +1,89 @@
+"""
+Tests for the dashboard's filter cube (report/filter_payload.py).
+"""
+
+import pytest
+import sys
+import os
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import gzip
+import json
+import random
+
+import numpy as np
+import pandas as pd
+
+from report.filter_payload import encode_filter_payload, publish_filter_payload, query_filter_payload
+
+
+@pytest.fixture
+def jobs():
+    rng = random.Random(3)
+    n = 3000
+    return pd.DataFrame({
+        'role_type': [rng.choice(['Developer', 'Sales', 'Logistics', 'Other', None]) for _ in range(n)],
+        'seniority_level': [rng.choice(['Junior', 'Mid', 'Senior', 'Lead']) for _ in range(n)],
+        'avg_salary': [rng.choice([np.nan, 0, rng.randrange(20, 200) * 1000 + rng.random() * 999]) for _ in range(n)],
+        'company': [f"Firma {rng.randrange(60)}" for _ in range(n)],
+        'contract_type': [rng.choice(['HPP', 'HPP', 'IČO']) for _ in range(n)],
+        'city': [rng.choice(['Praha', 'Brno', 'Ostrava', 'Zlín', None]) for _ in range(n)],
+    })
+
+
+def assert_near_quantile(value, salaries, q):
+    """Cube quantiles are exact up to one 1 000 CZK bin around the order statistics."""
+    low, high = salaries.quantile(q, interpolation='lower'), salaries.quantile(q, interpolation='higher')
+    assert low - 1000 <= value <= high + 1000
+
+
+class TestFilterCube:
+
+    @pytest.mark.parametrize("selection", [{}, {'role_type': 'Developer'}, {'city': 'Brno', 'seniority_level': 'Mid'}])
+    def test_cube_matches_row_level_figures(self, jobs, selection):
+        result = query_filter_payload(encode_filter_payload(jobs), **selection)
+
+        rows = jobs.copy()
+        rows[['role_type', 'city']] = rows[['role_type', 'city']].fillna('')
+        rows = rows.drop_duplicates()  # the cube counts distinct postings
+        for column, value in selection.items():
+            rows = rows[rows[column] == value]
+        paid = rows[rows['avg_salary'] > 0]
+        assert result['jobs'] == len(rows)
+        assert result['salary_count'] == len(paid)
+        assert_near_quantile(result['median_salary'], paid['avg_salary'], 0.5)
+        assert_near_quantile(result['hpp_median_salary'], paid[paid['contract_type'] == 'HPP']['avg_salary'], 0.5)
+        assert result['seniority_counts'] == rows['seniority_level'].value_counts().to_dict()
+
+        expected = rows['company'].value_counts()
+        assert [n for _, n in result['top_companies']] == expected.head(10).tolist()
+        assert set(name for name, _ in result['top_companies']) <= set(expected.index)
+
+        developer = paid[(paid['role_type'] == 'Developer') & (paid['avg_salary'] <= 150000)]['avg_salary']
+        if 'Developer' in result['box']:
+            q1, median, q3 = result['box']['Developer']
+            assert_near_quantile(q1, developer, 0.25)
+            assert_near_quantile(median, developer, 0.5)
+            assert_near_quantile(q3, developer, 0.75)
+        assert 'Other' not in result['box']
+
+    def test_size_is_bounded_by_cells_and_rare_cities_fold_into_other(self, jobs):
+        small = encode_filter_payload(jobs)
+        big = encode_filter_payload(pd.concat([jobs] * 5 + [jobs.assign(avg_salary=jobs['avg_salary'] + 1)]))
+        assert len(json.dumps(big)) < 2 * len(json.dumps(small))
+
+        many_cities = jobs.assign(city=[f"Obec {i}" for i in range(len(jobs))])
+        payload = encode_filter_payload(many_cities, cities=['Obec 7'])
+        assert set(payload['dims']['city']) >= {'Obec 7', 'Other'}
+        assert len(payload['dims']['city']) <= 52
+
+    def test_published_assets_are_stable(self, jobs, tmp_path):
+        payload = encode_filter_payload(jobs)
+        first = publish_filter_payload(payload, tmp_path)
+        gz_bytes = (tmp_path / 'data' / 'filters.json.gz').read_bytes()
+        assert json.loads(gzip.decompress(gz_bytes)) == payload
+        assert publish_filter_payload(payload, tmp_path) == first
+        assert (tmp_path / 'data' / 'filters.json.gz').read_bytes() == gz_bytes
+        assert first['filter_data_url'] == 'data/filters.json'
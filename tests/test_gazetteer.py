@@ -0,0 +1,44 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from tools.gazetteer import Gazetteer, Place, fold
+
+
+def test_fold_strips_diacritics_and_punctuation():
+    assert fold("Ústí nad Labem") == ["usti", "nad", "labem"]
+    assert fold("Praha 4 - Smíchov") == ["praha", "4", "smichov"]
+
+
+def test_lookup_spellings_and_suffixes():
+    gazetteer = Gazetteer.default()
+    praha = Place("Hlavní město Praha", "Praha", None, "municipality")
+    for location in ["Praha", "Praha 4", "PRAHA 10 - Strašnice", "Prague, Czech Republic", "Hlavní město Praha"]:
+        assert gazetteer.lookup(location) == praha
+    assert gazetteer.lookup("Usti nad Labem").municipality == "Ústí nad Labem"
+    assert gazetteer.lookup("Plzen, CZ").municipality == "Plzeň"
+    assert gazetteer.lookup("Remote") is None
+    assert gazetteer.lookup("CZ") is None
+
+
+def test_lookup_prefers_longest_name_and_municipality():
+    gazetteer = Gazetteer.default()
+    # Longest name at a position: not Jičín, not Praha
+    assert gazetteer.lookup("Nový Jičín").municipality == "Nový Jičín"
+    assert gazetteer.lookup("Praha-východ") == Place("Středočeský kraj", None, "Praha-východ", "district")
+    assert gazetteer.lookup("Brno-venkov").city == "Brno-venkov"
+    assert gazetteer.lookup("Brno-město").municipality == "Brno"
+    # A municipality beats the kraj named before it
+    assert gazetteer.lookup("Moravskoslezský kraj, Ostrava").municipality == "Ostrava"
+    assert gazetteer.lookup("Moravskoslezský kraj") == Place("Moravskoslezský kraj", None, None, "kraj")
+    # Kraj-only locations still have a display city
+    assert gazetteer.lookup("Jihomoravský kraj").city == "Jihomoravský kraj"
+
+
+def test_find_only_matches_unambiguous_statutory_cities():
+    gazetteer = Gazetteer.default()
+    assert gazetteer.find("The most important role, based in Ostrava or Brno").municipality == "Ostrava"
+    assert gazetteer.find("Hledáme kolegu do Kolína") is None
+    assert gazetteer.find("Praha Solutions s.r.o.").municipality == "Praha"
+    assert gazetteer.find("Nothing here") is None
@@ -0,0 +1,121 @@
+"""
+Tests for the labour-law audit (audit_legal): the compiled single-pass
+auditor against the former per-pattern checks, and incremental runs over
+stored findings.
+"""
+
+import re
+
+import pytest
+import sys
+import os
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import audit_legal
+
+
+def legacy_audit(text):
+    """The former analyze_discrimination + analyze_svarcsystem (one re.search per pattern)."""
+    text = text.lower()
+    found = []
+    for category, patterns in audit_legal.DISCRIMINATION_PATTERNS.items():
+        for pat in patterns:
+            if re.search(pat, text):
+                if "důchodce" in pat and "vhodné" in text:
+                    continue
+                found.append(f"{category}: '{pat.replace(chr(92) + 'b', '').strip()}'")
+                break
+    indicators = audit_legal.SVARCSYSTEM_INDICATORS
+    if any(re.search(pat, text) for pat in indicators["Contract Type"]):
+        dependent = [pat for pat in indicators["Dependent Features"] if re.search(pat, text)]
+        if dependent:
+            found.append(f"Potential Švarcsystém (§ 2, § 3): IČO combined with {', '.join(dependent)}")
+    return found
+
+
+TEXTS = [
+    "Hledáme  asistentku na recepci, mladý\nkolektiv.",
+    "Práce vhodné pro důchodce, IČO spolupráce, kancelář v Praze, 9-17.",
+    "Hledáme důchodce na vrátnici.",
+    "Spolupráce na ŽL, fakturace měsíčně; sick   days a stravenky.",
+    "Muži i ženy vítáni, žádná fakturace ani kancelář.",
+    "Hledáme řidiče, bez dětí, svobodnou. Dovolená 5 týdnů.",
+    "Python developer, remote, no office.",
+    "",
+]
+
+SIGNALS = [
+    ("Asistentka", "Hledáme asistentku do kanceláře."),
+    ("Obchodník", "Spolupráce na IČO, fakturace, povinná přítomnost na pracovišti."),
+    ("Developer", "Python, home office, flexibilní doba."),
+]
+
+
+@pytest.mark.parametrize("text", TEXTS)
+def test_auditor_matches_per_pattern_checks(text):
+    auditor = audit_legal.LegalAuditor()
+    assert auditor.audit(text) == legacy_audit(text)
+    assert audit_legal.analyze_discrimination(text) + audit_legal.analyze_svarcsystem(text) == legacy_audit(text)
+
+
+def test_auditor_compiles_to_literals():
+    # Every pattern is a \b-anchored literal once whitespace is collapsed: no per-pattern regex left
+    assert audit_legal.get_auditor().matcher._tails == []
+
+
+def test_parallel_chunks_match_serial():
+    rows = [(str(i), f"Job {i}", text) for i, text in enumerate(TEXTS * 5)]
+    assert audit_legal.audit_rows(rows, workers=2, chunk_size=7) == audit_legal.audit_rows(rows, workers=1)
+
+
+class TestIncrementalAudit:
+
+    @pytest.fixture
+    def temp_db(self, tmp_path, monkeypatch):
+        db_path = str(tmp_path / "test_audit.db")
+        monkeypatch.setenv("JOBSCZINSIGHT_DB_PATH", db_path)
+        monkeypatch.setenv("JOBSCZINSIGHT_SNAPSHOT_PATH", str(tmp_path / "snap.parquet"))
+        monkeypatch.setenv("JOBSCZINSIGHT_LEGAL_FINDINGS_PATH", str(tmp_path / "findings.parquet"))
+        import analyzer
+        original_path = analyzer.DB_PATH
+        analyzer.DB_PATH = db_path
+        yield db_path
+        analyzer.DB_PATH = original_path
+
+    def _add(self, signals, offset=0):
+        from analyzer import IntelligenceCore, JobSignal
+        core = IntelligenceCore(read_only=False)
+        for i, (title, description) in enumerate(signals, start=offset):
+            core.add_signal(JobSignal(title=title, company=f"Co {i}", link=f"https://jobs.cz/{i}",
+                                      source="Jobs.cz", description=description, location="Praha"))
+        core.con.execute("CHECKPOINT")
+        core.close()
+
+    def test_later_runs_audit_only_new_signals(self, temp_db, tmp_path, monkeypatch):
+        report = tmp_path / "report.md"
+        audited = []
+        audit_rows = audit_legal.audit_rows
+        monkeypatch.setattr(audit_legal, "audit_rows",
+                            lambda rows, workers=None: audited.append(len(rows)) or audit_rows(rows, workers))
+
+        self._add(SIGNALS)
+        audit_legal.run_audit(output=str(report), workers=1)
+        first = report.read_text(encoding="utf-8")
+        assert "**Scanned:** 3 job listings" in first
+        assert "**Total Flagged Listings:** 2 (66.7%)" in first
+        assert len(audit_legal.load_findings()) == 3
+
+        self._add([("Skladník", "Hledáme skladníka, IČO, kancelář.")], offset=len(SIGNALS))
+        audit_legal.run_audit(output=str(report), workers=1)
+        second = report.read_text(encoding="utf-8")
+        assert audited == [3, 1]
+        assert "**Total Flagged Listings:** 3 (75.0%)" in second
+        assert "### Skladník (Co 3)" in second and "### Asistentka (Co 0)" in second
+
+        # Changed rules invalidate the stored findings
+        monkeypatch.setattr(audit_legal, "rules_version", lambda: "changed")
+        audit_legal.run_audit(output=str(report), workers=1)
+        assert audited == [3, 1, 4]
+        assert report.read_text(encoding="utf-8") == second
@@ -51,3 +51,45 @@ def test_normalize_other():
     region, city = normalizer.normalize("Plzeň")
     assert region == "Other"
     assert city == "Plzeň"
+
+def test_resolve_uses_czech_hub_names_and_description_fallback():
+    normalizer = LocationNormalizer()
+    assert normalizer.resolve("Praha 4") == ("Prague", "Praha")
+    assert normalizer.resolve("Plzeň, CZ") == ("Other", "Plzeň")
+    # Country-only locations: first statutory city the description names
+    assert normalizer.resolve("CZ", "Pobočky Zlín a Brno") == ("Other", "Zlín")
+    assert normalizer.resolve("CZ", "Pobočky Brno a Zlín") == ("Brno", "Brno")
+    assert normalizer.resolve("Česká republika", "Kancelář Pardubice") == ("Other", "Pardubice")
+    assert normalizer.resolve("CZ", "Bez místa") == ("Other", "Other")
+    assert normalizer.resolve("") == ("Unknown", "Unknown")
+
+def test_resolve_uses_gazetteer_names():
+    normalizer = LocationNormalizer()
+    assert normalizer.resolve("Usti nad Labem") == ("Other", "Ústí nad Labem")
+    assert normalizer.resolve("Hlavní město Praha") == ("Prague", "Praha")
+    assert normalizer.resolve("Brno-město") == ("Brno", "Brno")
+    # Districts around a hub are not the hub
+    assert normalizer.resolve("Praha-východ") == ("Other", "Praha-východ")
+    # Kraj-only locations keep the kraj, so resolved_city is never NULL
+    assert normalizer.resolve("Jihomoravský kraj") == ("Other", "Jihomoravský kraj")
+    assert normalizer.resolve_many(["Středočeský kraj"])["city"].tolist() == ["Středočeský kraj"]
+    # Unknown places keep the text before the comma
+    assert normalizer.resolve("Dolní Lhota, CZ") == ("Other", "Dolní Lhota")
+
+def test_description_fallback_matches_scraper_card_text():
+    normalizer = LocationNormalizer()
+    # Any statutory city, found the way extract_city finds it in card text
+    assert normalizer.resolve("CZ", "Nová pobočka v Jihlava, směnný provoz") == ("Other", "Jihlava")
+    assert normalizer.resolve("CZ", "Office in Prague and Brno") == ("Prague", "Praha")
+    # Names that are also common words are not read as cities
+    assert normalizer.resolve("CZ", "The most flexible team") == ("Other", "Other")
+
+
+def test_resolve_many_matches_resolve():
+    normalizer = LocationNormalizer()
+    locations = ["Praha 10", "CZ", "CZ", None, "Ostrava-město", "Czechia", "Brno, CZ", "CZ"]
+    descriptions = ["", "Office in Pilsen", None, "Brno", "", "Praha i Ostrava", "", "Pobočka Jihlava"]
+    resolved = normalizer.resolve_many(locations, descriptions)
+    assert list(zip(resolved["region"], resolved["city"])) == [
+        normalizer.resolve(loc, desc) for loc, desc in zip(locations, descriptions)
+    ]
@@ -0,0 +1,104 @@
+"""
+Tests for the ingest micro-batcher and its use by IntelligenceCore.add_signals.
+"""
+
+import pytest
+import sys
+import os
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import classifiers
+from classifiers import ClassificationCache, JobClassifier
+from micro_batcher import MicroBatcher
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestMicroBatcher:
+
+    def test_flushes_by_size_then_latency_then_drain(self):
+        clock = FakeClock()
+        batches = []
+        batcher = MicroBatcher(batches.append, max_size=3, max_latency=5.0, clock=clock)
+
+        batcher.add([1, 2, 3, 4])
+        assert batches == [[1, 2, 3]] and len(batcher) == 1
+
+        clock.now = 4.0
+        batcher.add([5])
+        assert len(batches) == 1  # oldest (4) has waited 4s
+        clock.now = 5.5
+        batcher.poll()
+        assert batches[-1] == [4, 5]
+
+        batcher.add([6])
+        batcher.flush()
+        batcher.flush()  # nothing pending: no empty batch
+        assert batches[-1] == [6]
+
+        stats = batcher.stats()
+        assert stats["batches"] == 3 and stats["items"] == 6 and stats["largest_batch"] == 3
+        assert stats["max_wait_s"] == 5.5
+        assert stats["reasons"] == {"size": 1, "latency": 1, "drain": 1}
+
+
+class FakeEmbeddingClassifier:
+    """Labels every job 'Logistics' and records each batch it is given."""
+
+    def __init__(self):
+        self.batches = []
+
+    def is_available(self):
+        return True
+
+    def classify_roles_batch(self, jobs):
+        self.batches.append(len(jobs))
+        return ["Logistics"] * len(jobs)
+
+
+class TestIngestBatching:
+
+    @pytest.fixture
+    def temp_db(self, tmp_path):
+        db_path = str(tmp_path / "test_micro_batcher.db")
+        import analyzer
+        original_path = analyzer.DB_PATH
+        analyzer.DB_PATH = db_path
+        yield db_path
+        analyzer.DB_PATH = original_path
+
+    def test_keyword_misses_wait_for_one_embedding_batch(self, temp_db, monkeypatch):
+        from analyzer import IntelligenceCore, JobSignal
+        fake = FakeEmbeddingClassifier()
+        monkeypatch.setattr(classifiers, "EmbeddingClassifier", fake)
+        monkeypatch.setattr(JobClassifier, "USE_EMBEDDINGS", True)
+        monkeypatch.setattr(JobClassifier, "cache", ClassificationCache(maxsize=100))
+        monkeypatch.setenv("JOBSCZINSIGHT_ROLE_BATCH_SIZE", "10")
+        monkeypatch.setenv("JOBSCZINSIGHT_ROLE_BATCH_LATENCY_S", "3600")
+
+        core = IntelligenceCore(read_only=False)
+        count = lambda: core.con.execute("SELECT COUNT(*) FROM signals").fetchone()[0]
+        for page in range(3):
+            core.add_signals([
+                JobSignal(title="Python Developer", company=f"Firma {page}", link=f"https://x/{page}/dev",
+                          source="Test", description="Django backend"),
+                JobSignal(title=f"Zzz {page}", company=f"Firma {page}", link=f"https://x/{page}/zzz",
+                          source="Test", description="nic konkretniho"),
+            ])
+        assert count() == 3  # keyword-classified signals only
+        assert fake.batches == []
+
+        core.flush_pending_signals()
+        assert count() == 6
+        assert fake.batches == [3]
+        roles = dict(core.con.execute("SELECT title, role_type FROM signals").fetchall())
+        assert roles["Zzz 1"] == "Logistics" and roles["Python Developer"] == "Developer"
+        core.close()
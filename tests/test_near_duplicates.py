@@ -0,0 +1,130 @@
+"""
+Tests for near-duplicate detection (MinHash + LSH) and cluster assignment at ingest.
+"""
+
+import pytest
+import sys
+import os
+from datetime import datetime, timedelta
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+import near_duplicates
+
+BASE_TEXT = (
+    "Hledáme zkušeného Python vývojáře do týmu, který vyvíjí platformu pro správu "
+    "logistiky. Budete navrhovat REST API v Django, psát testy a spolupracovat s "
+    "frontend týmem na nových funkcích. Požadujeme alespoň tři roky praxe, znalost "
+    "PostgreSQL a Dockeru a chuť učit se nové věci. Nabízíme hybridní režim práce, "
+    "stravenky, MultiSport kartu, pět týdnů dovolené a vzdělávací rozpočet."
+)
+REPOST_TEXT = BASE_TEXT.replace("pět týdnů dovolené", "25 dní dovolené")
+OTHER_TEXT = (
+    "Přijmeme účetní na hlavní pracovní poměr. Náplní práce je vedení účetnictví "
+    "menších klientů, zpracování mezd, komunikace s finančním úřadem a příprava "
+    "podkladů pro audit. Nabízíme stabilní zázemí, stravenky a příspěvek na penzijní "
+    "připojištění. Požadujeme středoškolské vzdělání ekonomického směru a praxi."
+)
+
+
+class TestMinHash:
+    """Unit tests for signatures and LSH keys."""
+
+    def test_similar_texts_have_similar_signatures(self):
+        a = near_duplicates.minhash_signature(BASE_TEXT)
+        b = near_duplicates.minhash_signature(REPOST_TEXT)
+        c = near_duplicates.minhash_signature(OTHER_TEXT)
+        assert near_duplicates.estimate_similarity(a, b) >= near_duplicates.SIMILARITY_THRESHOLD
+        assert near_duplicates.estimate_similarity(a, c) < 0.3
+
+    def test_short_text_has_no_signature(self):
+        assert near_duplicates.minhash_signature("Python developer") is None
+        assert near_duplicates.minhash_signature(None) is None
+
+    def test_signature_is_deterministic_and_round_trips(self):
+        sig = near_duplicates.minhash_signature(BASE_TEXT)
+        assert sig.dtype == np.uint32 and len(sig) == near_duplicates.NUM_PERM
+        assert np.array_equal(sig, near_duplicates.minhash_signature(BASE_TEXT))
+        restored = near_duplicates.signature_from_bytes(near_duplicates.signature_to_bytes(sig))
+        assert np.array_equal(sig, restored)
+
+    def test_band_keys_shape_and_band_separation(self):
+        sig = near_duplicates.minhash_signature(BASE_TEXT)
+        keys = near_duplicates.band_keys(sig)
+        assert keys.shape == (1, near_duplicates.BANDS)
+        # Identical band values in different bands must not share a bucket
+        flat = np.zeros(near_duplicates.NUM_PERM, dtype=np.uint32)
+        assert len(set(near_duplicates.band_keys(flat)[0].tolist())) == near_duplicates.BANDS
+
+    def test_cluster_signatures_groups_reposts(self):
+        sigs = np.vstack([
+            near_duplicates.minhash_signature(BASE_TEXT),
+            near_duplicates.minhash_signature(OTHER_TEXT),
+            near_duplicates.minhash_signature(REPOST_TEXT),
+            near_duplicates.minhash_signature(BASE_TEXT),
+        ])
+        reps = near_duplicates.cluster_signatures(sigs)
+        assert reps.tolist() == [0, 1, 0, 0]
+
+
+class TestClusterAssignment:
+    """Integration tests for cluster ids on IntelligenceCore."""
+
+    @pytest.fixture
+    def temp_db(self, tmp_path):
+        db_path = str(tmp_path / "test_near_duplicates.db")
+        import analyzer
+        original_path = analyzer.DB_PATH
+        analyzer.DB_PATH = db_path
+        yield db_path
+        analyzer.DB_PATH = original_path
+
+    @pytest.fixture
+    def core(self, temp_db):
+        from analyzer import IntelligenceCore
+        core = IntelligenceCore(read_only=False)
+        yield core
+        core.close()
+
+    @staticmethod
+    def _signal(title, link, description, source="Jobs.cz"):
+        from analyzer import JobSignal
+        return JobSignal(title=title, company="LogiSoft", link=link, source=source,
+                         description=description, location="Praha")
+
+    def _clusters(self, core):
+        return dict(core.con.execute("SELECT link, cluster_id FROM signals").fetchall())
+
+    def test_repost_with_tweaked_title_joins_cluster(self, core):
+        core.add_signal(self._signal("Python Developer", "https://jobs.cz/1", BASE_TEXT))
+        core.add_signal(self._signal("Python Developer (Django)", "https://prace.cz/9", REPOST_TEXT, "Prace.cz"))
+        core.add_signal(self._signal("Účetní", "https://jobs.cz/2", OTHER_TEXT))
+        clusters = self._clusters(core)
+        assert clusters["https://prace.cz/9"] == clusters["https://jobs.cz/1"]
+        assert clusters["https://jobs.cz/2"] != clusters["https://jobs.cz/1"]
+
+    def test_buckets_stored_per_signal(self, core):
+        core.add_signal(self._signal("Python Developer", "https://jobs.cz/1", BASE_TEXT))
+        assert core.con.execute("SELECT COUNT(*) FROM minhash_signatures").fetchone()[0] == 1
+        assert core.con.execute("SELECT COUNT(*) FROM lsh_buckets").fetchone()[0] == near_duplicates.BANDS
+
+    def test_cleanup_prunes_index(self, core):
+        core.add_signal(self._signal("Python Developer", "https://jobs.cz/1", BASE_TEXT))
+        core.con.execute("UPDATE signals SET last_seen_at = ?", [datetime.now() - timedelta(hours=2)])
+        core.cleanup_expired(threshold_minutes=60)
+        assert core.con.execute("SELECT COUNT(*) FROM lsh_buckets").fetchone()[0] == 0
+        assert core.con.execute("SELECT COUNT(*) FROM minhash_signatures").fetchone()[0] == 0
+
+    def test_rebuild_backfills_existing_signals(self, core):
+        core.add_signal(self._signal("Python Developer", "https://jobs.cz/1", BASE_TEXT))
+        core.add_signal(self._signal("Python Dev", "https://prace.cz/9", REPOST_TEXT, "Prace.cz"))
+        core.con.execute("UPDATE signals SET cluster_id = NULL")
+        core.con.execute("DELETE FROM lsh_buckets")
+        core.con.execute("DELETE FROM minhash_signatures")
+
+        core.ensure_near_duplicate_index()
+        clusters = self._clusters(core)
+        assert None not in clusters.values()
+        assert clusters["https://prace.cz/9"] == clusters["https://jobs.cz/1"]
@@ -0,0 +1,104 @@
+"""
+Tests for the append-only observation history and the trends that read it.
+"""
+
+import pytest
+import sys
+import os
+from datetime import date, datetime, timedelta
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import duckdb
+import pandas as pd
+
+from observations import ObservationStore, week_start
+from analysis.regional_analysis import RegionalAnalysis
+from analysis.salary_analysis import SalaryAnalysis
+
+
+def _signals_con(rows):
+    """In-memory signals table with the columns observations read."""
+    con = duckdb.connect()
+    con.execute("""
+        CREATE TABLE signals (
+            hash TEXT, source TEXT, region TEXT, city TEXT, company TEXT, role_type TEXT,
+            seniority_level TEXT, avg_salary DOUBLE, ghost_score INTEGER,
+            cluster_id TEXT, last_seen_at TIMESTAMP
+        )
+    """)
+    con.executemany("INSERT INTO signals VALUES (?, 'Jobs.cz', ?, NULL, 'Co', 'Developer', 'Mid', ?, 0, ?, ?)",
+                    [(h, region, salary, h, seen) for h, region, salary, seen in rows])
+    return con
+
+
+class TestObservationStore:
+
+    @pytest.fixture
+    def store(self, tmp_path):
+        return ObservationStore(tmp_path / "observations")
+
+    def test_record_writes_weekly_partition(self, store):
+        day = date(2026, 10, 14)  # Wednesday
+        con = _signals_con([
+            ("a", "Prague", 80000, datetime(2026, 10, 14, 9)),
+            ("b", "Brno", 70000, datetime(2026, 10, 14, 10)),
+            ("stale", "Brno", 50000, datetime(2026, 10, 1)),
+        ])
+        assert store.record(con, observed_on=day) == 2
+        expected = store.root / "week=2026-10-12" / "observed_2026-10-14.parquet"
+        assert expected.exists()
+        assert store.observed_dates() == [day]
+        assert set(store.load(columns=["hash"])["hash"]) == {"a", "b"}
+
+    def test_rerun_same_day_replaces_file(self, store):
+        day = date(2026, 10, 14)
+        con = _signals_con([("a", "Prague", 80000, datetime(2026, 10, 14, 9))])
+        store.record(con, observed_on=day)
+        store.record(con, observed_on=day)
+        assert len(store.load()) == 1
+
+    def test_load_filters_by_date_range(self, store):
+        for offset in range(3):
+            day = date(2026, 10, 5) + timedelta(days=7 * offset)
+            con = _signals_con([(f"h{offset}", "Prague", 80000, datetime.combine(day, datetime.min.time()))])
+            store.record(con, observed_on=day)
+        df = store.load(columns=["hash"], since=date(2026, 10, 12))
+        assert sorted(df["hash"]) == ["h1", "h2"]
+        df = store.load(columns=["hash"], dates=[date(2026, 10, 5)])
+        assert df["hash"].tolist() == ["h0"]
+
+    def test_empty_store(self, store):
+        assert not store.available()
+        assert store.load(columns=["hash"]).empty
+        assert week_start(date(2026, 10, 18)) == date(2026, 10, 12)
+
+
+class TestTrendsFromHistory:
+
+    def test_regional_trends_see_expired_listings(self, tmp_path):
+        """Listings cleanup_expired removed still count toward the previous scrape."""
+        store = ObservationStore(tmp_path / "observations")
+        last_week, today = date(2026, 10, 12), date(2026, 10, 19)
+        store.record(_signals_con([("old", "Prague", 80000, datetime(2026, 10, 12, 8))]), observed_on=last_week)
+        store.record(_signals_con([("new", "Prague", 88000, datetime(2026, 10, 19, 8))]), observed_on=today)
+
+        live = pd.DataFrame([{"region": "Prague", "avg_salary": 88000, "scraped_at": pd.Timestamp(today)}])
+        trends = RegionalAnalysis(live, store).get_regional_trends()
+        prague = trends[trends["Region"] == "Prague"].iloc[0]
+        assert prague["Previous Median"] == 80000
+        assert prague["Change %"] == 10.0
+
+    def test_weekly_salary_trend_from_history(self, tmp_path):
+        store = ObservationStore(tmp_path / "observations")
+        start = date(2026, 8, 31)
+        for week in range(7):
+            day = start + timedelta(days=7 * week)
+            rows = [(h, "Prague", 60000 + 1000 * week, datetime.combine(day, datetime.min.time())) for h in ("a", "b")]
+            store.record(_signals_con(rows), observed_on=day)
+
+        trend = SalaryAnalysis(pd.DataFrame(), {}, store).get_salary_trend_weekly()
+        assert len(trend) == 7
+        assert trend["count"].tolist() == [2] * 7
+        assert trend["median_salary"].iloc[-1] == 66000
@@ -0,0 +1,180 @@
+"""
+Tests for the local JSON query API (query_api), served on an ephemeral port.
+"""
+
+import json
+import threading
+import urllib.error
+import urllib.request
+
+import pytest
+import sys
+import os
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import duckdb
+
+import dashboard_data
+import query_api
+
+SIGNALS = [
+    ("Python Developer", "Praha", 90000, "Python and Django, home office. We are looking for the best."),
+    ("Java Developer", "Brno", 80000, "Java, Spring, office only."),
+    ("Účetní", "Ostrava", 45000, "Hledáme účetní, HPP, stravenky."),
+    ("Data Analyst", "Praha", 70000, "SQL and Python for the data team, sick day."),
+]
+
+
+class TestQueryApi:
+
+    @pytest.fixture
+    def temp_db(self, tmp_path, monkeypatch):
+        db_path = str(tmp_path / "test_api.db")
+        monkeypatch.setenv("JOBSCZINSIGHT_SNAPSHOT_PATH", str(tmp_path / "snap.parquet"))
+        monkeypatch.setenv("JOBSCZINSIGHT_OBSERVATIONS_DIR", str(tmp_path / "observations"))
+        import analyzer
+        original_path = analyzer.DB_PATH
+        analyzer.DB_PATH = db_path
+        yield db_path
+        analyzer.DB_PATH = original_path
+
+    @pytest.fixture
+    def api(self, temp_db):
+        from analyzer import IntelligenceCore, JobSignal
+        core = IntelligenceCore(read_only=False)
+        for i, (title, location, salary, description) in enumerate(SIGNALS):
+            core.add_signal(JobSignal(title=title, company=f"Co {i}", link=f"https://jobs.cz/{i}",
+                                      source="Jobs.cz", description=description, location=location,
+                                      salary=f"{salary} Kč"))
+        core.refresh_rollups()
+        core.con.execute("CHECKPOINT")
+        core.close()
+
+        server = query_api.serve(host="127.0.0.1", port=0)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+
+        def get(path):
+            url = f"http://127.0.0.1:{server.server_port}{path}"
+            try:
+                with urllib.request.urlopen(url, timeout=30) as response:
+                    return response.status, json.loads(response.read())
+            except urllib.error.HTTPError as e:
+                return e.code, json.loads(e.read())
+
+        yield get
+        server.shutdown()
+        server.server_close()
+        server.service.close()
+
+    def test_kpis_match_dashboard_and_are_cached(self, api):
+        status, body = api("/kpis")
+        assert status == 200
+        with dashboard_data.connect() as con:
+            assert body == dashboard_data.kpis(con)
+
+        assert api("/kpis") == (200, body)
+        _, metrics = api("/metrics")
+        assert metrics["/kpis"]["requests"] == 2
+        assert metrics["/kpis"]["cache_hits"] == 1
+        assert metrics["/kpis"]["p95_ms"] >= metrics["/kpis"]["p50_ms"] >= 0
+
+    def test_salary_from_rollups(self, api):
+        status, rows = api("/salary?by=role_type&q=0.5")
+        assert status == 200
+        assert sum(row["jobs"] for row in rows) == len(SIGNALS)
+        assert all("q50" in row for row in rows)
+
+        status, overall = api("/salary?region=Prague")
+        assert status == 200
+        assert overall[0]["jobs"] == 2
+
+    def test_signals_stream_with_filters(self, api):
+        status, rows = api("/signals?columns=title,avg_salary&limit=3")
+        assert status == 200
+        assert len(rows) == 3
+        assert set(rows[0]) == {"title", "avg_salary"}
+
+        _, prague = api("/signals?columns=title&region=Prague")
+        assert sorted(row["title"] for row in prague) == ["Data Analyst", "Python Developer"]
+
+    @pytest.fixture
+    def zstd_codec(self, monkeypatch):
+        import analyzer
+        if not analyzer.ZSTD_AVAILABLE:
+            pytest.skip("zstandard not installed")
+        monkeypatch.setenv("JOBSCZINSIGHT_TEXT_CODEC", "zstd")
+
+    def test_signals_decode_zstd_texts(self, zstd_codec, api):
+        status, rows = api("/signals?columns=title,description")
+        assert status == 200
+        assert {row["title"]: row["description"] for row in rows} == {
+            title: description for title, _, _, description in SIGNALS
+        }
+
+    def test_invalid_parameters(self, api):
+        assert api("/salary?by=salary")[0] == 400
+        assert api("/signals?columns=secret")[0] == 400
+        assert api("/signals?limit=many")[0] == 400
+        assert api("/nope")[0] == 404
+        _, metrics = api("/metrics")
+        assert metrics["/salary"]["errors"] == 1
+
+    def test_market_intelligence_endpoints(self, api):
+        from analyzer import MarketIntelligence
+        status, rows = api("/salary-by-role?limit=2")
+        assert status == 200
+        intel = MarketIntelligence()
+        expected = intel.get_salary_by_role().head(2)
+        intel.close()
+        assert rows == json.loads(query_api.to_json(expected))
+        assert api("/ghost-jobs")[0] == 200
+
+
+class TestConnectionLifetimes:
+
+    def test_new_version_waits_for_checked_out_cursors(self):
+        opened = []
+
+        def connect():
+            opened.append(duckdb.connect())
+            return opened[-1]
+
+        pool = query_api.ConnectionPool(2, connect=connect)
+        with pool.cursor("v1") as cur:
+            cur.execute("SELECT * FROM range(10000)")
+            first = cur.fetchmany(10)
+            # A republished snapshot while a /signals stream is still reading
+            with pool.cursor("v2") as other:
+                assert other.execute("SELECT 1").fetchall() == [(1,)]
+            assert len(first) + len(cur.fetchall()) == 10000
+        with pytest.raises(duckdb.ConnectionException):
+            opened[0].execute("SELECT 1")
+        with pool.cursor("v2") as cur:
+            assert cur.execute("SELECT 1").fetchall() == [(1,)]
+        pool.close()
+        with pytest.raises(duckdb.ConnectionException):
+            opened[1].execute("SELECT 1")
+
+    def test_market_intelligence_of_old_versions_is_closed(self, monkeypatch):
+        class FakeIntel:
+            def __init__(self):
+                self.closed = False
+
+            def get_ghost_jobs(self):
+                return {"closed": self.closed}
+
+            def close(self):
+                self.closed = True
+
+        monkeypatch.setattr(query_api.analyzer, "MarketIntelligence", FakeIntel)
+        service = query_api.QueryService(pool_size=1, version=lambda: "v1")
+        endpoint = service.endpoints["/ghost-jobs"]
+        assert endpoint({}, "v1") == {"closed": False}
+        first = service._intel[1]
+        endpoint({}, "v2")
+        assert first.closed
+        service.close()
+        assert service._intel == (None, None)
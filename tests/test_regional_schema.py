@@ -67,3 +67,31 @@ class TestRegionalSchema:
         assert result is not None
         assert result[0] == "Brno"
         assert result[1] == "Brno"
+
+    def test_add_signal_stores_resolved_city(self, core):
+        """Country-only locations are resolved from the description at ingest."""
+        sample = JobSignal(
+            title="Dev",
+            company="Test",
+            link="http://test.com/cz",
+            source="Test",
+            location="CZ",
+            description="Hledáme kolegu do naší kanceláře v Ostrava centru."
+        )
+
+        core.add_signal(sample)
+
+        result = core.con.execute("SELECT region, city, resolved_city FROM signals WHERE link = ?", [sample.link]).fetchone()
+        assert result == ("Ostrava", "CZ", "Ostrava")
+
+    def test_resolve_locations_backfills_old_rows(self, core):
+        """Rows stored before resolved_city existed get region and city on backfill."""
+        for link, location in [("http://test.com/a", "Praha 4"), ("http://test.com/b", "CZ")]:
+            core.add_signal(JobSignal(title="Dev", company="Test", link=link, source="Test",
+                                      location=location, description="Práce v Brno"))
+        core.con.execute("UPDATE signals SET resolved_city = NULL, region = 'Other'")
+
+        assert core.resolve_locations() == 2
+        rows = core.con.execute("SELECT link, region, resolved_city FROM signals ORDER BY link").fetchall()
+        assert rows == [("http://test.com/a", "Prague", "Praha"), ("http://test.com/b", "Brno", "Brno")]
+        assert core.resolve_locations() == 0
@@ -0,0 +1,83 @@
+"""
+Tests for the incremental report build graph (report/build_graph.py).
+"""
+
+import pytest
+import sys
+import os
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+from report.build_graph import ReportBuild, Section, hash_paths
+
+
+class CountingInputs:
+    """Records which sections touched the shared inputs."""
+
+    def __init__(self):
+        self.loads = []
+
+    def value(self, name):
+        self.loads.append(name)
+        return np.int64(len(self.loads))
+
+
+def build_total(inputs):
+    return {'total': inputs.value('total')}
+
+
+def build_chart(inputs):
+    return {'chart_json': f"chart-{inputs.value('chart')}"}
+
+
+def build_static(inputs):
+    return {'label': 'static'}
+
+
+class TestReportBuild:
+
+    @pytest.fixture
+    def config(self, tmp_path):
+        path = tmp_path / "chart.yaml"
+        path.write_text("color: blue")
+        return path
+
+    def sections(self, config):
+        return [
+            Section('total', build_total),
+            Section('chart', build_chart, files=(str(config),)),
+            Section('static', build_static, uses_data=False),
+        ]
+
+    def test_only_stale_sections_rebuild(self, tmp_path, config):
+        cache = tmp_path / "cache"
+        inputs = CountingInputs()
+        first = ReportBuild(cache, "data-v1", tmp_path).run(self.sections(config), inputs)
+        assert first == {'total': 1, 'chart_json': 'chart-2', 'label': 'static'}
+        assert type(first['total']) is int  # same types as a cached run
+
+        build = ReportBuild(cache, "data-v1", tmp_path)
+        assert build.run(self.sections(config), inputs) == first
+        assert inputs.loads == ['total', 'chart']  # nothing recomputed
+        assert "0/3 sections rebuilt" in build.timings()
+
+        config.write_text("color: red")
+        build = ReportBuild(cache, "data-v1", tmp_path)
+        build.run(self.sections(config), inputs)
+        assert inputs.loads[2:] == ['chart']
+        assert [r.name for r in build.results if not r.cached] == ['chart']
+
+        build = ReportBuild(cache, "data-v2", tmp_path)
+        build.run(self.sections(config), inputs)
+        assert [r.name for r in build.results if not r.cached] == ['total', 'chart']
+
+    def test_hash_paths_covers_directory_contents(self, tmp_path):
+        (tmp_path / "pkg").mkdir()
+        (tmp_path / "pkg" / "a.py").write_text("x = 1")
+        before = hash_paths(["pkg", "missing.yaml"], tmp_path)
+        assert hash_paths(["pkg", "missing.yaml"], tmp_path) == before
+        (tmp_path / "pkg" / "a.py").write_text("x = 2")
+        assert hash_paths(["pkg", "missing.yaml"], tmp_path) != before
@@ -0,0 +1,117 @@
+"""
+Tests for the report rollups (counts and log-bucket salary sketches).
+"""
+
+import pytest
+import sys
+import os
+from datetime import datetime, timedelta
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+import pandas as pd
+
+import rollups
+
+
+class TestRollups:
+
+    @pytest.fixture
+    def temp_db(self, tmp_path):
+        db_path = str(tmp_path / "test_rollups.db")
+        import analyzer
+        original_path = analyzer.DB_PATH
+        analyzer.DB_PATH = db_path
+        yield db_path
+        analyzer.DB_PATH = original_path
+
+    @pytest.fixture
+    def core(self, temp_db):
+        from analyzer import IntelligenceCore
+        core = IntelligenceCore(read_only=False)
+        yield core
+        core.close()
+
+    @staticmethod
+    def _add(core, i, title="Python Developer", salary="60 000 Kč", description="Práce na HPP v Praze."):
+        from analyzer import JobSignal
+        core.add_signal(JobSignal(title=title, company=f"Co {i}", link=f"https://jobs.cz/{i}",
+                                  source="Jobs.cz", salary=salary, description=f"{description} #{i}",
+                                  location="Praha"))
+
+    def _snapshot(self, core):
+        return core.con.execute("""
+            SELECT * EXCLUDE (last_scraped_at) FROM rollup_counts ORDER BY ALL
+        """).fetchall(), core.con.execute("SELECT * FROM rollup_salary_sketch ORDER BY ALL").fetchall()
+
+    def test_quantiles_within_relative_accuracy(self, core):
+        rng = np.random.default_rng(7)
+        salaries = rng.lognormal(mean=np.log(55000), sigma=0.4, size=2000).round()
+        core.con.execute("DELETE FROM signals")
+        frame = pd.DataFrame({
+            "hash": [f"h{i}" for i in range(len(salaries))],
+            "avg_salary": salaries,
+            "role_type": "Developer",
+            "scraped_at": datetime(2026, 10, 14),
+        })
+        core.con.execute("INSERT INTO signals BY NAME SELECT * FROM frame")
+        core.refresh_rollups(full=True)
+
+        result = rollups.Rollups(core.con).quantiles(qs=(0.25, 0.5, 0.9))
+        for q, column in [(0.25, "q25"), (0.5, "q50"), (0.9, "q90")]:
+            exact = np.quantile(salaries, q, method="lower")
+            assert abs(result[column].iloc[0] - exact) / exact <= 0.011
+        assert result["count"].iloc[0] == len(salaries)
+
+    def test_incremental_refresh_matches_full_rebuild(self, core):
+        for i in range(3):
+            self._add(core, i)
+        core.refresh_rollups()
+        core.con.execute("UPDATE signals SET scraped_at = scraped_at - INTERVAL 21 DAY WHERE link = 'https://jobs.cz/0'")
+        core.refresh_rollups(full=True)
+
+        self._add(core, 3, title="Účetní", salary="40 000 Kč", description="Fakturace na IČO")
+        assert core._stale_rollup_weeks
+        core.refresh_rollups()
+        incremental = self._snapshot(core)
+        core.refresh_rollups(full=True)
+        assert incremental == self._snapshot(core)
+
+    def test_cleanup_refreshes_expired_weeks(self, core):
+        for i in range(2):
+            self._add(core, i)
+        core.refresh_rollups()
+        core.con.execute("""
+            UPDATE signals SET scraped_at = scraped_at - INTERVAL 30 DAY,
+                               last_seen_at = last_seen_at - INTERVAL 30 DAY
+            WHERE link = 'https://jobs.cz/0'
+        """)
+        core.refresh_rollups(full=True)
+        core.cleanup_expired(threshold_minutes=14 * 24 * 60)
+        core.refresh_rollups()
+        assert rollups.Rollups(core.con).counts()["jobs"].iloc[0] == 1
+
+    def test_contract_type_matches_dataframe_logic(self, core):
+        from analyzer import CONTRACT_TYPE_LABELS
+        self._add(core, 0, description="Spolupráce na IČO, fakturace měsíčně")
+        self._add(core, 1, description="Brigáda vhodné pro studenty")
+        self._add(core, 2, description="Hlavní pracovní poměr")
+        core.refresh_rollups()
+        counts = rollups.Rollups(core.con).counts(by=["contract_type"])
+        assert dict(zip(counts["contract_type"], counts["jobs"])) == {
+            CONTRACT_TYPE_LABELS["ico"]: 1, CONTRACT_TYPE_LABELS["brigada"]: 1, "HPP": 1
+        }
+
+    def test_filters_and_unavailable_tables(self, core):
+        import duckdb
+        self._add(core, 0)
+        self._add(core, 1, title="Účetní")
+        core.refresh_rollups()
+        reader = rollups.Rollups(core.con)
+        roles = set(reader.counts(by=["role_type"])["role_type"])
+        first = sorted(roles)[0]
+        filtered = reader.counts(filters={"role_type": [first]})
+        assert filtered["jobs"].iloc[0] == 1
+        assert not rollups.Rollups(duckdb.connect()).available()
@@ -186,3 +186,37 @@ class TestThousandSeparators:
         min_s, max_s, avg_s = SalaryParser.parse("50 000 Kč")
         # After space removal and joining, this becomes 50000
         assert avg_s == 50000
+
+
+# Every input exercised above, plus formats seen in the scraped sources
+EQUIVALENCE_CASES = [
+    ("40000 - 60000 Kč", None), ("", None), (None, None), ("50000 Kč", None),
+    ("80k-100k CZK", None), ("50K Kč", None), ("45-80k", None), ("50000kč", None),
+    ("200 Kč/hod", None), ("250 CZK/h", None), ("2000 EUR", None), ("3000 USD", None),
+    ("€2000", None), ("unpaid internship", None), ("0 Kč", None), ("dohodou", None),
+    ("negotiable", None), ("TBD", None), ("5000 Kč", None), ("1000000 Kč", None),
+    ("60-80 Kč", "StartupJobs"), ("600-900 Kč", "StartupJobs"), ("5000 - 8000 Kč", "StartupJobs"),
+    ("3,3 - 3300 €", "StartupJobs"), ("50.000 Kč", None), ("50 000 Kč", None),
+    ("60-80 Kč", "Jobs.cz"), ("40\u00a0000 – 55\u00a0000 Kč/měsíc", "Jobs.cz"), ("1.500 €/den", None),
+    ("35 až 45 tis. Kč", None), ("2 500 GBP", None), ("120 zł/hod", None), ("90 CHF per hour", None),
+    ("Mzda dohodou, 13. plat", None), ("25-30k + bonus 10 000", "StartupJobs"), ("5 let praxe, 45000", None),
+    (float("nan"), None), (42, None),
+]
+
+
+class TestParseMany:
+    """parse_many must match parse() element by element."""
+
+    def test_matches_scalar_parser(self):
+        salaries = [s for s, _ in EQUIVALENCE_CASES] * 3  # repeats go through the dedup path
+        sources = [src for _, src in EQUIVALENCE_CASES] * 3
+        mins, maxs, avgs = SalaryParser.parse_many(salaries, sources)
+        for i, (salary, source) in enumerate(zip(salaries, sources)):
+            expected = SalaryParser.parse(salary, source)
+            assert (mins[i], maxs[i], avgs[i]) == expected, salary
+            assert [type(v) for v in (mins[i], maxs[i], avgs[i])] == [type(v) for v in expected], salary
+
+    def test_single_source_and_empty_input(self):
+        _, _, avgs = SalaryParser.parse_many(["60-80 Kč", "60-80 Kč"], "StartupJobs")
+        assert list(avgs) == [70000.0, 70000.0]
+        assert all(len(column) == 0 for column in SalaryParser.parse_many([]))
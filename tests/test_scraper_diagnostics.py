@@ -39,3 +39,19 @@ class TestScraperDiagnostics:
         assert city == "CZ"
         # Verify diagnostic logging - this is expected to fail initially
         mock_logger.debug.assert_any_call("TestSite: City selector '.city' returned no element")
+
+    @pytest.mark.asyncio
+    async def test_extract_city_uses_gazetteer(self, scraper):
+        selector_card = AsyncMock()
+        element = AsyncMock()
+        element.inner_text.return_value = "Usti nad Labem, CZ"
+        selector_card.query_selector.return_value = element
+        assert await scraper.extract_city(selector_card) == "Ústí nad Labem"
+
+        element.inner_text.return_value = "Jihomoravský kraj"
+        assert await scraper.extract_city(selector_card) == "Jihomoravský kraj"
+
+        text_card = AsyncMock()
+        text_card.query_selector.return_value = None
+        text_card.inner_text.return_value = "Most attractive offer, office in Hradec Králové"
+        assert await scraper.extract_city(text_card) == "Hradec Králové"
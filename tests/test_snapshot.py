@@ -0,0 +1,72 @@
+"""
+Tests for the read-only Parquet snapshot used by report and dashboard scripts.
+"""
+
+import pytest
+import sys
+import os
+import time
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pyarrow.parquet as pq
+
+import snapshot
+
+
+class TestSnapshot:
+
+    @pytest.fixture
+    def temp_db(self, tmp_path):
+        db_path = str(tmp_path / "test_snapshot.db")
+        import analyzer
+        original_path = analyzer.DB_PATH
+        analyzer.DB_PATH = db_path
+        yield db_path
+        analyzer.DB_PATH = original_path
+
+    @pytest.fixture
+    def core(self, temp_db):
+        from analyzer import IntelligenceCore, JobSignal
+        core = IntelligenceCore(read_only=False)
+        for i, (title, location) in enumerate([("Python Developer", "Praha"), ("Účetní", "Brno"),
+                                               ("Java Developer", "Ostrava")]):
+            core.add_signal(JobSignal(title=title, company=f"Co {i}", link=f"https://jobs.cz/{i}",
+                                      source="Jobs.cz", description=f"{title} popis pozice {i}",
+                                      location=location))
+        core.con.execute("CHECKPOINT")
+        yield core
+        core.close()
+
+    def test_publish_resolves_texts_and_sorts(self, core, tmp_path):
+        path = snapshot.publish_from_core(core, tmp_path / "snap.parquet")
+        table = pq.read_table(path)
+        assert table.num_rows == 3
+        df = table.to_pandas()
+        assert set(df["description"]) == {"Python Developer popis pozice 0", "Účetní popis pozice 1",
+                                          "Java Developer popis pozice 2"}
+        assert df["role_type"].tolist() == sorted(df["role_type"].tolist())
+
+    def test_low_cardinality_columns_dictionary_encoded(self, core, tmp_path):
+        path = snapshot.publish_from_core(core, tmp_path / "snap.parquet")
+        meta = pq.ParquetFile(path).metadata.row_group(0)
+        encodings = {meta.column(i).path_in_schema: meta.column(i).encodings for i in range(meta.num_columns)}
+        for column in snapshot.DICTIONARY_COLUMNS:
+            assert any("DICTIONARY" in e for e in encodings[column])
+
+    def test_connect_reads_fresh_snapshot(self, core, temp_db, tmp_path):
+        path = snapshot.publish_from_core(core, tmp_path / "snap.parquet")
+        con = snapshot.connect(path, db_path=temp_db)
+        assert con.execute("SELECT COUNT(*) FROM signals_text WHERE description LIKE '%popis%'").fetchone()[0] == 3
+        con.close()
+
+    def test_stale_snapshot_falls_back_to_db(self, core, temp_db, tmp_path):
+        path = snapshot.publish_from_core(core, tmp_path / "snap.parquet")
+        assert snapshot.is_fresh(path, temp_db)
+        os.utime(temp_db, (time.time() + 10, time.time() + 10))
+        assert not snapshot.is_fresh(path, temp_db)
+        assert snapshot.load_df(path, db_path=temp_db) is None
+
+    def test_missing_snapshot(self, tmp_path):
+        assert not snapshot.is_fresh(tmp_path / "missing.parquet", tmp_path / "missing.db")
@@ -0,0 +1,82 @@
+"""
+Tests for the single-pass taxonomy keyword matcher.
+"""
+
+import pytest
+import sys
+import os
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pandas as pd
+import yaml
+
+from settings import settings
+from taxonomy_matcher import TaxonomyHits, TaxonomyMatcher, get_matcher, taxonomy_patterns
+
+SAMPLE_DESCRIPTIONS = [
+    "Hledáme Python vývojáře (Django, PostgreSQL), home office 2 dny v týdnu, stravenky a MultiSport karta.",
+    "Senior Java 17 developer, Spring Boot, Kubernetes, AWS. Full remote, 5 weeks vacation, sick days.",
+    "ML engineer pro tým AI/ML, PyTorch; spolupráce na IČO, fakturace měsíčně.",
+    "Brigáda na DPP - řidičský průkaz sk. B nutný, řp sk. B výhodou.",
+    "React Native & TypeScript frontend, Node.js backend, .NET legacy, C# and C++ welcome.",
+    "Go developer (golang), GraphQL, Terraform, Kafka; no remote, office only.",
+    "Účetní na HPP, Praha. Cafeteria, penzijní připojištění, 13. plat.",
+    "Práce v Googlu? Ne - goalkeeper, reaction time, ago.",
+    "",
+    None,
+]
+
+
+@pytest.fixture(scope="module")
+def taxonomy():
+    with open(settings.TAXONOMY_PATH, 'r', encoding='utf-8') as f:
+        return yaml.safe_load(f)
+
+
+class TestTaxonomyMatcher:
+
+    def test_matches_per_pattern_regex_scans(self, taxonomy):
+        """Every label agrees with str.contains on lowercased text, as the old scans did."""
+        matcher = get_matcher(taxonomy)
+        patterns = taxonomy_patterns(taxonomy)
+        desc = pd.Series(SAMPLE_DESCRIPTIONS).fillna('').str.lower()
+        matrix = matcher.match_many(SAMPLE_DESCRIPTIONS)
+        for i, (group, name) in enumerate(matcher.labels):
+            expected = desc.str.contains(patterns[group][name], case=False, regex=True, na=False)
+            assert list(matrix[:, i]) == list(expected), (group, name)
+        assert matrix.any()
+
+    def test_word_boundaries_and_overlapping_literals(self):
+        matcher = TaxonomyMatcher({"skills": {
+            "Go": r"\bgo\b|\bgolang\b",
+            "React": r"\breact\b",
+            "React Native": r"react native",
+            "C++": r"c\+\+",
+        }})
+        names = lambda text: {matcher.labels[i][1] for i in matcher.match(text)}
+        assert names("Go, golang") == {"Go"}
+        assert names("google ago goal") == set()
+        assert names("React Native apps") == {"React", "React Native"}
+        assert names("reactive c++") == {"C++"}
+
+    def test_regex_tail_and_invalid_pattern_fallback(self):
+        matcher = TaxonomyMatcher({"skills": {
+            "Java": r"\bjava\b|java\s+\d+",
+            "Broken": r"broken|*x",
+        }})
+        assert matcher.match("JAVA  21") == {matcher.label_id("skills", "Java")}
+        assert matcher.match("javascript 5") == set()
+        assert matcher.match("it is broken") == {matcher.label_id("skills", "Broken")}
+
+    def test_hits_align_with_dataframe_index(self, taxonomy):
+        df = pd.DataFrame({"description": SAMPLE_DESCRIPTIONS},
+                          index=range(100, 100 + len(SAMPLE_DESCRIPTIONS)))
+        hits = TaxonomyHits(df, taxonomy)
+        assert hits.mask("contract", "ico").loc[102]
+        assert hits.mask("contract", "brigada").loc[103]
+        assert not hits.mask("contract", "ico").loc[109]
+        assert hits.count("benefits").loc[100] >= 2
+        assert hits.count("benefits").loc[109] == 0
+        assert get_matcher(taxonomy) is hits.matcher
@@ -0,0 +1,121 @@
+"""
+Tests for the similar-postings vector index and its IntelligenceCore API.
+"""
+
+import pytest
+import sys
+import os
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+import embedding_classifier
+import embedding_store
+from vector_index import VectorIndex
+
+
+def clustered_vectors(n, dim=32, clusters=40, seed=0):
+    rng = np.random.default_rng(seed)
+    centers = rng.normal(size=(clusters, dim))
+    return centers[rng.integers(0, clusters, n)] + 0.3 * rng.normal(size=(n, dim))
+
+
+class TestVectorIndex:
+
+    def test_ivf_recall_against_brute_force(self):
+        vectors = clustered_vectors(5000)
+        index = VectorIndex("test")
+        index.add([f"h{i}" for i in range(4000)], vectors[:4000])
+        index.add([f"h{i}" for i in range(4000, 5000)], vectors[4000:])  # incremental
+        assert len(index.centroids) > 1
+
+        queries = clustered_vectors(50, seed=1)
+        unit = vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+        exact = np.argsort(-(queries @ unit.T), axis=1)[:, :10]
+        found = index.search(queries, k=10)
+        recall = np.mean([
+            len({f"h{i}" for i in truth} & {h for h, _ in hits}) / 10
+            for truth, hits in zip(exact, found)
+        ])
+        assert recall >= 0.9
+        scores = [score for _, score in found[0]]
+        assert scores == sorted(scores, reverse=True)
+
+    def test_remove_and_persist(self, tmp_path):
+        vectors = clustered_vectors(300)
+        index = VectorIndex("model-a")
+        index.add([f"h{i}" for i in range(300)], vectors)
+        assert index.remove(["h0", "h1", "missing"]) == 2
+        assert "h0" not in index and len(index) == 298
+
+        path = tmp_path / "vectors.npz"
+        index.save(path)
+        loaded = VectorIndex.load(path, "model-a")
+        assert len(loaded) == 298
+        assert loaded.search(vectors[5], k=1)[0][0][0] == "h5"
+        # Vectors from another embedding space are not reused
+        assert len(VectorIndex.load(path, "model-b")) == 0
+
+
+class FakeModel:
+    """Bag-of-words 'embeddings' over a tiny vocabulary."""
+
+    VOCAB = ["python", "java", "sklad", "řidič", "účetní", "django", "spring", "vozík"]
+
+    def encode(self, texts, convert_to_numpy=True, show_progress_bar=False):
+        return np.array([[t.lower().count(w) for w in self.VOCAB] + [0.01] for t in texts], dtype=np.float32)
+
+
+class TestSimilarPostings:
+
+    @pytest.fixture
+    def temp_db(self, tmp_path):
+        db_path = str(tmp_path / "test_vector_index.db")
+        import analyzer
+        original_path = analyzer.DB_PATH
+        analyzer.DB_PATH = db_path
+        yield db_path
+        analyzer.DB_PATH = original_path
+
+    @pytest.fixture
+    def fake_embeddings(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("JOBSCZINSIGHT_EMBEDDINGS_DIR", str(tmp_path / "embeddings"))
+        monkeypatch.delenv("JOBSCZINSIGHT_VECTOR_INDEX_PATH", raising=False)
+        monkeypatch.setattr(embedding_store, "_stores", {})
+        monkeypatch.setattr(embedding_classifier, "EMBEDDINGS_AVAILABLE", True)
+        monkeypatch.setattr(embedding_classifier, "_model", FakeModel())
+        monkeypatch.setattr(embedding_classifier, "_loaded", False)
+
+    def test_find_similar_and_cleanup_prunes_index(self, temp_db, fake_embeddings):
+        from analyzer import IntelligenceCore, JobSignal
+        core = IntelligenceCore(read_only=False)
+        postings = [
+            ("Python Developer", "Django, Python backend"),
+            ("Backend Engineer", "Python a Django API"),
+            ("Java Developer", "Spring, Java"),
+            ("Skladník", "Sklad, vozík, řidič VZV"),
+        ]
+        core.add_signals([
+            JobSignal(title=t, company=f"Firma {i}", link=f"https://x/{i}", source="Test", description=d)
+            for i, (t, d) in enumerate(postings)
+        ])
+        core.flush_pending_signals()
+        assert core.update_vector_index() == 4
+        assert core.update_vector_index() == 0  # already indexed
+
+        hashes = dict(core.con.execute("SELECT title, hash FROM signals").fetchall())
+        similar = core.find_similar(hashes["Python Developer"], k=2)
+        assert similar["title"].tolist()[0] == "Backend Engineer"
+        assert hashes["Python Developer"] not in similar["hash"].tolist()
+        assert core.find_similar_text("řidič vozík sklad", k=1)["title"].tolist() == ["Skladník"]
+
+        core.con.execute("UPDATE signals SET last_seen_at = now() - INTERVAL 2 HOUR WHERE title = 'Skladník'")
+        core.cleanup_expired(threshold_minutes=60)
+        assert hashes["Skladník"] not in core.vector_index
+        core.close()
+
+        reopened = IntelligenceCore(read_only=True)
+        assert len(reopened.vector_index) == 3
+        reopened.close()
@@ -0,0 +1,56 @@
+"""
+Tests for the skill counts and co-occurrence behind trends.html (visualizer).
+"""
+
+import duckdb
+import pandas as pd
+import pytest
+import sys
+import os
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import visualizer
+
+DESCRIPTIONS = [
+    "Python and SQL developer, PostgreSQL experience.",
+    "Java developer with SQL and Docker.",
+    "Python, Docker and Kubernetes.",
+    "Účetní, žádné technologie.",
+    None,
+]
+
+
+@pytest.fixture
+def conn():
+    con = duckdb.connect()
+    con.register("frame", pd.DataFrame({"description": DESCRIPTIONS}))
+    con.execute("CREATE TABLE signals_text AS SELECT * FROM frame")
+    yield con
+    con.close()
+
+
+def test_cooccurrence_matches_per_skill_queries(conn):
+    matrix = visualizer.skill_cooccurrence(conn, batch_size=2)
+    assert list(matrix.index) == list(matrix.columns)
+    assert (matrix.to_numpy() == matrix.to_numpy().T).all()
+
+    # The diagonal is what the former one-query-per-skill loop counted
+    for name, pattern in visualizer.SKILL_PATTERNS.items():
+        expected = conn.execute("SELECT COUNT(*) FROM signals_text WHERE regexp_matches(lower(description), ?)",
+                                [pattern]).fetchone()[0]
+        assert matrix.at[name, name] == expected, name
+
+    assert matrix.at["Python", "SQL"] == 1
+    assert matrix.at["Docker", "Python"] == 1
+    assert matrix.at["Java", "Python"] == 0
+
+
+def test_top_pairs(conn):
+    matrix = visualizer.skill_cooccurrence(conn)
+    pairs = visualizer.top_pairs(matrix, ["Python", "SQL", "Docker", "Java"])
+    assert {p["pair"] for p in pairs} == {"Python + SQL", "Python + Docker", "SQL + Docker", "Docker + Java",
+                                           "SQL + Java"}
+    assert all(p["count"] == 1 for p in pairs)
+    assert next(p for p in pairs if p["pair"] == "SQL + Java")["share"] == 1.0
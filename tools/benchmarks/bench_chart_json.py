@@ -0,0 +1,103 @@
+"""
+Benchmark: dashboard chart serialization, before and after.
+
+Before: clean_json called fig.to_dict() (a deep copy that base64-encodes
+arrays), walked the result in Python with _deep_convert and json.dumps'd
+it, and the salary box plot carried every salary of the top roles. After:
+clean_json json.dumps the traces and layout directly, converting numpy
+arrays as the encoder meets them, and the box plot ships per-role
+quartiles and whiskers.
+
+For each chart of the dashboard this reports serialization time and JSON
+bytes before and after (the template used to embed each chart twice, for
+.data and .layout; the byte columns count one copy).
+
+Usage:
+    python tools/benchmarks/bench_chart_json.py [n_signals ...]
+"""
+import json
+import os
+import sys
+import time
+from types import SimpleNamespace
+
+import numpy as np
+import plotly.express as px
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from synthetic import generate_frame  # noqa: E402
+
+import generate_report  # noqa: E402
+
+REPEATS = 5
+
+
+def _deep_convert(obj):
+    """The former recursive converter, kept here as the baseline."""
+    if hasattr(obj, 'tolist'):
+        return obj.tolist()
+    elif isinstance(obj, dict):
+        return {k: _deep_convert(v) for k, v in obj.items()}
+    elif isinstance(obj, (list, tuple)):
+        return [_deep_convert(item) for item in obj]
+    elif isinstance(obj, (np.integer, np.floating)):
+        return float(obj) if isinstance(obj, np.floating) else int(obj)
+    return obj
+
+
+def legacy_clean_json(fig):
+    return json.dumps(_deep_convert(fig.to_dict()))
+
+
+def legacy_box_plot(inputs):
+    """The box plot as px.box over every salary of the top roles."""
+    valid_salaries = inputs.valid_salaries
+    top_roles_list = [r for r in inputs.role_counts.head(11).index.tolist() if r != 'Other'][:10]
+    box_df = valid_salaries[(valid_salaries['role_type'].isin(top_roles_list)) &
+                            (valid_salaries['avg_salary'] <= generate_report.SALARY_CAP)].copy()
+    return px.box(box_df, x='role_type', y='avg_salary', color='role_type', points=False,
+                  color_discrete_sequence=px.colors.qualitative.Prism)
+
+
+def _figures(inputs, build):
+    """Figures a build function serializes, captured instead of encoded."""
+    captured = []
+    original = generate_report.clean_json
+    generate_report.clean_json = lambda fig: captured.append(fig) or ''
+    try:
+        build(inputs)
+    finally:
+        generate_report.clean_json = original
+    return captured[0]
+
+
+def _timed(serialize, fig):
+    start = time.perf_counter()
+    for _ in range(REPEATS):
+        text = serialize(fig)
+    return (time.perf_counter() - start) / REPEATS * 1000, len(text.encode('utf-8'))
+
+
+def main():
+    sizes = [int(a) for a in sys.argv[1:]] or [5_000, 50_000]
+    for n in sizes:
+        frame = generate_frame(n)
+        valid = frame[frame['avg_salary'] > 0]
+        inputs = SimpleNamespace(df=frame, valid_salaries=valid, role_counts=frame['role_type'].value_counts(),
+                                 intel=SimpleNamespace(unique_df=frame), city_normalized=frame['city'])
+        charts = {
+            'salary_box_plot': (legacy_box_plot(inputs), _figures(inputs, generate_report.build_salary_box_plot)),
+            'seniority_pie': (None, _figures(inputs, generate_report.build_seniority_pie)),
+            'top_companies': (None, _figures(inputs, generate_report.build_top_companies)),
+            'city_treemap': (None, _figures(inputs, generate_report.build_city_treemap)),
+        }
+        print(f"\n{n:,} signals")
+        print(f"{'chart':<17}{'before ms':>10}{'before KB':>11}{'after ms':>10}{'after KB':>10}")
+        for name, (before_fig, after_fig) in charts.items():
+            before_ms, before_bytes = _timed(legacy_clean_json, before_fig if before_fig is not None else after_fig)
+            after_ms, after_bytes = _timed(generate_report.clean_json, after_fig)
+            print(f"{name:<17}{before_ms:10.2f}{before_bytes / 1024:11.1f}{after_ms:10.2f}{after_bytes / 1024:10.1f}")
+
+
+if __name__ == "__main__":
+    main()
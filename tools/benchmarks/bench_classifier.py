@@ -0,0 +1,63 @@
+"""
+Benchmark: keyword role classification throughput (jobs/sec).
+
+Classifies synthetic signals (real exported titles with generated
+descriptions) with JobClassifier._classify_role_keywords, title-only and
+with the description, which is the per-signal cost paid by add_signal and
+reanalyze_all before any embedding fallback. The last rows run the
+memoized classify_role + detect_seniority pair through the
+ClassificationCache: cold (re-posts keep their first title, as re-posted
+ads do) and warm (the next run re-classifying still-listed ads).
+
+Usage:
+    python tools/benchmarks/bench_classifier.py [n_signals]
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from synthetic import generate_frame  # noqa: E402
+
+from classifiers import ClassificationCache, JobClassifier  # noqa: E402
+
+
+def _rate(pairs) -> float:
+    classify = JobClassifier._classify_role_keywords
+    best = float("inf")
+    for _ in range(3):
+        start = time.perf_counter()
+        for title, description in pairs:
+            classify(title, description)
+        best = min(best, time.perf_counter() - start)
+    return len(pairs) / best
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    frame = generate_frame(n)
+    titles = frame["title"].tolist()
+    with_description = list(zip(titles, frame["description"].tolist()))
+    title_only = [(t, "") for t in titles]
+
+    print(f"Signals: {n}")
+    print(f"{'input':24}{'jobs/sec':>12}")
+    print(f"{'title only':24}{_rate(title_only):12,.0f}")
+    print(f"{'title + description':24}{_rate(with_description):12,.0f}")
+
+    first_title = {}
+    reposted = [(first_title.setdefault(d, t), d) for t, d in with_description]
+    JobClassifier.cache = ClassificationCache(maxsize=2 * n)  # role + seniority entries
+    for label in ("cached, cold", "cached, warm"):
+        JobClassifier.cache.hits = JobClassifier.cache.misses = 0
+        start = time.perf_counter()
+        for title, description in reposted:
+            JobClassifier.classify_role(title, description)
+            JobClassifier.detect_seniority(title, description)
+        elapsed = time.perf_counter() - start
+        hit_rate = JobClassifier.cache.stats()["hit_rate"]
+        print(f"{label + ' role+seniority':24}{n / elapsed:12,.0f}   hit rate {hit_rate:.1%}")
+
+
+if __name__ == "__main__":
+    main()
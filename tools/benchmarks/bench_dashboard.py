@@ -0,0 +1,102 @@
+"""
+Benchmark: Streamlit dashboard cold start and rerun, before and after.
+
+Before: app.py cached a whole MarketIntelligence with st.cache_resource and
+then, on every rerun, ran get_language_barrier (a row-wise apply),
+get_remote_truth and one str.contains scan per benefit. After: each widget
+reads one dashboard_data query, cached with st.cache_data per
+dashboard_data.data_version(), so a rerun only stats the data files.
+
+Against a synthetic database in the state a scrape leaves behind (locations
+resolved, rollups refreshed, snapshot published) this reports:
+
+- before/after cold start (load + every widget's data) and rerun
+  (widget data with the load cached);
+- the current app.py end to end through streamlit's AppTest, cold and rerun.
+
+Usage:
+    python tools/benchmarks/bench_dashboard.py [n_signals]
+"""
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from synthetic import ROOT, build_db, generate_frame  # noqa: E402
+
+QUERIES = ["kpis", "city_volume", "regional", "benefit_saturation", "contract_split", "market_vibe"]
+
+
+def legacy_widgets(intel):
+    """Per-rerun work of the former app.py, kept here as the baseline."""
+    df = intel.df
+    valid = df[df['avg_salary'] > 0]
+    values = [len(df), valid['avg_salary'].median(), intel.get_language_barrier()['English Friendly'],
+              intel.get_remote_truth()['True Remote'], intel.get_contract_split()['HPP']]
+    values.append(df['resolved_city'].value_counts().head(10))
+    values += [intel.get_regional_stats(), intel.get_regional_trends()]
+    for benefit in ['multisport', 'sick day', 'flexibil', 'home office', 'akademie', 'stravenk']:
+        values.append(df['description'].fillna('').str.lower().str.contains(benefit, regex=False).sum())
+    values += [intel.get_contract_split(), intel.get_market_vibe()]
+    return values
+
+
+def _timed(func):
+    start = time.perf_counter()
+    result = func()
+    return time.perf_counter() - start, result
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    tmp = tempfile.mkdtemp(prefix="bench_dashboard_")
+    os.environ.update(
+        JOBSCZINSIGHT_DB_PATH=os.path.join(tmp, "intelligence.db"),
+        JOBSCZINSIGHT_SNAPSHOT_PATH=os.path.join(tmp, "signals.parquet"),
+        JOBSCZINSIGHT_OBSERVATIONS_DIR=os.path.join(tmp, "observations"),
+    )
+    print(f"building {n:,} signals in {tmp} ...")
+    build_db(os.environ["JOBSCZINSIGHT_DB_PATH"], generate_frame(n))
+
+    import analyzer
+    import dashboard_data
+    import snapshot
+
+    # What the scraper does after a run
+    core = analyzer.IntelligenceCore(read_only=False)
+    core.resolve_locations()
+    core.refresh_rollups()
+    snapshot.publish_from_core(core)
+    core.close()
+
+    load_time, intel = _timed(analyzer.MarketIntelligence)
+    widgets_time, _ = _timed(lambda: legacy_widgets(intel))
+
+    def after_cold():
+        version = dashboard_data.data_version()
+        results = {}
+        for name in QUERIES:
+            with dashboard_data.connect() as con:
+                results[(name, version)] = getattr(dashboard_data, name)(con)
+        return results
+
+    cold_time, cache = _timed(after_cold)
+    rerun_time, _ = _timed(lambda: [cache[(name, dashboard_data.data_version())] for name in QUERIES])
+
+    print(f"\n{'':<26}{'cold s':>9}{'rerun s':>10}")
+    print(f"{'before (MarketIntelligence)':<26}{load_time + widgets_time:9.2f}{widgets_time:10.2f}")
+    print(f"{'after (cached queries)':<26}{cold_time:9.2f}{rerun_time:10.4f}")
+
+    from streamlit import logger as streamlit_logger
+    from streamlit.testing.v1 import AppTest
+    streamlit_logger.set_log_level("error")
+    app = AppTest.from_file(str(ROOT / "app.py"), default_timeout=600)
+    app_cold, _ = _timed(app.run)
+    app_rerun, _ = _timed(app.run)
+    assert not app.exception, app.exception
+    print(f"{'app.py via AppTest':<26}{app_cold:9.2f}{app_rerun:10.4f}")
+
+
+if __name__ == "__main__":
+    main()
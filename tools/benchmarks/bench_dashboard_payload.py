@@ -0,0 +1,138 @@
+"""
+Benchmark: dashboard filter data, inline rows vs the pre-aggregated cube.
+
+Before: generate_report inlined one JSON object per signal as RAW_DATA in
+public/index.html, and every filter change scanned those rows and sorted
+their salaries for the medians. After: report/filter_payload.py writes a
+cube of (role, seniority, city, contract) cells with salary histograms to a
+lazy asset (data/filters.json.gz), and a filter change sums cells.
+
+For each corpus size this reports:
+
+- payload: the inline row JSON (raw and gzip) against the cube asset (gzip)
+  and its cell count, which stays flat as the corpus grows
+- per-filter time: Node running a row scan + sort median over RAW_DATA
+  (the old applyFilters) against getFilteredCells + sumHistograms +
+  cubeQuantile from the dashboard template, averaged over role x city
+  selections; the cube answers are checked against query_filter_payload
+
+Node is optional; without it only sizes are reported.
+
+Usage:
+    python tools/benchmarks/bench_dashboard_payload.py [n_signals ...]
+"""
+import gzip
+import json
+import os
+import random
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from synthetic import ROOT, generate_frame  # noqa: E402
+
+from report.filter_payload import _decode_array, encode_filter_payload, query_filter_payload  # noqa: E402
+
+EXPORT_COLUMNS = ['role_type', 'seniority_level', 'avg_salary', 'company', 'contract_type', 'city']
+
+NODE_SCRIPT = r"""
+const fs = require('fs');
+const vm = require('vm');
+const zlib = require('zlib');
+const [inlinePath, assetPath, cubePath, selectionsPath] = process.argv.slice(2);
+const selections = JSON.parse(fs.readFileSync(selectionsPath, 'utf8'));
+
+function rowMedian(values) {
+    if (!values.length) return 0;
+    const sorted = values.slice().sort((a, b) => a - b);
+    const mid = Math.floor(sorted.length / 2);
+    return sorted.length % 2 ? sorted[mid] : (sorted[mid - 1] + sorted[mid]) / 2;
+}
+
+const RAW_DATA = JSON.parse(fs.readFileSync(inlinePath, 'utf8'));
+let start = process.hrtime.bigint();
+for (const s of selections) {
+    const rows = RAW_DATA.filter(d => (!s.role_type || d.role_type === s.role_type) && (!s.city || d.city === s.city));
+    rowMedian(rows.map(d => d.avg_salary).filter(v => v > 0));
+}
+const rowMs = Number(process.hrtime.bigint() - start) / 1e6 / selections.length;
+
+vm.runInThisContext(fs.readFileSync(cubePath, 'utf8'));
+globalThis.CUBE = decodeCube(JSON.parse(zlib.gunzipSync(fs.readFileSync(assetPath)).toString('utf8')));
+const answers = [];
+start = process.hrtime.bigint();
+for (const s of selections) {
+    const cells = getFilteredCells(s);
+    let jobs = 0;
+    cells.forEach(c => { jobs += CUBE.counts[c]; });
+    answers.push({jobs, median: cubeQuantile(sumHistograms(cells), 0.5)});
+}
+const cubeMs = Number(process.hrtime.bigint() - start) / 1e6 / selections.length;
+console.log(JSON.stringify({rowMs, cubeMs, answers}));
+"""
+
+
+def _cube_source() -> str:
+    """The cube helpers and getFilteredCells exactly as the dashboard template defines them."""
+    with open(os.path.join(ROOT, 'templates', 'executive_dashboard.html'), encoding='utf-8') as f:
+        template = f.read()
+    helpers = re.search(r"(const TYPED_ARRAYS.*?)\n\s*async function fetchFilterData", template, re.S).group(1)
+    cells = re.search(r"(function getFilteredCells.*?\n        })\n", template, re.S).group(1)
+    return f"{helpers}\n{cells}\n"
+
+
+def _export_frame(n: int):
+    frame = generate_frame(n)
+    rng = random.Random(7)
+    frame['contract_type'] = [rng.choice(['HPP', 'HPP', 'HPP', 'IČO', 'Brigáda']) for _ in range(n)]
+    return frame[EXPORT_COLUMNS]
+
+
+def _selections(frame, limit: int = 40):
+    roles = [''] + frame['role_type'].dropna().value_counts().index[:4].tolist()
+    cities = [''] + frame['city'].dropna().value_counts().index[:7].tolist()
+    return [{'role_type': r, 'city': c} for r in roles for c in cities][:limit]
+
+
+def main():
+    sizes = [int(a) for a in sys.argv[1:]] or [5_000, 20_000, 100_000]
+    node = shutil.which('node')
+    print(f"{'signals':>8}{'inline KB':>11}{'inline gz':>11}{'cube gz':>9}{'cells':>7}"
+          f"{'rows ms/filter':>16}{'cube ms/filter':>16}")
+    for n in sizes:
+        frame = _export_frame(n)
+        inline = json.dumps(frame.fillna('').to_dict(orient='records'), default=str)
+        payload = encode_filter_payload(frame)
+        body = json.dumps(payload, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+        asset = gzip.compress(body, compresslevel=9, mtime=0)
+        inline_gz = len(gzip.compress(inline.encode('utf-8')))
+        selections = _selections(frame)
+
+        row_ms = cube_ms = float('nan')
+        if node:
+            with tempfile.TemporaryDirectory() as tmp:
+                paths = [os.path.join(tmp, name)
+                         for name in ('rows.json', 'filters.json.gz', 'cube.js', 'selections.json', 'bench.js')]
+                contents = [inline.encode('utf-8'), asset, _cube_source().encode('utf-8'),
+                            json.dumps(selections).encode('utf-8'), NODE_SCRIPT.encode('utf-8')]
+                for path, content in zip(paths, contents):
+                    with open(path, 'wb') as f:
+                        f.write(content)
+                out = json.loads(subprocess.check_output([node, paths[4], *paths[:4]]))
+            row_ms, cube_ms = out['rowMs'], out['cubeMs']
+            for selection, answer in zip(selections, out['answers']):
+                expected = query_filter_payload(payload, **selection)
+                assert answer['jobs'] == expected['jobs'], selection
+                assert abs(answer['median'] - (expected['median_salary'] or 0)) < 1e-6, selection
+
+        cells = len(_decode_array(payload['cells']['count']))
+        print(f"{n:8,}{len(inline) / 1024:11,.0f}{inline_gz / 1024:11,.0f}{len(asset) / 1024:9,.0f}{cells:7,}"
+              f"{row_ms:16.2f}{cube_ms:16.2f}")
+    print("inline = rows the page used to carry in index.html; cube = data/filters.json.gz fetched on first filter use.")
+
+
+if __name__ == "__main__":
+    main()
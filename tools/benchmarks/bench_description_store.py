@@ -0,0 +1,94 @@
+"""
+Benchmark: inline description columns vs the content-addressed description store.
+
+Builds the same synthetic market twice - once with description/benefits inline
+on signals (pre-v1.6 layout) and once migrated into the descriptions table - and
+reports file size (what Git LFS uploads for each weekly DB commit), and the cost
+of a full text scan and of loading the analytics DataFrame.
+
+Usage:
+    python tools/benchmarks/bench_description_store.py [n_signals] [repost_rate]
+"""
+import os
+import sys
+import tempfile
+import time
+
+import duckdb
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from synthetic import build_db, generate_frame  # noqa: E402
+
+LEGACY_SCHEMA = """
+    CREATE TABLE signals (
+        hash TEXT PRIMARY KEY, title TEXT, company TEXT, salary_raw TEXT,
+        avg_salary DOUBLE, description TEXT, benefits TEXT, link TEXT, source TEXT,
+        city TEXT, scraped_at TIMESTAMP, toxicity_score INTEGER, tech_status TEXT,
+        last_seen_at TIMESTAMP, role_type TEXT, seniority_level TEXT,
+        ghost_score INTEGER, region TEXT
+    )
+"""
+
+SCAN_SQL = "SELECT COUNT(*) FROM {table} WHERE regexp_matches(lower(description), '\\bpython\\b')"
+
+
+def _timed(fn, repeat: int = 3) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def _size_mb(path: str) -> float:
+    return os.path.getsize(path) / (1024 * 1024)
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 50_000
+    repost_rate = float(sys.argv[2]) if len(sys.argv) > 2 else 0.3
+    tmp = tempfile.mkdtemp(prefix="bench_texts_")
+    inline_path = os.path.join(tmp, "inline.db")
+    store_path = os.path.join(tmp, "store.db")
+
+    print(f"Generating {n} synthetic signals (repost rate {repost_rate:.0%})...")
+    frame = generate_frame(n, repost_rate=repost_rate)
+
+    con = duckdb.connect(inline_path)
+    con.execute(LEGACY_SCHEMA)
+    con.execute("INSERT INTO signals BY NAME SELECT * FROM frame")
+    con.execute("CHECKPOINT")
+    inline_scan = _timed(lambda: con.execute(SCAN_SQL.format(table="signals")).fetchone())
+    inline_load = _timed(lambda: con.execute("SELECT * FROM signals").df(), repeat=1)
+    con.close()
+
+    start = time.perf_counter()
+    build_db(store_path, frame)
+    build_time = time.perf_counter() - start
+
+    import analyzer
+    analyzer.DB_PATH = store_path
+    core = analyzer.IntelligenceCore(read_only=False)
+    core.vacuum_database()
+    core.con.execute("CHECKPOINT")
+    distinct = core.con.execute("SELECT COUNT(*) FROM descriptions").fetchone()[0]
+    store_scan = _timed(lambda: core.con.execute(SCAN_SQL.format(table="signals_text")).fetchone())
+    store_load = _timed(lambda: core.load_as_df(), repeat=1)
+    narrow_load = _timed(lambda: core.load_as_df(include_text=False), repeat=1)
+    core.close()
+
+    inline_mb, store_mb = _size_mb(inline_path), _size_mb(store_path)
+    print(f"\nSignals: {n}  distinct texts stored: {distinct}  (codec: {analyzer.settings.get_text_codec()})")
+    print(f"{'':28}{'inline':>12}{'store':>12}")
+    print(f"{'DB file / LFS upload (MB)':28}{inline_mb:12.1f}{store_mb:12.1f}   ({1 - store_mb / inline_mb:.0%} smaller)")
+    print(f"{'regex text scan (s)':28}{inline_scan:12.3f}{store_scan:12.3f}")
+    print(f"{'full df load (s)':28}{inline_load:12.3f}{store_load:12.3f}")
+    print(f"{'df load without text (s)':28}{'-':>12}{narrow_load:12.3f}")
+    if analyzer.settings.get_text_codec() == "zstd":
+        print("(zstd texts are not visible to SQL, so the store scan above only covers raw rows)")
+    print(f"\nMigration of {n} inline rows (build + migrate): {build_time:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""
+Benchmark + agreement report: fp32 PyTorch vs int8 ONNX embedding backends.
+
+Embeds every title in current_classifications.txt the way classify_role does
+("{title} {title} {description[:500]}", no description here) with both
+backends. Each backend uses its own exemplar embeddings. The report covers:
+
+- agreement: the share of titles that get the same embedding role from both
+  backends (the bar for making onnx-int8 selectable is >= 99%)
+- docs/sec: encode throughput of each backend on this machine
+
+Until a run meets that bar, embedding_classifier.BACKEND stays "torch".
+
+Nothing is read from or written to the embedding store; the int8 export is
+created under settings.get_models_dir() on first run.
+
+Usage:
+    python tools/benchmarks/bench_embedding_backends.py [threads]
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from synthetic import load_titles  # noqa: E402
+
+import embedding_classifier as ec  # noqa: E402
+
+AGREEMENT_TARGET = 0.99
+
+
+def _run(model, texts):
+    exemplars = {role: model.encode(' '.join(text.split()), convert_to_numpy=True)
+                 for role, text in ec.ROLE_EXEMPLARS.items()}
+    labels, matrix = ec.stack_exemplars(exemplars)
+    model.encode(texts[:64], convert_to_numpy=True)  # warm-up
+    start = time.perf_counter()
+    embeddings = model.encode(texts, convert_to_numpy=True, batch_size=64)
+    elapsed = time.perf_counter() - start
+    return ec.best_matches(ec.similarity_matrix(embeddings, matrix), labels, ec.SIMILARITY_THRESHOLD, "Other"), elapsed
+
+
+def main():
+    if len(sys.argv) > 1:
+        os.environ["JOBSCZINSIGHT_EMBEDDING_THREADS"] = sys.argv[1]
+    titles = load_titles()
+    texts = [f"{t} {t} " for t in titles]
+    print(f"Titles: {len(titles)} (current_classifications.txt)")
+
+    from sentence_transformers import SentenceTransformer
+    fp32_roles, fp32_time = _run(SentenceTransformer(ec.MODEL_NAME, device="cpu"), texts)
+    int8_roles, int8_time = _run(ec._load_onnx_int8_model(), texts)
+
+    agree = sum(a == b for a, b in zip(fp32_roles, int8_roles)) / len(titles)
+    print(f"{'backend':14}{'time (s)':>10}{'docs/sec':>12}")
+    print(f"{'torch fp32':14}{fp32_time:10.2f}{len(texts) / fp32_time:12,.0f}")
+    print(f"{'onnx int8':14}{int8_time:10.2f}{len(texts) / int8_time:12,.0f}")
+    print(f"speedup: {fp32_time / int8_time:.2f}x")
+    print(f"agreement: {agree:.2%} ({'OK' if agree >= AGREEMENT_TARGET else 'BELOW'} target {AGREEMENT_TARGET:.0%})")
+
+    disagreements = [(t, a, b) for t, a, b in zip(titles, fp32_roles, int8_roles) if a != b]
+    for title, a, b in disagreements[:20]:
+        print(f"  {title[:60]:60} fp32={a:14} int8={b}")
+
+
+if __name__ == "__main__":
+    main()
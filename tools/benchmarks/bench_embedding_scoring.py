@@ -0,0 +1,67 @@
+"""
+Benchmark: per-role cosine loop vs matrix scoring of job embeddings.
+
+The loop column is what classify_roles_batch did before: a dict
+comprehension calling cosine_similarity once per (job, role), then max() and
+the threshold per job. The matrix column is similarity_matrix + best_matches
+over the stacked, pre-normalized exemplars. Scoring only; encoding is not
+timed. Embeddings are synthetic (exemplar + noise, so both sides of the
+threshold occur) and the two methods' labels are checked to agree.
+
+Usage:
+    python tools/benchmarks/bench_embedding_scoring.py [n_jobs ...]
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import synthetic  # noqa: E402,F401  (puts the repo root on sys.path)
+
+import numpy as np  # noqa: E402
+
+from embedding_classifier import (  # noqa: E402
+    ROLE_EXEMPLARS, SIMILARITY_THRESHOLD, best_matches, cosine_similarity, similarity_matrix, stack_exemplars,
+)
+
+DIMS = 384
+
+
+def _loop(embeddings, role_embeddings):
+    results = []
+    for text_embedding in embeddings:
+        similarities = {role: cosine_similarity(text_embedding, role_emb) for role, role_emb in role_embeddings.items()}
+        best_role = max(similarities, key=similarities.get)
+        results.append("Other" if similarities[best_role] < SIMILARITY_THRESHOLD else best_role)
+    return results
+
+
+def main():
+    sizes = [int(a) for a in sys.argv[1:]] or [1_000, 10_000, 100_000]
+    rng = np.random.default_rng(0)
+    role_embeddings = {role: rng.standard_normal(DIMS).astype(np.float32) for role in ROLE_EXEMPLARS}
+    exemplars = np.stack(list(role_embeddings.values()))
+
+    print(f"Roles: {len(role_embeddings)}  dims: {DIMS}")
+    print(f"{'jobs':>8}{'loop (s)':>12}{'matrix (s)':>12}{'jobs/s loop':>14}{'jobs/s matrix':>16}{'speedup':>9}")
+    for n in sizes:
+        picks = rng.integers(0, len(exemplars), n)
+        embeddings = exemplars[picks] + rng.standard_normal((n, DIMS)).astype(np.float32) * 2.3
+
+        start = time.perf_counter()
+        expected = _loop(embeddings, role_embeddings)
+        loop = time.perf_counter() - start
+
+        start = time.perf_counter()
+        labels, matrix = stack_exemplars(role_embeddings)
+        got = best_matches(similarity_matrix(embeddings, matrix), labels, SIMILARITY_THRESHOLD, "Other")
+        vectorized = time.perf_counter() - start
+
+        mismatched = sum(a != b for a, b in zip(expected, got))
+        assert mismatched <= n // 10_000, f"{mismatched} labels differ"
+        print(f"{n:8d}{loop:12.3f}{vectorized:12.4f}{n / loop:14,.0f}{n / vectorized:16,.0f}{loop / vectorized:8.0f}x"
+              f"   other: {got.count('Other') / n:.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""
+Benchmark: embedding a reanalyze-sized batch cold vs from the embedding store.
+
+Builds the text classify_roles_batch encodes ("{title} {title} {desc[:500]}")
+for synthetic signals and embeds them through an EmbeddingStore in a temp
+dir: cold (every text goes to the model and is stored) and warm (a fresh
+store instance, as in the next run over an unchanged DB). The cold pass uses
+the real model when it can be loaded; otherwise random 384-d vectors stand in
+and only the store overhead is measured.
+
+Usage:
+    python tools/benchmarks/bench_embedding_store.py [n_signals]
+"""
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from synthetic import generate_frame  # noqa: E402
+
+import numpy as np  # noqa: E402
+
+import embedding_classifier  # noqa: E402
+from embedding_store import EmbeddingStore  # noqa: E402
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    frame = generate_frame(n)
+    texts = [f"{t} {t} {d[:500]}" for t, d in zip(frame["title"], frame["description"])]
+
+    if embedding_classifier._load_model():
+        encoder = "model"
+        encode = lambda batch: embedding_classifier._model.encode(batch, convert_to_numpy=True)
+    else:
+        encoder = "random vectors (model unavailable)"
+        rng = np.random.default_rng(0)
+        encode = lambda batch: rng.standard_normal((len(batch), 384)).astype(np.float32)
+
+    print(f"Texts: {n}  distinct: {len(set(texts))}  encoder: {encoder}")
+    print(f"{'pass':26}{'time (s)':>10}{'us/text':>10}")
+    with tempfile.TemporaryDirectory() as root:
+        start = time.perf_counter()
+        cold = EmbeddingStore(embedding_classifier.MODEL_NAME, root).get_many(texts, encode)
+        elapsed = time.perf_counter() - start
+        print(f"{'cold (encode + store)':26}{elapsed:10.2f}{elapsed / n * 1e6:10.1f}")
+
+        start = time.perf_counter()
+        warm = EmbeddingStore(embedding_classifier.MODEL_NAME, root).get_many(texts, encode)
+        elapsed = time.perf_counter() - start
+        print(f"{'warm (reopen + lookup)':26}{elapsed:10.2f}{elapsed / n * 1e6:10.1f}")
+
+        size = sum(os.path.getsize(os.path.join(root, f)) for f in os.listdir(root))
+        err = float(np.abs(cold - warm).max())
+        print(f"store size: {size / 2**20:.1f} MB  max |cold - warm|: {err:.2g}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""
+Benchmark: gazetteer lookups and location coverage.
+
+Throughput: location fields through the gazetteer trie vs
+LocationNormalizer.normalize (three hub regexes), and job-card text through
+Gazetteer.find vs the former extract_city fallback, which built a regex per
+city per card.
+
+Coverage: share of signals whose stored city resolves to a municipality, a
+district or only a kraj, plus the most common unresolved values. Reads the
+database at settings.get_db_path() (or --db); when that is not a usable
+DuckDB file (e.g. an un-fetched LFS pointer) a synthetic frame stands in.
+
+Usage:
+    python tools/benchmarks/bench_gazetteer.py [--db PATH] [--lookups N]
+"""
+import os
+import random
+import re
+import sys
+import time
+from collections import Counter
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from synthetic import generate_frame  # noqa: E402
+
+from settings import settings  # noqa: E402
+from tools.gazetteer import Gazetteer  # noqa: E402
+from tools.location_normalizer import LocationNormalizer  # noqa: E402
+
+# The former config/selectors.yaml common.fallback_cities
+LEGACY_FALLBACK_CITIES = ["praha", "brno", "ostrava", "plzeň", "liberec", "olomouc", "hradec králové",
+                          "české budějovice", "pardubice", "zlín", "havířov", "kladno", "most", "opava",
+                          "karviná"]
+
+LOCATIONS = ["Praha", "Praha 4 - Smíchov", "Prague, Czech Republic", "Hlavní město Praha", "Brno-město",
+             "Brno-venkov", "Ostrava, Moravskoslezský kraj", "Plzen, CZ", "Usti nad Labem",
+             "Nový Jičín", "Mladá Boleslav", "Praha-východ", "Jihomoravský kraj", "CZ", "Remote",
+             "Dolní Lhota"]
+
+CARD_TEXTS = ["Senior Java Developer\nAcme s.r.o.\nHradec Králové\n60 000 - 80 000 Kč",
+              "Účetní\nFirma a.s.\nPlzeň - Doubravka\nHPP",
+              "QA Engineer\nRemote first, the most flexible team\nDohodou",
+              "Skladník\nLogistika CZ\nČeské Budějovice 2\n35 000 Kč"]
+
+
+def legacy_card_city(card_text):
+    """The former extract_city text fallback, kept here as the baseline."""
+    card_text = card_text.lower()
+    for city in LEGACY_FALLBACK_CITIES:
+        pattern = r'\b' + re.escape(city.lower()) + r'\b'
+        if re.search(pattern, card_text):
+            return city.title()
+    return "CZ"
+
+
+def _rate(func, items):
+    start = time.perf_counter()
+    for item in items:
+        func(item)
+    return len(items) / (time.perf_counter() - start)
+
+
+def load_cities(db_path):
+    """Stored city of every signal, and where it came from."""
+    try:
+        import duckdb
+        con = duckdb.connect(str(db_path), read_only=True)
+        try:
+            cities = [row[0] for row in con.execute("SELECT city FROM signals").fetchall()]
+        finally:
+            con.close()
+        return cities, str(db_path)
+    except Exception as e:
+        print(f"(no usable database at {db_path}: {type(e).__name__}; using synthetic signals)")
+        return generate_frame(20_000)['city'].tolist(), "synthetic frame"
+
+
+def main():
+    args = sys.argv[1:]
+    db_path = args[args.index('--db') + 1] if '--db' in args else settings.get_db_path()
+    n = int(args[args.index('--lookups') + 1]) if '--lookups' in args else 100_000
+
+    build_start = time.perf_counter()
+    gazetteer = Gazetteer()
+    build_ms = (time.perf_counter() - build_start) * 1000
+    normalizer = LocationNormalizer()
+    rng = random.Random(0)
+    locations = [rng.choice(LOCATIONS) for _ in range(n)]
+    cards = [rng.choice(CARD_TEXTS) for _ in range(n // 10)]
+
+    print(f"trie built in {build_ms:.1f} ms ({len(gazetteer.municipalities)} municipalities)")
+    print(f"{'path':<34}{'per second':>14}")
+    print(f"{'normalize (hub regexes)':<34}{_rate(normalizer.normalize, locations):14,.0f}")
+    print(f"{'Gazetteer.lookup':<34}{_rate(gazetteer.lookup, locations):14,.0f}")
+    print(f"{'card text, regex per city':<34}{_rate(legacy_card_city, cards):14,.0f}")
+    print(f"{'card text, Gazetteer.find':<34}{_rate(gazetteer.find, cards):14,.0f}")
+
+    cities, origin = load_cities(db_path)
+    counts = Counter(city or "" for city in cities)
+    kinds, unresolved = Counter(), Counter()
+    for city, count in counts.items():
+        place = gazetteer.lookup(city)
+        kinds[place.kind if place else "unresolved"] += count
+        if place is None:
+            unresolved[city] += count
+    total = sum(counts.values()) or 1
+    print(f"\ncoverage over {sum(counts.values()):,} signals ({origin}, {len(counts):,} distinct cities)")
+    for kind in ["municipality", "district", "kraj", "unresolved"]:
+        print(f"  {kind:<14}{kinds[kind]:>9,}{kinds[kind] / total:>8.1%}")
+    print("  top unresolved: " + ", ".join(f"{city or '<empty>'!r} ({count:,})"
+                                          for city, count in unresolved.most_common(10)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""
+Benchmark: import time and peak RSS of each entry point.
+
+Every entry point is imported in a fresh interpreter, which is what a scrape
+run, a report build, the Streamlit app or a test session pays before doing any
+work. app.py does its work at import, so its row imports only the modules
+it depends on. The last row forces the embedding
+model load afterwards, to show what is now deferred to the first embedding
+fallback.
+
+Usage:
+    python tools/benchmarks/bench_import.py [repeats]
+"""
+import json
+import os
+import subprocess
+import sys
+
+from synthetic import ROOT
+
+ENTRY_POINTS = [
+    ("classifiers", "import classifiers"),
+    ("analyzer", "import analyzer"),
+    ("scraper", "import scraper"),
+    ("generate_report", "import generate_report"),
+    ("app (imports)", "import streamlit, altair, analyzer"),
+    ("classifiers + model load", "import classifiers, embedding_classifier; embedding_classifier.ensure_loaded()"),
+]
+
+PROBE = """
+import json, resource, time
+start = time.perf_counter()
+{statement}
+elapsed = time.perf_counter() - start
+print(json.dumps([elapsed, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024]))
+"""
+
+
+def _measure(statement: str):
+    code = PROBE.format(statement=statement)
+    env = dict(os.environ, PYTHONPATH=ROOT)
+    out = subprocess.run([sys.executable, "-c", code], cwd=ROOT, env=env,
+                         capture_output=True, text=True, check=True).stdout
+    return json.loads(out.strip().splitlines()[-1])
+
+
+def main():
+    repeats = int(sys.argv[1]) if len(sys.argv) > 1 else 3
+    print(f"{'entry point':30}{'import (s)':>12}{'peak RSS (MB)':>16}")
+    for label, statement in ENTRY_POINTS:
+        try:
+            runs = [_measure(statement) for _ in range(repeats)]
+        except subprocess.CalledProcessError as e:
+            print(f"{label:30}{'failed':>12}   {e.stderr.strip().splitlines()[-1]}")
+            continue
+        elapsed = min(r[0] for r in runs)
+        rss = min(r[1] for r in runs)
+        print(f"{label:30}{elapsed:12.2f}{rss:16.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""
+Benchmark: labour-law audit, per-pattern checks vs compiled and incremental.
+
+- per-pattern: the former run_audit loop, iterrows over a DataFrame of every
+  description with one re.search per pattern (and a lower() per check group);
+- compiled: LegalAuditor, all patterns in one TaxonomyMatcher pass, serially
+  and in parallel chunks (settings.get_audit_workers() processes);
+- run_audit end to end on a synthetic database: the first (full) run, then a
+  weekly run after 1% new signals, which audits only those and rebuilds the
+  report from stored findings.
+
+Findings of the per-pattern and compiled paths are compared before timings
+are printed.
+
+Usage:
+    python tools/benchmarks/bench_legal_audit.py [n_signals]
+"""
+import os
+import re
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from synthetic import build_db, generate_frame  # noqa: E402
+
+
+def legacy_audit(df, discrimination, svarcsystem):
+    """The former per-row, per-pattern audit, kept here as the baseline."""
+    findings = []
+    for _, row in df.iterrows():
+        text = f"{row['title']} {row['description'] or ''}".lower()
+        found = []
+        for category, patterns in discrimination.items():
+            for pat in patterns:
+                if re.search(pat, text):
+                    if "důchodce" in pat and "vhodné" in text:
+                        continue
+                    found.append(f"{category}: '{pat.replace(chr(92) + 'b', '').strip()}'")
+                    break
+        if any(re.search(pat, text) for pat in svarcsystem["Contract Type"]):
+            dependent = [pat for pat in svarcsystem["Dependent Features"] if re.search(pat, text)]
+            if dependent:
+                found.append(f"Potential Švarcsystém (§ 2, § 3): IČO combined with {', '.join(dependent)}")
+        findings.append(found)
+    return findings
+
+
+def append(path, frame):
+    """Insert more signals into a database made by build_db (migrated on next open)."""
+    import duckdb
+    con = duckdb.connect(path)
+    con.execute("INSERT INTO signals BY NAME SELECT * FROM frame")
+    con.close()
+
+
+def _timed(func):
+    start = time.perf_counter()
+    result = func()
+    return time.perf_counter() - start, result
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    tmp = tempfile.mkdtemp(prefix="bench_legal_audit_")
+    os.environ.update(
+        JOBSCZINSIGHT_DB_PATH=os.path.join(tmp, "intelligence.db"),
+        JOBSCZINSIGHT_SNAPSHOT_PATH=os.path.join(tmp, "signals.parquet"),
+        JOBSCZINSIGHT_OBSERVATIONS_DIR=os.path.join(tmp, "observations"),
+        JOBSCZINSIGHT_LEGAL_FINDINGS_PATH=os.path.join(tmp, "legal_findings.parquet"),
+    )
+    frame = generate_frame(n)
+    print(f"building {n:,} signals in {tmp} ...")
+    build_db(os.environ["JOBSCZINSIGHT_DB_PATH"], frame.iloc[: n - n // 100])
+
+    import analyzer
+    import audit_legal
+    import snapshot
+    from settings import settings
+
+    rows = list(zip(frame["hash"], frame["title"], frame["description"]))
+    workers = settings.get_audit_workers()
+    legacy_time, legacy = _timed(lambda: legacy_audit(frame[["title", "description"]],
+                                                     audit_legal.DISCRIMINATION_PATTERNS,
+                                                     audit_legal.SVARCSYSTEM_INDICATORS))
+    serial_time, serial = _timed(lambda: audit_legal.audit_rows(rows, workers=1))
+    parallel_time, _ = _timed(lambda: audit_legal.audit_rows(rows, workers=workers))
+    mismatched = sum(old != new for old, (_, new) in zip(legacy, serial))
+    print(f"flagged: {sum(bool(f) for f in legacy):,}  mismatched: {mismatched}")
+
+    print(f"\n{'audit of all descriptions':<34}{'time (s)':>10}")
+    print(f"{'per-pattern (iterrows)':<34}{legacy_time:10.2f}")
+    print(f"{'compiled, 1 process':<34}{serial_time:10.2f}")
+    print(f"{f'compiled, {workers} processes':<34}{parallel_time:10.2f}")
+
+    def publish():
+        core = analyzer.IntelligenceCore(read_only=False)
+        snapshot.publish_from_core(core)
+        core.close()
+
+    report = os.path.join(tmp, "LEGAL_AUDIT_REPORT.md")
+    publish()
+    first, _ = _timed(lambda: audit_legal.run_audit(output=report))
+    append(os.environ["JOBSCZINSIGHT_DB_PATH"], frame.iloc[n - n // 100:])
+    publish()
+    weekly, _ = _timed(lambda: audit_legal.run_audit(output=report))
+
+    print(f"\n{'run_audit':<34}{'time (s)':>10}")
+    print(f"{'first run (all signals)':<34}{first:10.2f}")
+    print(f"{'next run (+1% new signals)':<34}{weekly:10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""
+Benchmark: report city normalization, row-wise apply vs resolved at ingest.
+
+Before: generate_report ran normalize_city through df.apply(axis=1) on every
+report, searching the description for ten cities whenever city == 'CZ'.
+After: LocationNormalizer.resolve_many does the same over the distinct
+locations and the 'CZ' subset in bulk, once, when signals are stored or
+backfilled (IntelligenceCore.resolve_locations); the report reads the
+resolved_city column.
+
+Signals are stored with normalize()'s city (hubs as Prague/Brno/Ostrava),
+so both paths start from that column. The resolved cities must match the
+old function's; the table reports seconds for each path.
+
+Usage:
+    python tools/benchmarks/bench_location_resolver.py [n_signals ...]
+"""
+import os
+import sys
+import time
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from synthetic import generate_frame  # noqa: E402
+
+from tools.location_normalizer import LocationNormalizer  # noqa: E402
+
+
+def legacy_normalize_city(row):
+    """The former generate_report.normalize_city, kept here as the baseline."""
+    city = str(row['city']) if pd.notna(row['city']) else ''
+    desc = str(row['description']) if pd.notna(row['description']) else ''
+    if 'Praha' in city or 'prague' in city.lower() or city == 'Hlavní město Praha':
+        return 'Praha'
+    if city == 'CZ':
+        city_patterns = [
+            ('Praha', ['Praha', 'Prague']), ('Brno', ['Brno']), ('Ostrava', ['Ostrava']),
+            ('Plzeň', ['Plzeň', 'Pilsen']), ('Pardubice', ['Pardubice']), ('Olomouc', ['Olomouc']),
+            ('Liberec', ['Liberec']), ('Hradec Králové', ['Hradec Králové']),
+            ('České Budějovice', ['České Budějovice']), ('Zlín', ['Zlín']),
+        ]
+        for norm_name, patterns in city_patterns:
+            if any(p in desc for p in patterns):
+                return norm_name
+        return 'Other'
+    return city
+
+
+def main():
+    sizes = [int(a) for a in sys.argv[1:]] or [10_000, 50_000]
+    normalizer = LocationNormalizer()
+    print(f"{'signals':>9}{'apply s':>10}{'resolve_many s':>16}{'report s':>10}")
+    for n in sizes:
+        frame = generate_frame(n)
+        frame['city'] = [normalizer.normalize(c)[1] for c in frame['city']]
+
+        start = time.perf_counter()
+        before = frame.apply(legacy_normalize_city, axis=1)
+        apply_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        resolved = normalizer.resolve_many(frame['city'], frame['description'])
+        resolve_time = time.perf_counter() - start
+
+        assert resolved['city'].tolist() == before.tolist(), "resolve_many disagrees with normalize_city"
+        frame['resolved_city'] = resolved['city']
+        start = time.perf_counter()
+        frame['resolved_city'].value_counts()
+        report_time = time.perf_counter() - start
+        print(f"{n:9,}{apply_time:10.3f}{resolve_time:16.3f}{report_time:10.4f}")
+    print("resolve_many runs at ingest/backfill; the report only reads resolved_city.")
+
+
+if __name__ == "__main__":
+    main()
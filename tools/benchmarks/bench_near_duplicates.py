@@ -0,0 +1,110 @@
+"""
+Benchmark: near-duplicate clustering (MinHash + LSH) at increasing market sizes.
+
+For each size the script builds a synthetic DB in which a share of signals are
+edited re-posts of an earlier ad (EDIT_RATE of words replaced), then reports:
+
+- backfill time of IntelligenceCore.rebuild_near_duplicates()
+- per-signal ingest cost (_find_cluster + _index_signature) against the full
+  index; it should stay flat as the market grows, i.e. total ingest cost is
+  O(n log n) rather than the O(n^2) of comparing every pair
+- pair precision/recall of the clusters against the known re-posts
+
+Usage:
+    python tools/benchmarks/bench_near_duplicates.py [size ...]
+"""
+import os
+import random
+import sys
+import tempfile
+import time
+from itertools import combinations
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from synthetic import build_db, generate_frame, perturb, varied_description, vocabulary  # noqa: E402
+
+REPOST_RATE = 0.3
+EDIT_RATE = 0.05  # Share of words changed in a re-post
+INGEST_SAMPLE = 300
+
+
+def make_frame(n: int, seed: int = 7):
+    rng = random.Random(seed)
+    words = vocabulary()
+    frame = generate_frame(n, seed=seed, repost_rate=0.0)
+    texts, truth, originals = [], [], []
+    for i in range(n):
+        if texts and rng.random() < REPOST_RATE:
+            origin = rng.choice(originals)
+            texts.append(perturb(rng, texts[origin], EDIT_RATE))
+            truth.append(origin)
+        else:
+            texts.append(varied_description(rng, words, rng.randint(120, 400)))
+            truth.append(i)
+            originals.append(i)
+    frame["description"] = texts
+    frame["benefits"] = None
+    return frame, truth
+
+
+def pair_scores(predicted: list, truth: list, sample: int = 200_000, seed: int = 1):
+    """Precision/recall over same-cluster pairs (all truth pairs, sampled predicted pairs)."""
+    def groups(labels):
+        out = {}
+        for i, label in enumerate(labels):
+            out.setdefault(label, []).append(i)
+        return [g for g in out.values() if len(g) > 1]
+
+    def pairs(labels):
+        return {p for g in groups(labels) for p in combinations(g, 2)}
+
+    true_pairs, predicted_pairs = pairs(truth), pairs(predicted)
+    if len(predicted_pairs) > sample:
+        predicted_pairs = set(random.Random(seed).sample(sorted(predicted_pairs), sample))
+    precision = sum(1 for p in predicted_pairs if truth[p[0]] == truth[p[1]]) / max(len(predicted_pairs), 1)
+    recall = sum(1 for a, b in true_pairs if predicted[a] == predicted[b]) / max(len(true_pairs), 1)
+    return precision, recall
+
+
+def run(n: int, tmp: str):
+    import analyzer
+    import near_duplicates
+
+    frame, truth = make_frame(n + INGEST_SAMPLE)
+    base, extra = frame.iloc[:n].copy(), frame.iloc[n:]
+    path = os.path.join(tmp, f"near_dup_{n}.db")
+    build_db(path, base)
+
+    analyzer.DB_PATH = path
+    core = analyzer.IntelligenceCore(read_only=False)
+    start = time.perf_counter()
+    core.rebuild_near_duplicates()
+    backfill = time.perf_counter() - start
+
+    clusters = dict(core.con.execute("SELECT hash, cluster_id FROM signals").fetchall())
+    predicted = [clusters[h] for h in base["hash"]]
+    precision, recall = pair_scores(predicted, truth[:n])
+
+    start = time.perf_counter()
+    for h, text in zip(extra["hash"], extra["description"]):
+        signature = near_duplicates.minhash_signature(text)
+        cluster_id = core._find_cluster(signature) or h
+        core._index_signature(h, cluster_id, signature)
+    ingest_ms = (time.perf_counter() - start) / len(extra) * 1000
+    core.close()
+
+    print(f"{n:>9} {backfill:>12.1f} {ingest_ms:>14.2f} {precision:>10.3f} {recall:>8.3f}")
+
+
+def main():
+    sizes = [int(a) for a in sys.argv[1:]] or [10_000, 50_000, 200_000]
+    tmp = tempfile.mkdtemp(prefix="bench_near_dup_")
+    print(f"Re-post rate {REPOST_RATE:.0%}, {EDIT_RATE:.0%} of words edited, "
+          f"ingest sample {INGEST_SAMPLE} signals per size")
+    print(f"{'signals':>9} {'backfill (s)':>12} {'ingest (ms/job)':>14} {'precision':>10} {'recall':>8}")
+    for n in sizes:
+        run(n, tmp)
+
+
+if __name__ == "__main__":
+    main()
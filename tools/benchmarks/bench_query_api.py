@@ -0,0 +1,83 @@
+"""
+Benchmark: local query API latency, cold vs cached, and /signals streaming.
+
+Against a synthetic database in the state a scrape leaves behind (locations
+resolved, rollups refreshed, snapshot published), query_api is served on an
+ephemeral port and each endpoint is requested once cold (pool connection or
+MarketIntelligence load included) and then repeatedly from the response
+cache. /signals is read in full to report streamed rows per second; the
+server's own /metrics percentiles are printed at the end.
+
+Usage:
+    python tools/benchmarks/bench_query_api.py [n_signals]
+"""
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+import urllib.request
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from synthetic import build_db, generate_frame  # noqa: E402
+
+ENDPOINTS = ["/kpis", "/salary?by=role_type,seniority_level", "/regional", "/salary-by-role", "/ghost-jobs"]
+REPEATS = 50
+
+
+def _get(port, path):
+    start = time.perf_counter()
+    with urllib.request.urlopen(f"http://127.0.0.1:{port}{path}", timeout=600) as response:
+        body = response.read()
+    return time.perf_counter() - start, body
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    tmp = tempfile.mkdtemp(prefix="bench_query_api_")
+    os.environ.update(
+        JOBSCZINSIGHT_DB_PATH=os.path.join(tmp, "intelligence.db"),
+        JOBSCZINSIGHT_SNAPSHOT_PATH=os.path.join(tmp, "signals.parquet"),
+        JOBSCZINSIGHT_OBSERVATIONS_DIR=os.path.join(tmp, "observations"),
+    )
+    print(f"building {n:,} signals in {tmp} ...")
+    build_db(os.environ["JOBSCZINSIGHT_DB_PATH"], generate_frame(n))
+
+    import analyzer
+    import query_api
+    import snapshot
+
+    core = analyzer.IntelligenceCore(read_only=False)
+    core.resolve_locations()
+    core.refresh_rollups()
+    snapshot.publish_from_core(core)
+    core.close()
+
+    server = query_api.serve(host="127.0.0.1", port=0)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    port = server.server_port
+
+    print(f"\n{'endpoint':<40}{'cold ms':>10}{'cached ms':>11}")
+    for path in ENDPOINTS:
+        cold, _ = _get(port, path)
+        cached = sorted(_get(port, path)[0] for _ in range(REPEATS))[REPEATS // 2]
+        print(f"{path:<40}{cold * 1000:10.1f}{cached * 1000:11.2f}")
+
+    seconds, body = _get(port, "/signals")
+    rows = len(json.loads(body))
+    print(f"\n/signals: {rows:,} rows, {len(body) / 1e6:.1f} MB in {seconds:.2f} s "
+          f"({rows / seconds:,.0f} rows/s)")
+
+    _, metrics = _get(port, "/metrics")
+    print("\nserver /metrics:")
+    for endpoint, stats in json.loads(metrics).items():
+        print(f"  {endpoint:<22}" + "  ".join(f"{k}={v}" for k, v in stats.items()))
+
+    server.shutdown()
+    server.server_close()
+    server.service.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+Benchmark: report aggregates from raw rows vs the rollup tables.
+
+For each table size, times the aggregates the report scripts need (salary
+percentiles and counts by role, professional/HPP medians, top roles) computed
+from signals, and the same figures read from the rollups. Also reports a full
+rollup rebuild and an incremental refresh of the most recent week, which is
+what the scraper runs after each scrape.
+
+Usage:
+    python tools/benchmarks/bench_rollups.py [n_signals ...]
+"""
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from synthetic import build_db, generate_frame  # noqa: E402
+
+RAW_QUERIES = [
+    """SELECT role_type, COUNT(*), quantile_cont(avg_salary, [0.25, 0.5, 0.75])
+       FROM signals WHERE avg_salary > 20000 GROUP BY role_type""",
+    "SELECT role_type, COUNT(*) FROM signals GROUP BY role_type",
+    "SELECT MEDIAN(avg_salary) FROM signals WHERE avg_salary > 0 AND role_type IN ('Developer', 'Analyst', 'PM')",
+    """SELECT MEDIAN(avg_salary) FROM signals_text WHERE avg_salary > 0
+       AND NOT regexp_matches(lower(description), 'ico|faktur|živnost|osvč|dpp|dpč|brigád')""",
+    "SELECT COUNT(*), MAX(scraped_at) FROM signals",
+]
+
+
+def _timed(fn, repeat: int = 3) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def _from_rollups(reader):
+    reader.quantiles(by=["role_type"], qs=(0.25, 0.5, 0.75), min_salary=20000)
+    reader.counts(by=["role_type"])
+    reader.quantiles(filters={"role_type": ["Developer", "Analyst", "PM"]})
+    reader.quantiles(filters={"contract_type": "HPP"})
+    reader.counts()
+
+
+def main():
+    sizes = [int(a) for a in sys.argv[1:]] or [20_000, 100_000]
+    import analyzer
+    import rollups
+
+    print(f"{'signals':>9}{'raw (ms)':>11}{'rollups (ms)':>14}{'full build (s)':>16}{'week refresh (s)':>18}")
+    for n in sizes:
+        path = os.path.join(tempfile.mkdtemp(prefix="bench_rollups_"), "intelligence.db")
+        build_db(path, generate_frame(n))
+        analyzer.DB_PATH = path
+        core = analyzer.IntelligenceCore(read_only=False)
+
+        raw = _timed(lambda: [core.con.execute(q).fetchall() for q in RAW_QUERIES])
+        full = _timed(lambda: core.refresh_rollups(full=True), repeat=1)
+        latest = core.con.execute("SELECT MAX(CAST(date_trunc('week', scraped_at) AS DATE)) FROM signals").fetchone()[0]
+        core._stale_rollup_weeks = {latest}
+        week = _timed(lambda: core.refresh_rollups(), repeat=1)
+        reader = rollups.Rollups(core.con)
+        summary = _timed(lambda: _from_rollups(reader))
+        core.close()
+
+        print(f"{n:>9}{raw * 1000:11.1f}{summary * 1000:14.1f}{full:16.2f}{week:18.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""
+Benchmark: SalaryParser.parse per row vs SalaryParser.parse_many.
+
+Salary strings are drawn from a mix of formats the scrapers see (ranges,
+k-notation, hourly/daily rates, foreign currencies, "dohodou", missing
+values), with a few thousand distinct amounts, so strings repeat the way
+they do in the signals table. Both paths must return identical results; the
+table reports rows/sec for each.
+
+Usage:
+    python tools/benchmarks/bench_salary_parser.py [n_rows ...]
+"""
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from synthetic import SOURCES  # noqa: E402
+
+from parsers import SalaryParser  # noqa: E402
+
+TEMPLATES = [
+    "{a} - {b} Kč", "{a} – {b} Kč/měsíc", "{ka}-{kb}k", "{ka}k - {kb}k CZK", "od {a} Kč",
+    "{h} Kč/hod", "{d} Kč/den", "{e} EUR", "€{e} - {e2}", "{a:,} Kč", "Mzda dohodou",
+    "{ka} - {kb} Kč", "{a} až {b} Kč + bonus", None, None,
+]
+
+
+def _salaries(n, seed=42):
+    rng = random.Random(seed)
+    rows = []
+    for _ in range(n):
+        template = rng.choice(TEMPLATES)
+        if template is None:
+            rows.append((None, rng.choice(SOURCES)))
+            continue
+        a = rng.randrange(25, 120) * 1000
+        values = dict(a=a, b=a + rng.randrange(5, 60) * 1000, ka=a // 1000, kb=a // 1000 + rng.randrange(5, 60),
+                      h=rng.randrange(150, 900, 10), d=rng.randrange(2000, 9000, 100),
+                      e=rng.randrange(2000, 6000, 100), e2=rng.randrange(6000, 9000, 100))
+        rows.append((template.format(**values), rng.choice(SOURCES)))
+    return [s for s, _ in rows], [src for _, src in rows]
+
+
+def main():
+    sizes = [int(a) for a in sys.argv[1:]] or [10_000, 100_000, 500_000]
+    print(f"{'rows':>9}{'distinct':>10}{'parse s':>10}{'rows/s':>12}{'many s':>9}{'rows/s':>12}{'speedup':>9}")
+    for n in sizes:
+        salaries, sources = _salaries(n)
+        start = time.perf_counter()
+        scalar = [SalaryParser.parse(s, src) for s, src in zip(salaries, sources)]
+        scalar_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        mins, maxs, avgs = SalaryParser.parse_many(salaries, sources)
+        many_time = time.perf_counter() - start
+
+        assert scalar == list(zip(mins, maxs, avgs)), "parse_many disagrees with parse"
+        distinct = len(set(zip(salaries, sources)))
+        print(f"{n:9,}{distinct:10,}{scalar_time:10.2f}{n / scalar_time:12,.0f}"
+              f"{many_time:9.2f}{n / many_time:12,.0f}{scalar_time / many_time:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
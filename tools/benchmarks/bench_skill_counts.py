@@ -0,0 +1,91 @@
+"""
+Benchmark: skill counts for trends.html, per-skill queries vs one pass.
+
+- per-skill queries: the former visualizer loop, one
+  `SELECT COUNT(*) ... WHERE regexp_matches(lower(description), <pattern>)`
+  per entry in SKILL_PATTERNS (a full scan and lowercase pass each);
+- one SQL statement: a `COUNT(*) FILTER (WHERE regexp_matches(...))` per
+  skill over a single lowercased scan (counts only);
+- full-taxonomy matcher: one TaxonomyMatcher pass testing every taxonomy
+  label, as visualizer did before its skill-only matcher (counts only);
+- skill matcher + co-occurrence: visualizer.skill_cooccurrence, one pass over
+  the skill labels only, giving counts and the pair matrix together.
+
+Counts of all four are checked against each other before timings are printed.
+DuckDB runs the SQL variants on all cores, so compare them on the target
+machine.
+
+Usage:
+    python tools/benchmarks/bench_skill_counts.py [n_descriptions]
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from synthetic import generate_frame  # noqa: E402
+
+import duckdb  # noqa: E402
+import numpy as np  # noqa: E402
+
+import visualizer  # noqa: E402
+from taxonomy_matcher import get_matcher  # noqa: E402
+
+
+def per_skill_queries(conn):
+    query = "SELECT COUNT(*) FROM signals_text WHERE regexp_matches(lower(description), '{}')"
+    return {name: conn.execute(query.format(pattern)).fetchone()[0]
+            for name, pattern in visualizer.SKILL_PATTERNS.items()}
+
+
+def one_statement(conn):
+    names = list(visualizer.SKILL_PATTERNS)
+    counts = ", ".join(f"COUNT(*) FILTER (WHERE regexp_matches(text, ${i + 1}))" for i in range(len(names)))
+    row = conn.execute(f"SELECT {counts} FROM (SELECT lower(description) AS text FROM signals_text)",
+                       [visualizer.SKILL_PATTERNS[name] for name in names]).fetchone()
+    return dict(zip(names, row))
+
+
+def full_taxonomy_matcher(conn, batch_size=10_000):
+    matcher = get_matcher(visualizer.TAXONOMY)
+    ids = [matcher.label_id('skills', name) for name in visualizer.SKILL_PATTERNS]
+    totals = np.zeros(len(matcher.labels), dtype=np.int64)
+    cursor = conn.execute("SELECT description FROM signals_text")
+    while rows := cursor.fetchmany(batch_size):
+        totals += matcher.match_many(row[0] for row in rows).sum(axis=0)
+    return {name: int(totals[i]) for name, i in zip(visualizer.SKILL_PATTERNS, ids)}
+
+
+def cooccurrence(conn):
+    matrix = visualizer.skill_cooccurrence(conn)
+    return {name: int(matrix.at[name, name]) for name in visualizer.SKILL_PATTERNS}
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    frame = generate_frame(n)[["description"]]
+    conn = duckdb.connect()
+    conn.register("frame", frame)
+    conn.execute("CREATE TABLE signals_text AS SELECT * FROM frame")
+    threads = conn.execute("SELECT current_setting('threads')").fetchone()[0]
+    print(f"Descriptions: {n}  skills: {len(visualizer.SKILL_PATTERNS)}  threads: {threads}")
+    visualizer.skill_matcher()  # compile outside the timings, as get_matcher is
+
+    results = {}
+    print(f"{'method':34}{'time (s)':>10}")
+    for label, func in [("per-skill queries", per_skill_queries), ("one SQL statement", one_statement),
+                        ("full-taxonomy matcher", full_taxonomy_matcher),
+                        ("skill matcher + co-occurrence", cooccurrence)]:
+        start = time.perf_counter()
+        results[label] = func(conn)
+        print(f"{label:34}{time.perf_counter() - start:10.2f}")
+
+    baseline = results["per-skill queries"]
+    for label, counts in results.items():
+        mismatched = [name for name in baseline if counts[name] != baseline[name]]
+        if mismatched:
+            print(f"{label}: counts differ for {mismatched}")
+
+
+if __name__ == "__main__":
+    main()
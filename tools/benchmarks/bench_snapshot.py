@@ -0,0 +1,78 @@
+"""
+Benchmark: post-scrape pipeline reading intelligence.db vs the Parquet snapshot.
+
+Runs the read-only steps that follow the scraper in the weekly workflow, each
+in its own process as CI does, against a synthetic database - first with no
+snapshot (every step opens the DB) and then after publishing one. The
+"snapshot" total includes the publish step itself.
+
+Usage:
+    python tools/benchmarks/bench_snapshot.py [n_signals]
+"""
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from synthetic import ROOT, build_db, generate_frame  # noqa: E402
+
+STEPS = {
+    "market intelligence (report/app)": (
+        "import analyzer; intel = analyzer.MarketIntelligence(); "
+        "intel.get_salary_by_role(); intel.get_role_distribution(); intel.get_unique_job_count()"
+    ),
+    "whitelist discovery": "from tools import whitelist_discovery as w; w.extract_candidates_from_db(5)",
+    "visualizer": "import visualizer, snapshot; visualizer.get_market_intelligence(snapshot.connect())",
+    "update_readme stats": "import update_readme; update_readme.get_stats()",
+    "legal audit load": (
+        "import snapshot; snapshot.connect().execute("
+        "'SELECT title, company, description, link, source FROM signals_text').df()"
+    ),
+}
+
+
+def _run(code: str, env: dict, repeat: int = 2) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", code], cwd=ROOT, env=env, check=True,
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 50_000
+    tmp = tempfile.mkdtemp(prefix="bench_snapshot_")
+    db_path = os.path.join(tmp, "intelligence.db")
+    snapshot_path = os.path.join(tmp, "signals_snapshot.parquet")
+
+    print(f"Generating {n} synthetic signals...")
+    build_db(db_path, generate_frame(n))
+    env = dict(os.environ, JOBSCZINSIGHT_DB_PATH=db_path, JOBSCZINSIGHT_SNAPSHOT_PATH=snapshot_path,
+               HF_HUB_OFFLINE="1")
+
+    before = {name: _run(code, env) for name, code in STEPS.items()}
+    import analyzer
+    import snapshot
+    analyzer.DB_PATH = db_path
+    core = analyzer.IntelligenceCore(read_only=True)
+    start = time.perf_counter()
+    snapshot.publish_from_core(core, snapshot_path)
+    publish = time.perf_counter() - start
+    core.close()
+    after = {name: _run(code, env) for name, code in STEPS.items()}
+
+    print(f"\nSignals: {n}  snapshot: {os.path.getsize(snapshot_path) / 2**20:.1f} MB  "
+          f"DB: {os.path.getsize(db_path) / 2**20:.1f} MB")
+    print(f"{'step (own process)':36}{'DB (s)':>10}{'snapshot (s)':>14}")
+    print(f"{'publish snapshot':36}{'-':>10}{publish:14.2f}")
+    for name in STEPS:
+        print(f"{name:36}{before[name]:10.2f}{after[name]:14.2f}")
+    print(f"{'total':36}{sum(before.values()):10.2f}{publish + sum(after.values()):14.2f}")
+
+
+if __name__ == "__main__":
+    main()
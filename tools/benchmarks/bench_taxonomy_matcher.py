@@ -0,0 +1,55 @@
+"""
+Benchmark: per-pattern taxonomy scans vs the single-pass TaxonomyMatcher.
+
+The per-pattern column is what the analysis modules did before: one
+str.contains scan of all lowercased descriptions per benefit category, skill,
+work model, contract type and red-flag list. The matcher column is one pass
+over each description returning every hit. Both produce the same boolean hit
+matrix, which is checked before timings are printed.
+
+Usage:
+    python tools/benchmarks/bench_taxonomy_matcher.py [n_descriptions]
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from synthetic import TAXONOMY, generate_frame  # noqa: E402
+
+import numpy as np  # noqa: E402
+
+from taxonomy_matcher import TaxonomyMatcher, taxonomy_patterns  # noqa: E402
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    descriptions = generate_frame(n)["description"]
+    print(f"Descriptions: {n}  avg length: {descriptions.str.len().mean():.0f} chars")
+
+    start = time.perf_counter()
+    patterns = taxonomy_patterns(TAXONOMY)
+    matcher = TaxonomyMatcher(patterns)
+    compile_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    matrix = matcher.match_many(descriptions.tolist())
+    single_pass = time.perf_counter() - start
+
+    start = time.perf_counter()
+    lowered = descriptions.fillna('').str.lower()
+    columns = [lowered.str.contains(patterns[group][name], case=False, regex=True, na=False).to_numpy()
+               for group, name in matcher.labels]
+    per_pattern = time.perf_counter() - start
+
+    mismatched = int((np.column_stack(columns) != matrix).any(axis=0).sum())
+    print(f"Labels: {len(matcher.labels)}  mismatched labels: {mismatched}  hits: {int(matrix.sum())}")
+    print(f"{'method':34}{'time (s)':>10}{'us/description':>16}")
+    print(f"{'compile matcher':34}{compile_time:10.3f}{'-':>16}")
+    print(f"{'per-pattern scans':34}{per_pattern:10.2f}{per_pattern / n * 1e6:16.1f}")
+    print(f"{'single pass':34}{single_pass:10.2f}{single_pass / n * 1e6:16.1f}")
+    print(f"speedup: {per_pattern / single_pass:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
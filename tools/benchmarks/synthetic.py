@@ -0,0 +1,175 @@
+"""
+Synthetic market data for the benchmarks in tools/benchmarks.
+
+The production database lives in Git LFS and is not available in every
+checkout, so benchmarks generate signals that look like scraped ones: real
+titles from current_classifications.txt, taxonomy keywords mixed into Czech and
+English boilerplate, and a configurable share of re-posted descriptions (the
+same ad published by several agencies or sources).
+"""
+import os
+import random
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pandas as pd
+import yaml
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT))
+
+TAXONOMY = yaml.safe_load(open(ROOT / "config" / "taxonomy.yaml", encoding="utf-8"))
+
+SOURCES = ["Jobs.cz", "Prace.cz", "StartupJobs", "Cocuma", "WTTJ", "LinkedIn"]
+CITIES = ["Praha", "Praha 4", "Brno", "Ostrava", "Plzeň", "Olomouc", "Liberec",
+          "Hradec Králové", "České Budějovice", "Pardubice", "Zlín", "CZ", "Remote"]
+ROLES = ["Developer", "Analyst", "QA", "Designer", "PM", "Sales", "HR", "Marketing",
+         "Support", "Operations", "Finance", "DevOps", "Data", "Other"]
+SENIORITY = ["Junior", "Mid", "Senior", "Lead", "Executive"]
+
+BOILERPLATE = [
+    "Hledáme nového kolegu do našeho týmu, který bude zodpovědný za rozvoj produktu.",
+    "Nabízíme stabilní zázemí mezinárodní společnosti a přátelský kolektiv.",
+    "We are looking for a motivated colleague to join our growing team.",
+    "Požadujeme min. 2 roky praxe v oboru, komunikativní znalost angličtiny.",
+    "The role offers a clear career path and mentoring from senior colleagues.",
+    "Náplň práce: spolupráce s oddělením obchodu, příprava reportů a analýz.",
+    "Zaměstnavatel je držitelem certifikátu rovné příležitosti pro všechny uchazeče.",
+    "Pracovní doba je od pondělí do pátku, nástup možný ihned nebo dle dohody.",
+    "You will work closely with product owners, designers and stakeholders.",
+    "Odměna odpovídá zkušenostem, nabízíme také pravidelné hodnocení výkonu.",
+]
+
+
+def load_titles() -> list:
+    """Job titles exported from the production DB (see tools/debug/dump_classifications.py)."""
+    path = ROOT / "current_classifications.txt"
+    titles = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if line and not line.startswith("---"):
+                titles.append(line)
+    return titles
+
+
+def _keyword_pool() -> list:
+    pool = []
+    for keywords in TAXONOMY.get("benefits_keywords", {}).values():
+        pool.extend(keywords)
+    for keywords in TAXONOMY.get("work_model_keywords", {}).values():
+        pool.extend(keywords)
+    for keywords in TAXONOMY.get("contract_keywords", {}).values():
+        pool.extend(keywords)
+    pool.extend(TAXONOMY.get("toxicity", {}).get("red_flags", []))
+    for tier in ("modern", "legacy"):
+        pool.extend(TAXONOMY.get("tech_stack", {}).get(tier, []))
+    return pool
+
+
+def make_description(rng: random.Random, keywords: list, length: int = 2500) -> str:
+    """Boilerplate paragraphs with a handful of taxonomy keywords mixed in."""
+    parts = []
+    size = 0
+    while size < length:
+        sentence = rng.choice(BOILERPLATE)
+        if rng.random() < 0.35:
+            sentence = f"{sentence} {rng.choice(keywords)}, {rng.choice(keywords)}."
+        parts.append(sentence)
+        size += len(sentence) + 1
+    return "\n".join(parts)
+
+
+def vocabulary() -> list:
+    """Distinct lowercase words from the exported titles and boilerplate."""
+    words = set()
+    for text in load_titles() + BOILERPLATE:
+        words.update(w for w in text.lower().split() if w.isalpha() and len(w) > 2)
+    return sorted(words)
+
+
+def varied_description(rng: random.Random, words: list, length: int = 250) -> str:
+    """Random word sequence; unrelated ads share few shingles, unlike make_description."""
+    return " ".join(rng.choice(words) for _ in range(length))
+
+
+def perturb(rng: random.Random, text: str, rate: float = 0.05) -> str:
+    """Replace a share of the words, mimicking an edited re-post."""
+    tokens = text.split()
+    for i in rng.sample(range(len(tokens)), int(len(tokens) * rate)):
+        tokens[i] = tokens[rng.randrange(len(tokens))]
+    return " ".join(tokens)
+
+
+def generate_frame(n: int, seed: int = 42, repost_rate: float = 0.3) -> pd.DataFrame:
+    """Signals-shaped DataFrame with n rows.
+
+    Args:
+        n: Number of signals.
+        seed: RNG seed, so runs are comparable.
+        repost_rate: Share of signals whose description is copied from an
+            earlier signal (same ad on several sources / agencies).
+    """
+    rng = random.Random(seed)
+    titles = load_titles()
+    keywords = _keyword_pool()
+    now = datetime.now()
+
+    rows = []
+    descriptions = []
+    for i in range(n):
+        if descriptions and rng.random() < repost_rate:
+            description = rng.choice(descriptions)
+        else:
+            description = make_description(rng, keywords, length=rng.randint(800, 4500))
+            descriptions.append(description)
+        low = rng.randrange(25, 120) * 1000
+        has_salary = rng.random() < 0.6
+        scraped = now - timedelta(days=rng.randint(0, 120), minutes=rng.randint(0, 1440))
+        city = rng.choice(CITIES)
+        rows.append({
+            "hash": f"{i:064x}",
+            "title": rng.choice(titles),
+            "company": f"Company {rng.randint(1, max(n // 20, 50))}",
+            "salary_raw": f"{low} - {low + rng.randrange(5, 60) * 1000} Kč" if has_salary else None,
+            "avg_salary": float(low + 10000) if has_salary else None,
+            "description": description,
+            "benefits": ", ".join(rng.sample(keywords, 3)),
+            "link": f"https://example.com/job/{i}",
+            "source": rng.choice(SOURCES),
+            "city": city,
+            "scraped_at": scraped,
+            "toxicity_score": rng.choice([0, 0, 0, 30, 60]),
+            "tech_status": rng.choice(["Modern", "Stable", "Dinosaur"]),
+            "last_seen_at": scraped + timedelta(days=rng.randint(0, 14)),
+            "role_type": rng.choice(ROLES),
+            "seniority_level": rng.choice(SENIORITY),
+            "ghost_score": rng.choice([0, 0, 15, 25]),
+            "region": city if city in ("Brno", "Ostrava") else ("Prague" if city.startswith("Praha") else "Other"),
+        })
+    return pd.DataFrame(rows)
+
+
+def build_db(path: str, frame: pd.DataFrame) -> None:
+    """Create an IntelligenceCore database at path holding the given signals frame.
+
+    Rows are bulk-loaded with their texts inline (the pre-v1.6 layout) and the
+    DB is then reopened through IntelligenceCore so the normal migrations run.
+    """
+    import duckdb
+    import analyzer
+
+    if os.path.exists(path):
+        os.remove(path)
+
+    original = analyzer.DB_PATH
+    analyzer.DB_PATH = path
+    try:
+        analyzer.IntelligenceCore(read_only=False).close()
+        con = duckdb.connect(path)
+        con.execute("INSERT INTO signals BY NAME SELECT * FROM frame")
+        con.close()
+        analyzer.IntelligenceCore(read_only=False).close()
+    finally:
+        analyzer.DB_PATH = original
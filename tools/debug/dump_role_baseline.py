@@ -0,0 +1,61 @@
+"""
+Record JobClassifier keyword outputs for every title in current_classifications.txt.
+
+Each title is classified with a fixed set of descriptions (empty, short
+snippets that trigger the refinement rules, and a few synthetic ads). The
+role codes per title (in file order) are written to
+tests/fixtures/role_baseline.json and checked by
+tests/test_classifiers.py, so rewrites of the keyword engine must reproduce
+it exactly. Re-run only when a classification change is intended.
+
+Usage:
+    python tools/debug/dump_role_baseline.py
+"""
+import json
+import os
+import random
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "tools", "benchmarks"))
+
+from classifiers import JobClassifier  # noqa: E402
+from synthetic import _keyword_pool, load_titles, make_description, varied_description, vocabulary  # noqa: E402
+
+OUTPUT_PATH = os.path.join(ROOT, "tests", "fixtures", "role_baseline.json")
+
+SNIPPETS = [
+    "",
+    "Vývoj software v Pythonu a Javě, cloud, REST API, devops.",
+    "Práce ve skladu (warehouse), směnný provoz, řidičský průkaz výhodou.",
+    "Developerská společnost, správa nemovitostí, real estate.",
+    "Accounts payable and receivable, faktura, controlling.",
+    "HVAC, vzduchotechnika, topení, silnoproud, technické zařízení budov, MEP.",
+    "Výroba potravin, quality control, ISO 9001, production line, strojírenství.",
+    "Úklid, ostraha a security objektu, zahradník, potravinářský průkaz.",
+    "Grafik směn; team lead; HR business partner; sales manager; IT-support.",
+]
+
+
+def main():
+    rng = random.Random(7)
+    keywords = _keyword_pool()
+    words = vocabulary()
+    descriptions = (SNIPPETS + [make_description(rng, keywords, length=600)]
+                    + [varied_description(rng, words, length=60) for _ in range(4)])
+    titles = load_titles()
+    roles = sorted(set(JobClassifier._classify_role_keywords(t, d) for t in titles for d in descriptions))
+    codes = {role: i for i, role in enumerate(roles)}
+    expected = [" ".join(str(codes[JobClassifier._classify_role_keywords(t, d)]) for d in descriptions)
+                for t in titles]
+
+    os.makedirs(os.path.dirname(OUTPUT_PATH), exist_ok=True)
+    with open(OUTPUT_PATH, "w", encoding="utf-8") as f:
+        json.dump({"titles": len(titles), "descriptions": descriptions, "roles": roles, "expected": expected},
+                  f, ensure_ascii=False, indent=0)
+    print(f"Recorded {len(titles)} titles x {len(descriptions)} descriptions to {OUTPUT_PATH}")
+
+
+if __name__ == "__main__":
+    main()
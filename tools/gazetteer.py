@@ -0,0 +1,125 @@
+"""
+Offline gazetteer of Czech places (config/gazetteer.yaml).
+
+Every municipality, district (okres) and kraj name, with its aliases, is
+folded to lowercase ASCII tokens and stored in a token trie. A lookup walks
+the trie from each token of the query, so its cost depends on the length of
+the query, not on the number of places, and the longest name wins at each
+position ("Praha-východ" is the district, not Praha; "Nový Jičín" is not
+Jičín).
+"""
+import re
+import unicodedata
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional
+
+import yaml
+
+from settings import settings
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+# When a text names several places, municipalities beat districts beat kraje
+KIND_RANK = {"municipality": 0, "district": 1, "kraj": 2}
+
+
+class Place(NamedTuple):
+    """A resolved place; municipality is None for kraj- or district-only matches."""
+    kraj: str
+    municipality: Optional[str]
+    district: Optional[str]
+    kind: str
+
+    @property
+    def city(self) -> str:
+        """Display city: the municipality, else the district, else the kraj name."""
+        return self.municipality or self.district or self.kraj
+
+
+def fold(text: str) -> List[str]:
+    """Lowercase ASCII tokens of text ("Ústí nad Labem" -> ['usti', 'nad', 'labem'])."""
+    text = unicodedata.normalize("NFKD", text or "")
+    text = "".join(c for c in text if not unicodedata.combining(c))
+    return TOKEN_PATTERN.findall(text.lower())
+
+
+class Gazetteer:
+    """Token trie over the Czech places in config/gazetteer.yaml."""
+
+    _default = None
+
+    def __init__(self, path: Optional[Path] = None):
+        path = Path(path or settings.GAZETTEER_PATH)
+        with open(path, "r", encoding="utf-8") as f:
+            data = yaml.safe_load(f)
+
+        self.trie: Dict = {}
+        self.municipalities: Dict[str, str] = {}  # municipality -> kraj
+        ambiguous = set(data.get("ambiguous", []))
+        aliases = data.get("aliases", {})
+
+        # Inserted from the coarsest kind up, so a municipality replaces a kraj
+        # or district sharing its name ("Hlavní město Praha", "Kladno")
+        for kraj, entry in data["kraje"].items():
+            for name in [kraj] + entry.get("aliases", []):
+                self._insert(name, Place(kraj, None, None, "kraj"), free_text=False)
+        for kraj, entry in data["kraje"].items():
+            for district, seat in (entry.get("districts") or {}).items():
+                self._insert(district, Place(kraj, seat, district, "district"), free_text=False)
+        for kraj, entry in data["kraje"].items():
+            for municipality in entry.get("statutory", []) + entry.get("municipalities", []):
+                self.municipalities[municipality] = kraj
+        self.statutory = {m for entry in data["kraje"].values() for m in entry.get("statutory", [])}
+        for municipality, kraj in self.municipalities.items():
+            place = Place(kraj, municipality, None, "municipality")
+            free_text = municipality in self.statutory and municipality not in ambiguous
+            for name in [municipality] + aliases.get(municipality, []):
+                self._insert(name, place, free_text=free_text)
+
+    @classmethod
+    def default(cls) -> "Gazetteer":
+        """Shared instance built from settings.GAZETTEER_PATH."""
+        if cls._default is None:
+            cls._default = cls()
+        return cls._default
+
+    def _insert(self, name: str, place: Place, free_text: bool) -> None:
+        node = self.trie
+        for token in fold(name):
+            node = node.setdefault(token, {})
+        # None key holds (place, usable in free text)
+        node[None] = (place, free_text)
+
+    def _matches(self, tokens: List[str], free_text: bool) -> List[tuple]:
+        """(start, length, place) of the longest name starting at each token."""
+        matches = []
+        for start in range(len(tokens)):
+            node, best = self.trie, None
+            for end in range(start, len(tokens)):
+                node = node.get(tokens[end])
+                if node is None:
+                    break
+                if None in node and (node[None][1] or not free_text):
+                    best = (start, end - start + 1, node[None][0])
+            if best:
+                matches.append(best)
+        return matches
+
+    def lookup(self, location: str) -> Optional[Place]:
+        """Place named by a location field ("Praha 4 - Smíchov", "Brno-venkov", "Plzen, CZ").
+
+        A municipality anywhere in the text wins over a district or kraj;
+        among equals the first one wins.
+        """
+        matches = self._matches(fold(location), free_text=False)
+        if not matches:
+            return None
+        return min(matches, key=lambda m: (KIND_RANK[m[2].kind], m[0]))[2]
+
+    def find(self, text: str) -> Optional[Place]:
+        """First statutory city named in free text (job card, description).
+
+        Names that are also common words (gazetteer 'ambiguous') are skipped.
+        """
+        matches = self._matches(fold(text), free_text=True)
+        return matches[0][2] if matches else None
@@ -1,6 +1,19 @@
 
 import re
 import unicodedata
+from typing import Iterable, Optional
+
+import numpy as np
+import pandas as pd
+
+from tools.gazetteer import Gazetteer
+
+# Display (Czech) name of each hub region's city
+HUB_CITIES = {"Prague": "Praha", "Brno": "Brno", "Ostrava": "Ostrava"}
+
+# Locations that only name the country
+GENERIC_LOCATIONS = {"cz", "czechia", "czech republic", "česká republika"}
+
 
 class LocationNormalizer:
     """Normalizes job location strings into canonical regions and cities."""
@@ -12,6 +25,9 @@ class LocationNormalizer:
             "Brno": re.compile(r"\bbrno\b", re.IGNORECASE),
             "Ostrava": re.compile(r"\bostrava\b", re.IGNORECASE)
         }
+        self.city_regions = {city: region for region, city in HUB_CITIES.items()}
+        self.generic_locations = {self._normalize_basic(location) for location in GENERIC_LOCATIONS}
+        self.gazetteer = Gazetteer.default()
     
     def _normalize_basic(self, text: str) -> str:
         """Basic text normalization: NFKD, lowercase, strip."""
@@ -45,3 +61,82 @@ class LocationNormalizer:
         # But let's keep the city name slightly more original (just stripped/normalized)
         city = location_str.split(',')[0].strip() # Get the city part before comma
         return "Other", city
+
+    def resolve(self, location_str: str, description: Optional[str] = None) -> tuple[str, str]:
+        """
+        Maps a location string (and the job description) to (Region, display City).
+
+        The city comes from the gazetteer (canonical Czech municipality, else the
+        district or kraj for locations such as "Praha-východ" or "Jihomoravský
+        kraj"); locations
+        it does not know fall back to normalize, with hub cities under their
+        Czech name. A location that only names the country is resolved from
+        the first statutory city the description names (Gazetteer.find, as
+        the scraper does for card text; "Other" if none).
+
+        Examples:
+            "Praha 4" -> ("Prague", "Praha")
+            "Usti nad Labem" -> ("Other", "Ústí nad Labem")
+            "Praha-východ" -> ("Other", "Praha-východ")
+            "Jihomoravský kraj" -> ("Other", "Jihomoravský kraj")
+            "CZ" + "...kancelář v Brně, Brno..." -> ("Brno", "Brno")
+            "CZ" + "no city named" -> ("Other", "Other")
+        """
+        region, city, generic = self._resolve_location(location_str)
+        if not generic:
+            return region, city
+        return self._resolve_description(description)
+
+    def _resolve_description(self, description: Optional[str]) -> tuple[str, str]:
+        """(Region, display City) of the first statutory city a description names."""
+        place = self.gazetteer.find(description) if description else None
+        if place is None:
+            return "Other", "Other"
+        return self.city_regions.get(place.municipality, "Other"), place.city
+
+    def _resolve_location(self, location_str: str) -> tuple[str, str, bool]:
+        """(Region, display City, names only the country) of a location string."""
+        if self._normalize_basic(location_str) in self.generic_locations:
+            return "Other", "Other", True
+        place = self.gazetteer.lookup(location_str) if location_str else None
+        if place is not None:
+            return self.city_regions.get(place.municipality, "Other"), place.city, False
+        region, city = self.normalize(location_str)
+        return region, HUB_CITIES.get(city, city), False
+
+    def resolve_many(self, locations: Iterable, descriptions: Optional[Iterable] = None) -> pd.DataFrame:
+        """
+        Vectorized resolve over many signals (same results as resolve).
+
+        Each distinct location is resolved once; descriptions are only
+        searched for rows whose location is generic.
+
+        Args:
+            locations: Location strings (None/NaN treated as empty).
+            descriptions: Matching job descriptions, or None to skip the
+                description fallback.
+
+        Returns:
+            DataFrame with 'region' and 'city' columns, aligned with locations
+            (keeping its index when it is a Series).
+        """
+        index = locations.index if isinstance(locations, pd.Series) else None
+        locations = pd.Series(list(locations) if index is None else locations.to_numpy(), dtype=object)
+        codes, uniques = pd.factorize(locations.fillna(""))
+
+        resolved = [self._resolve_location(str(location)) for location in uniques]
+        regions = np.array([region for region, _, _ in resolved], dtype=object)
+        cities = np.array([city for _, city, _ in resolved], dtype=object)
+        generic = np.array([is_generic for _, _, is_generic in resolved], dtype=bool)
+
+        region, city = regions[codes], cities[codes]
+        rows = np.flatnonzero(generic[codes])
+        if len(rows):
+            city[rows], region[rows] = "Other", "Other"
+            if descriptions is not None:
+                texts = pd.Series(list(descriptions), dtype=object).iloc[rows].fillna("").astype(str)
+                found = [self._resolve_description(text) for text in texts]
+                region[rows] = [r for r, _ in found]
+                city[rows] = [c for _, c in found]
+
+        return pd.DataFrame({"region": region, "city": city}, index=index)
@@ -5,6 +5,7 @@ import datetime
 from collections import Counter
 from typing import List, Dict
 from settings import settings
+import snapshot
 from dotenv import load_dotenv
 
 # Load environment variables
@@ -77,15 +78,14 @@ def extract_candidates_from_db(min_count: int = 5) -> Dict[str, int]:
     """
     Extract frequent terms from 'Other' jobs in the database.
     """
-    db_path = str(settings.get_db_path())
-    con = duckdb.connect(db_path, read_only=True)
+    con = snapshot.connect()
     
     # Select titles and descriptions for 'Other' roles
     # We assume the table is 'signals' and it has 'role_category'
     try:
         query = """
         SELECT title, description 
-        FROM signals 
+        FROM signals_text 
         WHERE role_type = 'Other' 
         AND description IS NOT NULL
         """
@@ -1,7 +1,30 @@
 import os
 import datetime
-import duckdb
 from settings import settings
+import rollups
+import snapshot
+
+# Professional Market Median (Tech/White-collar focus)
+PROF_ROLES = (
+    'Developer', 'Analyst', 'Management', 'PM', 'Sales', 'HR', 
+    'Marketing', 'Designer', 'QA', 'Finance', 'Legal', 
+    'Education', 'Technical Specialists', 'Electromechanics'
+)
+
+def _stats_from_rollups(summary):
+    """Same figures as get_stats, read from the report rollups."""
+    totals = summary.counts()
+    prof = summary.quantiles(filters={"role_type": list(PROF_ROLES)})
+    # contract_type is derived with the same keywords as MarketIntelligence
+    hpp = summary.quantiles(filters={"contract_type": "HPP"})
+    roles = summary.counts(by=["role_type"]).sort_values("jobs", ascending=False).head(5)
+    return {
+        "total_jobs": int(totals["jobs"].iloc[0] or 0),
+        "prof_median": int(prof["q50"].iloc[0]) if not prof.empty else 0,
+        "hpp_median": int(hpp["q50"].iloc[0]) if not hpp.empty else 0,
+        "top_roles": list(roles[["role_type", "jobs"]].itertuples(index=False, name=None)),
+        "last_date": totals["last_scraped_at"].iloc[0].to_pydatetime() if not totals.empty else None
+    }
 
 def get_stats():
     """Fetch key statistics from the database."""
@@ -10,18 +33,18 @@ def get_stats():
         return None
 
     try:
-        con = duckdb.connect(db_path, read_only=True)
+        con = snapshot.connect(include_signals=False) if snapshot.is_fresh() else snapshot.connect()
+        summary = rollups.Rollups(con)
+        if summary.available():
+            stats = _stats_from_rollups(summary)
+            con.close()
+            return stats
         
         # Total active jobs
         total_jobs = con.execute("SELECT COUNT(*) FROM signals").fetchone()[0]
         
         # 1. Professional Market Median (Tech/White-collar focus)
-        prof_roles = (
-            'Developer', 'Analyst', 'Management', 'PM', 'Sales', 'HR', 
-            'Marketing', 'Designer', 'QA', 'Finance', 'Legal', 
-            'Education', 'Technical Specialists', 'Electromechanics'
-        )
-        roles_sql = ", ".join([f"'{r}'" for r in prof_roles])
+        roles_sql = ", ".join([f"'{r}'" for r in PROF_ROLES])
         
         prof_median = con.execute(f"""
             SELECT MEDIAN(avg_salary) 
@@ -35,7 +58,7 @@ def get_stats():
         # This is a rough SQL filter to mimic the Python logic
         hpp_median = con.execute("""
             SELECT MEDIAN(avg_salary) 
-            FROM signals 
+            FROM signals_text 
             WHERE avg_salary > 0 
             AND lower(description) NOT LIKE '%ico%' 
             AND lower(description) NOT LIKE '%faktur%' 
@@ -3,8 +3,9 @@
 Data Quality Validation Script
 Runs sanity checks on the JobsCzInsight database to detect corruption
 """
-import duckdb
+from datetime import datetime
 from settings import settings
+import snapshot
 
 DB_PATH = str(settings.get_db_path())
 
@@ -14,7 +15,7 @@ print(f"Run Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
 print("=" * 70)
 
 try:
-    conn = duckdb.connect(DB_PATH, read_only=True)
+    conn = snapshot.connect()
 
     # Basic Stats
     total_jobs = conn.execute("SELECT COUNT(*) FROM signals").fetchone()[0]
@@ -139,16 +140,16 @@ try:
     print("📝 TEST 4: DESCRIPTION QUALITY")
     print("─" * 70)
 
-    empty_desc = conn.execute("SELECT COUNT(*) FROM signals WHERE description IS NULL OR description = ''").fetchone()[0]
+    empty_desc = conn.execute("SELECT COUNT(*) FROM signals_text WHERE description IS NULL OR description = ''").fetchone()[0]
     empty_pct = (empty_desc / total_jobs) * 100
     status_desc = "✅ PASS" if empty_pct < 10 else "⚠️  WARN"
     print(f"{status_desc} Empty descriptions: {empty_desc} ({empty_pct:.2f}%)")
 
-    avg_length = conn.execute("SELECT AVG(LENGTH(description)) FROM signals WHERE description IS NOT NULL").fetchone()[0]
+    avg_length = conn.execute("SELECT AVG(LENGTH(description)) FROM signals_text WHERE description IS NOT NULL").fetchone()[0]
     print(f"Average description length: {avg_length:.0f} characters")
 
     # Very short descriptions (likely extraction errors)
-    too_short_desc = conn.execute("SELECT COUNT(*) FROM signals WHERE LENGTH(description) < 100 AND description IS NOT NULL").fetchone()[0]
+    too_short_desc = conn.execute("SELECT COUNT(*) FROM signals_text WHERE LENGTH(description) < 100 AND description IS NOT NULL").fetchone()[0]
     short_desc_pct = (too_short_desc / (total_jobs - empty_desc)) * 100 if (total_jobs - empty_desc) > 0 else 0
     status_short_desc = "✅ PASS" if short_desc_pct < 5 else "⚠️  WARN"
     print(f"{status_short_desc} Suspiciously short descriptions (<100 chars): {too_short_desc} ({short_desc_pct:.2f}%)")
@@ -0,0 +1,214 @@
+"""
+Approximate nearest-neighbour index over job embeddings ("similar postings").
+
+The embeddings the role classifier computes are also a good similarity
+signal between postings, so IntelligenceCore keeps every active signal's
+vector in an inverted-file (IVF) index built on NumPy:
+
+- k-means centroids split the unit vectors into ~4*sqrt(N) lists
+- a query scores the centroids, then only the members of the nprobe
+  closest lists (nprobe=16 by default: a few percent of the corpus)
+- vectors are held L2-normalized in float16, so a dot product is the
+  cosine similarity
+
+Signals are added incrementally (each new vector joins its nearest list)
+and removed when cleanup_expired deletes them. The centroids are retrained
+when the index has grown 4x since the last training. The index is saved as
+one .npz file next to intelligence.db and rewritten atomically.
+"""
+from pathlib import Path
+from typing import Iterable, List, Optional, Sequence, Tuple
+import logging
+import os
+
+import numpy as np
+
+logger = logging.getLogger('HR-Intel-VectorIndex')
+
+# Below this size every query is exact (one list holding everything)
+MIN_TRAIN_SIZE = 1024
+# Retrain the centroids when the index has grown this much since training
+RETRAIN_GROWTH = 4.0
+KMEANS_SAMPLE = 20_000
+KMEANS_ITERATIONS = 12
+
+
+def _normalize(vectors: np.ndarray) -> np.ndarray:
+    vectors = np.asarray(vectors, dtype=np.float32)
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    return np.divide(vectors, norms, out=np.zeros_like(vectors), where=norms > 0)
+
+
+def _spherical_kmeans(vectors: np.ndarray, n_lists: int, seed: int = 0) -> np.ndarray:
+    """Unit-norm centroids for n_lists clusters of unit vectors (Lloyd's iterations on a sample)."""
+    rng = np.random.default_rng(seed)
+    if len(vectors) > KMEANS_SAMPLE:
+        vectors = vectors[rng.choice(len(vectors), KMEANS_SAMPLE, replace=False)]
+    vectors = vectors.astype(np.float32)
+    centroids = vectors[rng.choice(len(vectors), n_lists, replace=False)]
+    for _ in range(KMEANS_ITERATIONS):
+        assign = (vectors @ centroids.T).argmax(axis=1)
+        sums = np.zeros_like(centroids)
+        np.add.at(sums, assign, vectors)
+        empty = np.bincount(assign, minlength=n_lists) == 0
+        # Re-seed empty lists with random points so every list stays in use
+        sums[empty] = vectors[rng.choice(len(vectors), int(empty.sum()))]
+        centroids = _normalize(sums)
+    return centroids
+
+
+class VectorIndex:
+    """IVF index of unit vectors keyed by signal hash."""
+
+    def __init__(self, name: str = "", dim: Optional[int] = None):
+        """
+        Args:
+            name: Embedding space the vectors come from (model + backend); an
+                index saved for another space is discarded on load.
+            dim: Vector dimension, taken from the first add() if None.
+        """
+        self.name = name
+        self.dim = dim
+        self.hashes = np.empty(0, dtype=object)
+        self.vectors = np.empty((0, dim or 0), dtype=np.float16)
+        self.assign = np.empty(0, dtype=np.int32)
+        self.centroids = np.empty((0, dim or 0), dtype=np.float32)
+        self.trained_size = 0
+        self._positions = {}
+        self._order = None
+        self._offsets = None
+
+    def __len__(self) -> int:
+        return len(self.hashes)
+
+    def __contains__(self, signal_hash: str) -> bool:
+        return signal_hash in self._positions
+
+    # --- maintenance ---
+
+    def _reindex(self) -> None:
+        self._positions = {h: i for i, h in enumerate(self.hashes)}
+        # Members of list j are _order[_offsets[j]:_offsets[j + 1]]
+        self._order = np.argsort(self.assign, kind='stable')
+        self._offsets = np.searchsorted(self.assign[self._order], np.arange(len(self.centroids) + 1))
+
+    def _nearest_list(self, vectors: np.ndarray) -> np.ndarray:
+        if len(self.centroids) <= 1:
+            return np.zeros(len(vectors), dtype=np.int32)
+        return (vectors.astype(np.float32) @ self.centroids.T).argmax(axis=1).astype(np.int32)
+
+    def train(self) -> None:
+        """(Re)compute the centroids from the current vectors and reassign every vector."""
+        n_lists = int(4 * np.sqrt(len(self))) if len(self) >= MIN_TRAIN_SIZE else 1
+        if n_lists > 1:
+            self.centroids = _spherical_kmeans(self.vectors, n_lists)
+        else:
+            self.centroids = np.zeros((1, self.dim), dtype=np.float32)
+        self.assign = self._nearest_list(self.vectors)
+        self.trained_size = len(self)
+        self._reindex()
+
+    def add(self, hashes: Sequence[str], vectors: np.ndarray) -> None:
+        """Insert (or replace) vectors for signal hashes."""
+        if not len(hashes):
+            return
+        vectors = _normalize(vectors)
+        if self.dim is None:
+            self.dim = vectors.shape[1]
+            self.vectors = self.vectors.reshape(0, self.dim)
+            self.centroids = self.centroids.reshape(0, self.dim)
+        self.remove([h for h in hashes if h in self._positions])
+        self.hashes = np.concatenate([self.hashes, np.asarray(list(hashes), dtype=object)])
+        self.vectors = np.concatenate([self.vectors, vectors.astype(np.float16)])
+        if not len(self.centroids) or len(self) >= max(self.trained_size * RETRAIN_GROWTH, MIN_TRAIN_SIZE):
+            self.train()
+            return
+        self.assign = np.concatenate([self.assign, self._nearest_list(vectors)])
+        self._reindex()
+
+    def remove(self, hashes: Iterable[str]) -> int:
+        """Drop vectors of the given signal hashes (unknown hashes are ignored)."""
+        drop = [self._positions[h] for h in hashes if h in self._positions]
+        if not drop:
+            return 0
+        keep = np.ones(len(self), dtype=bool)
+        keep[drop] = False
+        self.hashes = self.hashes[keep]
+        self.vectors = self.vectors[keep]
+        self.assign = self.assign[keep]
+        self._reindex()
+        return len(drop)
+
+    # --- queries ---
+
+    def vector(self, signal_hash: str) -> Optional[np.ndarray]:
+        position = self._positions.get(signal_hash)
+        return None if position is None else self.vectors[position].astype(np.float32)
+
+    def search(self, queries: np.ndarray, k: int = 10, nprobe: int = 16) -> List[List[Tuple[str, float]]]:
+        """Approximate top-k most similar indexed signals for each query vector.
+
+        Args:
+            queries: (m, dim) query vectors (normalized here).
+            k: Results per query.
+            nprobe: Closest lists scanned per query; more is slower but
+                closer to exact (all lists = exact search).
+
+        Returns:
+            Per query, up to k (signal hash, cosine similarity) pairs, best first.
+        """
+        if not len(self):
+            return [[] for _ in range(len(queries))]
+        queries = _normalize(np.atleast_2d(queries))
+        nprobe = min(nprobe, len(self.centroids))
+        if nprobe < len(self.centroids):
+            probes = np.argpartition(-(queries @ self.centroids.T), nprobe - 1, axis=1)[:, :nprobe]
+        else:
+            probes = np.tile(np.arange(len(self.centroids)), (len(queries), 1))
+        results = []
+        for query, lists in zip(queries, probes):
+            candidates = np.concatenate([self._order[self._offsets[j]:self._offsets[j + 1]] for j in lists])
+            if not len(candidates):
+                results.append([])
+                continue
+            scores = self.vectors[candidates].astype(np.float32) @ query
+            top = min(k, len(candidates))
+            best = np.argpartition(-scores, top - 1)[:top]
+            best = best[np.argsort(-scores[best], kind='stable')]
+            results.append([(self.hashes[candidates[i]], float(scores[i])) for i in best])
+        return results
+
+    # --- persistence ---
+
+    def save(self, path: Path) -> None:
+        """Write the index to path atomically (via a temp file in the same dir)."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(path.name + ".tmp")
+        with open(tmp, 'wb') as f:
+            np.savez(f, hashes=self.hashes.astype(str), vectors=self.vectors, assign=self.assign,
+                     centroids=self.centroids, trained_size=self.trained_size, name=self.name)
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path: Path, name: str = "") -> "VectorIndex":
+        """Index saved at path, or an empty one if missing or built for another embedding space."""
+        path = Path(path)
+        if not path.exists():
+            return cls(name)
+        try:
+            with np.load(path, allow_pickle=False) as data:
+                if str(data["name"]) != name:
+                    logger.info(f"Vector index was built for {data['name']}, not {name}; rebuilding")
+                    return cls(name)
+                index = cls(name, int(data["vectors"].shape[1]))
+                index.hashes = data["hashes"].astype(object)
+                index.vectors = data["vectors"]
+                index.assign = data["assign"]
+                index.centroids = data["centroids"]
+                index.trained_size = int(data["trained_size"])
+        except (OSError, KeyError, ValueError) as e:
+            logger.warning(f"Vector index at {path} unreadable ({e}); rebuilding")
+            return cls(name)
+        index._reindex()
+        return index
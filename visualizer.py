@@ -1,9 +1,14 @@
-import duckdb
 import json
 import os
 import yaml
 from datetime import datetime
+from functools import lru_cache
+import numpy as np
+import pandas as pd
 from settings import settings
+import rollups
+import snapshot
+from taxonomy_matcher import TaxonomyMatcher, taxonomy_patterns
 
 # Configuration - use centralized settings
 # Triggering fresh workflow run to verify LFS fix
@@ -12,16 +17,57 @@ OUTPUT_HTML = os.path.join(settings.BASE_DIR, 'public', 'trends.html')
 TAXONOMY_PATH = str(settings.TAXONOMY_PATH)
 
 # Load skill patterns from taxonomy
-def load_skill_patterns():
-    """Load skill detection patterns from taxonomy.yaml"""
+def load_taxonomy():
+    """Load taxonomy.yaml (skill detection patterns etc.)"""
     with open(TAXONOMY_PATH, 'r', encoding='utf-8') as f:
-        taxonomy = yaml.safe_load(f)
-    return taxonomy.get('skill_patterns', {})
+        return yaml.safe_load(f)
 
-SKILL_PATTERNS = load_skill_patterns()
+TAXONOMY = load_taxonomy()
+SKILL_PATTERNS = TAXONOMY.get('skill_patterns', {})
+
+
+@lru_cache(maxsize=1)
+def skill_matcher() -> TaxonomyMatcher:
+    """Matcher compiled from the skill patterns only (no benefit, contract, ... labels to test)."""
+    return TaxonomyMatcher({'skills': taxonomy_patterns(TAXONOMY)['skills']})
+
+
+def skill_cooccurrence(conn, batch_size: int = 10_000) -> pd.DataFrame:
+    """Jobs mentioning each pair of skills, from one matcher pass over all descriptions.
+
+    Returns:
+        Square DataFrame indexed and labelled by skill name; the diagonal holds
+        the jobs mentioning each skill.
+    """
+    matcher = skill_matcher()
+    names = [name for _, name in matcher.labels]
+    totals = np.zeros((len(names), len(names)), dtype=np.int64)
+    cursor = conn.execute("SELECT description FROM signals_text")
+    while True:
+        rows = cursor.fetchmany(batch_size)
+        if not rows:
+            break
+        hits = matcher.match_many(row[0] for row in rows).astype(np.int32)
+        totals += hits.T @ hits
+    return pd.DataFrame(totals, index=names, columns=names)
+
+
+def top_pairs(matrix: pd.DataFrame, skills: list, limit: int = 12) -> list:
+    """Most frequent skill pairs among `skills`, with the share of the rarer skill's jobs."""
+    pairs = []
+    for i, a in enumerate(skills):
+        for b in skills[i + 1:]:
+            together = int(matrix.at[a, b])
+            if together:
+                base = int(min(matrix.at[a, a], matrix.at[b, b]))
+                pairs.append({"pair": f"{a} + {b}", "count": together, "share": round(together / base, 3)})
+    pairs.sort(key=lambda p: (-p["count"], p["pair"]))
+    return pairs[:limit]
 
 def get_market_intelligence(conn):
     print("Generating Market Intelligence Data...")
+    summary = rollups.Rollups(conn)
+    use_rollups = summary.available()
     
     # 1. Salary Analysis by Role (Percentiles for Honest Reporting)
     # We filter out NULL salaries and suspiciously low values (< 20000 CZK)
@@ -38,7 +84,13 @@ def get_market_intelligence(conn):
         HAVING count(*) > 5
         ORDER BY median_sal DESC
     """
-    salary_results = conn.execute(salary_query).fetchall()
+    if use_rollups:
+        by_role = summary.quantiles(by=["role_type"], qs=(0.25, 0.5, 0.75), min_salary=20000)
+        by_role = by_role[by_role["role_type"].notna() & (by_role["count"] > 5)]
+        by_role = by_role.sort_values("q50", ascending=False)
+        salary_results = list(by_role[["role_type", "count", "q25", "q50", "q75"]].itertuples(index=False, name=None))
+    else:
+        salary_results = conn.execute(salary_query).fetchall()
     
     salary_data = {
         "labels": [r[0] for r in salary_results],
@@ -69,23 +121,18 @@ def get_market_intelligence(conn):
         ORDER BY count DESC 
         LIMIT 15
     """
-    role_distribution = conn.execute(role_dist_query).fetchall()
+    if use_rollups:
+        roles = summary.counts(by=["role_type"])
+        roles = roles[roles["role_type"].notna() & (roles["role_type"] != "Unknown")]
+        roles = roles.sort_values("jobs", ascending=False).head(15)
+        role_distribution = list(roles[["role_type", "jobs"]].itertuples(index=False, name=None))
+    else:
+        role_distribution = conn.execute(role_dist_query).fetchall()
 
-    # 4. Skill Heatmap (Modern Stack) - Using accurate regex patterns
-    skill_counts = []
-    for skill_name, pattern in SKILL_PATTERNS.items():
-        # Security: Validate pattern is a safe string before using in SQL
-        # Escape single quotes to prevent SQL injection
-        safe_pattern = pattern.replace("'", "''") if isinstance(pattern, str) else None
-        if not safe_pattern:
-            continue
-        query = f"SELECT COUNT(*) FROM signals WHERE regexp_matches(lower(description), '{safe_pattern}')"
-        try:
-            count = conn.execute(query).fetchone()[0]
-            skill_counts.append({"skill": skill_name, "count": count})
-        except Exception as e:
-            print(f"Error: Skill '{skill_name}' pattern failed: {e} - SKIPPING")
-            continue  # Skip skills with invalid patterns instead of using loose matching
+    # 4. Skill Heatmap (Modern Stack) - counts and co-occurrence from one pass
+    cooccurrence = skill_cooccurrence(conn)
+    skill_counts = [{"skill": name, "count": int(cooccurrence.at[name, name])}
+                    for name in SKILL_PATTERNS if name in cooccurrence.index]
 
     # Filter out skills with very low counts (< 10 jobs) and sort
     skill_counts = [s for s in skill_counts if s['count'] >= 10]
@@ -93,6 +140,7 @@ def get_market_intelligence(conn):
 
     # Limit to top 18 skills for readability
     skill_counts = skill_counts[:18]
+    top_skills = [x['skill'] for x in skill_counts]
     
     return {
         "salary": salary_data,
@@ -105,9 +153,10 @@ def get_market_intelligence(conn):
             "data": [r[1] for r in role_distribution]
         },
         "skills": {
-            "labels": [x['skill'] for x in skill_counts],
+            "labels": top_skills,
             "data": [x['count'] for x in skill_counts]
-        }
+        },
+        "skill_pairs": top_pairs(cooccurrence, top_skills)
     }
 
 def generate_executive_report(data):
@@ -181,6 +230,15 @@ def generate_executive_report(data):
                     <canvas id="skillChart"></canvas>
                 </div>
 
+                <!-- Skill Co-occurrence -->
+                <div class="card">
+                    <h2>🔗 Skills Asked For Together</h2>
+                    <div class="insight-box">
+                        <strong>Hiring Insight:</strong> Most common pairs among the skills above. Hover a bar for the share of the rarer skill's jobs that also mention the other one.
+                    </div>
+                    <canvas id="skillPairChart"></canvas>
+                </div>
+
                 <!-- Top Hiring Volume -->
                 <div class="card">
                     <h2>🏢 Top Hiring Volumes (Overall)</h2>
@@ -235,6 +293,27 @@ def generate_executive_report(data):
                 }}
             }});
 
+            // 2b. Skill Pairs
+            const skillPairs = {json.dumps(data['skill_pairs'])};
+            new Chart(document.getElementById('skillPairChart'), {{
+                type: 'bar',
+                data: {{
+                    labels: skillPairs.map(p => p.pair),
+                    datasets: [{{
+                        label: 'Jobs Mentioning Both',
+                        data: skillPairs.map(p => p.count),
+                        backgroundColor: '#ef4444'
+                    }}]
+                }},
+                options: {{
+                    indexAxis: 'y',
+                    plugins: {{
+                        legend: {{ display: false }},
+                        tooltip: {{ callbacks: {{ afterLabel: ctx => Math.round(skillPairs[ctx.dataIndex].share * 100) + '% of the rarer skill' }} }}
+                    }}
+                }}
+            }});
+
             // 3. Top Companies
             new Chart(document.getElementById('companyChart'), {{
                 type: 'bar',
@@ -279,7 +358,7 @@ def generate_executive_report(data):
 
 def main():
     try:
-        conn = duckdb.connect(DB_PATH, read_only=True)
+        conn = snapshot.connect()
         data = get_market_intelligence(conn)
         generate_executive_report(data)
     except Exception as e: